@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_actions.py
+# Açıklama: Animasyon eylemlerini OLED ve LED kontrolcülerine bağlayan mixin. Canlı animasyon
+#           motoru ve çevrimdışı önizleme çizicisi aynı eylem haritasını kullanır.
+# Bağımlılıklar: sys, typing
+# Bağlı Dosyalar: animation_engine.py, animation_renderer.py, animation_timeline.py, animation_curves.py,
+#                 led_controller_base.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Eylemler kontrolcülerde gerçekten bulunan metotlara bağlandı (look_at_points, show_growing_circle,
+#           set_mouth_expression, pulse, rainbow yoktu); etrafa bakma göz pozisyonu eğrisiyle oynatılıyor.
+#           ACTION_TARGETS ile eylem hedefleri derleme sırasında doğrulanabiliyor
+# - [0.1.0] Eylem fonksiyonları ve bileşen -> eylem haritası animation_engine.py dosyasından taşındı
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import sys
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from src.modules.animation_curves import KeyframeCurve
+from src.modules.led_controller_base import AnimationPattern
+
+
+class AnimationActionsMixin:
+    """
+    Animasyon eylemleri mixin sınıfı
+
+    Kullanan sınıf oled_controller ve led_controller özniteliklerini tanımlamalı
+    ve başlatıcısında _init_actions() çağırmalıdır.
+    """
+
+    # Bileşen -> eylem adı -> (kontrolcü özniteliği, çağrılan metot)
+    ACTION_TARGETS: Dict[str, Dict[str, Tuple[str, str]]] = {
+        "eyes": {
+            "clear": ("oled_controller", "clear_eyes"),
+            "growing_circle": ("oled_controller", "show_eyes_growing_circle"),
+            "blink": ("oled_controller", "blink"),
+            "look_around": ("oled_controller", "play_curve"),
+        },
+        "mouth": {
+            "clear": ("oled_controller", "clear_mouth"),
+            "smile": ("oled_controller", "show_mouth_expression"),
+            "speak": ("oled_controller", "animate_speaking"),
+        },
+        "leds": {
+            "off": ("led_controller", "clear"),
+            "pulse": ("led_controller", "animate"),
+            "rainbow": ("led_controller", "animate"),
+        },
+    }
+
+    def _init_actions(self) -> None:
+        """
+        Bileşen -> eylem adı -> fonksiyon haritasını oluşturur
+        """
+        # Animasyon eylemlerinin işlevi haritası
+        self.eye_actions = {
+            "clear": self._action_eyes_clear,
+            "growing_circle": self._action_eyes_growing_circle,
+            "blink": self._action_eyes_blink,
+            "look_around": self._action_eyes_look_around,
+        }
+
+        self.mouth_actions = {
+            "clear": self._action_mouth_clear,
+            "smile": self._action_mouth_smile,
+            "speak": self._action_mouth_speak,
+        }
+
+        self.led_actions = {
+            "off": self._action_leds_off,
+            "pulse": self._action_leds_pulse,
+            "rainbow": self._action_leds_rainbow,
+        }
+
+        self.emotion_actions = {
+            "set_emotion": self._action_set_emotion,
+        }
+
+        self.curve_actions = {
+            "play": self._action_play_curve,
+        }
+
+        # Bileşen -> eylem haritası (zaman çizelgesi derleyicisi kullanır)
+        self.action_dispatch = {
+            "eyes": self.eye_actions,
+            "mouth": self.mouth_actions,
+            "leds": self.led_actions,
+            "emotion": self.emotion_actions,
+            "curves": self.curve_actions,
+        }
+
+    def _unresolved_action_target(self, component: str, action: str) -> Optional[str]:
+        """
+        Eylemin çağıracağı kontrolcü metodunu doğrular (compile_timeline kullanır)
+
+        Kontrolcü henüz bağlanmamışsa eylem çalışmaz, bu durumda hata sayılmaz.
+
+        Args:
+            component (str): Bileşen adı
+            action (str): Eylem adı
+
+        Returns:
+            Optional[str]: Bulunamayan hedef ("Sınıf.metot"), hedef çözülebiliyorsa None
+        """
+        target = self.ACTION_TARGETS.get(component, {}).get(action)
+        if target is None:
+            return None
+        attribute, method = target
+        controller = getattr(self, attribute, None)
+        if controller is None or callable(getattr(controller, method, None)):
+            return None
+        return f"{type(controller).__name__}.{method}"
+
+    def _get_curve_controller(self, track: str):
+        """
+        Eğri izini çizen kontrolcüyü döndürür
+
+        Args:
+            track (str): İz adı
+
+        Returns:
+            LED izleri için LED kontrolcü, diğerleri için OLED kontrolcü (yoksa None)
+        """
+        controller = self.led_controller if track.startswith("led_") else self.oled_controller
+        if controller is None or not hasattr(controller, "play_curve"):
+            return None
+        return controller
+
+    # Eylem fonksiyonları
+    def _action_eyes_clear(self, params: Mapping[str, Any]) -> None:
+        """Gözleri temizler"""
+        if self.oled_controller:
+            self.oled_controller.clear_eyes()
+
+    def _action_eyes_blink(self, params: Mapping[str, Any]) -> None:
+        """Göz kırpma"""
+        duration = params.get("duration", 0.2)
+        if self.oled_controller:
+            self.oled_controller.blink(duration)
+
+    def _action_eyes_look_around(self, params: Mapping[str, Any]) -> None:
+        """Etrafı izleme (noktalar süreye eşit aralıklarla göz pozisyonu eğrisine dizilir)"""
+        duration = params.get("duration", 1.0)
+        points = params.get("points", [[-0.5, 0], [0.5, 0], [0, 0]])
+        if not self.oled_controller or not points:
+            return
+
+        step = max(0.0, float(duration)) / len(points)
+        keyframes = [{"time": 0.0, "value": getattr(self.oled_controller, "target_eye_position", (0, 0))}]
+        keyframes.extend({"time": (index + 1) * step, "value": point} for index, point in enumerate(points))
+        self.oled_controller.play_curve(KeyframeCurve("eye_position", keyframes, "smooth"))
+
+    def _action_eyes_growing_circle(self, params: Mapping[str, Any]) -> None:
+        """Büyüyen çember"""
+        duration = params.get("duration", 1.0)
+        if self.oled_controller:
+            self.oled_controller.show_eyes_growing_circle(duration)
+
+    def _action_mouth_clear(self, params: Mapping[str, Any]) -> None:
+        """Ağzı temizler"""
+        if self.oled_controller:
+            self.oled_controller.clear_mouth()
+
+    def _action_mouth_smile(self, params: Mapping[str, Any]) -> None:
+        """Gülümseme"""
+        emotion = params.get("emotion", "happy")
+        intensity = params.get("intensity", 0.7)
+        if self.oled_controller:
+            self.oled_controller.show_mouth_expression(emotion, intensity)
+
+    def _action_mouth_speak(self, params: Mapping[str, Any]) -> None:
+        """Konuşma animasyonu"""
+        duration = params.get("duration", 1.0)
+        pattern = params.get("pattern", "default")
+        if self.oled_controller:
+            self.oled_controller.animate_speaking(duration, pattern)
+
+    def _action_leds_off(self, params: Mapping[str, Any]) -> None:
+        """LED'leri kapatır"""
+        if self.led_controller:
+            self.led_controller.clear()
+
+    def _action_leds_pulse(self, params: Mapping[str, Any]) -> None:
+        """LED'leri yanıp söndürür"""
+        speed = params.get("speed", 50)
+        color = params.get("color", [0, 0, 255])  # Varsayılan mavi
+        if self.led_controller:
+            self.led_controller.animate(AnimationPattern.PULSE, tuple(color), speed)
+
+    def _action_leds_rainbow(self, params: Mapping[str, Any]) -> None:
+        """LED'lerde gökkuşağı efekti"""
+        speed = params.get("speed", 30)
+        if self.led_controller:
+            self.led_controller.animate(AnimationPattern.RAINBOW, speed=speed)
+
+    def _action_play_curve(self, params: Mapping[str, Any]) -> None:
+        """Sürekli izi ilgili kontrolcünün çizim döngüsünde başlatır"""
+        controller = self._get_curve_controller(params["track"])
+        if controller is not None:
+            controller.play_curve(params["curve"])
+
+    def _action_set_emotion(self, params: Mapping[str, Any]) -> None:
+        """Duygu durumunu ayarlar"""
+        emotion = params.get("emotion", "neutral")
+        intensity = params.get("intensity", 0.7)
+
+        if hasattr(sys.modules.get('__main__', None), 'face_plugin'):
+            face_plugin = sys.modules['__main__'].face_plugin
+            if face_plugin and hasattr(face_plugin, 'set_emotion'):
+                face_plugin.set_emotion(emotion, intensity)
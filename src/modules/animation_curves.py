@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_curves.py
+# Açıklama: Animasyonlardaki sürekli izler (göz pozisyonu, LED rengi, parlaklık, ağız açıklığı,
+#           duygu yoğunluğu) için anahtar kare eğrileri. Eğriler yükleme anında parçalı
+#           tablolara derlenir; çizim döngüleri her karede tek bir tablo araması ile değer okur.
+# Bağımlılıklar: bisect, math, threading, time
+# Bağlı Dosyalar: animation_timeline.py, oled_controller_base.py, led_controller_base.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Yumuşatma eğrili anahtar kare izleri ve çizim döngüleri için eğri oynatıcı eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Yumuşatma tablolarının örnek sayısı (0.0 - 1.0 aralığı bu kadar parçaya bölünür)
+EASING_TABLE_SIZE = 256
+
+CurveValue = Union[float, Tuple[float, ...]]
+
+
+def _ease_in_out(u: float) -> float:
+    return 4 * u ** 3 if u < 0.5 else 1 - 4 * (1 - u) ** 3
+
+
+def _bounce(u: float) -> float:
+    if u < 1 / 2.75:
+        return 7.5625 * u * u
+    if u < 2 / 2.75:
+        u -= 1.5 / 2.75
+        return 7.5625 * u * u + 0.75
+    if u < 2.5 / 2.75:
+        u -= 2.25 / 2.75
+        return 7.5625 * u * u + 0.9375
+    u -= 2.625 / 2.75
+    return 7.5625 * u * u + 0.984375
+
+
+def _elastic(u: float) -> float:
+    if u <= 0.0 or u >= 1.0:
+        return u
+    return 2 ** (-10 * u) * math.sin((u * 10 - 0.75) * (2 * math.pi / 3)) + 1
+
+
+# Yumuşatma adı -> u (0.0-1.0) -> ilerleme (0.0-1.0)
+EASING_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    "linear": lambda u: u,
+    "step": lambda u: 0.0,  # sonraki anahtar kareye kadar değeri tut
+    "ease_in": lambda u: u * u * u,
+    "ease_out": lambda u: 1 - (1 - u) ** 3,
+    "ease_in_out": _ease_in_out,
+    "smooth": lambda u: u * u * (3 - 2 * u),
+    "sine": lambda u: 0.5 - 0.5 * math.cos(math.pi * u),
+    "bounce": _bounce,
+    "elastic": _elastic,
+}
+
+# Dokümantasyondaki adlandırma (docs/animation_system.md) ile uyumluluk
+EASING_FUNCTIONS.update({
+    "easeIn": EASING_FUNCTIONS["ease_in"],
+    "easeOut": EASING_FUNCTIONS["ease_out"],
+    "easeInOut": EASING_FUNCTIONS["ease_in_out"],
+})
+
+# Her yumuşatma fonksiyonu bir kez örneklenir; son eleman u = 1.0 içindir
+EASING_TABLES: Dict[str, Tuple[float, ...]] = {
+    name: tuple(func(i / EASING_TABLE_SIZE) for i in range(EASING_TABLE_SIZE + 1))
+    for name, func in EASING_FUNCTIONS.items()
+}
+
+# İz adı -> (boyut, en küçük, en büyük değer)
+CURVE_TRACKS: Dict[str, Tuple[int, float, float]] = {
+    "eye_position": (2, -1.0, 1.0),
+    "led_color": (3, 0.0, 255.0),
+    "led_brightness": (1, 0.0, 1.0),
+    "mouth_openness": (1, 0.0, 1.0),
+    "emotion_intensity": (1, 0.0, 1.0),
+}
+
+# İz adı -> zamanlayıcı izi (öncelik ve öne geçme kuralları için)
+CURVE_COMPONENTS: Dict[str, str] = {
+    "eye_position": "eyes",
+    "mouth_openness": "mouth",
+    "emotion_intensity": "emotion",
+    "led_color": "leds",
+    "led_brightness": "leds",
+}
+
+
+class KeyframeCurve:
+    """
+    Derlenmiş anahtar kare eğrisi
+
+    Her parça için başlangıç değeri, değer farkı, 1 / süre ve yumuşatma tablosu
+    önceden hesaplanır. Bir anahtar karedeki "easing", o kareden bir sonrakine
+    geçişi belirler. Değerlendirme: ikili arama + tablo okuma + çarp-topla.
+    """
+
+    __slots__ = ("track", "times", "starts", "deltas", "inv_spans", "tables", "dims", "low", "high",
+                 "duration", "loop")
+
+    def __init__(self, track: str, keyframes: Sequence[Dict], easing: str = "linear", loop: bool = False):
+        """
+        Anahtar karelerden eğri derler
+
+        Args:
+            track (str): İz adı (CURVE_TRACKS anahtarlarından biri)
+            keyframes (Sequence[Dict]): {"time", "value", "easing"} anahtar kareleri
+            easing (str, optional): Anahtar karede belirtilmezse kullanılacak yumuşatma. Varsayılan: "linear"
+            loop (bool, optional): Eğri sonunda başa sarılsın mı. Varsayılan: False
+
+        Raises:
+            ValueError: İz bilinmiyorsa veya anahtar kare yoksa
+        """
+        if track not in CURVE_TRACKS:
+            raise ValueError(f"Bilinmeyen eğri izi: {track}")
+        dims, low, high = CURVE_TRACKS[track]
+
+        points = []
+        for keyframe in keyframes:
+            value = keyframe.get("value")
+            values = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+            if len(values) != dims:
+                raise ValueError(f"{track}: anahtar kare değeri {dims} boyutlu olmalı: {value}")
+            values = tuple(max(low, min(high, float(v))) for v in values)
+            points.append((max(0.0, float(keyframe.get("time", 0.0))), values,
+                           keyframe.get("easing", easing)))
+        if not points:
+            raise ValueError(f"{track}: anahtar kare yok")
+
+        # Aynı zamanlı anahtar karelerde dosyadaki sıra korunur
+        points.sort(key=lambda point: point[0])
+
+        self.track = track
+        self.dims = dims
+        self.low = low
+        self.high = high
+        self.loop = bool(loop)
+        self.times = tuple(point[0] for point in points)
+        self.starts = tuple(point[1] for point in points)
+        self.deltas = tuple(tuple(b - a for a, b in zip(points[i][1], points[i + 1][1]))
+                            for i in range(len(points) - 1)) + ((0.0,) * dims,)
+        self.inv_spans = tuple(1.0 / (points[i + 1][0] - points[i][0]) if points[i + 1][0] > points[i][0] else 0.0
+                               for i in range(len(points) - 1)) + (0.0,)
+        self.tables = tuple(EASING_TABLES.get(point[2], EASING_TABLES["linear"]) for point in points)
+        self.duration = self.times[-1]
+
+    def evaluate(self, t: float) -> CurveValue:
+        """
+        Eğrinin t anındaki değerini döndürür
+
+        Args:
+            t (float): Eğri başlangıcından beri geçen süre (saniye)
+
+        Returns:
+            CurveValue: Tek boyutlu izlerde float, diğerlerinde demet
+        """
+        times = self.times
+        if self.loop and t > self.duration > times[0]:
+            t = times[0] + (t - times[0]) % (self.duration - times[0])
+
+        if t <= times[0]:
+            index, progress = 0, 0.0
+        elif t >= self.duration:
+            index, progress = len(times) - 1, 0.0
+        else:
+            index = bisect.bisect_right(times, t) - 1
+            u = (t - times[index]) * self.inv_spans[index]
+            progress = self.tables[index][int(u * EASING_TABLE_SIZE)]
+
+        # bounce/elastic gibi yumuşatmalar hedefi aşabilir; iz aralığında tutulur
+        low, high = self.low, self.high
+        start = self.starts[index]
+        if self.dims == 1:
+            return max(low, min(high, start[0] + self.deltas[index][0] * progress))
+        return tuple(max(low, min(high, s + d * progress)) for s, d in zip(start, self.deltas[index]))
+
+
+def compile_curves(tracks: Dict) -> Dict[str, KeyframeCurve]:
+    """
+    Animasyon JSON'undaki "tracks" bölümünü eğrilere derler
+
+    Args:
+        tracks (Dict): İz adı -> {"keyframes": [...], "easing": str, "loop": bool}
+
+    Returns:
+        Dict[str, KeyframeCurve]: İz adı -> derlenmiş eğri
+
+    Raises:
+        ValueError: Bir iz geçersizse
+    """
+    curves = {}
+    for track, spec in tracks.items():
+        if isinstance(spec, list):
+            spec = {"keyframes": spec}
+        curves[track] = KeyframeCurve(track, spec.get("keyframes", []),
+                                      spec.get("easing", "linear"), spec.get("loop", False))
+    return curves
+
+
+class CurvePlayer:
+    """
+    Bir çizim döngüsünde etkin eğrileri tutan oynatıcı
+
+    Her iz için en fazla bir eğri çalışır; yeni eğri eskisinin yerini alır.
+    Döngüsüz eğriler bittiklerinde son değerleri bir kez daha döndürülüp kaldırılır.
+    """
+
+    def __init__(self):
+        """Boş oynatıcı oluşturur"""
+        self._curves: Dict[str, Tuple[KeyframeCurve, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Çalışan eğri varsa True"""
+        return bool(self._curves)
+
+    def is_active(self, track: str) -> bool:
+        """
+        İzde çalışan bir eğri olup olmadığını döndürür
+
+        Args:
+            track (str): İz adı
+
+        Returns:
+            bool: Eğri çalışıyorsa True
+        """
+        return track in self._curves
+
+    def play(self, curve: KeyframeCurve, start_time: Optional[float] = None) -> None:
+        """
+        Eğriyi kendi izinde başlatır
+
+        Args:
+            curve (KeyframeCurve): Derlenmiş eğri
+            start_time (Optional[float], optional): Monoton başlangıç zamanı. Varsayılan: şimdi
+        """
+        with self._lock:
+            self._curves[curve.track] = (curve, time.monotonic() if start_time is None else start_time)
+
+    def stop(self, track: str, curve: Optional[KeyframeCurve] = None) -> None:
+        """
+        İzdeki eğriyi durdurur
+
+        Args:
+            track (str): İz adı
+            curve (Optional[KeyframeCurve], optional): Verilirse yalnızca bu eğri çalışıyorsa durdurulur
+        """
+        with self._lock:
+            current = self._curves.get(track)
+            if current is not None and (curve is None or current[0] is curve):
+                del self._curves[track]
+
+    def clear(self) -> None:
+        """Tüm eğrileri durdurur"""
+        with self._lock:
+            self._curves.clear()
+
+    def evaluate(self, now: Optional[float] = None) -> Dict[str, CurveValue]:
+        """
+        Etkin eğrilerin şimdiki değerlerini döndürür
+
+        Args:
+            now (Optional[float], optional): Monoton zaman. Varsayılan: şimdi
+
+        Returns:
+            Dict[str, CurveValue]: İz adı -> değer
+        """
+        if not self._curves:
+            return {}
+        if now is None:
+            now = time.monotonic()
+
+        values = {}
+        with self._lock:
+            for track, (curve, start_time) in list(self._curves.items()):
+                elapsed = now - start_time
+                values[track] = curve.evaluate(elapsed)
+                if not curve.loop and elapsed >= curve.duration:
+                    del self._curves[track]
+        return values
+
+    def describe(self) -> List[Dict]:
+        """
+        Etkin eğrilerin bilgisini döndürür
+
+        Returns:
+            List[Dict]: İz bilgileri
+        """
+        with self._lock:
+            return [{"track": track, "duration": curve.duration, "loop": curve.loop,
+                     "keyframes": len(curve.times)}
+                    for track, (curve, _) in self._curves.items()]
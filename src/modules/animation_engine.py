@@ -5,10 +5,22 @@
 # Dosya: animation_engine.py
 # Açıklama: Animasyon sekanslarını yöneten ve çalıştıran modül
 # Bağımlılıklar: json, threading, logging, time
-# Bağlı Dosyalar: oled_controller.py, led_controller.py
+# Bağlı Dosyalar: oled_controller.py, led_controller.py, animation_actions.py, animation_renderer.py
 
-# Versiyon: 0.3.3
+# Versiyon: 0.3.10
 # Değişiklikler:
+# - [0.3.10] Zaman çizelgesi derlenirken eylem hedefleri kontrolcülerde doğrulanıyor
+# - [0.3.9] Kullanılmayan typing içe aktarmaları ve yer tutucusuz f-string temizlendi
+# - [0.3.8] Eylem fonksiyonları AnimationActionsMixin'e taşındı (önizleme çizicisiyle ortak);
+#           animasyonları çevrimdışı kare paketine çizen render_preview eklendi
+# - [0.3.7] Animasyonlar başlangıçta tam yüklenmiyor: listeleme/bilgi diskteki hafif dizinden,
+#           tam sekans ilk oynatmada okunuyor; dizinler izleniyor, derlenmiş çizelge önbelleği sınırlı
+# - [0.3.6] Sürekli anahtar kare izleri (göz pozisyonu, LED rengi/parlaklığı, ağız açıklığı,
+#           duygu yoğunluğu) kontrolcülerin çizim döngülerine devrediliyor
+# - [0.3.5] Animasyon başına iş parçacığı yerine tek zamanlayıcı yığını; izler (göz, ağız, LED,
+#           duygu) öncelik ve öne geçme ile paylaşılıyor, eylemler tam zamanında uyandırılıyor
+# - [0.3.4] Animasyonlar yükleme/kaydetme anında değişmez zaman çizelgelerine derleniyor;
+#           çizelgeler dosya başına önbellekleniyor ve mtime değişince yeniden derleniyor
 # - [0.3.3] Animasyon motoru ve JSON formatı desteği eklendi
 #
 # Yazar: GitHub Copilot
@@ -21,17 +33,23 @@ import json
 import time
 import logging
 import threading
-from typing import Dict, List, Tuple, Optional, Union, Any, Callable
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Union
 from pathlib import Path
 
 # Proje dizinini Python yoluna ekle
 PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.append(str(PROJECT_DIR))
 
+from src.modules.animation_timeline import AnimationTimeline, compile_timeline
+from src.modules.animation_library import AnimationLibrary, validate_animation
+from src.modules.animation_scheduler import AnimationScheduler, Playback, PRIORITY_NORMAL, PRIORITY_HIGH
+from src.modules.animation_actions import AnimationActionsMixin
+
 # Logger yapılandırması
 logger = logging.getLogger("AnimationEngine")
 
-class AnimationEngine:
+class AnimationEngine(AnimationActionsMixin):
     """
     Animasyon sekanslarını yöneten ve oynatmaya yarayan motor sınıfı
     """
@@ -57,36 +75,28 @@ class AnimationEngine:
         # Animasyon çalıştırma değişkenleri
         self.current_animation = None
         self.animation_running = False
-        self.animation_thread = None
-        self.stop_animation = threading.Event()
         self.is_running = False
         
-        # Kullanılabilir animasyonların listesi
-        self.animations = {}
-        
-        # Animasyon eylemlerinin işlevi haritası
-        self.eye_actions = {
-            "clear": self._action_eyes_clear,
-            "growing_circle": self._action_eyes_growing_circle,
-            "blink": self._action_eyes_blink,
-            "look_around": self._action_eyes_look_around,
-        }
+        # Tüm animasyonlar tek bir zamanlayıcı iş parçacığında oynatılır
+        self.scheduler = AnimationScheduler()
+        self._current_playback: Optional[Playback] = None
+        self._transition_playback: Optional[Playback] = None
         
-        self.mouth_actions = {
-            "clear": self._action_mouth_clear,
-            "smile": self._action_mouth_smile,
-            "speak": self._action_mouth_speak,
-        }
+        # Kullanılabilir animasyonların hafif dizini (meta veri, süre, etiketler, mtime, boyut)
+        animation_config = config.get("animation", {})
+        self.library = AnimationLibrary(
+            [("standard", self.standard_dir), ("custom", self.custom_dir)],
+            os.path.join(self.animation_dir, ".animation_index.json")
+        )
+        self.library_poll_interval = float(animation_config.get("library_poll_interval", 2.0))
         
-        self.led_actions = {
-            "off": self._action_leds_off,
-            "pulse": self._action_leds_pulse,
-            "rainbow": self._action_leds_rainbow,
-        }
+        # Dosya yolu -> (mtime_ns, derlenmiş çizelge); en son kullanılanlar tutulur
+        self._timeline_cache: "OrderedDict[str, Tuple[int, AnimationTimeline]]" = OrderedDict()
+        self.timeline_cache_size = max(1, int(animation_config.get("timeline_cache_size", 32)))
+        self._lock = threading.RLock()
         
-        self.emotion_actions = {
-            "set_emotion": self._action_set_emotion,
-        }
+        # Animasyon eylemlerinin işlevi haritası
+        self._init_actions()
         
         # Animasyonları yükle
         self.load_animations()
@@ -101,9 +111,9 @@ class AnimationEngine:
         try:
             logger.info("Animasyon motoru başlatılıyor...")
             
-            # Animasyonları yüklediğimizden emin olalım
-            if not self.animations:
-                self.load_animations()
+            # Dizini güncelle ve değişiklikler için animasyon dizinlerini izle
+            self.load_animations()
+            self.library.start_watching(self.library_poll_interval, self._on_library_changed)
             
             # Kontrolcüleri ayarla
             from src.face_plugin import FacePlugin
@@ -119,8 +129,9 @@ class AnimationEngine:
                 if self.led_controller is None and hasattr(face_plugin, 'led_controller'):
                     self.led_controller = face_plugin.led_controller
             
+            self.scheduler.start()
             self.is_running = True
-            logger.info(f"Animasyon motoru başlatıldı. Yüklü animasyon sayısı: {len(self.animations)}")
+            logger.info(f"Animasyon motoru başlatıldı. Yüklü animasyon sayısı: {len(self.library)}")
             return True
             
         except Exception as e:
@@ -134,8 +145,10 @@ class AnimationEngine:
         try:
             logger.info("Animasyon motoru durduruluyor...")
             
-            # Çalışan animasyonu durdur
+            # Çalışan animasyonları, zamanlayıcıyı ve dizin izlemeyi durdur
             self.stop_current_animation()
+            self.scheduler.stop()
+            self.library.stop_watching()
             
             # Motoru durdur
             self.is_running = False
@@ -216,7 +229,7 @@ class AnimationEngine:
             startup_animations = ["startup", "boot", "welcome"]
             
             for anim_name in startup_animations:
-                if anim_name in self.animations:
+                if anim_name in self.library:
                     logger.info(f"Başlangıç animasyonu oynatılıyor: {anim_name}")
                     return self.play_animation(anim_name)
             
@@ -281,23 +294,20 @@ class AnimationEngine:
                     
                     # Dönüm noktalarında özel LED efektleri
                     if progress_point in [0.25, 0.5, 0.75]:
-                        threading.Thread(
-                            target=self._transition_led_effect,
-                            args=(source_state, target_state, eased_progress),
-                            daemon=True
-                        ).start()
+                        self.scheduler.call_later(0.0, self._transition_led_effect,
+                                                  source_state, target_state, eased_progress)
             
             # Geçiş için özel bir animasyon bul ve oynat
             transition_animation = f"{source_state}_to_{target_state}"
             fallback_animation = "emotion_transition"
             
             # İleri seviye kullanım: Eğer tam geçiş animasyonu varsa, oynat
-            if progress == 0.5 and transition_animation in self.animations:
+            if progress == 0.5 and transition_animation in self.library:
                 # Direkt animasyonu çağırmak yerine geçiş bilgisini ilet (recursive çağrıyı önle)
                 return self._play_transition_animation(transition_animation, source_state, target_state, intensity)
             
             # Veya varsayılan geçiş animasyonu kullan (emotion_transition.json)
-            elif progress == 0.5 and fallback_animation in self.animations:
+            elif progress == 0.5 and fallback_animation in self.library:
                 return self._play_transition_animation(fallback_animation, source_state, target_state, intensity)
                 
             # OLED kontrolcü ile duygu ifadelerini güncelle
@@ -383,52 +393,43 @@ class AnimationEngine:
         """
         try:
             # Çalışan bir geçiş animasyonu var mı kontrol et
-            if hasattr(self, '_transition_animation_running') and self._transition_animation_running:
+            if self._transition_playback is not None:
                 # İki geçiş animasyonunu üst üste bindirmek istemiyoruz
-                logger.debug(f"Zaten bir geçiş animasyonu çalışıyor, yeni istek iptal edildi")
+                logger.debug("Zaten bir geçiş animasyonu çalışıyor, yeni istek iptal edildi")
                 return False
             
-            # Bu geçiş için özel olarak düzenlenecek animasyon verilerini kopyala
-            animation_data = self.animations[animation_name].copy()
-            
-            # Animasyon meta verilerini geçişe göre güncelle
-            animation_data["metadata"] = animation_data.get("metadata", {}).copy()
-            animation_data["metadata"]["source_state"] = source_state
-            animation_data["metadata"]["target_state"] = target_state
-            animation_data["metadata"]["intensity"] = intensity
+            # Derlenmiş çizelge paylaşılır; geçiş için veri kopyalanmaz
+            timeline = self._get_timeline(animation_name)
+            if timeline is None:
+                return False
             
-            # Geçiş durumunu işaretle
-            self._transition_animation_running = True
+            logger.debug(f"Geçiş animasyonu: {animation_name} ({source_state} -> {target_state}, yoğunluk: {intensity})")
             
-            # Animasyonu yeni bir thread'de çalıştır
-            threading.Thread(
-                target=self._run_transition_animation,
-                args=(animation_data,),
-                daemon=True
-            ).start()
+            # Geçişler yüksek öncelikle oynatılır ve kullandıkları izleri devralır
+            with self._lock:
+                self._transition_playback = self.scheduler.play(
+                    timeline, PRIORITY_HIGH, self._on_transition_finished)
             
-            return True
+            return self._transition_playback is not None
             
         except Exception as e:
             logger.error(f"Geçiş animasyonu başlatılırken hata: {e}")
-            self._transition_animation_running = False
+            self._transition_playback = None
             return False
     
-    def _run_transition_animation(self, animation_data: Dict) -> None:
+    def _on_transition_finished(self, playback: Playback) -> None:
         """
-        Geçiş animasyonunu çalıştırır ve tamamlandığında temizlik yapar
+        Geçiş animasyonu bittiğinde veya kesildiğinde geçiş durumunu temizler
         
         Args:
-            animation_data (Dict): Animasyon verileri
+            playback (Playback): Biten oynatma
         """
-        try:
-            # Animasyonu normal şekilde çalıştır (mevcut metodu kullan)
-            self._run_animation(animation_data)
-        except Exception as e:
-            logger.error(f"Geçiş animasyonu çalıştırılırken hata: {e}")
-        finally:
-            # Geçiş durumunu temizle
-            self._transition_animation_running = False
+        with self._lock:
+            if self._transition_playback is playback:
+                self._transition_playback = None
+        
+        if playback.cancelled:
+            self._stop_timeline_curves(playback.timeline)
     
     def _update_emotion_blend(self, source_state: str, target_state: str, progress: float, intensity: float) -> None:
         """
@@ -511,52 +512,113 @@ class AnimationEngine:
     
     def load_animations(self) -> None:
         """
-        Tüm animasyon dosyalarını yükler
+        Animasyon dizinini günceller
+        
+        Dosyalar tam olarak yüklenmez; yalnızca dizinde olmayan veya mtime/boyutu
+        değişen dosyalar ayrıştırılır ve meta verileri dizine yazılır.
         """
         logger.info("Animasyonlar yükleniyor...")
         
-        # Öncelikle standart animasyonlar
-        self._load_animations_from_dir(self.standard_dir)
+        parsed_before = self.library.parse_count
+        self.library.refresh()
         
-        # Sonra özel animasyonlar (aynı isimli olanlar standart olanları geçersiz kılar)
-        self._load_animations_from_dir(self.custom_dir)
+        logger.info(f"Toplam {len(self.library)} animasyon bulundu "
+                    f"({self.library.parse_count - parsed_before} dosya ayrıştırıldı)")
+    
+    def _on_library_changed(self, names) -> None:
+        """
+        Dizin izleyicisi değişiklik bulduğunda derlenmiş çizelgeleri geçersiz kılar
         
-        logger.info(f"Toplam {len(self.animations)} animasyon yüklendi")
+        Args:
+            names (Set[str]): Eklenen, değişen veya silinen animasyon adları
+        """
+        with self._lock:
+            for path in [path for path in self._timeline_cache
+                         if os.path.splitext(os.path.basename(path))[0] in names]:
+                del self._timeline_cache[path]
     
-    def _load_animations_from_dir(self, directory: str) -> None:
+    def _load_animation_file(self, name: str, filepath: str) -> Optional[AnimationTimeline]:
         """
-        Belirtilen dizindeki tüm JSON animasyonlarını yükler
+        Tek bir animasyon dosyasını okur, doğrular ve zaman çizelgesine derler
         
         Args:
-            directory (str): Animasyonların bulunduğu dizin
+            name (str): Animasyon adı
+            filepath (str): JSON dosya yolu
+            
+        Returns:
+            Optional[AnimationTimeline]: Derlenmiş çizelge veya hata durumunda None
         """
-        if not os.path.exists(directory):
-            logger.warning(f"Dizin bulunamadı: {directory}")
-            return
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+            animation_data = self.library.read_file(filepath)
+            if animation_data is None:
+                return None
             
-        for filename in os.listdir(directory):
-            if not filename.endswith(".json"):
-                continue
-                
-            filepath = os.path.join(directory, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    animation_data = json.load(f)
-                
-                # Animasyon adını dosya adından al (uzantısız)
-                anim_name = os.path.splitext(filename)[0]
-                
-                # Animasyon verilerini doğrula
-                if not self._validate_animation(animation_data):
-                    logger.error(f"Geçersiz animasyon formatı: {filepath}")
-                    continue
-                
-                # Animasyonu koleksiyona ekle
-                self.animations[anim_name] = animation_data
-                logger.debug(f"Animasyon yüklendi: {anim_name}")
-                
-            except Exception as e:
-                logger.error(f"Animasyon dosyası yüklenirken hata: {filepath} - {e}")
+            timeline = compile_timeline(name, animation_data, self.action_dispatch,
+                                        self._unresolved_action_target)
+            self._cache_timeline(filepath, mtime, timeline)
+            
+            logger.debug(f"Animasyon yüklendi: {name} ({len(timeline.actions)} eylem)")
+            return timeline
+            
+        except Exception as e:
+            logger.error(f"Animasyon dosyası yüklenirken hata: {filepath} - {e}")
+            return None
+    
+    def _cache_timeline(self, filepath: str, mtime: int, timeline: AnimationTimeline) -> None:
+        """
+        Derlenmiş çizelgeyi önbelleğe ekler; sınır aşılırsa en eski kullanılanı çıkarır
+        
+        Args:
+            filepath (str): Kaynak dosya yolu
+            mtime (int): Kaynak dosyanın mtime_ns değeri
+            timeline (AnimationTimeline): Derlenmiş çizelge
+        """
+        with self._lock:
+            self._timeline_cache[filepath] = (mtime, timeline)
+            self._timeline_cache.move_to_end(filepath)
+            while len(self._timeline_cache) > self.timeline_cache_size:
+                self._timeline_cache.popitem(last=False)
+    
+    def _get_timeline(self, name: str) -> Optional[AnimationTimeline]:
+        """
+        Animasyonun derlenmiş zaman çizelgesini döndürür
+        
+        Tam sekans ilk oynatmada okunup derlenir. Kaynak dosyanın mtime değeri
+        önbellektekinden farklıysa dosya yeniden okunur; aksi halde önbellekteki
+        çizelge kullanılır.
+        
+        Args:
+            name (str): Animasyon adı
+            
+        Returns:
+            Optional[AnimationTimeline]: Zaman çizelgesi veya bulunamazsa None
+        """
+        entry = self.library.get(name)
+        if entry is None:
+            return None
+        filepath = entry.path
+        
+        with self._lock:
+            cached = self._timeline_cache.get(filepath)
+            if cached is not None:
+                self._timeline_cache.move_to_end(filepath)
+        
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if cached is not None and (mtime is None or cached[0] == mtime):
+            return cached[1]
+        
+        if mtime is not None:
+            timeline = self._load_animation_file(name, filepath)
+            if timeline is not None:
+                return timeline
+        
+        # Bozuk düzenlemede son geçerli çizelge ile devam et
+        return cached[1] if cached is not None else None
     
     def _validate_animation(self, animation_data: Dict) -> bool:
         """
@@ -568,33 +630,20 @@ class AnimationEngine:
         Returns:
             bool: Doğrulama başarılı ise True
         """
-        # Temel animasyon yapısını kontrol et
-        if not isinstance(animation_data, dict):
-            return False
-        
-        # Metadata alanını kontrol et
-        if "metadata" not in animation_data or not isinstance(animation_data["metadata"], dict):
-            return False
-        
-        # Adım sırasını kontrol et
-        if "sequence" not in animation_data or not isinstance(animation_data["sequence"], list):
-            return False
-        
-        # Tüm değil, ama basit kontroller yeterlidir
-        return True
+        return validate_animation(animation_data)
     
     def get_animation_names(self) -> List[str]:
         """
-        Mevcut animasyon adlarını döndürür
+        Mevcut animasyon adlarını döndürür (dizinden, dosya okunmadan)
         
         Returns:
             List[str]: Animasyon adları listesi
         """
-        return list(self.animations.keys())
+        return self.library.names()
     
     def get_animation_info(self, name: str) -> Optional[Dict]:
         """
-        Animasyon meta bilgilerini döndürür
+        Animasyon meta bilgilerini döndürür (dizinden, dosya okunmadan)
         
         Args:
             name (str): Animasyon adı
@@ -602,17 +651,28 @@ class AnimationEngine:
         Returns:
             Optional[Dict]: Animasyon bilgileri veya bulunamazsa None
         """
-        if name not in self.animations:
+        entry = self.library.get(name)
+        if entry is None:
             return None
         
-        animation_data = self.animations[name]
+        # Metadata bilgilerinden bir kopya döndür; süre ve etiketler her zaman bulunur
+        info = dict(entry.metadata)
+        info["duration"] = entry.duration
+        info["tags"] = list(entry.tags)
+        return info
+    
+    def get_animation_index(self) -> List[Dict]:
+        """
+        Tüm animasyonların özet bilgilerini döndürür (dashboard listesi için)
         
-        # Metadata bilgilerinden bir kopya döndür
-        return animation_data.get("metadata", {})
+        Returns:
+            List[Dict]: Ad, görünen ad, açıklama, süre, etiketler, kaynak, boyut ve mtime
+        """
+        return [entry.to_info() for entry in self.library.entries()]
     
     def get_animation_details(self, name: str) -> Optional[Dict]:
         """
-        Animasyon detaylarını döndürür (tam içerik)
+        Animasyon detaylarını döndürür (tam içerik diskten okunur)
         
         Args:
             name (str): Animasyon adı
@@ -620,10 +680,7 @@ class AnimationEngine:
         Returns:
             Optional[Dict]: Animasyon detayları veya bulunamazsa None
         """
-        if name not in self.animations:
-            return None
-        
-        return self.animations[name]
+        return self.library.load(name)
     
     def save_animation(self, name: str, animation_data: Dict) -> bool:
         """
@@ -658,8 +715,11 @@ class AnimationEngine:
             with open(filepath, 'w') as f:
                 json.dump(animation_data, f, indent=2)
             
-            # Animasyonu koleksiyona ekle veya güncelle
-            self.animations[name] = animation_data
+            # Dizini güncelle ve kaydedilen hali derle
+            self.library.update_file(filepath)
+            timeline = compile_timeline(name, animation_data, self.action_dispatch,
+                                        self._unresolved_action_target)
+            self._cache_timeline(filepath, os.stat(filepath).st_mtime_ns, timeline)
             
             logger.info(f"Animasyon kaydedildi: {filepath}")
             return True
@@ -694,9 +754,10 @@ class AnimationEngine:
             # Dosyayı sil
             os.remove(custom_filepath)
             
-            # Animasyonu koleksiyondan kaldır
-            if name in self.animations:
-                del self.animations[name]
+            # Animasyonu dizinden ve önbellekten kaldır
+            self.library.remove_file(custom_filepath)
+            with self._lock:
+                self._timeline_cache.pop(custom_filepath, None)
             
             logger.info(f"Animasyon silindi: {name}")
             return True
@@ -705,295 +766,134 @@ class AnimationEngine:
             logger.error(f"Animasyon silinirken hata: {name} - {e}")
             return False
     
-    def play_animation(self, name: str) -> bool:
+    def play_animation(self, name: str, priority: int = PRIORITY_NORMAL) -> bool:
         """
         Belirtilen animasyonu oynatır
         
+        Animasyon, kullandığı izlerde (göz, ağız, LED, duygu) eşit veya daha düşük
+        öncelikli oynatmaların yerini alır; diğer izlerdeki animasyonlar sürer.
+        
         Args:
             name (str): Oynatılacak animasyon adı
+            priority (int, optional): Öncelik. Varsayılan: PRIORITY_NORMAL
             
         Returns:
             bool: Başarılı ise True
         """
-        if name not in self.animations:
+        if name not in self.library:
             logger.warning(f"Animasyon bulunamadı: {name}")
             return False
         
-        # Zaten çalışan bir animasyon varsa durdur
-        self.stop_current_animation()
-        
         try:
-            # Animasyon verilerini al
-            animation_data = self.animations[name]
-            
-            # Mevcut animasyonu ayarla
-            self.current_animation = name
-            
-            # Animasyon iş parçacığını başlat
-            self.animation_thread = threading.Thread(target=self._run_animation, args=(animation_data,))
-            self.animation_thread.daemon = True
-            self.animation_thread.start()
+            # Derlenmiş zaman çizelgesini al (dosya değiştiyse yeniden derlenir)
+            timeline = self._get_timeline(name)
+            if timeline is None:
+                logger.error(f"Animasyon derlenemedi: {name}")
+                return False
             
-            self.animation_running = True
+            with self._lock:
+                playback = self.scheduler.play(timeline, priority, self._on_playback_finished)
+                if playback is None:
+                    logger.warning(f"Animasyonda oynatılacak eylem yok: {name}")
+                    return False
+                
+                # Mevcut animasyonu ayarla
+                self._current_playback = playback
+                self.current_animation = name
+                self.animation_start_time = time.time()
+                self.animation_running = True
             
             logger.info(f"Animasyon oynatılıyor: {name}")
             return True
             
         except Exception as e:
             logger.error(f"Animasyon oynatılırken hata: {name} - {e}")
-            self.animation_running = False
-            self.current_animation = None
             return False
     
-    def stop_current_animation(self) -> None:
+    def _on_playback_finished(self, playback: Playback) -> None:
         """
-        Çalışan animasyonu durdurur
-        """
-        if not self.animation_running:
-            return
+        Oynatma bittiğinde veya kesildiğinde mevcut animasyon durumunu günceller
         
-        # Durdurma sinyali gönder
-        self.stop_animation.set()
+        Args:
+            playback (Playback): Biten oynatma
+        """
+        with self._lock:
+            if self._current_playback is playback:
+                self._current_playback = None
+                self.animation_running = False
+                self.current_animation = None
         
-        # İş parçacığının tamamlanmasını bekle
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.animation_thread.join(timeout=1.0)
+        # Kesilen animasyonun eğrileri çizim döngülerinde kalmasın
+        if playback.cancelled:
+            self._stop_timeline_curves(playback.timeline)
+    
+    def stop_current_animation(self) -> None:
+        """
+        Çalışan tüm animasyonları ve sürekli izlerini durdurur
+        """
+        for controller in (self.oled_controller, self.led_controller):
+            if controller is not None and hasattr(controller, "stop_curve"):
+                controller.stop_curve()
         
-        self.animation_running = False
-        self.current_animation = None
-        self.stop_animation.clear()
+        if not self.scheduler.playbacks:
+            return
         
+        self.scheduler.cancel_all()
         logger.info("Animasyon durduruldu")
     
-    def _run_animation(self, animation_data: Dict) -> None:
+    def _stop_timeline_curves(self, timeline: AnimationTimeline) -> None:
         """
-        Animasyon sekansını çalıştırır
+        Zaman çizelgesinin hâlâ çalışan eğrilerini durdurur (yerine başka eğri geçtiyse dokunmaz)
         
         Args:
-            animation_data (Dict): Animasyon verileri
+            timeline (AnimationTimeline): Zaman çizelgesi
         """
-        if not animation_data or "sequence" not in animation_data:
-            logger.error("Geçersiz animasyon verileri")
-            return
-        
-        sequence = animation_data["sequence"]
-        
-        try:
-            # Adımları zamana göre sırala ve sadece bir kez sırala
-            sorted_steps = sorted(sequence, key=lambda x: x.get("time", 0))
-            
-            # Animasyon başlangıç zamanını kaydet
-            self.animation_start_time = time.time()
-            start_time = self.animation_start_time
-            
-            # Adımları önceden işlenecek gruplara ayır - performans optimizasyonu
-            max_time = 0
-            if sorted_steps:
-                max_time = sorted_steps[-1].get("time", 0)
-            
-            # Her adım için, zaman gelince eylemleri gerçekleştir
-            step_index = 0
-            step_count = len(sorted_steps)
-            
-            while step_index < step_count:
-                # Durdurma sinyali kontrol et
-                if self.stop_animation.is_set():
-                    break
-                
-                current_time = time.time() - start_time
-                
-                # Şu anki zamanda çalıştırılması gereken tüm adımları bul ve çalıştır
-                steps_to_execute = []
-                
-                # Mevcut zamanda yürütülmesi gereken adımları topla
-                while step_index < step_count:
-                    step = sorted_steps[step_index]
-                    step_time = step.get("time", 0)
-                    
-                    if step_time <= current_time:
-                        steps_to_execute.append(step)
-                        step_index += 1
-                    else:
-                        break
-                
-                # Toplanmış adımları yürüt
-                for step in steps_to_execute:
-                    self._execute_step(step)
-                
-                # Adımlar arasında CPU'yu rahatlatmak için kısa bir bekleme
-                if not steps_to_execute and step_index < step_count:
-                    next_step = sorted_steps[step_index]
-                    next_time = next_step.get("time", 0)
-                    wait_time = max(0.001, min(next_time - current_time, 0.05))  # En fazla 50ms bekle
-                    
-                    if self.stop_animation.wait(timeout=wait_time):
-                        break
-                
-                # Animasyon süresi doldu mu kontrol et
-                if max_time > 0 and current_time > max_time + 0.5:  # 0.5 saniye tolerans
-                    break
-            
-        except Exception as e:
-            logger.error(f"Animasyon çalıştırılırken hata: {e}")
-        finally:
-            # Animasyonu temizle
-            self.animation_running = False
-            self.current_animation = None
+        for track, curve in timeline.curves.items():
+            controller = self._get_curve_controller(track)
+            if controller is not None:
+                controller.stop_curve(track, curve)
     
-    def _execute_step(self, step: Dict) -> None:
+    def render_preview(self, animation: Union[str, Dict], fps: Optional[float] = None):
         """
-        Animasyon adımını yürütür
+        Animasyonu canlı yüzün teması ve önbellekleriyle çevrimdışı olarak kare paketine çizer
+        
+        Canlı kontrolcülere dokunulmaz; çizim ayrı, headless kontrolcülerde sanal saatle
+        yapılır ve aynı girdiler için aynı paketi üretir.
         
         Args:
-            step (Dict): Animasyon adımı
+            animation (Union[str, Dict]): Animasyon adı veya animasyon verileri
+            fps (Optional[float], optional): Kare hızı. Varsayılan: animation.preview_fps
+            
+        Returns:
+            Optional[FramePack]: Kare paketi, animasyon bulunamaz veya geçersizse None
         """
-        try:
-            # Performans optimizasyonu: Eylemleri önbelleğe alarak tekrar tekrar getattr çağırmayı engelle
-            if not hasattr(self, '_action_cache'):
-                # Eylem fonksiyonlarını bir kere önbelleğe al
-                self._action_cache = {}
-            
-            # Eylemi önbellekten al veya önbelleğe ekle
-            def get_action_func(component, action):
-                cache_key = f"{component}_{action}"
-                if cache_key not in self._action_cache:
-                    action_name = f"_action_{component}_{action}"
-                    if hasattr(self, action_name):
-                        self._action_cache[cache_key] = getattr(self, action_name)
-                    else:
-                        logger.warning(f"Eylem bulunamadı: {action_name}")
-                        self._action_cache[cache_key] = None
-                return self._action_cache[cache_key]
-            
-            # Performans optimizasyonu: Animasyon adımlarını önceliğe göre sırala 
-            # (Ses olayları önce, görsel efektler sonra)
-            all_actions = []
-            
-            # Öncelik 1 - Ses ve duygu ayarları
-            if "sound" in step:
-                all_actions.append(("sound", step["sound"]))
-            if "emotion" in step:
-                all_actions.append(("emotion", step["emotion"]))
-            
-            # Öncelik 2 - LED efektleri
-            if "leds" in step:
-                all_actions.append(("leds", step["leds"]))
-            
-            # Öncelik 3 - Ekran efektleri
-            if "eyes" in step:
-                all_actions.append(("eyes", step["eyes"]))
-            if "mouth" in step:
-                all_actions.append(("mouth", step["mouth"]))
-            
-            # Performans optimizasyonu: Hafıza kullanımını azaltmak için
-            # eylemleri tek seferde işle
-            for component, action_data in all_actions:
-                if not action_data.get("action"):
-                    continue
-                
-                action_name = action_data.get("action", "")
-                params = action_data.get("params", {})
-                
-                # Bellek optimizasyonu: Büyük parametreleri kontrol et
-                if params and isinstance(params, dict):
-                    # Büyük veri yapılarını optimize et (örn. büyük listeler)
-                    for key, value in params.items():
-                        # Eğer liste uzunsa ve azaltılabilirse
-                        if isinstance(value, list) and len(value) > 100:
-                            # Örnek: Çok fazla nokta içeren koordinat listeleri 
-                            # gibi büyük listeleri örnekleyerek küçült
-                            params[key] = value[::2]  # Her ikinci değeri al
-                
-                # Eylem fonksiyonunu al
-                action_func = get_action_func(component, action_name)
-                
-                # Eylemi yürüt
-                if action_func:
-                    # Performans takibi
-                    action_start = time.perf_counter()
-                    action_func(params)
-                    action_time = time.perf_counter() - action_start
-                    
-                    # Performans uyarısı - yavaş eylemler için log
-                    if action_time > 0.1:  # 100ms'den uzun süren eylemler
-                        logger.debug(f"Performans uyarısı: {component}_{action_name} eylemi {action_time:.3f} sn sürdü")
-                        
-        except Exception as e:
-            logger.error(f"Adım yürütülürken hata: {e}")
-            logger.error(f"Adım verisi: {step}")
-    
-    # Eylem fonksiyonları
-    def _action_eyes_clear(self, params: Dict) -> None:
-        """Gözleri temizler"""
-        if self.oled_controller:
-            self.oled_controller.clear_eyes()
-    
-    def _action_eyes_blink(self, params: Dict) -> None:
-        """Göz kırpma"""
-        duration = params.get("duration", 0.2)
-        if self.oled_controller:
-            self.oled_controller.blink(duration)
-    
-    def _action_eyes_look_around(self, params: Dict) -> None:
-        """Etrafı izleme"""
-        duration = params.get("duration", 1.0)
-        points = params.get("points", [[-0.5, 0], [0.5, 0], [0, 0]])
-        if self.oled_controller:
-            self.oled_controller.look_at_points(points, duration)
-    
-    def _action_eyes_growing_circle(self, params: Dict) -> None:
-        """Büyüyen çember"""
-        duration = params.get("duration", 1.0)
-        if self.oled_controller:
-            self.oled_controller.show_growing_circle(duration)
-    
-    def _action_mouth_clear(self, params: Dict) -> None:
-        """Ağzı temizler"""
-        if self.oled_controller:
-            self.oled_controller.clear_mouth()
-    
-    def _action_mouth_smile(self, params: Dict) -> None:
-        """Gülümseme"""
-        emotion = params.get("emotion", "happy")
-        intensity = params.get("intensity", 0.7)
-        if self.oled_controller:
-            self.oled_controller.set_mouth_expression(emotion, intensity)
-    
-    def _action_mouth_speak(self, params: Dict) -> None:
-        """Konuşma animasyonu"""
-        duration = params.get("duration", 1.0)
-        pattern = params.get("pattern", "default")
-        if self.oled_controller:
-            self.oled_controller.animate_speaking(duration, pattern)
-    
-    def _action_leds_off(self, params: Dict) -> None:
-        """LED'leri kapatır"""
-        if self.led_controller:
-            self.led_controller.clear()
-    
-    def _action_leds_pulse(self, params: Dict) -> None:
-        """LED'leri yanıp söndürür"""
-        speed = params.get("speed", 50)
-        color = params.get("color", [0, 0, 255])  # Varsayılan mavi
-        if self.led_controller:
-            self.led_controller.pulse(color, speed)
-    
-    def _action_leds_rainbow(self, params: Dict) -> None:
-        """LED'lerde gökkuşağı efekti"""
-        speed = params.get("speed", 30)
-        if self.led_controller:
-            self.led_controller.rainbow(speed)
-    
-    def _action_set_emotion(self, params: Dict) -> None:
-        """Duygu durumunu ayarlar"""
-        emotion = params.get("emotion", "neutral")
-        intensity = params.get("intensity", 0.7)
-        transition = params.get("transition", 0.5)
+        # Çizici yalnızca önizleme istendiğinde yüklenir (PIL/numpy canlı motor için gerekmez)
+        from src.modules.animation_renderer import AnimationRenderer
         
-        if hasattr(sys.modules.get('__main__', None), 'face_plugin'):
-            face_plugin = sys.modules['__main__'].face_plugin
-            if face_plugin and hasattr(face_plugin, 'set_emotion'):
-                face_plugin.set_emotion(emotion, intensity, transition)
+        if isinstance(animation, str):
+            name = animation
+            animation_data = self.library.load(name)
+            if animation_data is None:
+                logger.error(f"Önizleme için animasyon bulunamadı: {name}")
+                return None
+        else:
+            animation_data = animation
+            name = animation_data.get("metadata", {}).get("name", "preview")
+        
+        oled = self.oled_controller
+        try:
+            renderer = AnimationRenderer(
+                self.config,
+                theme_name=getattr(oled, "theme_name", None),
+                geometry=getattr(oled, "geometry", None),
+                sprite_cache=getattr(oled, "sprite_cache", None),
+                morph_cache=getattr(oled, "morph_cache", None),
+                fps=fps,
+            )
+            return renderer.render(animation_data, name)
+        except ValueError as e:
+            logger.error(f"Önizleme çizilemedi: {name} - {e}")
+            return None
     
     def get_animation_status(self) -> Dict:
         """
@@ -1005,13 +905,14 @@ class AnimationEngine:
         status = {
             "playing": self.animation_running,
             "current_animation": self.current_animation,
-            "progress": 0.0
+            "progress": 0.0,
+            "scheduler": self.scheduler.get_stats()
         }
         
         # İlerleme bilgisini hesapla
-        if self.animation_running and self.current_animation in self.animations:
-            animation_data = self.animations[self.current_animation]
-            duration = animation_data.get("metadata", {}).get("duration", 0)
+        playback = self._current_playback
+        if self.animation_running and playback is not None:
+            duration = playback.timeline.duration
             
             if duration > 0:
                 # Mevcut zamanı al
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_library.py
+# Açıklama: Animasyon kütüphanesinin diskte tutulan hafif dizini (meta veri, süre, etiketler,
+#           mtime, boyut). Listeleme ve bilgi sorguları yalnızca dizinden yanıtlanır; tam sekanslar
+#           ilk oynatmada okunur. Dizinler izlenir ve yalnızca değişen dosyalar yeniden ayrıştırılır.
+# Bağımlılıklar: json, os, threading, logging
+# Bağlı Dosyalar: animation_engine.py, dashboard_routes.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Diskte kalıcı animasyon dizini, tembel yükleme ve değişiklik izleme eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+# Logger yapılandırması
+logger = logging.getLogger("AnimationEngine")
+
+# Dizin dosyasının biçim sürümü (alanlar değişirse eski dizin yok sayılır)
+INDEX_VERSION = 1
+
+# Dizinde saklanan meta veri alanları
+INDEX_METADATA_FIELDS = ("name", "description", "version", "author", "duration", "created", "tags")
+
+
+class AnimationIndexEntry(NamedTuple):
+    """Bir animasyon dosyasının dizin kaydı"""
+    name: str
+    path: str
+    source: str
+    mtime_ns: int
+    size: int
+    metadata: Dict
+    duration: float
+    tags: Tuple[str, ...]
+
+    def to_info(self) -> Dict:
+        """
+        Dashboard ve API için özet bilgi döndürür
+
+        Returns:
+            Dict: Animasyon özet bilgisi
+        """
+        return {
+            "name": self.name,
+            "display_name": self.metadata.get("name", self.name),
+            "description": self.metadata.get("description", ""),
+            "duration": self.duration,
+            "tags": list(self.tags),
+            "source": self.source,
+            "size": self.size,
+            "mtime": self.mtime_ns / 1e9,
+        }
+
+
+def validate_animation(animation_data: Dict) -> bool:
+    """
+    Animasyon verilerini doğrular
+
+    Args:
+        animation_data (Dict): Animasyon verileri
+
+    Returns:
+        bool: Doğrulama başarılı ise True
+    """
+    # Temel animasyon yapısını kontrol et
+    if not isinstance(animation_data, dict):
+        return False
+
+    # Metadata alanını kontrol et
+    if "metadata" not in animation_data or not isinstance(animation_data["metadata"], dict):
+        return False
+
+    # Adım sırasını kontrol et
+    if "sequence" not in animation_data or not isinstance(animation_data["sequence"], list):
+        return False
+
+    # Tüm değil, ama basit kontroller yeterlidir
+    return True
+
+
+def get_animation_duration(animation_data: Dict) -> float:
+    """
+    Animasyonun süresini hesaplar (meta veri, son adım ve eğri izlerinin en büyüğü)
+
+    Args:
+        animation_data (Dict): Animasyon verileri
+
+    Returns:
+        float: Süre (saniye)
+    """
+    duration = 0.0
+    metadata_duration = animation_data.get("metadata", {}).get("duration")
+    if isinstance(metadata_duration, (int, float)):
+        duration = float(metadata_duration)
+
+    for step in animation_data.get("sequence", []):
+        if isinstance(step, dict) and isinstance(step.get("time"), (int, float)):
+            duration = max(duration, float(step["time"]))
+
+    for spec in (animation_data.get("tracks") or {}).values():
+        keyframes = spec.get("keyframes", []) if isinstance(spec, dict) else spec
+        for keyframe in keyframes if isinstance(keyframes, list) else []:
+            if isinstance(keyframe, dict) and isinstance(keyframe.get("time"), (int, float)):
+                duration = max(duration, float(keyframe["time"]))
+
+    return duration
+
+
+class AnimationLibrary:
+    """
+    Animasyon dosyalarının dizini
+
+    Dizinler öncelik sırasıyla verilir; aynı adlı animasyonlarda sonraki dizin
+    (ör. custom) öncekini (ör. standard) geçersiz kılar. Dizin dosyası mtime ve
+    boyut değişmeyen dosyalar için ayrıştırmayı atlamak amacıyla kullanılır.
+    """
+
+    def __init__(self, directories: List[Tuple[str, str]], index_path: Optional[str] = None):
+        """
+        Kütüphaneyi oluşturur (dizin taraması refresh ile yapılır)
+
+        Args:
+            directories (List[Tuple[str, str]]): (kaynak adı, dizin yolu) listesi, artan öncelikle
+            index_path (Optional[str], optional): Kalıcı dizin dosyası. None ise dizin diske yazılmaz
+        """
+        self.directories = directories
+        self.index_path = index_path
+        self._entries: Dict[str, AnimationIndexEntry] = {}  # dosya yolu -> kayıt
+        self._names: Dict[str, AnimationIndexEntry] = {}  # animasyon adı -> geçerli kayıt
+        self._lock = threading.RLock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self.parse_count = 0  # Yeniden ayrıştırılan dosya sayısı (dizin isabetleri hariç)
+        self._scanned = False
+        self._invalid: Dict[str, Tuple[int, int]] = {}  # geçersiz dosyalar tekrar ayrıştırılmasın
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def refresh(self) -> Set[str]:
+        """
+        Dizinleri tarar; yeni veya değişmiş dosyaları ayrıştırır, silinenleri çıkarır
+
+        Returns:
+            Set[str]: Eklenen, değişen veya silinen animasyon adları
+        """
+        with self._lock:
+            if not self._entries:
+                self._load_index()
+
+            changed: Set[str] = set()
+            seen: Set[str] = set()
+            for source, directory in self.directories:
+                try:
+                    entries = list(os.scandir(directory))
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    logger.warning(f"Animasyon dizini okunamadı: {directory} - {e}")
+                    continue
+
+                for dir_entry in entries:
+                    if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                        continue
+                    seen.add(dir_entry.path)
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    current = self._entries.get(dir_entry.path)
+                    if (current is not None and current.mtime_ns == stat.st_mtime_ns
+                            and current.size == stat.st_size and current.source == source):
+                        continue
+                    if self._invalid.get(dir_entry.path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    entry = self._parse_entry(source, dir_entry.path, stat.st_mtime_ns, stat.st_size)
+                    if entry is None:
+                        self._invalid[dir_entry.path] = (stat.st_mtime_ns, stat.st_size)
+                        if self._entries.pop(dir_entry.path, None) is not None:
+                            changed.add(os.path.splitext(dir_entry.name)[0])
+                        continue
+                    self._invalid.pop(dir_entry.path, None)
+                    self._entries[dir_entry.path] = entry
+                    changed.add(entry.name)
+
+            for path in [path for path in self._entries if path not in seen]:
+                changed.add(self._entries.pop(path).name)
+
+            if changed or not self._scanned:
+                self._scanned = True
+                self._rebuild_names()
+                self._save_index()
+            return changed
+
+    def update_file(self, path: str) -> Optional[AnimationIndexEntry]:
+        """
+        Tek bir dosyanın dizin kaydını yeniler (kaydetme sonrası)
+
+        Args:
+            path (str): Dosya yolu
+
+        Returns:
+            Optional[AnimationIndexEntry]: Yeni kayıt veya dosya geçersizse None
+        """
+        source = next((source for source, directory in self.directories
+                       if os.path.dirname(os.path.abspath(path)) == os.path.abspath(directory)), "custom")
+        with self._lock:
+            try:
+                stat = os.stat(path)
+                entry = self._parse_entry(source, path, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                entry = None
+            if entry is None:
+                self._entries.pop(path, None)
+            else:
+                self._entries[path] = entry
+            self._rebuild_names()
+            self._save_index()
+            return entry
+
+    def remove_file(self, path: str) -> None:
+        """
+        Silinen dosyanın dizin kaydını çıkarır
+
+        Args:
+            path (str): Dosya yolu
+        """
+        with self._lock:
+            if self._entries.pop(path, None) is not None:
+                self._rebuild_names()
+                self._save_index()
+
+    def get(self, name: str) -> Optional[AnimationIndexEntry]:
+        """
+        Animasyonun geçerli dizin kaydını döndürür
+
+        Args:
+            name (str): Animasyon adı
+
+        Returns:
+            Optional[AnimationIndexEntry]: Kayıt veya bulunamazsa None
+        """
+        return self._names.get(name)
+
+    def names(self) -> List[str]:
+        """
+        Animasyon adlarını döndürür
+
+        Returns:
+            List[str]: Animasyon adları
+        """
+        return list(self._names.keys())
+
+    def entries(self) -> List[AnimationIndexEntry]:
+        """
+        Geçerli dizin kayıtlarını döndürür
+
+        Returns:
+            List[AnimationIndexEntry]: Kayıtlar
+        """
+        return list(self._names.values())
+
+    def load(self, name: str) -> Optional[Dict]:
+        """
+        Animasyonun tam içeriğini diskten okur
+
+        Args:
+            name (str): Animasyon adı
+
+        Returns:
+            Optional[Dict]: Animasyon verileri veya okunamazsa None
+        """
+        entry = self._names.get(name)
+        if entry is None:
+            return None
+        return self.read_file(entry.path)
+
+    @staticmethod
+    def read_file(path: str) -> Optional[Dict]:
+        """
+        Animasyon dosyasını okur ve doğrular
+
+        Args:
+            path (str): Dosya yolu
+
+        Returns:
+            Optional[Dict]: Animasyon verileri veya geçersizse None
+        """
+        try:
+            with open(path, 'r') as f:
+                animation_data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Animasyon dosyası yüklenirken hata: {path} - {e}")
+            return None
+
+        if not validate_animation(animation_data):
+            logger.error(f"Geçersiz animasyon formatı: {path}")
+            return None
+        return animation_data
+
+    def _parse_entry(self, source: str, path: str, mtime_ns: int, size: int) -> Optional[AnimationIndexEntry]:
+        """Dosyayı ayrıştırıp yalnızca dizin alanlarını tutan bir kayıt üretir"""
+        animation_data = self.read_file(path)
+        self.parse_count += 1
+        if animation_data is None:
+            return None
+
+        metadata = animation_data["metadata"]
+        tags = metadata.get("tags", [])
+        return AnimationIndexEntry(
+            name=os.path.splitext(os.path.basename(path))[0],
+            path=path,
+            source=source,
+            mtime_ns=mtime_ns,
+            size=size,
+            metadata={key: metadata[key] for key in INDEX_METADATA_FIELDS if key in metadata},
+            duration=get_animation_duration(animation_data),
+            tags=tuple(str(tag) for tag in tags) if isinstance(tags, list) else (),
+        )
+
+    def _rebuild_names(self) -> None:
+        """Ad -> kayıt haritasını dizin önceliğine göre yeniden kurar"""
+        priority = {source: index for index, (source, _) in enumerate(self.directories)}
+        names: Dict[str, AnimationIndexEntry] = {}
+        for entry in sorted(self._entries.values(), key=lambda e: (priority.get(e.source, len(priority)), e.path)):
+            names[entry.name] = entry
+        self._names = names
+
+    def _load_index(self) -> None:
+        """Kalıcı dizin dosyasını okur (yoksa veya eskiyse boş başlanır)"""
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            for item in data.get("entries", []):
+                entry = AnimationIndexEntry(item["name"], item["path"], item["source"], int(item["mtime_ns"]),
+                                            int(item["size"]), dict(item.get("metadata", {})),
+                                            float(item.get("duration", 0.0)), tuple(item.get("tags", ())))
+                self._entries[entry.path] = entry
+        except Exception as e:
+            logger.warning(f"Animasyon dizini okunamadı, yeniden oluşturulacak: {e}")
+            self._entries.clear()
+
+    def _save_index(self) -> None:
+        """Dizini atomik olarak diske yazar"""
+        if not self.index_path:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "entries": [entry._asdict() for entry in self._entries.values()],
+        }
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f"Animasyon dizini yazılamadı: {e}")
+
+    def start_watching(self, interval: float, on_change: Optional[Callable[[Set[str]], None]] = None) -> None:
+        """
+        Dizinleri belirtilen aralıkla izler; değişiklikte yalnızca ilgili dosyalar ayrıştırılır
+
+        Args:
+            interval (float): Tarama aralığı (saniye), 0 veya daha küçükse izleme yapılmaz
+            on_change (Optional[Callable[[Set[str]], None]], optional): Değişen adlarla çağrılır
+        """
+        if interval <= 0 or (self._watch_thread is not None and self._watch_thread.is_alive()):
+            return
+
+        self._watch_stop.clear()
+
+        def watch() -> None:
+            while not self._watch_stop.wait(interval):
+                try:
+                    changed = self.refresh()
+                    if changed:
+                        logger.info(f"Animasyon kütüphanesi güncellendi: {sorted(changed)}")
+                        if on_change:
+                            on_change(changed)
+                except Exception as e:
+                    logger.error(f"Animasyon dizini izlenirken hata: {e}")
+
+        self._watch_thread = threading.Thread(target=watch, name="AnimationLibraryWatch", daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """Dizin izlemeyi durdurur"""
+        self._watch_stop.set()
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            self._watch_thread.join(timeout=1.0)
+        self._watch_thread = None
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_renderer.py
+# Açıklama: Animasyonları donanım ve gerçek zaman olmadan, sabit kare hızında ve olabildiğince
+#           hızlı çizen çevrimdışı önizleme çizicisi. OLED ve LED kontrolcüleri headless kipte,
+#           sanal saat ve sabit rastgelelik tohumuyla çalıştırılır; kareler editörün ileri geri
+#           sarabileceği sıkıştırılmış bir kare paketine yazılır. Aynı animasyon ve tema için
+#           paket özeti (digest) her zaman aynıdır, bu yüzden regresyon karşılaştırması olarak da kullanılır.
+# Bağımlılıklar: numpy, zlib, hashlib, struct
+# Bağlı Dosyalar: animation_actions.py, animation_timeline.py, render_clock.py, oled_controller.py,
+#                 led_controller.py, frame_sink.py
+
+# Versiyon: 0.1.3
+# Değişiklikler:
+# - [0.1.3] Çizim sırasında başarısız olan eylemler yutulmuyor; paketin errors listesinde toplanıp
+#           describe() ile raporlanıyor
+# - [0.1.2] Göz kırpma ve büyüyen çember artık eylem içinde beklemiyor (kontrolcü durumundan çiziliyor)
+# - [0.1.1] Eylem hedefleri derleme sırasında doğrulanıyor
+# - [0.1.0] Headless animasyon önizleme çizicisi ve kare paketi formatı eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import copy
+import hashlib
+import logging
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.animation_actions import AnimationActionsMixin
+from src.modules.animation_library import validate_animation
+from src.modules.animation_timeline import compile_timeline
+from src.modules.frame_sink import FRAME_RGB, FRAME_SSD1306, WIRE_KIND_CODES
+from src.modules.led_controller import LEDController
+from src.modules.oled_controller import OLEDController
+from src.modules.render_clock import VirtualClock
+
+# Logger yapılandırması
+logger = logging.getLogger("AnimationRenderer")
+
+# Kare paketi: sıkıştırılmamış önek (sihirli bayt + sürüm), ardından zlib ile sıkıştırılmış gövde.
+# Gövde (küçük endian): kare hızı, kare sayısı, akış sayısı; her akış için başlık, ad,
+# kare -> benzersiz kare dizin tablosu (u16) ve benzersiz kareler.
+PACK_MAGIC = b"F1PK"
+PACK_VERSION = 1
+PACK_PREFIX = struct.Struct("<4sB")
+PACK_HEADER = struct.Struct("<fIB")
+STREAM_HEADER = struct.Struct("<BBHHHI")  # ad uzunluğu, tür kodu, genişlik, yükseklik, benzersiz kare, kare boyutu
+
+KIND_NAMES = {code: kind for kind, code in WIRE_KIND_CODES.items()}
+
+# Dizin tablosu u16 olduğundan akış başına benzersiz kare sınırı
+MAX_UNIQUE_FRAMES = 0xFFFF
+
+# Kare zamanı karşılaştırmalarında kayan nokta toleransı
+TIME_EPSILON = 1e-9
+
+
+class PackStream(NamedTuple):
+    """Kare paketindeki tek bir kaynağın (ekran veya LED şeridi) kareleri"""
+    name: str
+    kind: str
+    width: int
+    height: int
+    index: Tuple[int, ...]  # Kare -> benzersiz kare
+    frames: Tuple[bytes, ...]  # Benzersiz kareler (frame_sink ile aynı ham düzen)
+
+
+class FramePack:
+    """
+    Önizleme kare paketi
+
+    Her akışta ardışık aynı kareler (ve tekrar eden kareler) bir kez saklanır;
+    kare i'nin verisi frames[index[i]] ile okunur. errors, çizim sırasında başarısız
+    olan eylemlerdir; ikili biçime ve özete dahil edilmez.
+    """
+
+    def __init__(self, fps: float, frame_count: int, streams: List[PackStream],
+                 errors: Optional[List[Dict]] = None):
+        """
+        Kare paketi oluşturur
+
+        Args:
+            fps (float): Kare hızı
+            frame_count (int): Kare sayısı
+            streams (List[PackStream]): Akışlar
+            errors (Optional[List[Dict]], optional): Başarısız eylemler ({"time", "action", "error"})
+        """
+        self.fps = fps
+        self.frame_count = frame_count
+        self.streams: "OrderedDict[str, PackStream]" = OrderedDict((stream.name, stream) for stream in streams)
+        self.errors: List[Dict] = list(errors or [])
+
+    @property
+    def duration(self) -> float:
+        """Paketin süresi (saniye)"""
+        return self.frame_count / self.fps if self.fps else 0.0
+
+    def frame(self, name: str, index: int) -> bytes:
+        """
+        Bir akışın belirtilen karesini döndürür
+
+        Args:
+            name (str): Akış adı
+            index (int): Kare numarası
+
+        Returns:
+            bytes: Kare verisi
+        """
+        stream = self.streams[name]
+        return stream.frames[stream.index[index]]
+
+    def _encode_body(self) -> bytes:
+        """Sıkıştırılmamış paket gövdesini üretir"""
+        parts = [PACK_HEADER.pack(self.fps, self.frame_count, len(self.streams))]
+        for stream in self.streams.values():
+            name = stream.name.encode("utf-8")
+            frame_size = len(stream.frames[0]) if stream.frames else 0
+            parts.append(STREAM_HEADER.pack(len(name), WIRE_KIND_CODES[stream.kind], stream.width,
+                                            stream.height, len(stream.frames), frame_size))
+            parts.append(name)
+            parts.append(np.asarray(stream.index, dtype="<u2").tobytes())
+            parts.extend(stream.frames)
+        return b"".join(parts)
+
+    def to_bytes(self) -> bytes:
+        """
+        Paketi ikili biçime çevirir
+
+        Returns:
+            bytes: Önek + zlib ile sıkıştırılmış gövde
+        """
+        return PACK_PREFIX.pack(PACK_MAGIC, PACK_VERSION) + zlib.compress(self._encode_body(), 6)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FramePack":
+        """
+        İkili biçimden paketi okur
+
+        Args:
+            data (bytes): to_bytes() çıktısı
+
+        Returns:
+            FramePack: Kare paketi
+
+        Raises:
+            ValueError: Veri geçerli bir kare paketi değilse
+        """
+        if len(data) < PACK_PREFIX.size:
+            raise ValueError("Kare paketi çok kısa")
+        magic, version = PACK_PREFIX.unpack_from(data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"Desteklenmeyen kare paketi: {magic!r} v{version}")
+
+        try:
+            body = zlib.decompress(data[PACK_PREFIX.size:])
+            fps, frame_count, stream_count = PACK_HEADER.unpack_from(body)
+            offset = PACK_HEADER.size
+            streams = []
+            for _ in range(stream_count):
+                name_length, kind_code, width, height, unique, frame_size = STREAM_HEADER.unpack_from(body, offset)
+                offset += STREAM_HEADER.size
+                name = body[offset:offset + name_length].decode("utf-8")
+                offset += name_length
+                index = tuple(np.frombuffer(body, dtype="<u2", count=frame_count, offset=offset).tolist())
+                offset += frame_count * 2
+                frames = tuple(body[offset + i * frame_size:offset + (i + 1) * frame_size] for i in range(unique))
+                offset += unique * frame_size
+                streams.append(PackStream(name, KIND_NAMES[kind_code], width, height, index, frames))
+        except (zlib.error, struct.error, KeyError, ValueError) as e:
+            raise ValueError(f"Kare paketi çözülemedi: {e}")
+
+        return cls(fps, frame_count, streams)
+
+    def digest(self) -> str:
+        """
+        Paket içeriğinin SHA-256 özetini döndürür (sıkıştırma ayarlarından bağımsız)
+
+        Returns:
+            str: Onaltılık özet
+        """
+        return hashlib.sha256(self._encode_body()).hexdigest()
+
+    def describe(self) -> Dict:
+        """
+        Paket bilgisini döndürür
+
+        Returns:
+            Dict: Kare hızı, süre, kare sayısı, akış bilgileri ve başarısız eylemler
+        """
+        return {
+            "fps": self.fps,
+            "duration": self.duration,
+            "frames": self.frame_count,
+            "streams": {
+                stream.name: {"kind": stream.kind, "width": stream.width, "height": stream.height,
+                              "unique_frames": len(stream.frames)}
+                for stream in self.streams.values()
+            },
+            "errors": self.errors,
+        }
+
+
+class _StreamRecorder:
+    """Bir akışın karelerini yakalarken benzersiz kareleri ayıklar"""
+
+    def __init__(self, name: str, kind: str, width: int, height: int):
+        self.name = name
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.index: List[int] = []
+        self.frames: List[bytes] = []
+        self._lookup: Dict[bytes, int] = {}
+
+    def add(self, data: bytes) -> None:
+        unique = self._lookup.get(data)
+        if unique is None:
+            if len(self.frames) >= MAX_UNIQUE_FRAMES:
+                raise ValueError(f"{self.name}: benzersiz kare sınırı aşıldı ({MAX_UNIQUE_FRAMES})")
+            unique = len(self.frames)
+            self._lookup[data] = unique
+            self.frames.append(data)
+        self.index.append(unique)
+
+    def to_stream(self) -> PackStream:
+        return PackStream(self.name, self.kind, self.width, self.height, tuple(self.index), tuple(self.frames))
+
+
+class _PreviewActions(AnimationActionsMixin):
+    """
+    Önizleme kontrolcülerine bağlı eylem haritası
+
+    Canlı motorda duygu eylemi yüz eklentisine gider; önizlemede eklenti olmadığından
+    duygu doğrudan headless OLED ve LED kontrolcülerine uygulanır.
+    """
+
+    def __init__(self, oled_controller, led_controller):
+        self.oled_controller = oled_controller
+        self.led_controller = led_controller
+        self._init_actions()
+
+    def _action_set_emotion(self, params: Mapping[str, Any]) -> None:
+        """Duygu durumunu önizleme kontrolcülerinde ayarlar"""
+        emotion = params.get("emotion", "neutral")
+        intensity = params.get("intensity", 0.7)
+        self.oled_controller.set_emotion(emotion, intensity)
+        self.led_controller.on_emotion_changed({"emotion": emotion, "intensity": intensity})
+
+
+class AnimationRenderer:
+    """
+    Çevrimdışı animasyon önizleme çizicisi
+
+    Her çizim yeni headless kontrolcülerle başlar. Zaman çizelgesi eylemleri ile kare
+    adımları sanal saat üzerinde sırayla işlenir: önce eylem zamanından önceki kareler
+    çizilir, sonra eylem yürütülür. Eylemler bloklamaz (göz kırpma, büyüyen çember ve
+    konuşma kontrolcülerin kare güncellemesinde ilerler); doğrudan çağrılan bloklayıcı
+    kontrolcü metotlarının beklemeleri ise sanal saati ilerletir ve arada düşen kareleri çizer.
+    """
+
+    def __init__(self, config: Dict, theme_name: Optional[str] = None, geometry=None,
+                 sprite_cache=None, morph_cache=None, fps: Optional[float] = None, seed: int = 0):
+        """
+        Çiziciyi oluşturur
+
+        Args:
+            config (Dict): Yapılandırma ayarları (kopyalanır, değiştirilmez)
+            theme_name (Optional[str], optional): Tema adı. Varsayılan: yapılandırmadaki tema
+            geometry (optional): Canlı kontrolcünün derlenmiş tema geometrisi (yeniden derlenmez)
+            sprite_cache (optional): Canlı kontrolcünün sprite önbelleği (paylaşılır)
+            morph_cache (optional): Canlı kontrolcünün morph önbelleği (paylaşılır)
+            fps (Optional[float], optional): Kare hızı. Varsayılan: animation.preview_fps
+            seed (int, optional): Rastgelelik tohumu. Varsayılan: 0
+        """
+        self.config = copy.deepcopy(config)
+        if theme_name:
+            self.config.setdefault("theme", {})["default_theme"] = theme_name
+
+        # Canlı yüzün süren duygu geçişi önizlemeye taşınmaz
+        emotions_config = self.config.setdefault("emotions", {})
+        emotions_config.pop("target", None)
+        emotions_config.pop("source", None)
+
+        animation_config = self.config.get("animation", {})
+        self.fps = max(1.0, min(120.0, float(fps or animation_config.get("preview_fps", 30))))
+        self.max_duration = float(animation_config.get("preview_max_duration", 60.0))
+        self.tail = max(0.0, float(animation_config.get("preview_tail", 0.5)))
+        self.seed = seed
+
+        self.geometry = geometry
+        self.sprite_cache = sprite_cache
+        self.morph_cache = morph_cache
+
+    def _create_controllers(self, clock: VirtualClock) -> Tuple[OLEDController, LEDController]:
+        """
+        Sanal saate bağlı headless OLED ve LED kontrolcülerini oluşturur
+
+        Args:
+            clock (VirtualClock): Sanal saat
+
+        Returns:
+            Tuple[OLEDController, LEDController]: Kontrolcüler
+        """
+        oled = OLEDController(self.config, clock, self.seed, headless=True)
+        if self.geometry is not None:
+            oled.geometry = self.geometry
+        if self.sprite_cache is not None:
+            oled.sprite_cache = self.sprite_cache
+        if self.morph_cache is not None:
+            oled.morph_cache = self.morph_cache
+        if not oled._init_displays():
+            raise ValueError("Önizleme ekranları başlatılamadı")
+
+        # Yeni kontrolcü ilk göz kırpma zamanına kadar kapalı gözle başlar; önizleme,
+        # canlı yüzün olağan durumundan (açık gözler) başlatılır
+        oled.blink_state = True
+        oled.mark_dirty()
+
+        led = LEDController(self.config, clock, self.seed, headless=True)
+        return oled, led
+
+    def render(self, animation_data: Dict, name: str = "preview") -> FramePack:
+        """
+        Animasyonu kare paketine çizer
+
+        Args:
+            animation_data (Dict): Animasyon verileri
+            name (str, optional): Animasyon adı (loglar için). Varsayılan: "preview"
+
+        Returns:
+            FramePack: Kare paketi (başarısız eylemler pack.errors içinde)
+
+        Raises:
+            ValueError: Animasyon geçersizse
+        """
+        if not validate_animation(animation_data):
+            raise ValueError("Geçersiz animasyon formatı")
+
+        started = time.perf_counter()
+        clock = VirtualClock()
+        oled, led = self._create_controllers(clock)
+        actions = _PreviewActions(oled, led)
+        timeline = compile_timeline(name, animation_data, actions.action_dispatch,
+                                    actions._unresolved_action_target)
+
+        duration = min(timeline.duration + self.tail, self.max_duration)
+        frame_count = max(1, int(math.ceil(duration * self.fps - TIME_EPSILON)))
+        interval = 1.0 / self.fps
+
+        recorders = OrderedDict()
+        for display_name, display in oled.displays.items():
+            recorders[display_name] = _StreamRecorder(display_name, FRAME_SSD1306, display.width, display.height)
+        recorders["leds"] = _StreamRecorder("leds", FRAME_RGB, led.led_count, 1)
+
+        next_frame = 0
+        errors = []
+
+        def render_until(limit: float) -> None:
+            """limit zamanından önceki karelerin tümünü çizer"""
+            nonlocal next_frame
+            while next_frame < frame_count and next_frame * interval < limit - TIME_EPSILON:
+                frame_time = next_frame * interval
+                clock.set(frame_time)
+                oled._update_frame()
+                led._render_step(frame_time)
+                self._capture(oled, led, recorders)
+                next_frame += 1
+
+        # Eylemlerin içindeki beklemeler bu sürede düşen kareleri çizer
+        clock.on_sleep = render_until
+
+        for action_time, action in zip(timeline.times, timeline.actions):
+            if action_time >= duration:
+                break
+            render_until(action_time)
+            clock.set(action_time)
+            try:
+                action.func(action.params)
+            except Exception as e:
+                errors.append({"time": action_time, "action": f"{action.component}.{action.action}",
+                               "error": str(e)})
+                logger.warning(f"Önizleme eylemi yürütülürken hata: {action.component}.{action.action} - {e}")
+
+        render_until(float("inf"))
+        clock.on_sleep = None
+
+        pack = FramePack(self.fps, frame_count, [recorder.to_stream() for recorder in recorders.values()], errors)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Önizleme çizildi: {name}, {frame_count} kare, {pack.duration:.2f} sn içerik "
+                    f"{elapsed:.2f} sn'de ({pack.duration / elapsed if elapsed else 0.0:.1f}x gerçek zaman)")
+        return pack
+
+    @staticmethod
+    def _capture(oled: OLEDController, led: LEDController, recorders: Mapping[str, _StreamRecorder]) -> None:
+        """
+        Ekran belleklerinin ve LED çıkışının şimdiki halini kaydeder
+
+        Args:
+            oled (OLEDController): OLED kontrolcü
+            led (LEDController): LED kontrolcü
+            recorders (Mapping[str, _StreamRecorder]): Akış adı -> kaydedici
+        """
+        for display_name, display in oled.displays.items():
+            data = display.gddram.array.tobytes()
+            if not display.powered_on:
+                data = bytes(len(data))
+            recorders[display_name].add(data)
+        recorders["leds"].add(led.color_pipeline.preview(led.pixels).tobytes())
+
+
+# Çizici test kodu: animasyonu çizer ve regresyon karşılaştırması için özeti yazdırır
+if __name__ == "__main__":
+    import json
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    animation_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        PROJECT_DIR, "animation", "standard", "speaking.json")
+    with open(os.path.join(PROJECT_DIR, "config", "config.json"), "r") as f:
+        config = json.load(f)
+    with open(animation_path, "r") as f:
+        animation_data = json.load(f)
+
+    pack = AnimationRenderer(config).render(animation_data, Path(animation_path).stem)
+    print(json.dumps(pack.describe(), indent=2))
+    print(f"Paket boyutu: {len(pack.to_bytes())} bayt")
+    print(f"Özet: {pack.digest()}")
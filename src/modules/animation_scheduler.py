@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_scheduler.py
+# Açıklama: Derlenmiş animasyon zaman çizelgelerini tek bir iş parçacığında, zamanlayıcı
+#           yığını (heap) ile çalıştıran zamanlayıcı. Birden fazla animasyon aynı anda
+#           oynatılabilir; göz, ağız, LED ve duygu izleri öncelik ve öne geçme (pre-emption)
+#           kurallarıyla paylaştırılır.
+# Bağımlılıklar: heapq, threading, logging, time
+# Bağlı Dosyalar: animation_engine.py, animation_timeline.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Zamanlayıcı iş parçacığını bloklayan yavaş eylemler uyarı olarak loglanıyor
+# - [0.1.0] Zamanlayıcı yığını tabanlı, iz/öncelik destekli animasyon zamanlayıcısı eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Set
+
+from src.modules.animation_timeline import AnimationTimeline, TimelineAction
+
+# Logger yapılandırması
+logger = logging.getLogger("AnimationEngine")
+
+# Öncelik seviyeleri (yüksek değer, aynı izi kullanan düşük öncelikli oynatmayı keser)
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 50
+PRIORITY_HIGH = 100
+
+# Öncelik ve öne geçme kurallarına tabi izler; diğer bileşenler koşulsuz yürütülür
+TRACKS = ("eyes", "mouth", "leds", "emotion", "sound")
+
+# Bu süreden uzun süren eylemler diğer izleri geciktirir, loglanır
+SLOW_ACTION_THRESHOLD = 0.1
+
+
+class Playback:
+    """
+    Zamanlayıcıdaki tek bir zaman çizelgesi oynatması
+    """
+
+    def __init__(self, playback_id: int, timeline: AnimationTimeline, priority: int,
+                 start_time: float, on_finish: Optional[Callable[["Playback"], None]]):
+        """
+        Oynatma kaydı oluşturur
+
+        Args:
+            playback_id (int): Zamanlayıcı içinde benzersiz kimlik
+            timeline (AnimationTimeline): Oynatılacak zaman çizelgesi
+            priority (int): Öncelik
+            start_time (float): Monoton başlangıç zamanı
+            on_finish (Optional[Callable]): Oynatma bittiğinde veya iptal edildiğinde çağrılır
+        """
+        self.playback_id = playback_id
+        self.timeline = timeline
+        self.priority = priority
+        self.start_time = start_time
+        self.on_finish = on_finish
+        self.index = 0
+        self.cancelled = False
+        # Oynatmanın kullandığı ve henüz başka bir oynatmaya kaptırmadığı izler
+        self.tracks: Set[str] = {action.component for action in timeline.actions
+                                 if action.component in TRACKS}
+
+    @property
+    def name(self) -> str:
+        return self.timeline.name
+
+    def next_due(self) -> float:
+        """Sıradaki eylemin monoton zamanını döndürür"""
+        return self.start_time + self.timeline.times[self.index]
+
+    def describe(self) -> Dict:
+        """
+        Oynatmanın durum bilgisini döndürür
+
+        Returns:
+            Dict: Oynatma bilgisi
+        """
+        return {
+            "id": self.playback_id,
+            "name": self.name,
+            "priority": self.priority,
+            "tracks": sorted(self.tracks),
+            "progress": self.index / len(self.timeline.actions) if self.timeline.actions else 1.0,
+        }
+
+
+class AnimationScheduler:
+    """
+    Tek iş parçacıklı zamanlayıcı yığını
+
+    Her etkin oynatmanın yığında tek bir girdisi vardır: sıradaki eyleminin zamanı.
+    İş parçacığı en yakın zamana kadar koşul değişkeninde bekler; yeni bir oynatma
+    eklendiğinde veya iptal edildiğinde uyandırılır. Oynatma sayısından bağımsız
+    olarak yalnızca bir iş parçacığı kullanılır.
+
+    İz kuralları: yeni oynatma, kullandığı her izde eşit veya daha düşük öncelikli
+    sahibin yerini alır (o iz sahibinden kalıcı olarak alınır; tüm izlerini kaybeden
+    oynatma iptal edilir). Daha yüksek öncelikli sahibi olan izdeki eylemler atlanır;
+    iz boşaldığında ilk eylemle yeniden sahiplenilir.
+    """
+
+    def __init__(self):
+        """Zamanlayıcıyı oluşturur (iş parçacığı ilk kullanımda başlatılır)"""
+        self._heap: List = []
+        self._sequence = itertools.count()
+        self._ids = itertools.count(1)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.playbacks: Dict[int, Playback] = {}
+        self.track_owners: Dict[str, Playback] = {}
+
+        # Zamanlama istatistikleri
+        self.dispatch_count = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def start(self) -> None:
+        """Zamanlayıcı iş parçacığını başlatır"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="AnimationScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Tüm oynatmaları iptal eder ve iş parçacığını durdurur"""
+        self.cancel_all()
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def play(self, timeline: AnimationTimeline, priority: int = PRIORITY_NORMAL,
+             on_finish: Optional[Callable[[Playback], None]] = None) -> Optional[Playback]:
+        """
+        Zaman çizelgesini oynatmaya ekler
+
+        Args:
+            timeline (AnimationTimeline): Oynatılacak zaman çizelgesi
+            priority (int, optional): Öncelik. Varsayılan: PRIORITY_NORMAL
+            on_finish (Optional[Callable], optional): Bitişte çağrılacak fonksiyon
+
+        Returns:
+            Optional[Playback]: Oynatma kaydı, çizelge boşsa None
+        """
+        if not timeline.actions:
+            return None
+
+        self.start()
+        finished = []
+        with self._condition:
+            playback = Playback(next(self._ids), timeline, priority, time.monotonic(), on_finish)
+            for track in playback.tracks:
+                owner = self.track_owners.get(track)
+                if owner is None or priority >= owner.priority:
+                    if owner is not None:
+                        owner.tracks.discard(track)
+                        if not owner.tracks:
+                            self._cancel_locked(owner, finished)
+                    self.track_owners[track] = playback
+
+            self.playbacks[playback.playback_id] = playback
+            heapq.heappush(self._heap, (playback.next_due(), next(self._sequence), playback))
+            self._condition.notify()
+
+        self._notify_finished(finished)
+        return playback
+
+    def call_later(self, delay: float, func: Callable, *args) -> Optional[Playback]:
+        """
+        Bir fonksiyonu belirtilen gecikmeyle zamanlayıcı iş parçacığında çağırır
+
+        Args:
+            delay (float): Gecikme (saniye)
+            func (Callable): Çağrılacak fonksiyon
+            *args: Fonksiyon argümanları
+
+        Returns:
+            Optional[Playback]: Oynatma kaydı
+        """
+        action = TimelineAction("call", getattr(func, "__name__", "call"),
+                                lambda params: func(*args), MappingProxyType({}))
+        timeline = AnimationTimeline(action.action, (max(0.0, delay),), (action,), max(0.0, delay))
+        return self.play(timeline, PRIORITY_LOW)
+
+    def cancel(self, playback: Playback) -> None:
+        """
+        Bir oynatmayı iptal eder
+
+        Args:
+            playback (Playback): İptal edilecek oynatma
+        """
+        finished = []
+        with self._condition:
+            self._cancel_locked(playback, finished)
+            self._condition.notify()
+        self._notify_finished(finished)
+
+    def cancel_all(self) -> None:
+        """Tüm oynatmaları iptal eder"""
+        finished = []
+        with self._condition:
+            for playback in list(self.playbacks.values()):
+                self._cancel_locked(playback, finished)
+            self._heap.clear()
+            self._condition.notify()
+        self._notify_finished(finished)
+
+    def _cancel_locked(self, playback: Playback, finished: List[Playback]) -> None:
+        """Kilit altında oynatmayı iptal eder; yığın girdisi tembel olarak atılır"""
+        if playback.cancelled or self.playbacks.pop(playback.playback_id, None) is None:
+            return
+        playback.cancelled = True
+        self._release_tracks(playback)
+        finished.append(playback)
+
+    def _release_tracks(self, playback: Playback) -> None:
+        for track in playback.tracks:
+            if self.track_owners.get(track) is playback:
+                del self.track_owners[track]
+
+    def _notify_finished(self, finished: List[Playback]) -> None:
+        """Bitiş bildirimlerini kilit dışında çağırır"""
+        for playback in finished:
+            if playback.on_finish:
+                try:
+                    playback.on_finish(playback)
+                except Exception as e:
+                    logger.error(f"Animasyon bitiş bildirimi hatası: {playback.name} - {e}")
+
+    def _may_run(self, playback: Playback, action: TimelineAction) -> bool:
+        """Kilit altında eylemin izini kullanma hakkını kontrol eder ve gerekirse sahiplenir"""
+        track = action.component
+        if track not in TRACKS:
+            return True
+        if track not in playback.tracks:
+            return False
+        owner = self.track_owners.get(track)
+        if owner is None:
+            self.track_owners[track] = playback
+            return True
+        return owner is playback
+
+    def _run(self) -> None:
+        """Zamanlayıcı döngüsü: en yakın eylem zamanına kadar bekler ve yürütür"""
+        while True:
+            finished = []
+            with self._condition:
+                while self._running:
+                    # İptal edilmiş oynatmaların girdilerini at
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(timeout=delay)
+                if not self._running:
+                    return
+
+                due, _, playback = heapq.heappop(self._heap)
+                action = playback.timeline.actions[playback.index]
+                allowed = self._may_run(playback, action)
+                playback.index += 1
+
+                if playback.index < len(playback.timeline.actions):
+                    heapq.heappush(self._heap, (playback.next_due(), next(self._sequence), playback))
+                else:
+                    self.playbacks.pop(playback.playback_id, None)
+                    self._release_tracks(playback)
+                    finished.append(playback)
+
+            if allowed:
+                self._dispatch(action, due)
+            self._notify_finished(finished)
+
+    def _dispatch(self, action: TimelineAction, due: float) -> None:
+        """Eylemi kilit dışında yürütür ve zamanlama sapmasını kaydeder"""
+        start = time.monotonic()
+        lateness = start - due
+        self.dispatch_count += 1
+        self.total_lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+        try:
+            action.func(action.params)
+        except Exception as e:
+            logger.error(f"Eylem yürütülürken hata: {action.component}.{action.action} - {e}")
+            return
+
+        action_time = time.monotonic() - start
+        if action_time > SLOW_ACTION_THRESHOLD:
+            # Eylemler bloklamamalıdır; uzun süren eylem aynı anda oynayan tüm izleri geciktirir
+            logger.warning(f"Performans uyarısı: {action.component}_{action.action} eylemi {action_time:.3f} sn sürdü")
+
+    def get_stats(self) -> Dict:
+        """
+        Zamanlayıcı durumunu ve zamanlama sapması istatistiklerini döndürür
+
+        Returns:
+            Dict: Zamanlayıcı istatistikleri
+        """
+        with self._condition:
+            return {
+                "active": [playback.describe() for playback in self.playbacks.values()],
+                "tracks": {track: owner.name for track, owner in self.track_owners.items()},
+                "dispatched": self.dispatch_count,
+                "mean_lateness_ms": (self.total_lateness / self.dispatch_count * 1000.0
+                                     if self.dispatch_count else 0.0),
+                "max_lateness_ms": self.max_lateness * 1000.0,
+            }
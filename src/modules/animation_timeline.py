@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: animation_timeline.py
+# Açıklama: JSON animasyon sekanslarını değişmez zaman çizelgelerine derler. Adımlar bir kez
+#           sıralanır, eylemler bağlı fonksiyonlara çözülür ve parametreler dondurulur; oynatma
+#           sırasında sıralama, metin birleştirme veya sözlük dolaşımı yapılmaz.
+# Bağımlılıklar: logging, types
+# Bağlı Dosyalar: animation_engine.py, animation_curves.py
+
+# Versiyon: 0.1.2
+# Değişiklikler:
+# - [0.1.2] Derleme sırasında bilinmeyen adım anahtarları ve kontrolcüde karşılığı olmayan eylem
+#           hedefleri uyarıyla bildiriliyor (çözülemeyen eylemler çizelgeye alınmıyor)
+# - [0.1.1] "tracks" bölümündeki anahtar kare eğrileri derleniyor; eğriler çizelgenin başında
+#           ilgili zamanlayıcı izinde başlatılıyor, çizelge eğrilerin sonuna kadar sürüyor
+# - [0.1.0] Değişmez animasyon zaman çizelgesi ve derleyici eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from src.modules.animation_curves import CURVE_COMPONENTS, KeyframeCurve, compile_curves
+
+# Logger yapılandırması
+logger = logging.getLogger("AnimationEngine")
+
+# Bir adım içindeki bileşenlerin yürütülme sırası (ses ve duygu önce, görsel efektler sonra)
+COMPONENT_ORDER = ("sound", "emotion", "leds", "eyes", "mouth")
+
+# Bu uzunluğu aşan liste parametreleri derleme sırasında bir kez seyreltilir
+MAX_PARAM_LIST_LENGTH = 100
+
+ActionFunc = Callable[[Mapping[str, Any]], None]
+
+# (bileşen, eylem adı) -> çözülemeyen hedefin adı veya None
+TargetResolver = Callable[[str, str], Optional[str]]
+
+# Adımlarda bileşen dışında izin verilen anahtarlar
+STEP_KEYS = ("time", "description")
+
+EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _end_of_timeline(params: Mapping[str, Any]) -> None:
+    """Eğrilerin bitişini işaretleyen boş eylem (oynatmayı eğri süresince açık tutar)"""
+
+
+class TimelineAction(NamedTuple):
+    """Zaman çizelgesindeki tek bir eylem"""
+    component: str
+    action: str
+    func: ActionFunc
+    params: Mapping[str, Any]
+
+
+class AnimationTimeline(NamedTuple):
+    """
+    Derlenmiş, değişmez animasyon zaman çizelgesi
+
+    times ve actions paralel demetlerdir; times artan sıradadır ve aynı adımdaki
+    eylemler bileşen önceliği sırasıyla ardışık yer alır. curves, çizim döngülerinin
+    her karede değerlendirdiği sürekli izlerdir.
+    """
+    name: str
+    times: Tuple[float, ...]
+    actions: Tuple[TimelineAction, ...]
+    duration: float
+    curves: Mapping[str, KeyframeCurve] = EMPTY_PARAMS
+
+
+def freeze_params(value: Any) -> Any:
+    """
+    Parametre değerini özyinelemeli olarak salt okunur hale getirir
+
+    Sözlükler MappingProxyType, listeler demet olur. MAX_PARAM_LIST_LENGTH'ten
+    uzun listeler (ör. çok noktalı koordinat listeleri) her ikinci eleman alınarak
+    derleme sırasında bir kez küçültülür.
+
+    Args:
+        value (Any): JSON'dan gelen parametre değeri
+
+    Returns:
+        Any: Dondurulmuş değer
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_params(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        if len(value) > MAX_PARAM_LIST_LENGTH:
+            value = value[::2]
+        return tuple(freeze_params(item) for item in value)
+    return value
+
+
+def compile_timeline(name: str, animation_data: Dict,
+                     dispatch: Dict[str, Dict[str, ActionFunc]],
+                     resolve_target: Optional[TargetResolver] = None) -> AnimationTimeline:
+    """
+    Animasyon verisini zaman çizelgesine derler
+
+    Args:
+        name (str): Animasyon adı
+        animation_data (Dict): Doğrulanmış animasyon verileri ("metadata", "sequence", isteğe bağlı "tracks")
+        dispatch (Dict[str, Dict[str, ActionFunc]]): Bileşen -> eylem adı -> fonksiyon haritası;
+            eğriler "curves" -> "play" fonksiyonuyla başlatılır
+        resolve_target (Optional[TargetResolver], optional): Eylemin çağıracağı kontrolcü metodunu
+            doğrular; çözülemeyen hedefin adını döndüren eylemler uyarıyla atlanır
+
+    Returns:
+        AnimationTimeline: Derlenmiş zaman çizelgesi
+    """
+    entries = []
+    for index, step in enumerate(animation_data.get("sequence", [])):
+        if not isinstance(step, dict):
+            logger.warning(f"{name}: {index}. adım sözlük değil, atlandı")
+            continue
+
+        try:
+            step_time = max(0.0, float(step.get("time", 0)))
+        except (TypeError, ValueError):
+            logger.warning(f"{name}: {index}. adımın zamanı geçersiz, atlandı")
+            continue
+
+        for key in step:
+            if key not in COMPONENT_ORDER and key not in STEP_KEYS:
+                logger.warning(f"{name}: {index}. adımda bilinmeyen bileşen: {key}")
+
+        for component in COMPONENT_ORDER:
+            action_data = step.get(component)
+            if not isinstance(action_data, dict) or not action_data.get("action"):
+                continue
+
+            action_name = action_data["action"]
+            func: Optional[ActionFunc] = dispatch.get(component, {}).get(action_name)
+            if func is None:
+                logger.warning(f"{name}: eylem bulunamadı: {component}.{action_name}")
+                continue
+
+            missing = resolve_target(component, action_name) if resolve_target else None
+            if missing is not None:
+                logger.warning(f"{name}: eylem hedefi çözülemedi: {component}.{action_name} -> {missing}")
+                continue
+
+            params = freeze_params(action_data.get("params") or {})
+            entries.append((step_time, index, TimelineAction(component, action_name, func, params)))
+
+    curves = {}
+    play_curve = dispatch.get("curves", {}).get("play")
+    for track, spec in (animation_data.get("tracks") or {}).items():
+        try:
+            curve = compile_curves({track: spec})[track]
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"{name}: eğri izi derlenemedi: {track} - {e}")
+            continue
+        curves[track] = curve
+        if play_curve is not None:
+            # Eğriler aynı zamandaki adımlardan önce başlatılır
+            entries.append((0.0, -1, TimelineAction(CURVE_COMPONENTS[track], "curve", play_curve,
+                                                    MappingProxyType({"track": track, "curve": curve}))))
+
+    # Adım sırası ve bileşen önceliği korunarak zamana göre bir kez sıralanır
+    entries.sort(key=lambda entry: (entry[0], entry[1]))
+
+    times = tuple(entry[0] for entry in entries)
+    actions = tuple(entry[2] for entry in entries)
+
+    duration = times[-1] if times else 0.0
+    curve_end = max((curve.duration for curve in curves.values()), default=0.0)
+    if curve_end > duration:
+        # Oynatma (ve iz sahipliği) eğriler bitene kadar sürer
+        times += (curve_end,)
+        actions += (TimelineAction("end", "end", _end_of_timeline, EMPTY_PARAMS),)
+        duration = curve_end
+
+    metadata_duration = animation_data.get("metadata", {}).get("duration")
+    if isinstance(metadata_duration, (int, float)):
+        duration = max(duration, float(metadata_duration))
+
+    return AnimationTimeline(name, times, actions, duration, MappingProxyType(curves))
@@ -7,27 +7,33 @@
 # Bağımlılıklar: fastapi
 # Bağlı Dosyalar: dashboard_server.py, dashboard_websocket.py
 
-# Versiyon: 0.3.0
+# Versiyon: 0.3.6
 # Değişiklikler:
+# - [0.3.6] Simülasyon klasörünü tarayan /api/simulation kaldırıldı; ilk kare halka tampondan
+#           /api/simulation/{kaynak}/frame ile ikili olarak alınıyor
+# - [0.3.5] Önizleme yanıtı başarısız eylem sayısını X-Preview-Errors başlığında bildiriyor
+# - [0.3.4] Animasyon editörü için çevrimdışı çizilmiş kare paketi döndüren önizleme endpoint'leri eklendi
+# - [0.3.3] /api/animations listesi animasyon dizininden (etiketler, boyut, mtime dahil) dönüyor
+# - [0.3.2] Duygu, tema ve animasyon komutları Face Plugin IPC kanalı üzerinden iletiliyor
+# - [0.3.1] /api/status yanıtına OLED kare zamanlama istatistikleri eklendi
 # - [0.3.0] Widget sistemi entegrasyonu eklendi
 # - [0.2.0] Yapılandırma editörü endpoint'leri eklendi
 # - [0.1.0] dashboard_server.py dosyasından ayrıldı
 #
 # Yazar: GitHub Copilot
-# Tarih: 2025-05-05
+# Tarih: 2025-05-06
 ===========================================================
 """
 
 import os
-import time
-import glob
 import json
 import logging
 import copy
+import asyncio
 from typing import Dict, Optional, Any, List, Callable
 
 from fastapi import FastAPI, Request, WebSocket, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -51,6 +57,7 @@ class RoutesManager:
             project_dir: Proje dizini
         """
         self.face_plugin = face_plugin
+        self.face_ipc = None
         self.templates = templates
         self.templates_manager = templates_manager
         self.websocket_manager = websocket_manager
@@ -75,6 +82,64 @@ class RoutesManager:
         """
         self.face_plugin = face_plugin
     
+    def set_face_ipc(self, face_ipc) -> None:
+        """
+        Çalışan Face Plugin sürecine bağlı IPC istemcisini ayarlar
+        
+        Args:
+            face_ipc: FacePluginIPCClient nesnesi
+        """
+        self.face_ipc = face_ipc
+    
+    async def _call_face_ipc(self, method: str, **params) -> Optional[Any]:
+        """
+        Komutu IPC kanalı üzerinden çalışan Face Plugin sürecine iletir
+        
+        Args:
+            method (str): IPC metodu (set_emotion, set_theme, play_animation)
+            **params: Metot parametreleri
+            
+        Returns:
+            Optional[Any]: Sonuç veya IPC kullanılamıyorsa None
+        """
+        if not self.face_ipc:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, lambda: self.face_ipc.call(method, **params))
+        except Exception as e:
+            logger.warning(f"IPC çağrısı başarısız ({method}): {e}")
+            return None
+    
+    async def _render_animation_preview(self, animation, fps: Optional[float]) -> Response:
+        """
+        Animasyonu çevrimdışı çizer ve kare paketini ikili yanıt olarak döndürür
+        
+        Çizim CPU yoğun olduğundan olay döngüsünü bloklamamak için iş parçacığı havuzunda yapılır.
+        
+        Args:
+            animation: Animasyon adı veya animasyon verileri
+            fps (Optional[float]): Kare hızı (None ise yapılandırmadaki önizleme hızı)
+            
+        Returns:
+            Response: application/octet-stream kare paketi
+        """
+        if not self.face_plugin or not hasattr(self.face_plugin, "animation_engine") or self.face_plugin.animation_engine is None:
+            raise HTTPException(status_code=503, detail="Animasyon motoru çalışmıyor")
+        
+        engine = self.face_plugin.animation_engine
+        loop = asyncio.get_running_loop()
+        pack = await loop.run_in_executor(None, lambda: engine.render_preview(animation, fps))
+        
+        if pack is None:
+            name = animation if isinstance(animation, str) else "editör animasyonu"
+            raise HTTPException(status_code=400, detail=f"Animasyon önizlemesi çizilemedi: {name}")
+        
+        # Başarısız eylem sayısı; ayrıntılar sunucu loglarında
+        return Response(content=pack.to_bytes(), media_type="application/octet-stream",
+                        headers={"Cache-Control": "no-store", "X-Preview-Errors": str(len(pack.errors))})
+    
     def set_config(self, config: Dict) -> None:
         """
         Yapılandırma ayarlarını ayarlar
@@ -114,8 +179,10 @@ class RoutesManager:
             # Face Plugin referansını kontrol et
             face_plugin_running = False
             
-            # Önce doğrudan referans ile kontrol et
-            if self.face_plugin and hasattr(self.face_plugin, 'is_running') and self.face_plugin.is_running:
+            # Önce IPC bağlantısı ve doğrudan referans ile kontrol et
+            if self.face_ipc and self.face_ipc.is_connected:
+                face_plugin_running = True
+            elif self.face_plugin and hasattr(self.face_plugin, 'is_running') and self.face_plugin.is_running:
                 face_plugin_running = True
             else:
                 # Durum dosyasından kontrol et
@@ -185,12 +252,18 @@ class RoutesManager:
             if self.face_plugin.emotion_engine:
                 current_emotion = self.face_plugin.emotion_engine.get_current_emotion()
             
+            # OLED animasyon döngüsü durumu (kare süreleri, kaçırılan son tarihler)
+            display_status = None
+            if getattr(self.face_plugin, "oled_controller", None):
+                display_status = self.face_plugin.oled_controller.get_status()
+            
             return {
                 "status": "running" if self.face_plugin.is_running else "stopped",
                 "uptime": self.face_plugin.uptime if hasattr(self.face_plugin, "uptime") else 0,
                 "theme": current_theme,
                 "emotion": current_emotion,
-                "system": system_stats
+                "system": system_stats,
+                "display": display_status
             }
         
         @app.get("/api/themes")
@@ -208,10 +281,13 @@ class RoutesManager:
         
         @app.post("/api/themes/{theme_name}")
         async def set_theme(theme_name: str):
-            if not self.face_plugin:
-                raise HTTPException(status_code=503, detail="Yüz eklentisi çalışmıyor")
+            success = await self._call_face_ipc("set_theme", theme=theme_name)
             
-            success = self.face_plugin.set_theme(theme_name)
+            if success is None:
+                if not self.face_plugin:
+                    raise HTTPException(status_code=503, detail="Yüz eklentisi çalışmıyor")
+                
+                success = self.face_plugin.set_theme(theme_name)
             
             if not success:
                 raise HTTPException(status_code=400, detail=f"Tema ayarlanamadı: {theme_name}")
@@ -220,66 +296,34 @@ class RoutesManager:
         
         @app.post("/api/emotions/{emotion}")
         async def set_emotion(emotion: str, intensity: float = 1.0):
-            if not self.face_plugin:
-                raise HTTPException(status_code=503, detail="Yüz eklentisi çalışmıyor")
-            
             # Yoğunluk değerini sınırla
             intensity = max(0.0, min(1.0, intensity))
             
-            success = self.face_plugin.set_emotion(emotion, intensity)
+            success = await self._call_face_ipc("set_emotion", emotion=emotion, intensity=intensity)
+            
+            if success is None:
+                if not self.face_plugin:
+                    raise HTTPException(status_code=503, detail="Yüz eklentisi çalışmıyor")
+                
+                success = self.face_plugin.set_emotion(emotion, intensity)
             
             if not success:
                 raise HTTPException(status_code=400, detail=f"Duygu ayarlanamadı: {emotion}")
             
             return {"success": True, "emotion": emotion, "intensity": intensity}
         
-        @app.get("/api/simulation")
-        async def get_simulation_images():
+        @app.get("/api/simulation/{source}/frame")
+        async def get_simulation_frame(source: str):
             """
-            Simülasyon klasöründeki son görüntüleri döndürür
+            Kaynağın en son simülasyon karesini ikili mesaj olarak döndürür
+            (WebSocket akışıyla aynı biçim, bkz. frame_sink.encode_frame)
             """
-            simulation_dir = os.path.join(self.project_dir, "simulation")
-            if not os.path.exists(simulation_dir):
-                raise HTTPException(status_code=404, detail="Simülasyon klasörü bulunamadı")
-            
-            # Son oluşturulan görüntüleri bul
-            images = {
-                "left_eye": None,
-                "right_eye": None,
-                "mouth": None,
-                "leds": None
-            }
+            message = self.websocket_manager.get_latest_frame_message(source)
+            if message is None:
+                raise HTTPException(status_code=404, detail=f"Simülasyon karesi bulunamadı: {source}")
             
-            try:
-                # Sol göz görüntüleri
-                left_eye_images = sorted(glob.glob(os.path.join(simulation_dir, "display_left_eye_*.png")))
-                if left_eye_images:
-                    images["left_eye"] = os.path.basename(left_eye_images[-1])
-                
-                # Sağ göz görüntüleri
-                right_eye_images = sorted(glob.glob(os.path.join(simulation_dir, "display_right_eye_*.png")))
-                if right_eye_images:
-                    images["right_eye"] = os.path.basename(right_eye_images[-1])
-                
-                # Ağız görüntüleri
-                mouth_images = sorted(glob.glob(os.path.join(simulation_dir, "display_mouth_*.png")))
-                if mouth_images:
-                    images["mouth"] = os.path.basename(mouth_images[-1])
-                
-                # LED görüntüleri
-                led_images = sorted(glob.glob(os.path.join(simulation_dir, "leds_*.png")))
-                if led_images:
-                    images["leds"] = os.path.basename(led_images[-1])
-                
-                return {
-                    "timestamp": time.time(),
-                    "images": images
-                }
-            except Exception as e:
-                logger.error(f"Simülasyon görüntüleri alınırken hata: {e}")
-                raise HTTPException(status_code=500, detail=f"Simülasyon görüntüleri alınamadı: {e}")
+            return Response(content=message, media_type="application/octet-stream")
         
-        # WebSocket endpoint'i yoluyla düzenli simülasyon güncellemeleri göndermek için yeni bir fonksiyon
         @app.websocket("/ws/simulation")
         async def simulation_updates(websocket: WebSocket):
             await self.websocket_manager.handle_simulation_websocket(websocket)
@@ -348,9 +392,15 @@ class RoutesManager:
             if not self.face_plugin or not hasattr(self.face_plugin, "animation_engine") or self.face_plugin.animation_engine is None:
                 raise HTTPException(status_code=503, detail="Animasyon motoru çalışmıyor")
                 
+            engine = self.face_plugin.animation_engine
+            
+            # Liste animasyon dizininden gelir; animasyon dosyaları okunmaz
+            if hasattr(engine, "get_animation_index"):
+                return {"animations": engine.get_animation_index()}
+            
             animations = []
-            for anim_name in self.face_plugin.animation_engine.get_animation_names():
-                anim_info = self.face_plugin.animation_engine.get_animation_info(anim_name)
+            for anim_name in engine.get_animation_names():
+                anim_info = engine.get_animation_info(anim_name)
                 if anim_info:
                     animations.append({
                         "name": anim_name,
@@ -364,10 +414,13 @@ class RoutesManager:
         @app.post("/api/animations/{name}/play")
         async def play_animation(name: str):
             """Animasyon oynatır"""
-            if not self.face_plugin or not hasattr(self.face_plugin, "animation_engine") or self.face_plugin.animation_engine is None:
-                raise HTTPException(status_code=503, detail="Animasyon motoru çalışmıyor")
-                
-            success = self.face_plugin.animation_engine.play_animation(name)
+            success = await self._call_face_ipc("play_animation", name=name)
+            
+            if success is None:
+                if not self.face_plugin or not hasattr(self.face_plugin, "animation_engine") or self.face_plugin.animation_engine is None:
+                    raise HTTPException(status_code=503, detail="Animasyon motoru çalışmıyor")
+                    
+                success = self.face_plugin.animation_engine.play_animation(name)
             
             if not success:
                 raise HTTPException(status_code=400, detail=f"Animasyon oynatılamadı: {name}")
@@ -430,6 +483,16 @@ class RoutesManager:
                 
             return self.face_plugin.animation_engine.get_animation_status()
         
+        @app.get("/api/animations/{name}/preview")
+        async def get_animation_preview(name: str, fps: Optional[float] = None):
+            """Kayıtlı animasyonun önizleme kare paketini döndürür"""
+            return await self._render_animation_preview(name, fps)
+        
+        @app.post("/api/animations/preview")
+        async def post_animation_preview(animation_data: Dict, fps: Optional[float] = None):
+            """Editördeki (kaydedilmemiş) animasyonun önizleme kare paketini döndürür"""
+            return await self._render_animation_preview(animation_data, fps)
+        
         # Tema editörü sayfa endpoint'i
         @app.get("/theme-editor/{theme_name}", response_class=HTMLResponse)
         async def theme_editor(request: Request, theme_name: str):
@@ -7,8 +7,12 @@
 # Bağımlılıklar: fastapi, uvicorn, jinja2, aiofiles, psutil, websockets
 # Bağlı Dosyalar: face_plugin.py, io_manager.py, dashboard_websocket.py, state_reflector.js
 
-# Versiyon: 0.5.0
+# Versiyon: 0.5.4
 # Değişiklikler:
+# - [0.5.4] IPC olayları okuyucu iş parçacığından sunucu olay döngüsüne run_coroutine_threadsafe ile aktarılıyor
+# - [0.5.3] Face Plugin'e Unix soket IPC kanalı ile bağlanma, olayların WebSocket'e iletilmesi eklendi
+# - [0.5.2] WebSocket yöneticisine yapılandırma (paylaşılan kare tamponu yolu) aktarılıyor
+# - [0.5.1] Periyodik istatistik yayınına OLED kare zamanlama bilgileri eklendi
 # - [0.5.0] Durum Yansıtma Protokolü (State Reflection Protocol) entegrasyonu eklendi
 # - [0.5.0] Ses tepkimeli ifade sistemi için WebSocket entegrasyonu eklendi
 # - [0.5.0] IFrame Bridge entegrasyon desteği eklendi
@@ -52,6 +56,7 @@ from modules.dashboard_templates import TemplateManager
 from modules.dashboard_websocket import WebSocketManager
 from modules.dashboard_routes import RoutesManager
 from modules.dashboard_widgets.widget_manager import WidgetManager
+from modules.face.face_plugin_ipc import FacePluginIPCClient, get_ipc_socket_path
 
 # Logger yapılandırması
 logger = logging.getLogger("DashboardServer")
@@ -111,6 +116,10 @@ class DashboardServer:
             project_dir=PROJECT_DIR
         )
         self.routes_manager.set_config(self.config)
+        self.websocket_manager.set_config(self.config)
+        
+        # Sunucu olay döngüsü (uvicorn başladığında atanır)
+        self.loop = None
         
         # FastAPI uygulamasını oluştur
         self.app = self.create_app()
@@ -123,6 +132,7 @@ class DashboardServer:
         
         # İletişim geriye doğru referansları
         self.face_plugin = None
+        self.face_ipc = None
         
         logger.info("Dashboard Sunucu başlatıldı.")
     
@@ -151,6 +161,11 @@ class DashboardServer:
         # Rotaları kaydet
         self.routes_manager.register_routes(app, self.static_dir, self.templates_dir)
         
+        # Diğer iş parçacıklarından yayın yapabilmek için sunucu olay döngüsünü sakla
+        @app.on_event("startup")
+        async def remember_event_loop():
+            self.loop = asyncio.get_running_loop()
+        
         return app
     
     def start(self) -> bool:
@@ -201,6 +216,10 @@ class DashboardServer:
         self.is_running = False
         self.stop_event.set()
         
+        # IPC bağlantısını kapat
+        if self.face_ipc:
+            self.face_ipc.close()
+        
         logger.info("Dashboard sunucusu durduruldu.")
     
     def _run_server(self) -> None:
@@ -226,6 +245,11 @@ class DashboardServer:
                 # Sistem istatistiklerini al
                 stats = get_system_stats()
                 
+                # OLED kare zamanlaması (p50/p95/p99, kaçırılan son tarihler)
+                oled_controller = getattr(self.face_plugin, "oled_controller", None) if self.face_plugin else None
+                if oled_controller and hasattr(oled_controller, "get_frame_timing"):
+                    stats["frame_timing"] = oled_controller.get_frame_timing()
+                
                 # WebSocket istemcilerine gönder
                 if self.websocket_manager.active_connections:
                     asyncio.run(self.websocket_manager.broadcast({"type": "stats", "data": stats}))
@@ -261,68 +285,144 @@ class DashboardServer:
         if face_plugin and hasattr(face_plugin, "sound_processor"):
             self.websocket_manager.register_sound_callbacks()
     
+    def connect_face_plugin_ipc(self, timeout: float = None) -> Optional[Dict]:
+        """
+        Çalışan Face Plugin sürecine IPC kanalı üzerinden bağlanır
+        
+        Bağlantı kurulursa komutlar (duygu, tema, animasyon) doğrudan çalışan
+        sürece iletilir ve durum değişiklikleri WebSocket istemcilerine aktarılır.
+        Olaylar IPC okuyucu iş parçacığında gelir; yayın sunucu olay döngüsüne
+        (çağrı bir olay döngüsü içinden yapılıyorsa o döngüye) aktarılır.
+        
+        Args:
+            timeout (float, optional): Hazır olma bekleme süresi (saniye). None ise yapılandırmadan alınır.
+            
+        Returns:
+            Optional[Dict]: Plugin durumu veya bağlantı kurulamazsa None
+        """
+        ipc_config = self.config.get("ipc", {})
+        if not ipc_config.get("enabled", True):
+            return None
+        
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sunucu henüz başlamadı, döngü başlangıçta atanacak
+            pass
+        
+        if timeout is None:
+            timeout = ipc_config.get("connect_timeout", 2.0)
+        
+        client = FacePluginIPCClient(get_ipc_socket_path(self.config))
+        if not client.wait_until_ready(timeout):
+            logger.info("Face Plugin IPC kanalına ulaşılamadı, durum dosyası kullanılacak")
+            return None
+        
+        try:
+            status = client.call("get_status")
+            client.subscribe(self._on_face_plugin_event)
+        except Exception as e:
+            logger.error(f"Face Plugin IPC durumu alınamadı: {e}")
+            client.close()
+            return None
+        
+        self.face_ipc = client
+        self.routes_manager.set_face_ipc(client)
+        logger.info(f"Face Plugin IPC kanalına bağlanıldı (gidiş-dönüş: {client.last_rtt_ms:.2f} ms)")
+        return status
+    
+    def _on_face_plugin_event(self, event: str, data: Any) -> None:
+        """
+        Face Plugin'den gelen IPC olaylarını WebSocket istemcilerine iletir
+        
+        IPC okuyucu iş parçacığında çağrılır; yayın sunucu olay döngüsünde
+        çalıştırılır ve sonucu beklenmez.
+        
+        Args:
+            event (str): Olay adı (state_change, emotion_changed, theme_changed, ...)
+            data (Any): Olay verisi ("type" alanı içeren mesaj)
+        """
+        loop = self.loop
+        if loop is None or loop.is_closed() or not self.websocket_manager.active_connections:
+            return
+        
+        message = data if isinstance(data, dict) else {"type": event, "data": data}
+        try:
+            asyncio.run_coroutine_threadsafe(self.websocket_manager.broadcast(message), loop)
+        except Exception as e:
+            logger.error(f"Face Plugin olayı iletilirken hata: {e}")
+    
     def load_face_plugin_status(self) -> None:
         """
-        Face Plugin durum dosyasını okur ve bağlantı kurar
+        Face Plugin'e bağlanır: önce IPC kanalını dener, yoksa durum dosyasını okur
         """
-        if not os.path.exists(STATUS_FILE):
+        ipc_status = self.connect_face_plugin_ipc()
+        
+        if ipc_status is None and not os.path.exists(STATUS_FILE):
             logger.warning(f"Face Plugin durum dosyası bulunamadı: {STATUS_FILE}")
             return
         
         try:
-            with open(STATUS_FILE, "r") as f:
-                status_data = json.load(f)
-                plugin_module = status_data.get("plugin_module")
-                plugin_class = status_data.get("plugin_class")
+            status_data = {}
+            if os.path.exists(STATUS_FILE):
+                with open(STATUS_FILE, "r") as f:
+                    status_data = json.load(f)
+            
+            plugin_module = status_data.get("plugin_module", "src.modules.face1_plugin")
+            plugin_class = status_data.get("plugin_class", "FacePlugin")
+            
+            if ipc_status is not None:
+                status = "running" if ipc_status.get("running") else ipc_status.get("state")
+                logger.info(f"Face plugin durumu IPC kanalından alındı: {status}")
+            else:
                 status = status_data.get("status")
-                
                 logger.info(f"Face plugin durumu dosyadan okundu: {status}")
-                
-                # Sadece plugin çalışırken bağlanmaya çalış
-                if status != "running":
-                    logger.warning(f"Face plugin çalışmıyor, durum: {status}")
-                    return
-                
-                if plugin_module and plugin_class:
-                    try:
-                        # Modülü dinamik olarak içe aktar
-                        module = importlib.import_module(plugin_module)
-                        if hasattr(module, plugin_class):
-                            # Sınıfı al
-                            plugin_cls = getattr(module, plugin_class)
-                            
-                            # Instance oluştur, çalışan plugin'e bağlan
-                            config_path = os.path.join(PROJECT_DIR, "config", "config.json")
-                            face_plugin = plugin_cls(config_path)
-                            
-                            # Gerekli alt modüllerin başlatılıp başlatılmadığını kontrol et
-                            if not hasattr(face_plugin, "animation_engine") or face_plugin.animation_engine is None:
-                                logger.warning("Face plugin'in animation_engine modülü başlatılmamış veya None")
-                                
-                                # Animasyon motoru için varsayılan değer atamaya çalış
-                                try:
-                                    if hasattr(face_plugin, "init_animation_engine"):
-                                        logger.info("Animation engine başlatılmaya çalışılıyor...")
-                                        face_plugin.init_animation_engine()
-                                except Exception as init_error:
-                                    logger.error(f"Animation engine başlatılamadı: {init_error}")
-                            
-                            # Widget'ları başlatmak için plugin referansını ayarla
-                            self.set_face_plugin(face_plugin)
-                            
-                            logger.info(f"Face plugin referansı hazırlandı ve widget'lar yüklendi")
+            
+            # Sadece plugin çalışırken bağlanmaya çalış
+            if status != "running":
+                logger.warning(f"Face plugin çalışmıyor, durum: {status}")
+                return
+            
+            if plugin_module and plugin_class:
+                try:
+                    # Modülü dinamik olarak içe aktar
+                    module = importlib.import_module(plugin_module)
+                    if hasattr(module, plugin_class):
+                        # Sınıfı al
+                        plugin_cls = getattr(module, plugin_class)
+                        
+                        # Instance oluştur, çalışan plugin'e bağlan
+                        config_path = os.path.join(PROJECT_DIR, "config", "config.json")
+                        face_plugin = plugin_cls(config_path)
+                        
+                        # Gerekli alt modüllerin başlatılıp başlatılmadığını kontrol et
+                        if not hasattr(face_plugin, "animation_engine") or face_plugin.animation_engine is None:
+                            logger.warning("Face plugin'in animation_engine modülü başlatılmamış veya None")
                             
-                            # Animation engine kontrolünü yap
-                            if not hasattr(face_plugin, "animation_engine") or face_plugin.animation_engine is None:
-                                logger.warning("Dashboard üzerindeki animasyon özellikleri çalışmayabilir, animation_engine mevcut değil")
-                            else:
-                                logger.info("Animation engine başarıyla referanslandı")
+                            # Animasyon motoru için varsayılan değer atamaya çalış
+                            try:
+                                if hasattr(face_plugin, "init_animation_engine"):
+                                    logger.info("Animation engine başlatılmaya çalışılıyor...")
+                                    face_plugin.init_animation_engine()
+                            except Exception as init_error:
+                                logger.error(f"Animation engine başlatılamadı: {init_error}")
+                        
+                        # Widget'ları başlatmak için plugin referansını ayarla
+                        self.set_face_plugin(face_plugin)
+                        
+                        logger.info(f"Face plugin referansı hazırlandı ve widget'lar yüklendi")
+                        
+                        # Animation engine kontrolünü yap
+                        if not hasattr(face_plugin, "animation_engine") or face_plugin.animation_engine is None:
+                            logger.warning("Dashboard üzerindeki animasyon özellikleri çalışmayabilir, animation_engine mevcut değil")
                         else:
-                            logger.error(f"Plugin sınıfı bulunamadı: {plugin_class}")
-                    except Exception as e:
-                        logger.error(f"Plugin modülü içe aktarılırken hata: {e}")
-                else:
-                    logger.warning("Face Plugin durum dosyasında eksik modül/sınıf bilgisi.")
+                            logger.info("Animation engine başarıyla referanslandı")
+                    else:
+                        logger.error(f"Plugin sınıfı bulunamadı: {plugin_class}")
+                except Exception as e:
+                    logger.error(f"Plugin modülü içe aktarılırken hata: {e}")
+            else:
+                logger.warning("Face Plugin durum dosyasında eksik modül/sınıf bilgisi.")
         
         except Exception as e:
             logger.error(f"Face Plugin durumu yüklenirken hata: {e}")
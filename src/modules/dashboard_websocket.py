@@ -5,9 +5,10 @@
 # Dosya: dashboard_websocket.py
 # Açıklama: Dashboard için WebSocket işlemleri ve Durum Yansıtma Protokolü desteği
 # Bağımlılıklar: fastapi, websockets
-# Bağlı Dosyalar: dashboard_server.py, state_reflector.js, iframe_bridge.js
+# Bağlı Dosyalar: dashboard_server.py, state_reflector.js, iframe_bridge.js, frame_sink.py,
+#                 shared_framebuffer.py
 
-# Versiyon: 0.5.1
+# Versiyon: 0.5.5
 # Değişiklikler:
 # - [0.1.0] dashboard_server.py dosyasından ayrıldı
 # - [0.5.0] Durum Yansıtma Protokolü desteği eklendi
@@ -15,6 +16,11 @@
 # - [0.5.0] Ses ve animasyon olayları iyileştirildi
 # - [0.5.1] Simülasyon WebSocket bağlantı yönetimi iyileştirildi 
 # - [0.5.1] Hata işleme mekanizması geliştirildi
+# - [0.5.2] Simülasyon akışı dosya taraması yerine kare boru hattından ikili mesajlarla yapılıyor;
+#           yalnızca değişen kareler, istemci başına FPS ve en son kareye düşürme ile geri basınç
+# - [0.5.3] Yüz eklentisi ayrı süreçte çalışırken kareler paylaşılan kare tamponundan okunuyor
+# - [0.5.4] Sayfa açılışındaki ilk kare için kaynağın en son karesi ikili mesaj olarak alınabiliyor
+# - [0.5.5] Simülasyon akışında nesne olmayan JSON mesajları (liste, sayı, metin) yok sayılıyor
 #
 # Yazar: GitHub Copilot
 # Son Güncelleme: 2025-05-06
@@ -27,7 +33,6 @@ import json
 import logging
 import time
 import asyncio
-import glob
 from typing import Dict, Any, Dict, Callable, List, Optional
 from pathlib import Path
 
@@ -39,6 +44,14 @@ sys.path.append(str(SRC_DIR))
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+# Simülasyon kare akışı için ikili kodlama (PIL ve numpy gerektirir)
+try:
+    from modules.frame_sink import encode_frame, WIRE_VERSION
+    from modules.shared_framebuffer import SharedFrameBufferReader
+    FRAME_SINK_AVAILABLE = True
+except ImportError:
+    FRAME_SINK_AVAILABLE = False
+
 # Logger yapılandırması
 logger = logging.getLogger("DashboardWebSocket")
 
@@ -54,9 +67,21 @@ class WebSocketManager:
         self.last_speaking_state = False
         # Simülasyon modu için durumlar
         self.simulation_directory = os.path.join(PROJECT_DIR, "simulation")
-        self.simulation_update_interval = 0.5  # Saniye
-        self.max_image_age = 3600  # 1 saat
-        self.max_simulation_files = 1000  # Maksimum dosya sayısı
+        self.simulation_default_fps = 30  # İstemci FPS belirtmezse
+        self.simulation_max_fps = 60
+        # Yüz eklentisi ayrı süreçte çalışırken kareler paylaşılan bellekten okunur
+        self.shared_frames = SharedFrameBufferReader() if FRAME_SINK_AVAILABLE else None
+    
+    def set_config(self, config: Dict) -> None:
+        """
+        Yapılandırma ayarlarını uygular (paylaşılan kare tamponu yolu)
+        
+        Args:
+            config (Dict): Yapılandırma ayarları
+        """
+        path = config.get("shared_framebuffer", {}).get("path")
+        if path and FRAME_SINK_AVAILABLE:
+            self.shared_frames = SharedFrameBufferReader(path)
     
     def set_face_plugin(self, face_plugin) -> None:
         """
@@ -342,212 +367,179 @@ class WebSocketManager:
         """
         Simülasyon WebSocket bağlantısını işler
         
+        Kareler kare boru hattının halka tamponundan okunur ve ikili mesaj olarak
+        (bkz. frame_sink.encode_frame) yalnızca değiştiklerinde gönderilir.
+        İstemci başına hedef FPS URL'deki `fps` parametresi veya
+        {"type": "set_fps", "fps": N} mesajı ile belirlenir. İstemci yetişemezse
+        her kaynağın yalnızca en son karesi bekletilir, aradaki kareler düşürülür.
+        
         Args:
             websocket (WebSocket): WebSocket bağlantısı
         """
         await websocket.accept()
         
+        client_id = f"sim_{id(websocket)}"
+        self.active_connections[client_id] = websocket
+        
+        client = {
+            "fps": self._clamp_simulation_fps(websocket.query_params.get("fps", self.simulation_default_fps)),
+            "sent": 0,
+            "dropped": 0
+        }
+        pending = {}  # Kaynak adı -> gönderilmeyi bekleyen en son kare
+        ready = asyncio.Event()
+        
+        async def produce() -> None:
+            # Halka tampondaki yeni kareleri istemcinin FPS'i ile toplar
+            last_seq = {}
+            last_data = {}
+            while True:
+                frames = self._get_frame_source()
+                if frames is not None:
+                    for source in frames.sources():
+                        frame = frames.latest(source)
+                        if frame is None or last_seq.get(source) == frame.seq:
+                            continue
+                        last_seq[source] = frame.seq
+                        
+                        # İçeriği değişmeyen kareleri gönderme
+                        if last_data.get(source) == frame.data:
+                            continue
+                        last_data[source] = frame.data
+                        
+                        # Önceki kare henüz gönderilemediyse en son kare ile değiştir
+                        if source in pending:
+                            client["dropped"] += 1
+                        pending[source] = frame
+                    
+                    if pending:
+                        ready.set()
+                
+                await asyncio.sleep(1.0 / client["fps"])
+        
+        async def send() -> None:
+            # Bekleyen kareleri ikili mesaj olarak gönderir
+            while True:
+                await ready.wait()
+                ready.clear()
+                frames = list(pending.values())
+                pending.clear()
+                for frame in frames:
+                    await websocket.send_bytes(encode_frame(frame))
+                    client["sent"] += 1
+        
+        async def receive() -> None:
+            # İstemci mesajlarını (FPS değişikliği) işler, bağlantı kapanınca biter
+            while True:
+                text = await websocket.receive_text()
+                try:
+                    message = json.loads(text)
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                if message.get("type") == "set_fps":
+                    client["fps"] = self._clamp_simulation_fps(message.get("fps"))
+                    await websocket.send_json({"type": "simulation_fps", "fps": client["fps"]})
+        
+        tasks = []
         try:
-            client_id = f"sim_{id(websocket)}"
-            self.active_connections[client_id] = websocket
-            
-            # Bağlantı durumunu izlemek için bayrak
-            connection_active = True
+            frames = self._get_frame_source()
             
             # Hoş geldin mesajını gönder
             await websocket.send_json({
                 "type": "welcome",
-                "message": "Simülasyon akışı başlatıldı"
+                "message": "Simülasyon akışı başlatıldı",
+                "format": "binary",
+                "version": WIRE_VERSION if FRAME_SINK_AVAILABLE else None,
+                "fps": client["fps"],
+                "sources": frames.sources() if frames is not None else []
             })
             
-            # Simülasyon klasörünü temizle (eski dosyaları sil)
-            await self._cleanup_simulation_files()
+            if not FRAME_SINK_AVAILABLE or frames is None:
+                logger.warning("Simülasyon kare kaynağı bulunamadı, yalnızca kontrol mesajları işlenecek")
             
-            logger.info(f"Simülasyon WebSocket bağlantısı başlatıldı: {client_id}")
+            logger.info(f"Simülasyon WebSocket bağlantısı başlatıldı: {client_id} (hedef FPS: {client['fps']})")
             
-            # İlk simülasyon görüntülerini gönder
-            initial_images = await self._gather_simulation_images()
-            if initial_images and any(initial_images.values()):
-                try:
-                    await websocket.send_json({
-                        "type": "simulation_update",
-                        "timestamp": time.time(),
-                        "images": initial_images
-                    })
-                except Exception as e:
-                    logger.error(f"İlk simülasyon görüntüleri gönderilirken hata: {e}")
+            tasks = [asyncio.ensure_future(receive())]
+            if FRAME_SINK_AVAILABLE:
+                tasks += [asyncio.ensure_future(produce()), asyncio.ensure_future(send())]
             
-            # İstemci bağlantıyı kesene kadar düzenli güncellemeler gönder
-            last_update_time = time.time()
-            last_update_images = initial_images
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None and not isinstance(error, WebSocketDisconnect):
+                    raise error
             
-            while connection_active:
-                try:
-                    # Son simülasyon görüntülerini al
-                    current_time = time.time()
-                    
-                    # Güncelleme aralığını kontrol et
-                    if current_time - last_update_time >= self.simulation_update_interval:
-                        images = await self._gather_simulation_images()
-                        
-                        # Sadece yeni görüntüler varsa gönder
-                        if images and self._has_new_images(images, last_update_images):
-                            # Bağlantı aktif mi kontrol et
-                            if not websocket.client_state.CONNECTED:
-                                logger.info(f"İstemci artık bağlı değil, simülasyon döngüsü durduruluyor: {client_id}")
-                                connection_active = False
-                                break
-                            
-                            # Görüntü güncellemesini gönder
-                            try:
-                                await websocket.send_json({
-                                    "type": "simulation_update",
-                                    "timestamp": current_time,
-                                    "images": images
-                                })
-                                
-                                # Başarılı gönderimden sonra son güncelleme değerlerini kaydet
-                                last_update_time = current_time
-                                last_update_images = images.copy()
-                                
-                            except RuntimeError as e:
-                                # WebSocket bağlantı hatası, döngüyü sonlandır
-                                if "close message has been sent" in str(e) or "connection is closed" in str(e):
-                                    logger.info(f"WebSocket bağlantısı kapandı, simülasyon döngüsü durduruluyor: {client_id}")
-                                    connection_active = False
-                                    break
-                                else:
-                                    # Başka bir hata ise yükselt
-                                    raise
-                    
-                    # Her döngüde kısa bir bekleme yap
-                    await asyncio.sleep(0.1)
-                    
-                except Exception as e:
-                    logger.error(f"Simülasyon güncellemesi gönderilirken hata: {e}")
-                    
-                    # Ciddi bir hata oluştuğunda da döngüyü sonlandır
-                    if "close message has been sent" in str(e) or "connection is closed" in str(e):
-                        connection_active = False
-                        break
-                        
-                    # Diğer hatalar için kısa bir süre bekle ve devam et
-                    await asyncio.sleep(1)
-                
         except WebSocketDisconnect:
-            logger.info(f"Simülasyon WebSocket bağlantısı kapandı: {client_id}")
+            pass
         except Exception as e:
             logger.error(f"Simülasyon WebSocket hatası: {e}")
         finally:
+            for task in tasks:
+                task.cancel()
+            
             # Bağlantıyı kaldır
             if client_id in self.active_connections:
                 del self.active_connections[client_id]
+            
+            logger.info(f"Simülasyon WebSocket bağlantısı kapandı: {client_id} "
+                        f"(gönderilen: {client['sent']}, düşürülen: {client['dropped']})")
     
-    async def _gather_simulation_images(self) -> Dict[str, str]:
+    def _clamp_simulation_fps(self, fps) -> float:
         """
-        Son simülasyon görüntülerini bulur ve döndürür
+        İstemcinin istediği FPS'i geçerli aralığa sınırlar
         
+        Args:
+            fps: İstenen FPS (sayı veya metin)
+            
         Returns:
-            Dict[str, str]: Görüntü türlerine göre dosya isimleri
+            float: 1 ile simulation_max_fps arasında FPS
         """
         try:
-            # Simülasyon dizini yoksa oluştur
-            os.makedirs(self.simulation_directory, exist_ok=True)
-            
-            images = {
-                "left_eye": None,
-                "right_eye": None,
-                "mouth": None,
-                "leds": None
-            }
-            
-            # Sol göz görüntüleri
-            left_eye_images = sorted(glob.glob(os.path.join(self.simulation_directory, "display_left_eye_*.png")))
-            if left_eye_images:
-                images["left_eye"] = os.path.basename(left_eye_images[-1])
-            
-            # Sağ göz görüntüleri
-            right_eye_images = sorted(glob.glob(os.path.join(self.simulation_directory, "display_right_eye_*.png")))
-            if right_eye_images:
-                images["right_eye"] = os.path.basename(right_eye_images[-1])
-            
-            # Ağız görüntüleri
-            mouth_images = sorted(glob.glob(os.path.join(self.simulation_directory, "display_mouth_*.png")))
-            if mouth_images:
-                images["mouth"] = os.path.basename(mouth_images[-1])
-            
-            # LED görüntüleri
-            led_images = sorted(glob.glob(os.path.join(self.simulation_directory, "leds_*.png")))
-            if led_images:
-                images["leds"] = os.path.basename(led_images[-1])
-            
-            # Hiç görüntü bulunamazsa log ekle
-            if not any(images.values()):
-                logger.warning("Simülasyon klasöründe hiç görüntü bulunamadı")
-                
-            return images
-            
-        except Exception as e:
-            logger.error(f"Simülasyon görüntüleri toplanırken hata: {e}")
-            return {}
+            fps = float(fps)
+        except (TypeError, ValueError):
+            fps = self.simulation_default_fps
+        return float(max(1.0, min(self.simulation_max_fps, fps)))
     
-    def _has_new_images(self, new_images: Dict[str, str], old_images: Dict[str, str]) -> bool:
+    def get_latest_frame_message(self, source: str) -> Optional[bytes]:
         """
-        Yeni görüntüler olup olmadığını kontrol eder
+        Kaynağın en son karesini WebSocket akışıyla aynı ikili biçimde döndürür
         
         Args:
-            new_images (Dict[str, str]): Yeni görüntü dosyaları
-            old_images (Dict[str, str]): Eski görüntü dosyaları
-            
+            source (str): Kaynak adı (ör. "left_eye", "leds")
+        
         Returns:
-            bool: Yeni görüntü varsa True
+            Optional[bytes]: encode_frame ile kodlanmış kare, kare yoksa None
         """
-        if not old_images:
-            return bool(new_images and any(new_images.values()))
-            
-        # Herhangi bir görüntü türü değiştiyse true döndür
-        for img_type in ["left_eye", "right_eye", "mouth", "leds"]:
-            if new_images.get(img_type) != old_images.get(img_type):
-                return True
-                
-        return False
+        if not FRAME_SINK_AVAILABLE:
+            return None
+        
+        frames = self._get_frame_source()
+        frame = frames.latest(source) if frames is not None else None
+        return encode_frame(frame) if frame is not None else None
     
-    async def _cleanup_simulation_files(self) -> None:
+    def _get_frame_source(self):
         """
-        Eski simülasyon dosyalarını temizler
+        Simülasyon kareleri için kaynağı döndürür
+        
+        Kareleri başka bir süreç (start_all.py ile başlatılan yüz eklentisi) yazıyorsa
+        paylaşılan kare tamponu, aksi halde aynı süreçteki Face Plugin kontrolcülerinin
+        kare boru hattındaki halka tampon kullanılır.
+        
+        Returns:
+            SharedFrameBufferReader veya RingBufferSink: Kare kaynağı, yoksa None
         """
-        try:
-            # Simülasyon dizini yoksa oluştur ve işlemi atla
-            if not os.path.exists(self.simulation_directory):
-                os.makedirs(self.simulation_directory, exist_ok=True)
-                return
-                
-            # Tüm simülasyon görüntülerini bul
-            pattern = os.path.join(self.simulation_directory, "*.png")
-            all_files = glob.glob(pattern)
-            
-            # Dosya sayısı limiti aşılmadıysa işlem yapma
-            if len(all_files) <= self.max_simulation_files:
-                return
-                
-            # Dosyaları oluşturma zamanına göre sırala
-            sorted_files = sorted(all_files, key=os.path.getctime)
-            
-            # Silinecek dosya sayısını hesapla (dosya sayısını limitle sınırla)
-            files_to_delete = sorted_files[:len(sorted_files) - self.max_simulation_files]
-            
-            # Eski dosyaları sil
-            for file_path in files_to_delete:
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    logger.warning(f"Eski simülasyon dosyası silinirken hata: {e}")
-            
-            if files_to_delete:
-                logger.info(f"{len(files_to_delete)} eski simülasyon dosyası temizlendi")
-                
-        except Exception as e:
-            logger.error(f"Simülasyon dosyaları temizlenirken hata: {e}")
+        shared = self.shared_frames
+        if shared is not None and shared.is_alive() and shared.writer_pid != os.getpid():
+            return shared
+        
+        for name in ("oled_controller", "led_controller"):
+            controller = getattr(self.face_plugin, name, None)
+            pipeline = getattr(controller, "frame_pipeline", None)
+            if pipeline is not None:
+                return pipeline.get_sink("ring_buffer")
+        return None
 
     def register_sound_callbacks(self) -> None:
         """
@@ -4,11 +4,15 @@
 # Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
 # Dosya: face_plugin_callbacks.py
 # Açıklama: FacePlugin sınıfının callback işlevleri, duygu değişimi, tema değişimi vb.
-# Bağımlılıklar: logging, random
+# Bağımlılıklar: logging
 # Bağlı Dosyalar: face_plugin.py, face_plugin_base.py
 
-# Versiyon: 0.4.0
+# Versiyon: 0.4.4
 # Değişiklikler:
+# - [0.4.4] Geçiş efekti seçimi süreçten bağımsız (zlib.crc32); hash() tuzu her çalıştırmada farklı efekt seçiyordu
+# - [0.4.3] Duygu geçişi LED efekti animasyonu yeniden başlatmak yerine bindirme katmanında çalışıyor
+# - [0.4.2] Tema değişiminde tema yöneticisinin derlediği geometri OLED denetleyicisine aktarılıyor
+# - [0.4.1] Duygu ve tema değişimleri bildirim kanalına (IPC olayları) iletiliyor
 # - [0.4.0] FacePlugin modülerleştirildi, callback işlevleri ayrı dosyaya taşındı
 # - [0.3.2] Çevresel faktörlere tepki veren ifadeler eklendi
 #
@@ -17,8 +21,8 @@
 ===========================================================
 """
 
+import zlib
 import logging
-import random
 from typing import Dict
 
 # Loglama yapılandırması
@@ -71,6 +75,13 @@ class FacePluginCallbacks:
             # Animasyon motorunu güncelle
             if self.animation_engine:
                 self.animation_engine.set_emotion(emotion_state, intensity)
+            
+            # Dashboard gibi dinleyicilere bildir
+            self._notify_websocket_clients({
+                "type": "emotion_changed",
+                "emotion": emotion_state,
+                "intensity": intensity
+            })
         
         except Exception as e:
             logger.error(f"Duygu değişimi işlenirken hata: {e}")
@@ -95,13 +106,17 @@ class FacePluginCallbacks:
                 # Kaynak ve hedef duyguyu karıştırarak yumuşak geçiş sağla
                 self.oled_controller.blend_emotions(source_state, target_state, progress)
                 
-            # LED şeritler için geçiş animasyonu
-            if self.led_controller and progress > 0.05 and progress < 0.95:
-                # Geçiş ortasında özel bir animasyon seçilebilir
+            # LED şeritler için geçiş animasyonu: duygu animasyonunun üstünde bir bindirme katmanı
+            if self.led_controller:
                 if 0.4 < progress < 0.6:
-                    # Geçiş animasyonu olarak 'sparkle' veya 'fade' kullanılabilir
-                    animation_type = "sparkle" if random.random() > 0.5 else "fade"
-                    self.led_controller.animate(animation_type, None, 30)
+                    # Geçiş animasyonu olarak 'sparkle' veya 'fade' kullanılabilir; seçim aynı duygu çifti
+                    # için her süreçte aynıdır, böylece tekrarlanan çağrılar çalışan katmanı yeniden başlatmaz
+                    key = f"{source_state}->{target_state}".encode("utf-8")
+                    animation_type = "sparkle" if zlib.crc32(key) % 2 else "fade"
+                    self.led_controller.animate(animation_type, None, 30,
+                                                blend_mode="screen", layer_name="emotion_transition")
+                else:
+                    self.led_controller.stop_layer("emotion_transition")
             
             # Animasyon motoru için geçiş
             if self.animation_engine:
@@ -154,6 +169,10 @@ class FacePluginCallbacks:
             
             # OLED ekranları güncelle
             if self.oled_controller:
+                # Derlenmiş tema geometrisini aktar ve sprite önbelleğini yeni tema için ısıt
+                geometry = self.theme_manager.get_theme_geometry() if self.theme_manager else None
+                self.oled_controller.set_theme(new_theme, geometry)
+                
                 # Ekranları temizle ve yeni tema ile güncelle
                 self.oled_controller.clear_displays()
                 self.oled_controller.set_emotion(emotion_state, intensity)
@@ -171,6 +190,13 @@ class FacePluginCallbacks:
             if self.animation_engine:
                 self.animation_engine.set_theme(new_theme)
             
+            # Dashboard gibi dinleyicilere bildir
+            self._notify_websocket_clients({
+                "type": "theme_changed",
+                "theme": new_theme,
+                "old_theme": old_theme
+            })
+            
         except Exception as e:
             logger.error(f"Tema değişimi işlenirken hata: {e}")
     
@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: face_plugin_ipc.py
+# Açıklama: FacePlugin için Unix soket üzerinden düşük gecikmeli yerel RPC ve olay kanalı.
+#           Dashboard süreci komut gönderir (set_emotion, set_theme, play_animation) ve
+#           durum değişikliklerini dosya yoklaması yapmadan anlık olarak alır.
+# Bağımlılıklar: socket, json, threading, logging
+# Bağlı Dosyalar: face1_plugin.py, face_plugin_system.py, dashboard_server.py, start_all.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] İstemci olayları okuyucu yerine ayrı bir dağıtım iş parçacığında iletiyor (dinleyiciden call() kilitlenmesi giderildi)
+# - [0.1.0] Satır tabanlı JSON RPC sunucusu/istemcisi, olay aboneliği ve FacePlugin mixin'i eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import os
+import json
+import time
+import queue
+import socket
+import tempfile
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+# Loglama yapılandırması
+logger = logging.getLogger("FacePluginIPC")
+
+# Protokol (her mesaj tek satır UTF-8 JSON):
+#   İstek:  {"id": 1, "method": "set_emotion", "params": {"emotion": "happy", "intensity": 0.8}}
+#   Yanıt:  {"id": 1, "ok": true, "result": ...} veya {"id": 1, "ok": false, "error": "..."}
+#   Olay:   {"event": "state_change", "data": {...}, "timestamp": 1715000000.0}
+# Olaylar yalnızca "subscribe" çağrısı yapmış istemcilere gönderilir.
+
+
+def default_ipc_socket_path() -> str:
+    """
+    Varsayılan Unix soket yolunu döndürür
+
+    Returns:
+        str: Soket dosyası yolu
+    """
+    return os.path.join(tempfile.gettempdir(), "face1_plugin.sock")
+
+
+def get_ipc_socket_path(config: Dict) -> str:
+    """
+    Yapılandırmadaki ("ipc" bölümü) soket yolunu, yoksa varsayılanı döndürür
+
+    Args:
+        config (Dict): Yapılandırma ayarları
+
+    Returns:
+        str: Soket dosyası yolu
+    """
+    return config.get("ipc", {}).get("socket_path") or default_ipc_socket_path()
+
+
+class FacePluginIPCError(Exception):
+    """IPC çağrısı başarısız olduğunda (bağlantı yok, zaman aşımı, uzak hata) yükseltilir"""
+    pass
+
+
+class FacePluginIPCServer:
+    """
+    Unix soket RPC ve olay sunucusu
+
+    Her istemci kendi iş parçacığında okunur; istekler kayıtlı işleyicilere
+    yönlendirilir. publish() ile gönderilen olaylar abone istemcilere iletilir.
+    """
+
+    def __init__(self, path: str, handlers: Dict[str, Callable[[Dict], Any]]):
+        """
+        Sunucuyu hazırlar
+
+        Args:
+            path (str): Unix soket dosyası yolu
+            handlers (Dict[str, Callable]): Metot adı -> parametre sözlüğü alan işleyici
+        """
+        self.path = path
+        self.handlers = dict(handlers)
+        self.handlers.setdefault("ping", lambda params: {"pid": os.getpid(), "time": time.time()})
+        self._socket = None
+        self._thread = None
+        self._clients = {}  # Bağlantı -> {"lock": Lock, "events": Optional[set]}
+        self._clients_lock = threading.Lock()
+        self.is_running = False
+
+        # İstatistikler
+        self.requests = 0
+        self.errors = 0
+        self.events_published = 0
+
+    def start(self) -> bool:
+        """
+        Soketi açar ve bağlantı kabul iş parçacığını başlatır
+
+        Returns:
+            bool: Başarılı ise True, değilse False
+        """
+        if self.is_running:
+            return True
+
+        try:
+            # Önceki çalışmadan kalan soket dosyasını kaldır
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.bind(self.path)
+            os.chmod(self.path, 0o600)
+            self._socket.listen(8)
+        except OSError as e:
+            logger.error(f"IPC soketi açılamadı: {self.path}, hata: {e}")
+            self._socket = None
+            return False
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._accept_loop, name="FacePluginIPC")
+        self._thread.daemon = True
+        self._thread.start()
+        logger.info(f"IPC kanalı dinleniyor: {self.path}")
+        return True
+
+    def stop(self) -> None:
+        """
+        Sunucuyu ve tüm istemci bağlantılarını kapatır
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+        with self._clients_lock:
+            clients = list(self._clients)
+            self._clients.clear()
+        for conn in clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+                conn.close()
+            except OSError:
+                pass
+
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        logger.info("IPC kanalı kapatıldı")
+
+    def publish(self, event: str, data: Any) -> None:
+        """
+        Olayı abone istemcilere gönderir
+
+        Args:
+            event (str): Olay adı (ör. "state_change", "emotion_changed")
+            data (Any): JSON'a çevrilebilir olay verisi
+        """
+        with self._clients_lock:
+            targets = [(conn, client) for conn, client in self._clients.items()
+                       if client["events"] is not None and (not client["events"] or event in client["events"])]
+        if not targets:
+            return
+
+        line = self._encode({"event": event, "data": data, "timestamp": time.time()})
+        for conn, client in targets:
+            self._send(conn, client, line)
+        self.events_published += 1
+
+    def _accept_loop(self) -> None:
+        """
+        Yeni bağlantıları kabul eder
+        """
+        while self.is_running:
+            try:
+                conn, _ = self._socket.accept()
+            except OSError:
+                break
+
+            with self._clients_lock:
+                self._clients[conn] = {"lock": threading.Lock(), "events": None}
+            thread = threading.Thread(target=self._serve_client, args=(conn,), name="FacePluginIPCClient")
+            thread.daemon = True
+            thread.start()
+
+    def _serve_client(self, conn: socket.socket) -> None:
+        """
+        Bir istemcinin isteklerini okur ve yanıtlar
+
+        Args:
+            conn (socket.socket): İstemci bağlantısı
+        """
+        reader = conn.makefile("rb")
+        try:
+            for raw in reader:
+                client = self._clients.get(conn)
+                if client is None:
+                    break
+                try:
+                    request = json.loads(raw)
+                except ValueError:
+                    continue
+                self._send(conn, client, self._encode(self._dispatch(conn, client, request)))
+        except OSError:
+            pass
+        finally:
+            with self._clients_lock:
+                self._clients.pop(conn, None)
+            try:
+                reader.close()
+                conn.close()
+            except OSError:
+                pass
+
+    def _dispatch(self, conn: socket.socket, client: Dict, request: Dict) -> Dict:
+        """
+        İsteği işleyiciye yönlendirir ve yanıtı hazırlar
+
+        Args:
+            conn (socket.socket): İstemci bağlantısı
+            client (Dict): İstemci durumu
+            request (Dict): İstek
+
+        Returns:
+            Dict: Yanıt
+        """
+        self.requests += 1
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params") or {}
+
+        if method == "subscribe":
+            # Boş liste tüm olaylara abonelik anlamına gelir
+            client["events"] = set(params.get("events") or [])
+            return {"id": request_id, "ok": True, "result": True}
+
+        handler = self.handlers.get(method)
+        if handler is None:
+            self.errors += 1
+            return {"id": request_id, "ok": False, "error": f"Bilinmeyen metot: {method}"}
+
+        try:
+            return {"id": request_id, "ok": True, "result": handler(params)}
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"IPC isteği işlenirken hata: {method}, hata: {e}")
+            return {"id": request_id, "ok": False, "error": str(e)}
+
+    def _send(self, conn: socket.socket, client: Dict, line: bytes) -> None:
+        """
+        Satırı istemciye gönderir (bağlantı başına kilitli)
+
+        Args:
+            conn (socket.socket): İstemci bağlantısı
+            client (Dict): İstemci durumu
+            line (bytes): Kodlanmış mesaj
+        """
+        try:
+            with client["lock"]:
+                conn.sendall(line)
+        except OSError:
+            with self._clients_lock:
+                self._clients.pop(conn, None)
+
+    @staticmethod
+    def _encode(message: Dict) -> bytes:
+        return (json.dumps(message, default=str) + "\n").encode("utf-8")
+
+    def get_stats(self) -> Dict:
+        """
+        Sunucu istatistiklerini döndürür
+
+        Returns:
+            Dict: Bağlı istemci, istek, hata ve olay sayıları
+        """
+        return {
+            "path": self.path,
+            "running": self.is_running,
+            "clients": len(self._clients),
+            "requests": self.requests,
+            "errors": self.errors,
+            "events_published": self.events_published
+        }
+
+
+class FacePluginIPCClient:
+    """
+    Unix soket RPC ve olay istemcisi
+
+    Yanıtlar ve olaylar tek bir okuyucu iş parçacığında ayrıştırılır; call()
+    aynı anda birden fazla iş parçacığından çağrılabilir. Olay dinleyicileri
+    bağlantı başına ayrı bir dağıtım iş parçacığında sırayla çalışır, böylece
+    dinleyici içinden call() yapılabilir. Bağlantı koparsa sonraki call()
+    yeniden bağlanmayı dener ve olay abonelikleri yenilenir.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 2.0):
+        """
+        İstemciyi hazırlar (bağlantı connect() veya ilk call() ile kurulur)
+
+        Args:
+            path (Optional[str]): Unix soket dosyası yolu (None ise varsayılan)
+            timeout (float): Varsayılan çağrı zaman aşımı (saniye)
+        """
+        self.path = path or default_ipc_socket_path()
+        self.timeout = timeout
+        self._socket = None
+        self._reader_thread = None
+        self._event_thread = None
+        self._send_lock = threading.Lock()
+        self._pending = {}  # İstek kimliği -> [Event, yanıt]
+        self._pending_lock = threading.Lock()
+        self._next_id = 0
+        self._listeners = []  # (callback, olay kümesi)
+
+        # Son çağrının gidiş-dönüş süresi (milisaniye)
+        self.last_rtt_ms = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._socket is not None
+
+    def connect(self) -> bool:
+        """
+        Sunucuya bağlanır
+
+        Returns:
+            bool: Bağlantı kurulduysa True
+        """
+        if self._socket is not None:
+            return True
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            return False
+
+        self._socket = sock
+        events = queue.Queue()
+        self._event_thread = threading.Thread(target=self._event_loop, args=(events,), name="FacePluginIPCEvents")
+        self._event_thread.daemon = True
+        self._event_thread.start()
+        self._reader_thread = threading.Thread(target=self._read_loop, args=(sock, events), name="FacePluginIPCReader")
+        self._reader_thread.daemon = True
+        self._reader_thread.start()
+
+        # Olay aboneliklerini yenile
+        if self._listeners:
+            try:
+                self._subscribe_remote()
+            except FacePluginIPCError as e:
+                logger.warning(f"IPC olay aboneliği yenilenemedi: {e}")
+        return True
+
+    def close(self) -> None:
+        """
+        Bağlantıyı kapatır
+        """
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def wait_until_ready(self, timeout: float = 10.0, interval: float = 0.01) -> bool:
+        """
+        Sunucu bağlantı kabul edip ping'e yanıt verene kadar bekler
+
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye)
+            interval (float): Denemeler arası bekleme (saniye)
+
+        Returns:
+            bool: Sunucu hazırsa True, zaman aşımında False
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.connect():
+                try:
+                    self.call("ping", timeout=max(0.1, deadline - time.monotonic()))
+                    return True
+                except FacePluginIPCError:
+                    self.close()
+            time.sleep(interval)
+        return False
+
+    def call(self, method: str, timeout: Optional[float] = None, **params) -> Any:
+        """
+        Uzak metodu çağırır ve yanıtı bekler
+
+        Args:
+            method (str): Metot adı (ör. "set_emotion")
+            timeout (Optional[float]): Zaman aşımı (saniye, None ise varsayılan)
+            **params: Metot parametreleri
+
+        Returns:
+            Any: Metodun sonucu
+
+        Raises:
+            FacePluginIPCError: Bağlantı kurulamazsa, zaman aşımında veya uzak hata durumunda
+        """
+        if not self.connect():
+            raise FacePluginIPCError(f"IPC sunucusuna bağlanılamadı: {self.path}")
+
+        with self._pending_lock:
+            self._next_id += 1
+            request_id = self._next_id
+            slot = [threading.Event(), None]
+            self._pending[request_id] = slot
+
+        line = (json.dumps({"id": request_id, "method": method, "params": params}) + "\n").encode("utf-8")
+        started = time.perf_counter()
+        try:
+            sock = self._socket
+            if sock is None:
+                raise FacePluginIPCError("IPC bağlantısı kapalı")
+            with self._send_lock:
+                sock.sendall(line)
+
+            if not slot[0].wait(self.timeout if timeout is None else timeout):
+                raise FacePluginIPCError(f"IPC çağrısı zaman aşımına uğradı: {method}")
+        except OSError as e:
+            self.close()
+            raise FacePluginIPCError(f"IPC çağrısı gönderilemedi: {e}")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        response = slot[1]
+        if response is None:
+            raise FacePluginIPCError("IPC bağlantısı yanıt beklenirken kapandı")
+        self.last_rtt_ms = (time.perf_counter() - started) * 1000.0
+        if not response.get("ok"):
+            raise FacePluginIPCError(response.get("error", "Bilinmeyen hata"))
+        return response.get("result")
+
+    def subscribe(self, callback: Callable[[str, Any], None], events: Optional[List[str]] = None) -> None:
+        """
+        Sunucudan gelen olaylar için geri çağrı kaydeder
+
+        Args:
+            callback (Callable[[str, Any], None]): (olay adı, veri) alan fonksiyon
+            events (Optional[List[str]]): Dinlenecek olaylar (None ise tümü)
+        """
+        self._listeners.append((callback, set(events) if events else None))
+        if self.is_connected:
+            self._subscribe_remote()
+
+    def _subscribe_remote(self) -> None:
+        """
+        Dinleyicilerin ihtiyaç duyduğu olaylara sunucuda abone olur
+        """
+        events = set()
+        for _, listener_events in self._listeners:
+            if listener_events is None:
+                events = set()
+                break
+            events |= listener_events
+        self.call("subscribe", events=sorted(events))
+
+    def _read_loop(self, sock: socket.socket, events: queue.Queue) -> None:
+        """
+        Sunucudan gelen yanıt ve olayları okur
+
+        Olaylar burada çalıştırılmaz, dağıtım kuyruğuna eklenir; okuyucu
+        yanıtları iletmeye devam edebilsin diye dinleyiciler beklenmez.
+
+        Args:
+            sock (socket.socket): Bağlantı
+            events (queue.Queue): Bağlantının olay dağıtım kuyruğu
+        """
+        reader = sock.makefile("rb")
+        try:
+            for raw in reader:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+
+                if "event" in message:
+                    events.put((message["event"], message.get("data")))
+                    continue
+
+                with self._pending_lock:
+                    slot = self._pending.get(message.get("id"))
+                if slot is not None:
+                    slot[1] = message
+                    slot[0].set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            if self._socket is sock:
+                self._socket = None
+            # Yanıt bekleyen çağrıları serbest bırak
+            with self._pending_lock:
+                for slot in self._pending.values():
+                    slot[0].set()
+            # Dağıtım iş parçacığı kalan olayları iletip sonlanır
+            events.put(None)
+
+    def _event_loop(self, events: queue.Queue) -> None:
+        """
+        Bağlantının olaylarını geliş sırasıyla dinleyicilere iletir
+
+        Args:
+            events (queue.Queue): Bağlantının olay dağıtım kuyruğu
+        """
+        while True:
+            item = events.get()
+            if item is None:
+                break
+            self._dispatch_event(*item)
+
+    def _dispatch_event(self, event: str, data: Any) -> None:
+        """
+        Olayı ilgili dinleyicilere iletir
+
+        Args:
+            event (str): Olay adı
+            data (Any): Olay verisi
+        """
+        for callback, events in list(self._listeners):
+            if events is None or event in events:
+                try:
+                    callback(event, data)
+                except Exception as e:
+                    logger.error(f"IPC olay dinleyicisinde hata: {event}, hata: {e}")
+
+
+class FacePluginIPC:
+    """
+    FacePlugin IPC mixin sınıfı
+
+    Bu sınıf FacePlugin sınıfı için yerel IPC kanalını içerir:
+    - Unix soket RPC sunucusunun başlatılması ve durdurulması
+    - Komutlar: ping, get_status, set_emotion, set_theme, play_animation
+    - Durum değişikliklerinin abone süreçlere olay olarak iletilmesi
+    """
+
+    def _start_ipc(self) -> None:
+        """
+        IPC sunucusunu yapılandırmaya göre başlatır
+        """
+        if getattr(self, "ipc_server", None) is not None:
+            return
+
+        ipc_config = self.config.get("ipc", {})
+        if not ipc_config.get("enabled", True):
+            logger.info("IPC kanalı devre dışı bırakıldı.")
+            self.ipc_server = None
+            return
+
+        server = FacePluginIPCServer(get_ipc_socket_path(self.config), {
+            "get_status": lambda params: self._ipc_get_status(),
+            "set_emotion": lambda params: bool(self.set_emotion(params["emotion"], float(params.get("intensity", 1.0)))),
+            "set_theme": lambda params: self.set_theme(params["theme"]),
+            "play_animation": lambda params: self.play_animation(params["name"])
+        })
+        self.ipc_server = server if server.start() else None
+
+    def _stop_ipc(self) -> None:
+        """
+        IPC sunucusunu durdurur
+        """
+        server = getattr(self, "ipc_server", None)
+        if server is not None:
+            server.publish("shutdown", {"pid": os.getpid()})
+            server.stop()
+            self.ipc_server = None
+
+    def _ipc_get_status(self) -> Dict:
+        """
+        IPC için özet durum bilgisini döndürür
+
+        Returns:
+            Dict: Plugin durumu, güncel duygu ve tema
+        """
+        status = self.get_plugin_status()
+        status["pid"] = os.getpid()
+        status["emotion"] = self.get_current_emotion()
+        theme_manager = getattr(self, "theme_manager", None)
+        status["theme"] = theme_manager.get_current_theme() if theme_manager else "default"
+        return status
+
+    def _notify_websocket_clients(self, message: Dict[str, Any]) -> None:
+        """
+        Bildirimleri IPC olayı olarak abone süreçlere de iletir
+
+        Args:
+            message (Dict[str, Any]): "type" alanı olay adı olan mesaj
+        """
+        super()._notify_websocket_clients(message)
+
+        server = getattr(self, "ipc_server", None)
+        if server is not None:
+            server.publish(message.get("type", "event"), message)
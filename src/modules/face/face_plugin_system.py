@@ -7,8 +7,9 @@
 # Bağımlılıklar: logging, threading, time
 # Bağlı Dosyalar: face_plugin.py, face_plugin_base.py, face_plugin_lifecycle.py
 
-# Versiyon: 0.5.0
+# Versiyon: 0.5.1
 # Değişiklikler:
+# - [0.5.1] Ses işleme konuşma ve ses seviyesi geri çağırmaları bloklamayan ağız senkronizasyonuna bağlandı
 # - [0.5.0] Ses işleme modülü (sound_processor.py) entegrasyonu eklendi
 # - [0.4.1] Gelişmiş yaşam döngüsü yönetimi sistemiyle uyumlu hale getirildi
 # - [0.4.0] FacePlugin modülerleştirildi, sistem işlevleri ayrı dosyaya taşındı
@@ -127,7 +128,9 @@ class FacePluginSystem:
                 self.sound_processor.register_emotion_callback(self.emotion_engine.set_emotion_suggestion)
             
             if self.oled_controller:
-                self.sound_processor.register_speaking_callback(self.oled_controller.animate_mouth_speaking)
+                # Konuşma durumu ve ses seviyesi ağız senkronizasyonunu animasyon döngüsünde sürer
+                self.sound_processor.register_speaking_callback(self.oled_controller.set_speaking_state)
+                self.sound_processor.register_volume_callback(self.oled_controller.set_mouth_openness)
             
             # Ses işleme modülünü başlat
             if not self.sound_processor.start():
@@ -14,12 +14,15 @@
 #   - modules/face/face_plugin_metrics.py
 #   - modules/face/face_plugin_environment.py
 #   - modules/face/face_plugin_lifecycle.py
+#   - modules/face/face_plugin_ipc.py
 #   - plugins/plugin_isolation.py
 #   - plugins/config_standardizer.py
 #   - modules/sound_processor.py
 
-# Versiyon: 0.5.0
+# Versiyon: 0.5.2
 # Değişiklikler:
+# - [0.5.2] Ses seviyesi geri çağırması ağız açıklığına bağlandı
+# - [0.5.1] Unix soket IPC kanalı eklendi, set_theme ve play_animation metotları eklendi
 # - [0.5.0] Ses tepkimeli ifade sistemi entegre edildi
 # - [0.4.4] Tüm işlevler modüler mixin sınıflarına bölündü
 # - [0.4.3] Üst proje entegrasyonu için plugin izolasyon ve yapılandırma standardizasyon modülleri entegre edildi
@@ -27,7 +30,7 @@
 # - [0.3.3] Animasyon motoru entegrasyonu ve JSON formatı desteği eklendi
 #
 # Yazar: GitHub Copilot
-# Tarih: 2025-05-05
+# Tarih: 2025-05-06
 ===========================================================
 """
 
@@ -59,6 +62,7 @@ from src.modules.face.face_plugin_lifecycle import PluginState
 from src.modules.face.face_plugin_config import FacePluginConfigMixin
 from src.modules.face.face_plugin_metrics import FacePluginMetricsMixin
 from src.modules.face.face_plugin_environment import FacePluginEnvironmentMixin
+from src.modules.face.face_plugin_ipc import FacePluginIPC
 
 # Üst proje entegrasyonu için plugin modüllerini içe aktar
 from src.plugins.plugin_isolation import PluginIsolation
@@ -70,7 +74,7 @@ from src.modules.sound_processor import SoundProcessor
 # Loglama yapılandırması
 logger = logging.getLogger("FacePlugin")
 
-class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePluginAPI,
+class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePluginIPC, FacePluginAPI,
                FacePluginConfigMixin, FacePluginMetricsMixin, FacePluginEnvironmentMixin):
     """
     FACE1 yüz eklentisi ana sınıf
@@ -266,6 +270,7 @@ class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePlug
                 if self.oled_controller and hasattr(self.oled_controller, 'set_speaking_state'):
                     # Konuşma durumuna göre ağız animasyonu için callback kaydı
                     self.sound_processor.register_speaking_callback(self.oled_controller.set_speaking_state)
+                    self.sound_processor.register_volume_callback(self.oled_controller.set_mouth_openness)
             
             logger.info("Modüller başarıyla başlatıldı ve yapılandırıldı")
             return True
@@ -330,6 +335,9 @@ class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePlug
             
             # Durum dosyasını güncelle
             self._update_status_file("running")
+            
+            # Dashboard için IPC kanalını aç (hazır olma sinyali soketin kendisidir)
+            self._start_ipc()
                 
             return True
             
@@ -367,6 +375,9 @@ class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePlug
         if hasattr(self, 'sound_processor') and self.sound_processor is not None:
             self.sound_processor.stop()
         
+        # IPC kanalını kapat (abonelere "shutdown" olayı gönderilir)
+        self._stop_ipc()
+        
         # Önce temel durdurmayı çağır
         super().stop()
         
@@ -540,6 +551,63 @@ class FacePlugin(FacePluginBase, FacePluginCallbacks, FacePluginSystem, FacePlug
             logger.error(f"Duygu geçişi yapılırken hata: {e}")
             return False
     
+    def set_theme(self, theme_name: str) -> bool:
+        """
+        Aktif temayı değiştirir
+        
+        Args:
+            theme_name (str): Tema adı
+            
+        Returns:
+            bool: Başarılı ise True, değilse False
+        """
+        if self.state != PluginState.RUNNING or not self.theme_manager:
+            logger.warning(f"Yüz eklentisi çalışmıyor (durum: {self.state}), tema ayarlanamıyor.")
+            return False
+        
+        try:
+            # Watchdog kalp atışını güncelle
+            self.heartbeat()
+            
+            # İzole edilmiş çağrı
+            return bool(self.plugin_isolation.wrap_call(
+                self.theme_manager.set_theme, theme_name
+            ))
+            
+        except Exception as e:
+            logger.error(f"Tema ayarlanırken hata: {e}")
+            return False
+    
+    def play_animation(self, name: str) -> bool:
+        """
+        Animasyon motoru üzerinden bir animasyon oynatır
+        
+        Args:
+            name (str): Animasyon adı
+            
+        Returns:
+            bool: Başarılı ise True, değilse False
+        """
+        if self.state != PluginState.RUNNING or not self.animation_engine:
+            logger.warning(f"Yüz eklentisi çalışmıyor (durum: {self.state}), animasyon oynatılamıyor.")
+            return False
+        
+        try:
+            # Watchdog kalp atışını güncelle
+            self.heartbeat()
+            
+            # İzole edilmiş çağrı
+            success = bool(self.plugin_isolation.wrap_call(
+                self.animation_engine.play_animation, name
+            ))
+            if success:
+                self._notify_websocket_clients({"type": "animation_started", "animation": name})
+            return success
+            
+        except Exception as e:
+            logger.error(f"Animasyon oynatılırken hata: {e}")
+            return False
+    
     def get_current_emotion(self) -> Dict:
         """
         Mevcut duygu durumu bilgisini döndürür
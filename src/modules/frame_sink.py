@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: frame_sink.py
+# Açıklama: Simülasyon kareleri için eklenebilir kare hedefi (sink) boru hattı.
+#           Kareler sınırlı bir kuyruk üzerinden arka plan iş parçacığına aktarılır;
+#           çizim döngüsü disk erişimi veya PNG kodlaması için hiç beklemez.
+# Bağımlılıklar: PIL, numpy, threading, queue, logging
+# Bağlı Dosyalar: oled_controller_base.py, led_controller_base.py, oled_controller_framebuffer.py
+
+# Versiyon: 0.1.3
+# Değişiklikler:
+# - [0.1.3] get_png PNG önbelleğini kilit altında, kilitle okunan kare nesnesine bağlı tutuyor; kodlama kilit dışında
+# - [0.1.2] PNG hedefi varsayılan olarak kapatıldı (kareler halka tampondan get_png ile isteğe bağlı
+#           kodlanır); PNG hedefi açılışta önceki çalışmalardan kalan PNG dosyalarını siler
+# - [0.1.1] Dashboard akışı için ikili kare mesajı kodlaması (encode_frame) eklendi
+# - [0.1.0] Bellek içi halka tampon, isteğe bağlı PNG ve ham kayıt hedefleri ile
+#           sınırlı kuyruklu kare boru hattı eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import atexit
+import io
+import os
+import queue
+import struct
+import threading
+import time
+import logging
+from collections import deque, namedtuple
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .oled_controller_framebuffer import unpack_image
+
+# Logger yapılandırması
+logger = logging.getLogger("FrameSink")
+
+# Kare türleri
+FRAME_SSD1306 = "ssd1306"  # Sayfa düzeninde 1-bit kare, (yükseklik // 8) * genişlik bayt
+FRAME_RGB = "rgb"          # Satır düzeninde RGB kare, genişlik * yükseklik * 3 bayt
+
+# Tek bir simülasyon karesi
+Frame = namedtuple("Frame", ["source", "seq", "timestamp", "kind", "width", "height", "data"])
+
+# İkili kare mesajı başlığı (küçük endian): sürüm, tür kodu, genişlik, yükseklik,
+# sıra numarası, zaman damgası, kaynak adı uzunluğu; ardından kaynak adı ve kare verisi
+WIRE_VERSION = 1
+WIRE_HEADER = struct.Struct("<BBHHIdB")
+WIRE_KIND_CODES = {FRAME_SSD1306: 0, FRAME_RGB: 1}
+
+
+def encode_frame(frame: Frame) -> bytes:
+    """
+    Kareyi ikili WebSocket mesajına çevirir
+
+    Args:
+        frame (Frame): Kare
+
+    Returns:
+        bytes: Başlık + kaynak adı + kare verisi
+    """
+    source = frame.source.encode("utf-8")
+    header = WIRE_HEADER.pack(WIRE_VERSION, WIRE_KIND_CODES[frame.kind], frame.width, frame.height,
+                              frame.seq & 0xFFFFFFFF, frame.timestamp, len(source))
+    return header + source + frame.data
+
+
+def frame_to_image(frame: Frame) -> Image.Image:
+    """
+    Kareyi PIL görüntüsüne çevirir
+
+    LED şeridi kareleri (yükseklik 1) her LED bir daire olacak şekilde çizilir.
+
+    Args:
+        frame (Frame): Kare
+
+    Returns:
+        Image.Image: RGB görüntü
+    """
+    if frame.kind == FRAME_SSD1306:
+        pages = np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height // 8, frame.width)
+        return unpack_image(pages).convert("RGB")
+
+    if frame.height == 1:
+        return render_led_strip(np.frombuffer(frame.data, dtype=np.uint8).reshape(-1, 3))
+
+    return Image.frombytes("RGB", (frame.width, frame.height), frame.data)
+
+
+def render_led_strip(colors, led_radius: int = 10, spacing: int = 5) -> Image.Image:
+    """
+    LED renklerini yan yana daireler olarak çizer
+
+    Args:
+        colors: (R, G, B) renk dizisi
+        led_radius (int): LED dairesinin yarıçapı
+        spacing (int): LED'ler arası boşluk
+
+    Returns:
+        Image.Image: RGB görüntü
+    """
+    led_count = len(colors)
+    width = max(100, led_count * (led_radius * 2 + spacing))
+    height = led_radius * 2 + 20  # Üst ve alt kenar boşlukları
+
+    image = Image.new("RGB", (width, height), (0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    # LED'lerin konumlarını hesapla
+    led_width = led_radius * 2 + spacing
+    total_width = led_width * led_count - spacing
+    start_x = (width - total_width) // 2
+    y = height // 2
+
+    for i, color in enumerate(colors):
+        x = start_x + i * led_width
+        draw.ellipse((x - led_radius, y - led_radius, x + led_radius, y + led_radius),
+                     fill=tuple(int(c) for c in color))
+
+    return image
+
+
+class FrameSink:
+    """
+    Kare hedefi temel sınıfı
+
+    Alt sınıflar write() metodunu uygular. write() yalnızca boru hattının
+    iş parçacığından çağrılır.
+    """
+
+    name = "sink"
+
+    def write(self, frame: Frame) -> None:
+        """
+        Kareyi işler
+
+        Args:
+            frame (Frame): Kare
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Hedefin kaynaklarını serbest bırakır
+        """
+        pass
+
+    def get_stats(self) -> Dict:
+        """
+        Hedef istatistiklerini döndürür
+
+        Returns:
+            Dict: İstatistikler
+        """
+        return {}
+
+
+class RingBufferSink(FrameSink):
+    """
+    Her kaynak için son N kareyi bellekte tutan hedef
+
+    PNG kodlaması yalnızca istendiğinde (get_png) yapılır ve kare başına önbelleğe alınır.
+    """
+
+    name = "ring_buffer"
+
+    def __init__(self, capacity: int = 64):
+        """
+        Halka tamponu başlatır
+
+        Args:
+            capacity (int): Kaynak başına saklanacak kare sayısı
+        """
+        self.capacity = max(1, capacity)
+        self._frames = {}
+        self._png_cache = {}
+        self._lock = threading.Lock()
+
+    def write(self, frame: Frame) -> None:
+        with self._lock:
+            frames = self._frames.get(frame.source)
+            if frames is None:
+                frames = self._frames[frame.source] = deque(maxlen=self.capacity)
+            frames.append(frame)
+
+    def sources(self) -> List[str]:
+        """
+        Kare gelen kaynak adlarını döndürür
+
+        Returns:
+            List[str]: Kaynak adları
+        """
+        with self._lock:
+            return list(self._frames)
+
+    def latest(self, source: str) -> Optional[Frame]:
+        """
+        Kaynağın en son karesini döndürür
+
+        Args:
+            source (str): Kaynak adı (ör. "left_eye", "leds")
+
+        Returns:
+            Optional[Frame]: Kare veya yoksa None
+        """
+        with self._lock:
+            frames = self._frames.get(source)
+            return frames[-1] if frames else None
+
+    def frames(self, source: str) -> List[Frame]:
+        """
+        Kaynağın tampondaki tüm karelerini eskiden yeniye döndürür
+
+        Args:
+            source (str): Kaynak adı
+
+        Returns:
+            List[Frame]: Kareler
+        """
+        with self._lock:
+            return list(self._frames.get(source, ()))
+
+    def get_png(self, source: str) -> Optional[bytes]:
+        """
+        Kaynağın en son karesini PNG olarak kodlar (isteğe bağlı PNG)
+
+        Önbellek, kilit altında okunan kare nesnesine bağlıdır; kodlama kilit dışında
+        yapılır ve sonuç yalnızca kare hâlâ en son kareyse saklanır.
+
+        Args:
+            source (str): Kaynak adı
+
+        Returns:
+            Optional[bytes]: PNG verisi veya kare yoksa None
+        """
+        with self._lock:
+            frames = self._frames.get(source)
+            if not frames:
+                return None
+            frame = frames[-1]
+            cached = self._png_cache.get(source)
+            if cached is not None and cached[0] is frame:
+                return cached[1]
+
+        output = io.BytesIO()
+        frame_to_image(frame).save(output, format="PNG")
+        png = output.getvalue()
+
+        with self._lock:
+            frames = self._frames.get(source)
+            if frames and frames[-1] is frame:
+                self._png_cache[source] = (frame, png)
+        return png
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {source: len(frames) for source, frames in self._frames.items()}
+
+
+class PngFileSink(FrameSink):
+    """
+    Kareleri belirli aralıklarla PNG dosyası olarak yazan hedef
+
+    Dosya adları dashboard'un beklediği düzendedir
+    (`<önek>_<zaman damgası>_<sıra>.png`). Önceki çalışmalardan kalan dosyalar
+    açılışta bir kez temizlenir; sonrasında eski dosyalar, dizini taramadan,
+    bellekte tutulan yazılmış dosya listesi üzerinden silinir.
+    """
+
+    name = "png"
+
+    def __init__(self, directory: str, min_interval: float = 0.1, max_files: int = 100,
+                 prefixes: Optional[Dict[str, str]] = None):
+        """
+        PNG hedefini başlatır
+
+        Args:
+            directory (str): Çıktı dizini
+            min_interval (float): Aynı kaynak için iki PNG arasındaki en kısa süre (saniye)
+            max_files (int): Kaynak başına saklanacak en fazla dosya
+            prefixes (Optional[Dict[str, str]]): Kaynak adı -> dosya öneki (varsayılan: "display_<kaynak>")
+        """
+        self.directory = directory
+        self.min_interval = min_interval
+        self.max_files = max(1, max_files)
+        self.prefixes = prefixes or {}
+        self._last_write = {}
+        self._written = {}
+        self.files_written = 0
+        self.files_deleted = 0
+        os.makedirs(directory, exist_ok=True)
+        self._prune_stale_files()
+
+    def _prune_stale_files(self) -> None:
+        """
+        Önceki çalışmalardan kalan simülasyon PNG dosyalarını siler
+
+        Yazılmış dosya listesi bellekte tutulduğundan, yeniden başlatmadan önce
+        yazılan dosyalar max_files sınırına hiç girmez ve dizinde birikirdi.
+        """
+        prefixes = tuple(f"{prefix}_" for prefix in self.prefixes.values()) + ("display_",)
+        for entry in os.scandir(self.directory):
+            if not (entry.is_file() and entry.name.endswith(".png") and entry.name.startswith(prefixes)):
+                continue
+            try:
+                os.unlink(entry.path)
+                self.files_deleted += 1
+            except OSError as e:
+                logger.debug(f"Eski simülasyon dosyası silinemedi: {entry.path}, hata: {e}")
+
+    def write(self, frame: Frame) -> None:
+        if frame.timestamp - self._last_write.get(frame.source, 0.0) < self.min_interval:
+            return
+        self._last_write[frame.source] = frame.timestamp
+
+        prefix = self.prefixes.get(frame.source, f"display_{frame.source}")
+        filename = os.path.join(self.directory, f"{prefix}_{int(frame.timestamp)}_{frame.seq:04d}.png")
+        frame_to_image(frame).save(filename)
+        self.files_written += 1
+
+        # Eski dosyaları sil
+        written = self._written.get(frame.source)
+        if written is None:
+            written = self._written[frame.source] = deque()
+        written.append(filename)
+        while len(written) > self.max_files:
+            old_file = written.popleft()
+            try:
+                os.unlink(old_file)
+                self.files_deleted += 1
+            except OSError as e:
+                logger.debug(f"Eski simülasyon dosyası silinemedi: {old_file}, hata: {e}")
+
+    def get_stats(self) -> Dict:
+        return {"files_written": self.files_written, "files_deleted": self.files_deleted}
+
+
+class RawRecordingSink(FrameSink):
+    """
+    Kareleri ham ikili kayıt dosyasına ekleyen hedef
+
+    Dosya biçimi: "FACE1REC" + sürüm baytı, ardından her kare için
+    `<HdHH` başlık (kaynak uzunluğu, zaman damgası, genişlik, yükseklik),
+    kaynak adı, tür adı uzunluğu + tür adı, `<I` veri uzunluğu ve veri.
+    """
+
+    name = "recording"
+
+    MAGIC = b"FACE1REC\x01"
+
+    def __init__(self, path: str):
+        """
+        Kayıt hedefini başlatır
+
+        Args:
+            path (str): Kayıt dosyası yolu
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(self.MAGIC)
+        self.frames_recorded = 0
+        self.bytes_recorded = len(self.MAGIC)
+
+    def write(self, frame: Frame) -> None:
+        source = frame.source.encode("utf-8")
+        kind = frame.kind.encode("ascii")
+        record = b"".join((
+            struct.pack("<HdHH", len(source), frame.timestamp, frame.width, frame.height),
+            source,
+            struct.pack("<B", len(kind)), kind,
+            struct.pack("<I", len(frame.data)), frame.data
+        ))
+        self._file.write(record)
+        self.frames_recorded += 1
+        self.bytes_recorded += len(record)
+
+    def close(self) -> None:
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict:
+        return {"path": self.path, "frames": self.frames_recorded, "bytes": self.bytes_recorded}
+
+    @classmethod
+    def read(cls, path: str):
+        """
+        Kayıt dosyasındaki kareleri sırayla döndürür
+
+        Args:
+            path (str): Kayıt dosyası yolu
+
+        Yields:
+            Frame: Kaydedilen kareler
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"Geçersiz kayıt dosyası: {path}")
+            seq = 0
+            header_size = struct.calcsize("<HdHH")
+            while True:
+                header = f.read(header_size)
+                if len(header) < header_size:
+                    return
+                source_len, timestamp, width, height = struct.unpack("<HdHH", header)
+                source = f.read(source_len).decode("utf-8")
+                kind = f.read(struct.unpack("<B", f.read(1))[0]).decode("ascii")
+                data = f.read(struct.unpack("<I", f.read(4))[0])
+                yield Frame(source, seq, timestamp, kind, width, height, data)
+                seq += 1
+
+
+class FramePipeline:
+    """
+    Kareleri sınırlı bir kuyruk üzerinden hedeflere ileten boru hattı
+
+    publish() hiçbir zaman beklemez: kuyruk doluysa kare düşürülür ve sayılır.
+    Hedefler tek bir arka plan iş parçacığında sırayla çağrılır.
+    """
+
+    def __init__(self, max_queue: int = 64):
+        """
+        Boru hattını başlatır
+
+        Args:
+            max_queue (int): Kuyruktaki en fazla kare sayısı
+        """
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._sinks = []
+        self._sinks_lock = threading.Lock()
+        self._seq = {}
+        self._thread = None
+        self.is_running = False
+
+        # İstatistikler
+        self.published = 0
+        self.dropped = 0
+        self.processed = 0
+        self.errors = 0
+
+    def add_sink(self, sink: FrameSink) -> FrameSink:
+        """
+        Boru hattına bir hedef ekler
+
+        Args:
+            sink (FrameSink): Hedef
+
+        Returns:
+            FrameSink: Eklenen hedef
+        """
+        with self._sinks_lock:
+            self._sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: FrameSink) -> None:
+        """
+        Boru hattından bir hedefi çıkarır ve kapatır
+
+        Args:
+            sink (FrameSink): Hedef
+        """
+        with self._sinks_lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+        sink.close()
+
+    def get_sink(self, name: str) -> Optional[FrameSink]:
+        """
+        Ada göre ilk hedefi döndürür
+
+        Args:
+            name (str): Hedef adı ("ring_buffer", "png", "recording")
+
+        Returns:
+            Optional[FrameSink]: Hedef veya bulunamazsa None
+        """
+        with self._sinks_lock:
+            for sink in self._sinks:
+                if sink.name == name:
+                    return sink
+        return None
+
+    def start(self) -> None:
+        """
+        Hedefleri besleyen iş parçacığını başlatır
+        """
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._worker, name="FrameSinkWorker")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Kuyruktaki kareleri işler, iş parçacığını durdurur ve hedefleri kapatır
+
+        Args:
+            timeout (float): Bekleme süresi (saniye)
+        """
+        if not self.is_running:
+            return
+        self.is_running = False
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        with self._sinks_lock:
+            for sink in self._sinks:
+                sink.close()
+
+    def publish(self, source: str, kind: str, width: int, height: int, data: bytes) -> bool:
+        """
+        Bir kareyi hedeflere iletilmek üzere kuyruğa ekler (beklemez)
+
+        Args:
+            source (str): Kaynak adı (ör. "left_eye", "leds")
+            kind (str): Kare türü (FRAME_SSD1306 veya FRAME_RGB)
+            width (int): Genişlik
+            height (int): Yükseklik
+            data (bytes): Kare verisi (çağıran tarafından kopyalanmış olmalı)
+
+        Returns:
+            bool: Kare kuyruğa eklendiyse True, kuyruk dolu olduğu için düşürüldüyse False
+        """
+        seq = self._seq.get(source, 0)
+        self._seq[source] = seq + 1
+        frame = Frame(source, seq, time.time(), kind, width, height, data)
+
+        try:
+            self._queue.put_nowait(frame)
+            self.published += 1
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _worker(self) -> None:
+        """
+        Kuyruktaki kareleri hedeflere ileten iş parçacığı
+        """
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+
+            with self._sinks_lock:
+                sinks = list(self._sinks)
+            for sink in sinks:
+                try:
+                    sink.write(frame)
+                except Exception as e:
+                    self.errors += 1
+                    logger.debug(f"Kare hedefinde hata: {sink.name}, hata: {e}")
+            self.processed += 1
+
+    def get_stats(self) -> Dict:
+        """
+        Boru hattı istatistiklerini döndürür
+
+        Returns:
+            Dict: Yayınlanan, düşürülen, işlenen kare sayıları, kuyruk doluluğu ve hedef istatistikleri
+        """
+        with self._sinks_lock:
+            sinks = {sink.name: sink.get_stats() for sink in self._sinks}
+        return {
+            "published": self.published,
+            "dropped": self.dropped,
+            "processed": self.processed,
+            "errors": self.errors,
+            "queue_size": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "sinks": sinks
+        }
+
+
+# Süreç genelinde paylaşılan simülasyon boru hattı (OLED ve LED kontrolcüleri birlikte kullanır)
+_simulation_pipeline = None
+_simulation_pipeline_lock = threading.Lock()
+
+
+def get_simulation_pipeline(config: Dict, sim_dir: str) -> FramePipeline:
+    """
+    Paylaşılan simülasyon kare boru hattını döndürür, yoksa yapılandırmaya göre oluşturur
+
+    Yapılandırma "simulation" bölümünden okunur:
+    queue_size, ring_buffer_size, png_enabled, png_interval, max_png_files, record_path.
+
+    Args:
+        config (Dict): Yapılandırma ayarları
+        sim_dir (str): Simülasyon görüntü dizini
+
+    Returns:
+        FramePipeline: Çalışan boru hattı
+    """
+    global _simulation_pipeline
+
+    with _simulation_pipeline_lock:
+        if _simulation_pipeline is not None and _simulation_pipeline.is_running:
+            return _simulation_pipeline
+
+        sim_config = config.get("simulation", {})
+        pipeline = FramePipeline(sim_config.get("queue_size", 64))
+        pipeline.add_sink(RingBufferSink(sim_config.get("ring_buffer_size", 64)))
+
+        if sim_config.get("png_enabled", False):
+            pipeline.add_sink(PngFileSink(
+                sim_dir,
+                min_interval=sim_config.get("png_interval", 0.1),
+                max_files=sim_config.get("max_png_files", 100),
+                prefixes={"leds": "leds"}
+            ))
+
+        record_path = sim_config.get("record_path")
+        if record_path:
+            pipeline.add_sink(RawRecordingSink(record_path))
+
+        pipeline.start()
+        atexit.register(pipeline.stop)
+        _simulation_pipeline = pipeline
+        logger.info("Simülasyon kare boru hattı başlatıldı")
+        return pipeline
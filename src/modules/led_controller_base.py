@@ -4,11 +4,30 @@
 # Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
 # Dosya: led_controller_base.py
 # Açıklama: WS2812B LED şeritleri için temel kontrolcü modülü. Temel işlevler ve yapılandırmayı içerir.
-# Bağımlılıklar: rpi_ws281x, logging, threading, time
-# Bağlı Dosyalar: hardware_defines.py
+# Bağımlılıklar: rpi_ws281x, numpy, logging, threading, time
+# Bağlı Dosyalar: hardware_defines.py, frame_sink.py, shared_framebuffer.py, led_controller_kernels.py,
+#                 led_controller_layers.py, led_controller_output.py, render_clock.py
 
-# Versiyon: 0.4.0
+# Versiyon: 0.4.10
 # Değişiklikler:
+# - [0.4.10] Kullanılmayan rpi_ws281x.Color içe aktarması kaldırıldı (renkler numpy dizileriyle paketleniyor)
+# - [0.4.9] Kullanılmayan time içe aktarması kaldırıldı (zaman artık clock üzerinden okunuyor)
+# - [0.4.8] Zaman kaynağı (clock) ve rastgele sayı üreteci enjekte edilebilir; çizim döngüsünün tek
+#           adımı _render_step'e ayrıldı. headless kipte iş parçacığı, kare boru hattı ve paylaşılan
+#           tampon kullanılmaz; kareleri çevrimdışı önizleme çizicisi adım adım ilerletir
+# - [0.4.7] Animasyonların LED rengi ve parlaklık eğrileri çizim döngüsünde her karede uygulanıyor
+# - [0.4.6] Parlaklık ve gama, kare tamponunu değiştirmeden gönderim anında LUT'larla uygulanıyor
+#           (tekrarlanan karartma artık renkleri bozmuyor); get_brightness eklendi
+# - [0.4.5] Açık kare onaylama modeli: yazmalar arka tampona gider, çizim döngüsü yapılandırılabilir
+#           hızda kare başına tam olarak bir show() (veya bir simülasyon karesi) yapar; saniyedeki
+#           gönderim sayacı eklendi, paylaşılan kare tamponu donanım modunda da güncelleniyor
+# - [0.4.4] Doğrudan renk ayarları katmanların altındaki arka plan tamponuna yazılıyor; kalıcı çizim
+#           döngüsü için katman birleştiricisi ve uyandırma olayı eklendi
+# - [0.4.3] LED durumu (N, 3) uint8 NumPy kare tamponunda tutuluyor (simülasyon ve donanım için ortak);
+#           bölge yazmaları dilim ataması, donanıma gönderim tek geçişte ve yalnızca değişen piksellerle
+# - [0.4.2] Simülasyon LED durumu dashboard süreci için paylaşılan kare tamponuna yazılıyor
+# - [0.4.1] Simülasyon görüntüleri OLED ile ortak, arka plan iş parçacıklı kare boru hattına aktarılıyor;
+#           glob tabanlı dosya temizliği kaldırıldı
 # - [0.4.0] led_controller.py dosyasından bölündü (modüler mimari)
 # - [0.2.0] Duygu bazlı renk harmonileri, gelişmiş animasyon seçenekleri ve tema entegrasyonu eklendi
 # - [0.1.1] Simülasyon modu geliştirildi ve görselleştirme eklendi
@@ -21,32 +40,38 @@
 
 import os
 import sys
-import time
 import logging
+import random
 import threading
 from typing import Dict, List, Tuple, Optional, Union, Callable
 from pathlib import Path
 from enum import Enum
+import numpy as np
 
 # Proje dizinini ve include dizinini Python yoluna ekle
 PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.append(str(PROJECT_DIR))
 
 from include import hardware_defines
+from .led_controller_layers import LayerCompositor
+from .led_controller_output import ColorPipeline
+from .animation_curves import CurvePlayer
+from .render_clock import SYSTEM_CLOCK
 
 # Raspberry Pi platformlarında rpi_ws281x kütüphanesini yükle
 try:
-    from rpi_ws281x import PixelStrip, Color
+    from rpi_ws281x import PixelStrip
     LED_LIBRARY_AVAILABLE = True
 except ImportError:
     LED_LIBRARY_AVAILABLE = False
     
-# PIL kütüphanesini yükle (simülasyon modu için)
+# Simülasyon kare boru hattını yükle (simülasyon modu için, PIL ve numpy gerektirir)
 try:
-    from PIL import Image, ImageDraw
-    PIL_AVAILABLE = True
+    from .frame_sink import FRAME_RGB, get_simulation_pipeline
+    from .shared_framebuffer import get_shared_framebuffer
+    FRAME_SINK_AVAILABLE = True
 except ImportError:
-    PIL_AVAILABLE = False
+    FRAME_SINK_AVAILABLE = False
 
 # Logger yapılandırması
 logger = logging.getLogger("LEDController")
@@ -67,6 +92,7 @@ class AnimationPattern(Enum):
     SCAN = "scan"               # Tarama animasyonu
     TWINKLE = "twinkle"         # Yıldız parıltısı
     WAVE = "wave"               # Dalga animasyonu
+    FIRE = "fire"               # Ateş efekti
 
 
 class LEDZone:
@@ -98,16 +124,24 @@ class LEDControllerBase:
     Raspberry Pi platformlarında rpi_ws281x kütüphanesi kullanır.
     """
     
-    def __init__(self, config):
+    def __init__(self, config, clock=None, seed: Optional[int] = None, headless: bool = False):
         """
         LED kontrolcüsünü başlatır
         
         Args:
             config (dict): Yapılandırma ayarları
+            clock (optional): Zaman kaynağı (time/monotonic/sleep). Varsayılan: sistem saati
+            seed (Optional[int], optional): Animasyon çekirdekleri için rastgelelik tohumu. Varsayılan: None
+            headless (bool, optional): Yalnızca bellekte çalış (önizleme çizicisi). Varsayılan: False
         """
         logger.info("LED Kontrolcü başlatılıyor...")
         self.config = config
         
+        # Zaman kaynağı ve rastgelelik (önizleme çizicisi sanal saat ve sabit tohum verir)
+        self.clock = clock or SYSTEM_CLOCK
+        self.random = random.Random(seed)
+        self.headless = headless
+        
         # LED yapılandırması
         self.led_config = config.get("hardware", {}).get("led_strip", {})
         self.led_pin = self.led_config.get("pin", hardware_defines.DEFAULT_LED_PIN)
@@ -117,6 +151,16 @@ class LEDControllerBase:
         # LED nesnesi
         self.strip = None
         
+        # LED kare tamponu: (LED sayısı, 3) RGB, simülasyon ve donanım için ortak
+        self.pixels = np.zeros((self.led_count, 3), dtype=np.uint8)
+        # Doğrudan renk ayarlarının yazıldığı, animasyon katmanlarının altındaki arka plan
+        self.background = np.zeros((self.led_count, 3), dtype=np.uint8)
+        self._strip_pixels = None  # Şeride en son gönderilen paketlenmiş renkler (uint32)
+        
+        # Çıkış renk aşaması: parlaklık ve gama gönderim anında arama tablolarıyla uygulanır
+        self.color_pipeline = ColorPipeline(self.led_count, config.get("leds", {}).get("gamma", 1.0),
+                                            self.led_brightness)
+        
         # LED bölgeleri
         self.zones = self._create_default_zones()
         
@@ -125,9 +169,25 @@ class LEDControllerBase:
         self.animation_speed = 50  # ms
         self.animation_color = (255, 255, 255)  # varsayılan beyaz
         self.animation_running = False
-        self.animation_thread = None
+        self.animation_thread = None  # Kalıcı LED çizim döngüsü
         self.stop_animation = threading.Event()
         
+        # Animasyon katmanları ve çizim döngüsünü uyandırma olayı
+        self.compositor = LayerCompositor(self.led_count)
+        self._render_wakeup = threading.Event()
+        
+        # Animasyon motorundan gelen LED rengi/parlaklık eğrileri
+        self.curves = CurvePlayer()
+        self._compose_pending = False
+        
+        # Kare onaylama: kare başına tek gönderim, en fazla frame_rate kare/saniye
+        self.frame_rate = max(1.0, float(config.get("leds", {}).get("frame_rate", 60.0)))
+        self._next_commit_time = 0.0
+        self.show_count = 0
+        self.shows_per_second = 0.0
+        self._show_window_start = self.clock.monotonic()
+        self._show_window_count = 0
+        
         # Tema değişimi için callback
         self.theme_callback = None
         
@@ -135,7 +195,7 @@ class LEDControllerBase:
         self.power_save_enabled = config.get("system", {}).get("power_save_enabled", True)
         self.power_save_dim_delay = config.get("system", {}).get("power_save_dim_delay", 120)  # saniye
         self.power_save_off_delay = config.get("system", {}).get("power_save_off_delay", 300)  # saniye
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Platformu tespit et
         self.platform_type = hardware_defines.detect_platform()
@@ -143,21 +203,23 @@ class LEDControllerBase:
         
         # Simülasyon modu kontrolü
         self.simulation_mode = (
+            headless or
             config.get("hardware", {}).get("simulation_mode", False) or
             self.platform_type != "raspberry_pi" or 
             not LED_LIBRARY_AVAILABLE or
             "Raspberry Pi 5" in hardware_defines.get_platform_info()
         )
         
-        if self.simulation_mode:
+        if headless:
+            # Çevrimdışı önizleme: kareler yalnızca bellekte tutulur
+            self.frame_counter = 0
+            self.frame_pipeline = None
+        elif self.simulation_mode:
             if self.platform_type == "raspberry_pi":
                 logger.info("Simülasyon modu etkin (Raspberry Pi 5 henüz tam olarak desteklenmiyor veya yapılandırmada seçildi)")
             else:
                 logger.info("Simülasyon modu etkin (Raspberry Pi platformu değil)")
             
-            # Simülasyon LED durumu
-            self.sim_leds = [(0, 0, 0) for _ in range(self.led_count)]
-            
             # Simülasyon görüntü dosyaları için dizin
             self.sim_dir = os.path.join(PROJECT_DIR, "simulation")
             os.makedirs(self.sim_dir, exist_ok=True)
@@ -166,10 +228,14 @@ class LEDControllerBase:
             # Görselleştirme için frame sayacı
             self.frame_counter = 0
             
-            # Görüntü sayısı sınırlaması için parametreler
-            self.max_simulation_files = 100  # Saklanacak maksimum dosya sayısı
-            self.cleanup_counter = 0  # Temizleme işlemi sayacı
-            self.cleanup_interval = 50  # Kaç kayıt işleminde bir temizlik yapılacağı
+            # LED kareleri OLED kareleriyle aynı boru hattına (halka tampon, PNG, kayıt) aktarılır
+            self.frame_pipeline = get_simulation_pipeline(config, self.sim_dir) if FRAME_SINK_AVAILABLE else None
+        
+        # LED durumu dashboard sürecinin okuması için paylaşılan belleğe de yazılır
+        self.shared_framebuffer = (get_shared_framebuffer(config)
+                                   if FRAME_SINK_AVAILABLE and not headless else None)
+        if self.shared_framebuffer is not None:
+            self.shared_framebuffer.register("leds", FRAME_RGB, self.led_count, 1)
     
     def _create_default_zones(self) -> Dict[str, LEDZone]:
         """
@@ -217,7 +283,8 @@ class LEDControllerBase:
             if self.simulation_mode:
                 logger.info("LED kontrolcü (simülasyon modu) başlatılıyor...")
                 # İlk görselleştirmeyi oluştur
-                self._save_simulation_image()
+                self._show()
+                self._start_render_loop()
                 return True
             
             # Gerçek donanım için
@@ -240,7 +307,7 @@ class LEDControllerBase:
             dma = 10
             channel = 0
             invert = False
-            brightness = int(self.led_brightness * 255)  # 0.0-1.0 aralığını 0-255'e dönüştür
+            brightness = 255  # Parlaklık renk aşamasının LUT'unda uygulanır
             
             self.strip = PixelStrip(
                 self.led_count, self.led_pin, freq_hz, dma, invert, brightness, channel
@@ -249,6 +316,7 @@ class LEDControllerBase:
             
             # LEDleri sıfırla
             self.clear()
+            self._start_render_loop()
             
             logger.info("LED kontrolcü başlatıldı")
             return True
@@ -261,11 +329,14 @@ class LEDControllerBase:
         """
         Animasyonu durdurur ve LEDleri kapatır
         """
-        # Çalışan animasyonu durdur
+        # Çizim döngüsünü ve tüm animasyon katmanlarını durdur
         self.stop_animation.set()
+        self._render_wakeup.set()
         if self.animation_thread:
             self.animation_thread.join(timeout=1.0)
             self.animation_thread = None
+        self.compositor.clear()
+        self.animation_running = False
         
         # LEDleri kapat
         self.clear()
@@ -276,18 +347,9 @@ class LEDControllerBase:
         """
         Tüm LEDleri kapatır (siyah yapar)
         """
-        if self.simulation_mode:
-            # Simülasyon modunda
-            self.sim_leds = [(0, 0, 0) for _ in range(self.led_count)]
-            self._save_simulation_image()
-            logger.debug("Tüm LEDler temizlendi (simülasyon)")
-        else:
-            # Gerçek donanımda
-            if self.strip:
-                for i in range(self.strip.numPixels()):
-                    self.strip.setPixelColor(i, Color(0, 0, 0))
-                self.strip.show()
-                logger.debug("Tüm LEDler temizlendi")
+        self.background[:] = 0
+        self._request_frame()
+        logger.debug("Tüm LEDler temizlendi")
     
     def set_color(self, r: int, g: int, b: int, zone_name: str = "all") -> None:
         """
@@ -310,23 +372,8 @@ class LEDControllerBase:
             zone_name = "all"
         
         zone = self.zones[zone_name]
-        
-        if self.simulation_mode:
-            # Simülasyon modunda
-            for i in range(zone.start_index, zone.start_index + zone.count):
-                if 0 <= i < len(self.sim_leds):
-                    self.sim_leds[i] = (r, g, b)
-            self._save_simulation_image()
-            logger.debug(f"LED rengi ayarlandı: ({r}, {g}, {b}) bölge: {zone_name} (simülasyon)")
-        else:
-            # Gerçek donanımda
-            if self.strip:
-                color = Color(r, g, b)
-                for i in range(zone.start_index, zone.start_index + zone.count):
-                    if 0 <= i < self.strip.numPixels():
-                        self.strip.setPixelColor(i, color)
-                self.strip.show()
-                logger.debug(f"LED rengi ayarlandı: ({r}, {g}, {b}) bölge: {zone_name}")
+        self._set_zone_color((r, g, b), zone.start_index, zone.count)
+        logger.debug(f"LED rengi ayarlandı: ({r}, {g}, {b}) bölge: {zone_name}")
     
     def set_brightness(self, brightness: float) -> None:
         """
@@ -339,153 +386,260 @@ class LEDControllerBase:
         brightness = max(0.0, min(1.0, brightness))
         self.led_brightness = brightness
         
-        if self.simulation_mode:
-            # Simülasyon modunda parlaklık değişimi için LEDleri güncelle
-            new_leds = []
-            for r, g, b in self.sim_leds:
-                new_r = int(r * brightness)
-                new_g = int(g * brightness)
-                new_b = int(b * brightness)
-                new_leds.append((new_r, new_g, new_b))
-            
-            self.sim_leds = new_leds
-            self._save_simulation_image()
-            logger.debug(f"LED parlaklığı ayarlandı: {brightness} (simülasyon)")
-        else:
-            if self.strip:
-                # 0-255 aralığına dönüştür
-                brightness_int = int(brightness * 255)
-                self.strip.setBrightness(brightness_int)
-                self.strip.show()
-                logger.debug(f"LED parlaklığı ayarlandı: {brightness}")
+        # Yalnızca çıkış tablosu değişir, renkler korunur; yeni parlaklık bir sonraki karede gönderilir
+        self.color_pipeline.set_brightness(brightness)
+        self._request_frame()
+        logger.debug(f"LED parlaklığı ayarlandı: {brightness}")
+    
+    def get_brightness(self) -> float:
+        """
+        LED parlaklığını döndürür
+        
+        Returns:
+            float: Parlaklık seviyesi (0.0 - 1.0)
+        """
+        return self.led_brightness
     
     def _set_pixel_color(self, color: Tuple[int, int, int], index: int) -> None:
         """
-        Bir LED'in rengini ayarlar
+        Bir LED'in rengini arka tamponda ayarlar (kare onayı çağırana bırakılır)
         
         Args:
             color (Tuple[int, int, int]): RGB renk değerleri
             index (int): LED indeksi
         """
-        if self.simulation_mode:
-            # Simülasyon modunda
-            if 0 <= index < len(self.sim_leds):
-                self.sim_leds[index] = color
-        else:
-            # Gerçek donanımda
-            if self.strip and 0 <= index < self.strip.numPixels():
-                self.strip.setPixelColor(index, Color(color[0], color[1], color[2]))
+        if 0 <= index < self.led_count:
+            self.background[index] = color
     
-    def _set_zone_color(self, color: Tuple[int, int, int], start: int, count: int) -> None:
+    def _set_zone_color(self, color: Tuple[int, int, int], start: int, count: int,
+                        commit: bool = True) -> None:
         """
-        Bir bölgenin rengini ayarlar
+        Bir bölgenin rengini arka tamponda ayarlar
         
         Args:
             color (Tuple[int, int, int]): RGB renk değerleri
             start (int): Başlangıç LED indeksi
             count (int): LED sayısı
+            commit (bool, optional): Kare onayı istensin mi. Varsayılan: True
         """
-        for i in range(start, start + count):
-            self._set_pixel_color(color, i)
-            
-        # Gerçek donanımda LEDleri güncelle
-        if not self.simulation_mode and self.strip:
-            self.strip.show()
-
-    def _save_simulation_image(self, skip_frames: int = 1) -> None:
+        self.background[max(0, start):start + count] = color
+        if commit:
+            self._request_frame()
+    
+    def _request_frame(self) -> None:
         """
-        Simülasyon modunda LED durumunu bir görüntü dosyasına kaydeder
+        Arka tampondaki değişikliklerin bir sonraki karede gönderilmesini ister
         
-        Args:
-            skip_frames (int, optional): Kaç karede bir görüntü kaydedileceği. Varsayılan: 1
+        Çizim döngüsü çalışıyorsa istekler birleştirilir ve kare hızında tek bir
+        gönderim yapılır; döngü yoksa (başlatma öncesi/durdurma sonrası) kare hemen onaylanır.
+        headless kipte kare, çizicinin bir sonraki _render_step çağrısında onaylanır.
         """
-        if not self.simulation_mode or not PIL_AVAILABLE:
-            return
-            
-        # Performans için frame skip kontrolü
-        self.frame_counter += 1
-        if self.frame_counter % skip_frames != 0:
+        if self.headless:
+            self._compose_pending = True
+        elif self.animation_thread is not None and self.animation_thread.is_alive():
+            self._compose_pending = True
+            self._render_wakeup.set()
+        else:
+            self._compose_pending = False
+            self.compositor.compose(self.background, self.pixels)
+            self._show()
+    
+    def _start_render_loop(self) -> None:
+        """
+        Kalıcı LED çizim döngüsünü (çalışmıyorsa) başlatır
+        """
+        if self.headless or (self.animation_thread is not None and self.animation_thread.is_alive()):
             return
         
-        try:
-            # Görüntü boyutunu belirle
-            led_radius = 10
-            spacing = 5
-            width = max(100, self.led_count * (led_radius * 2 + spacing))
-            height = led_radius * 2 + 20  # Üst ve alt kenar boşlukları
-            
-            # Görüntü oluştur
-            image = Image.new('RGB', (width, height), (0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            # LED'lerin konumlarını hesapla
-            led_width = led_radius * 2 + spacing
-            total_width = led_width * self.led_count - spacing
-            start_x = (width - total_width) // 2
-            
-            # Her LED'i çiz
-            for i, color in enumerate(self.sim_leds):
-                x = start_x + i * led_width
-                y = height // 2
-                
-                # LED dairesini çiz
-                draw.ellipse(
-                    (x - led_radius, y - led_radius, x + led_radius, y + led_radius),
-                    fill=color
-                )
+        self.stop_animation.clear()
+        self.animation_thread = threading.Thread(target=self._render_loop, name="LEDRenderLoop")
+        self.animation_thread.daemon = True
+        self.animation_thread.start()
+    
+    def _render_loop(self) -> None:
+        """
+        LED çizim döngüsü
+        
+        Zamanı gelen katmanlardan yeni kare alır; katman veya arka tampon değiştiyse
+        ve kare aralığı dolduysa katmanları arka plan üzerinde birleştirip kareyi tek
+        bir gönderimle onaylar. Sonra en yakın katman karesi/kare onayı zamanına veya
+        bir değişikliğe kadar uyur.
+        """
+        while not self.stop_animation.is_set():
+            self._render_wakeup.clear()
             
-            # Zaman damgalı dosya adı oluştur
-            timestamp = int(time.time())
-            frame_num = (self.frame_counter // skip_frames) * 10
-            filename = f"led_simulation_{timestamp}_{frame_num:04d}.png"
-            filepath = os.path.join(self.sim_dir, filename)
+            try:
+                next_time = self._render_step(self.clock.monotonic())
+            except Exception as e:
+                logger.error(f"LED karesi çizilirken hata: {e}")
+                next_time = self.clock.monotonic() + 0.1
             
-            # Görüntüyü kaydet
-            image.save(filepath)
-            logger.debug(f"Simülasyon görüntüsü kaydedildi: {filename}")
+            timeout = None if next_time == float("inf") else max(0.0, next_time - self.clock.monotonic())
+            self._render_wakeup.wait(timeout)
+    
+    def _render_step(self, now: float) -> float:
+        """
+        Çizim döngüsünün tek adımı: katmanları ve eğrileri ilerletir, gerekirse kareyi onaylar
+        
+        Args:
+            now (float): Şimdiki monoton zaman
             
-            # Belirli aralıklarla eski dosyaları temizle
-            self.cleanup_counter += 1
-            if self.cleanup_counter >= self.cleanup_interval:
-                self._cleanup_old_simulation_files()
-                self.cleanup_counter = 0
-                
-        except Exception as e:
-            logger.error(f"Simülasyon görüntüsü kaydedilirken hata: {e}")
+        Returns:
+            float: Bir sonraki adımın monoton zamanı (bekleyen iş yoksa sonsuz)
+        """
+        frame_interval = 1.0 / self.frame_rate
+        
+        changed, next_time = self.compositor.advance(now)
+        if changed:
+            self._compose_pending = True
+        
+        # Eğri sürerken kare hızında çiz
+        if self._apply_curves(now):
+            next_time = min(next_time, now + frame_interval)
+        
+        if self._compose_pending:
+            if now >= self._next_commit_time:
+                self._compose_pending = False
+                self.compositor.compose(self.background, self.pixels)
+                self._show()
+                # Geride kalınırsa kareleri art arda gönderme
+                self._next_commit_time = max(self._next_commit_time + frame_interval, now)
+            else:
+                next_time = min(next_time, self._next_commit_time)
+        
+        self.animation_running = bool(self.compositor.layers)
+        return next_time
+    
+    def _apply_curves(self, now: float) -> bool:
+        """
+        Etkin eğrileri değerlendirir; LED rengi arka tampona, parlaklık çıkış tablolarına yazılır
+        
+        Args:
+            now (float): Şimdiki monoton zaman
             
-    def _cleanup_old_simulation_files(self) -> None:
+        Returns:
+            bool: Değerlendirmeden sonra hâlâ çalışan eğri varsa True
+        """
+        if not self.curves.active:
+            return False
+        
+        values = self.curves.evaluate(now)
+        
+        color = values.get("led_color")
+        if color is not None:
+            self._set_zone_color(tuple(int(round(c)) for c in color), 0, self.led_count, commit=False)
+            self._compose_pending = True
+        
+        brightness = values.get("led_brightness")
+        if brightness is not None and brightness != self.led_brightness:
+            self.led_brightness = brightness
+            self.color_pipeline.set_brightness(brightness)
+            self._compose_pending = True
+        
+        return self.curves.active
+    
+    def _show(self) -> None:
+        """
+        Kare tamponunu çıkışa gönderir (donanımda tek show(), simülasyonda tek kare)
+        """
+        preview = None
+        if self.simulation_mode:
+            preview = self.color_pipeline.preview(self.pixels)
+            self._save_simulation_image(preview)
+        elif self.strip:
+            self._push_frame_to_strip(self.color_pipeline.output(self.pixels))
+            self.strip.show()
+        
+        # LED durumu dashboard sürecinin okuması için paylaşılan belleğe de yazılır
+        if self.shared_framebuffer is not None:
+            if preview is None:
+                preview = self.color_pipeline.preview(self.pixels)
+            self.shared_framebuffer.write("leds", preview.tobytes())
+        
+        self._count_show()
+    
+    def _count_show(self) -> None:
+        """
+        Gönderim sayaçlarını günceller (saniyedeki gönderim sayısı bir saniyelik pencerelerle hesaplanır)
         """
-        Eski LED simülasyon görüntülerini temizler
+        self.show_count += 1
+        self._show_window_count += 1
+        
+        now = self.clock.monotonic()
+        elapsed = now - self._show_window_start
+        if elapsed >= 1.0:
+            self.shows_per_second = self._show_window_count / elapsed
+            self._show_window_start = now
+            self._show_window_count = 0
+    
+    def get_shows_per_second(self) -> float:
+        """
+        Son ölçüm penceresindeki saniyedeki şerit gönderimi (show) sayısını döndürür
+        
+        Returns:
+            float: Saniyedeki gönderim sayısı
+        """
+        if self.clock.monotonic() - self._show_window_start >= 2.0:
+            # Uzun süredir gönderim yok
+            return 0.0
+        return self.shows_per_second
+    
+    def _push_frame_to_strip(self, frame: np.ndarray) -> None:
+        """
+        Bir kareyi PixelStrip'in piksel belleğine aktarır
+        
+        Renkler tek bir vektörel işlemle rpi_ws281x'in 24 bit (0x00RRGGBB) biçimine
+        paketlenir; yalnızca son gönderimden bu yana değişen pikseller yazılır.
+        
+        Args:
+            frame (np.ndarray): (N, 3) uint8 çıkış renkleri
         """
+        pixels = frame.astype(np.uint32)
+        packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+        
+        if self._strip_pixels is None:
+            changed = np.arange(len(packed))
+        else:
+            changed = np.flatnonzero(packed != self._strip_pixels)
+        
+        set_pixel = self.strip.setPixelColor
+        for index, value in zip(changed.tolist(), packed[changed].tolist()):
+            set_pixel(index, value)
+        self._strip_pixels = packed
+
+    def _save_simulation_image(self, frame: Optional[np.ndarray] = None, skip_frames: int = 1) -> None:
+        """
+        Simülasyon modunda LED durumunu kare boru hattına aktarır (beklemez)
+        
+        Görüntü çizimi, PNG kaydı ve eski dosyaların temizliği boru hattının
+        iş parçacığında yapılır.
+        
+        Args:
+            frame (Optional[np.ndarray], optional): Aktarılacak kare. Varsayılan: None (parlaklık uygulanmış kare tamponu)
+            skip_frames (int, optional): Kaç karede bir kare aktarılacağı. Varsayılan: 1
+        """
+        if not self.simulation_mode:
+            return
+        
         try:
-            # LED için olan tüm görüntü dosyalarını listele
-            pattern = "led_simulation_*.png"
-            file_pattern = os.path.join(self.sim_dir, pattern)
-            
-            import glob
-            files = glob.glob(file_pattern)
+            if frame is None:
+                frame = self.color_pipeline.preview(self.pixels)
+            data = frame.tobytes()
             
-            # Dosyaları zaman damgasına göre sırala (en yeniler önce)
-            files.sort(key=os.path.getmtime, reverse=True)
+            # Performans için frame skip kontrolü
+            self.frame_counter += 1
+            if self.frame_pipeline is None or self.frame_counter % skip_frames != 0:
+                return
             
-            # Maksimum dosya sayısından fazlasını sil
-            if len(files) > self.max_simulation_files:
-                for old_file in files[self.max_simulation_files:]:
-                    try:
-                        os.unlink(old_file)
-                        logger.debug(f"Eski LED simülasyon dosyası silindi: {os.path.basename(old_file)}")
-                    except Exception as e:
-                        logger.debug(f"LED dosyası silinirken hata: {e}")
-                
-                logger.info(f"Simülasyon temizleme: LED için {len(files) - self.max_simulation_files} eski dosya silindi")
+            self.frame_pipeline.publish("leds", FRAME_RGB, self.led_count, 1, data)
         except Exception as e:
-            logger.error(f"LED simülasyon dosyaları temizlenirken hata: {e}")
+            logger.error(f"Simülasyon karesi aktarılırken hata: {e}")
     
     def reset_activity_timer(self) -> None:
         """
         Aktivite zamanlayıcısını sıfırlar
         """
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
     
     def register_theme_callback(self, callback: Callable) -> None:
         """
@@ -508,7 +662,12 @@ class LEDControllerBase:
             "simulation_mode": self.simulation_mode,
             "led_count": self.led_count,
             "brightness": self.led_brightness,
+            "gamma": self.color_pipeline.gamma,
             "animation_running": self.animation_running,
             "current_animation": self.current_animation.value if self.animation_running else None,
+            "layers": self.compositor.describe(),
+            "frame_rate": self.frame_rate,
+            "show_count": self.show_count,
+            "shows_per_second": round(self.get_shows_per_second(), 1),
             "zones": {name: {"start": zone.start_index, "count": zone.count} for name, zone in self.zones.items()}
         }
\ No newline at end of file
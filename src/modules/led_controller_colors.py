@@ -4,11 +4,13 @@
 # Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
 # Dosya: led_controller_colors.py
 # Açıklama: LED renk işlemleri ve duygu-renk eşleştirmeleri için modül.
-# Bağımlılıklar: logging
+# Bağımlılıklar: logging, functools
 # Bağlı Dosyalar: led_controller_base.py
 
-# Versiyon: 0.4.0
+# Versiyon: 0.4.2
 # Değişiklikler:
+# - [0.4.2] Önbellek anahtarı için kesirli döndürme dereceleri kesilmek yerine en yakın tam dereceye yuvarlanıyor
+# - [0.4.1] Ton döndürme sonuçları ve temel renk başına harmoni paletleri önbelleğe alınıyor
 # - [0.4.0] led_controller.py dosyasından bölündü (modüler mimari)
 # - [0.2.0] Renk harmonileri sistemi ve gelişmiş renk işleme fonksiyonları eklendi
 # - [0.1.0] Temel LED kontrolcü sınıfı ve renk ayarları oluşturuldu
@@ -19,6 +21,7 @@
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 from .led_controller_base import LEDControllerBase
@@ -26,6 +29,71 @@ from .led_controller_base import LEDControllerBase
 # Logger yapılandırması
 logger = logging.getLogger("LEDController")
 
+# Önbellekte tutulacak en fazla harmoni paleti sayısı
+MAX_HARMONY_PALETTES = 64
+
+
+@lru_cache(maxsize=1024)
+def rotate_hue(color: Tuple[int, int, int], degrees: int) -> Tuple[int, int, int]:
+    """
+    Rengin tonunu belirli bir derece döndürür (sonuçlar önbelleğe alınır)
+    
+    Args:
+        color (Tuple[int, int, int]): RGB renk değerleri
+        degrees (int): Döndürme derecesi (0-360)
+    
+    Returns:
+        Tuple[int, int, int]: Döndürülmüş RGB renk değerleri
+    """
+    # RGB'yi HSV'ye dönüştür
+    r, g, b = color
+    r, g, b = r/255.0, g/255.0, b/255.0
+    
+    max_val = max(r, g, b)
+    min_val = min(r, g, b)
+    delta = max_val - min_val
+    
+    # Ton (hue)
+    if delta == 0:
+        h = 0
+    elif max_val == r:
+        h = ((g - b) / delta) % 6
+    elif max_val == g:
+        h = (b - r) / delta + 2
+    else:
+        h = (r - g) / delta + 4
+    
+    h = (h * 60) % 360
+    
+    # Doygunluk (saturation)
+    s = 0 if max_val == 0 else delta / max_val
+    
+    # Değer (value)
+    v = max_val
+    
+    # Tonu döndür
+    h = (h + degrees) % 360
+    
+    # HSV'yi RGB'ye geri dönüştür
+    c = v * s
+    x = c * (1 - abs((h / 60) % 2 - 1))
+    m = v - c
+    
+    if 0 <= h < 60:
+        r, g, b = c, x, 0
+    elif 60 <= h < 120:
+        r, g, b = x, c, 0
+    elif 120 <= h < 180:
+        r, g, b = 0, c, x
+    elif 180 <= h < 240:
+        r, g, b = 0, x, c
+    elif 240 <= h < 300:
+        r, g, b = x, 0, c
+    else:
+        r, g, b = c, 0, x
+    
+    return (int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
+
 
 class LEDControllerColors:
     """
@@ -87,6 +155,9 @@ class LEDControllerColors:
         """
         # Renk harmonisi ayarları
         self.color_harmony = "monochromatic"  # varsayılan
+        
+        # (harmoni, temel renk, renk sayısı) -> palet
+        self._harmony_palettes = {}
     
     def set_emotion_color(self, emotion: str, zone_name: str = "all") -> None:
         """
@@ -143,6 +214,9 @@ class LEDControllerColors:
         """
         Temel bir renkten, seçilen harmoni tipine göre bir dizi uyumlu renk oluşturur
         
+        Paletler (harmoni, temel renk, renk sayısı) anahtarıyla önbelleğe alınır;
+        aynı duygu rengi için tekrarlanan çağrılar renk dönüşümü yapmaz.
+        
         Args:
             base_color (Tuple[int, int, int]): Temel RGB renk
             count (int, optional): Oluşturulacak renk sayısı. Varsayılan: 5
@@ -150,13 +224,21 @@ class LEDControllerColors:
         Returns:
             List[Tuple[int, int, int]]: Uyumlu renklerin listesi
         """
-        harmony_func = self.COLOR_HARMONIES.get(self.color_harmony, self.COLOR_HARMONIES["monochromatic"])
+        palettes = getattr(self, "_harmony_palettes", None)
+        if palettes is None:
+            palettes = self._harmony_palettes = {}
         
-        colors = []
-        for i in range(count):
-            colors.append(harmony_func(self, base_color, i))
+        key = (self.color_harmony, tuple(base_color), count)
+        palette = palettes.get(key)
+        if palette is None:
+            harmony_func = self.COLOR_HARMONIES.get(self.color_harmony, self.COLOR_HARMONIES["monochromatic"])
+            palette = tuple(harmony_func(self, key[1], i) for i in range(count))
+            
+            if len(palettes) >= MAX_HARMONY_PALETTES:
+                palettes.clear()
+            palettes[key] = palette
         
-        return colors
+        return list(palette)
     
     def _adjust_brightness(self, color: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
         """
@@ -197,61 +279,12 @@ class LEDControllerColors:
         
         Args:
             color (Tuple[int, int, int]): RGB renk değerleri
-            degrees (int): Döndürme derecesi (0-360)
+            degrees (int): Döndürme derecesi (kesirli değerler en yakın tam dereceye yuvarlanır)
         
         Returns:
             Tuple[int, int, int]: Döndürülmüş RGB renk değerleri
         """
-        # RGB'yi HSV'ye dönüştür
-        r, g, b = color
-        r, g, b = r/255.0, g/255.0, b/255.0
-        
-        max_val = max(r, g, b)
-        min_val = min(r, g, b)
-        delta = max_val - min_val
-        
-        # Ton (hue)
-        if delta == 0:
-            h = 0
-        elif max_val == r:
-            h = ((g - b) / delta) % 6
-        elif max_val == g:
-            h = (b - r) / delta + 2
-        else:
-            h = (r - g) / delta + 4
-        
-        h = (h * 60) % 360
-        
-        # Doygunluk (saturation)
-        s = 0 if max_val == 0 else delta / max_val
-        
-        # Değer (value)
-        v = max_val
-        
-        # Tonu döndür
-        h = (h + degrees) % 360
-        
-        # HSV'yi RGB'ye geri dönüştür
-        c = v * s
-        x = c * (1 - abs((h / 60) % 2 - 1))
-        m = v - c
-        
-        if 0 <= h < 60:
-            r, g, b = c, x, 0
-        elif 60 <= h < 120:
-            r, g, b = x, c, 0
-        elif 120 <= h < 180:
-            r, g, b = 0, c, x
-        elif 180 <= h < 240:
-            r, g, b = 0, x, c
-        elif 240 <= h < 300:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
-        
-        r, g, b = int((r + m) * 255), int((g + m) * 255), int((b + m) * 255)
-        
-        return (r, g, b)
+        return rotate_hue(tuple(color), round(degrees) % 360)
     
     def on_theme_changed(self, theme_data: Dict) -> None:
         """
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: led_controller_kernels.py
+# Açıklama: LED animasyon desenleri için NumPy tabanlı vektörel çekirdekler. Her çekirdek çağrısı
+#           bölgenin tamamı için (N, 3) uint8 boyutunda bir kare üretir.
+# Bağımlılıklar: numpy, math, functools
+# Bağlı Dosyalar: led_controller_base.py, led_controller_animations.py
+
+# Versiyon: 0.1.3
+# Değişiklikler:
+# - [0.1.3] Yıldız parıltısı seviye tablosu uint8 taşması olmadan hesaplanıyor (color * 3 taşıyordu);
+#           dalga ölçeklemesi ve renkler arası geçiş eski desenle aynı sonuç için float64 ile yapılıyor
+# - [0.1.2] Kullanılmayan typing içe aktarmaları kaldırıldı
+# - [0.1.1] Gökkuşağı ve ateş desenleri modül düzeyinde bir kez hesaplanan 256 girişli renk tekerleği
+#           ve ısı paleti dizilerinden kayan indekslerle okunuyor (başlatmada tablo üretimi yok)
+# - [0.1.0] Piksel başına Python döngüleri yerine kare başına vektörel animasyon çekirdekleri eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import math
+from functools import lru_cache
+from typing import Callable, Dict
+
+import numpy as np
+
+# Çekirdek imzası: (kare sayacı, LED sayısı, renk dizisi, durum sözlüğü) -> (N, 3) uint8 kare
+KernelFunc = Callable[[int, int, np.ndarray, Dict], np.ndarray]
+
+
+def wheel_colors(positions: np.ndarray) -> np.ndarray:
+    """
+    Renk tekerleği - 0-255 arası pozisyon dizisini RGB renklerine dönüştürür
+
+    Args:
+        positions (np.ndarray): Pozisyon değerleri (herhangi bir tam sayı; 256'ya göre sarılır)
+
+    Returns:
+        np.ndarray: (N, 3) uint8 RGB renk dizisi
+    """
+    pos = np.asarray(positions, dtype=np.int32) & 255
+    frame = np.zeros(pos.shape + (3,), dtype=np.int32)
+
+    first = pos < 85
+    second = (pos >= 85) & (pos < 170)
+    third = pos >= 170
+
+    p = pos[first]
+    frame[first] = np.stack([255 - p * 3, p * 3, np.zeros_like(p)], axis=-1)
+    p = pos[second] - 85
+    frame[second] = np.stack([np.zeros_like(p), 255 - p * 3, p * 3], axis=-1)
+    p = pos[third] - 170
+    frame[third] = np.stack([p * 3, np.zeros_like(p), 255 - p * 3], axis=-1)
+
+    return frame.astype(np.uint8)
+
+
+def heat_colors(heat: np.ndarray) -> np.ndarray:
+    """
+    Isı değerlerini (0-255) siyah -> kırmızı -> sarı -> beyaz renk skalasına dönüştürür
+
+    Args:
+        heat (np.ndarray): Isı değerleri
+
+    Returns:
+        np.ndarray: (N, 3) uint8 RGB renk dizisi
+    """
+    scaled = (np.asarray(heat, dtype=np.int32) * 191) // 255
+    ramp = (scaled & 0x3F) << 2
+    band = scaled >> 6
+
+    frame = np.zeros(scaled.shape + (3,), dtype=np.int32)
+    frame[..., 0] = np.where(band == 0, ramp, 255)
+    frame[..., 1] = np.where(band == 0, 0, np.where(band == 1, ramp, 255))
+    frame[..., 2] = np.where(band == 2, ramp, 0)
+    return frame.astype(np.uint8)
+
+
+# Paylaşılan salt okunur tablolar: renk tekerleği ve ısı -> renk paleti (256 x 3 bayt)
+WHEEL = wheel_colors(np.arange(256))
+WHEEL.setflags(write=False)
+HEAT_PALETTE = heat_colors(np.arange(256))
+HEAT_PALETTE.setflags(write=False)
+
+# Ateş efekti ayarları (soğuma ve kıvılcım aralığı)
+FIRE_COOLING = 55
+FIRE_SPARK_MIN = 160
+FIRE_SPARK_MAX = 255
+
+
+@lru_cache(maxsize=16)
+def rainbow_offsets(count: int) -> np.ndarray:
+    """
+    Gökkuşağında her LED'in renk tekerleği üzerindeki sabit kaymasını döndürür (LED sayısı başına bir kez)
+
+    Args:
+        count (int): LED sayısı
+
+    Returns:
+        np.ndarray: (count,) salt okunur kayma dizisi
+    """
+    offsets = (np.arange(count) * 256 // count + 1).astype(np.intp)
+    offsets.setflags(write=False)
+    return offsets
+
+
+def scale_color(color: np.ndarray, factors: np.ndarray) -> np.ndarray:
+    """
+    Tek bir rengi piksel başına parlaklık faktörleriyle ölçekler
+
+    Args:
+        color (np.ndarray): (3,) renk dizisi
+        factors (np.ndarray): (N,) parlaklık faktörleri (0.0-1.0)
+
+    Returns:
+        np.ndarray: (N, 3) uint8 RGB renk dizisi
+    """
+    return (np.asarray(factors, dtype=np.float64)[:, None] * color[None, :]).astype(np.uint8)
+
+
+def _fill(count: int, color: np.ndarray, factor: float = 1.0) -> np.ndarray:
+    """Tüm bölgeyi tek bir renkle (isteğe bağlı parlaklık faktörüyle) doldurur"""
+    frame = np.empty((count, 3), dtype=np.uint8)
+    frame[:] = (color * factor).astype(np.uint8)
+    return frame
+
+
+def kernel_static(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Sabit renk"""
+    return _fill(count, color)
+
+
+def kernel_pulse(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Nabız - 20 adımda parlayıp 20 adımda söner"""
+    i = step % 40
+    level = i * 5 if i < 20 else 100 - (i - 20) * 5
+    return _fill(count, color, level / 100.0)
+
+
+def kernel_breathe(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Nefes alma - 100 adımlık sinüs eğrisiyle yumuşak parlama/sönme"""
+    factor = (math.sin((step % 100) / 100.0 * math.pi) + 1) / 2
+    return _fill(count, color, factor)
+
+
+def kernel_fade(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Solma - tam renk, siyaha doğru 50 adımlık azalma ve kısa siyah bekleme"""
+    i = step % 55
+    if i < 2:
+        return _fill(count, color)
+    if i < 52:
+        return _fill(count, color, (100 - (i - 2) * 2) / 100.0)
+    return np.zeros((count, 3), dtype=np.uint8)
+
+
+def kernel_chase(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Takip - tek bir renk noktası şeridi dolaşır"""
+    frame = np.zeros((count, 3), dtype=np.uint8)
+    frame[step % count] = color
+    return frame
+
+
+def kernel_rainbow(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Gökkuşağı - renk tekerleği şerit boyunca kayar (tekerlek dizisinden kayan indeksle okunur)"""
+    frame = state.get("frame")
+    if frame is None:
+        frame = state["frame"] = np.empty((count, 3), dtype=np.uint8)
+        state["index"] = np.empty(count, dtype=np.intp)
+    index = state["index"]
+    np.add(rainbow_offsets(count), step, out=index)
+    np.bitwise_and(index, 255, out=index)
+    return np.take(WHEEL, index, axis=0, out=frame)
+
+
+def kernel_sparkle(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Pırıltı - sönük arka plan üzerinde rastgele parlak LEDler"""
+    frame = _fill(count, color, 0.1)
+    sparks = state["rng"].integers(0, count, size=max(1, count // 5))
+    frame[sparks] = color
+    return frame
+
+
+def kernel_wipe(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Silme - renk bir uçtan diğerine yayılır, bir süre kalır ve söner"""
+    i = step % (count + 10)
+    frame = np.zeros((count, 3), dtype=np.uint8)
+    if i < count + 5:
+        frame[:min(count, i + 1)] = color
+    return frame
+
+
+def kernel_theater_chase(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Tiyatro takip - her üç LED'den biri sırayla yanar"""
+    frame = np.zeros((count, 3), dtype=np.uint8)
+    frame[step % 3::3] = color
+    return frame
+
+
+def kernel_color_fade(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Renkler arası geçiş - uyumlu renkler arasında 100 adımlık doğrusal geçiş"""
+    palette = state["palette"]
+    i = (step // 100) % len(palette)
+    factor = (step % 100) / 100.0
+    current = palette[i].astype(np.float64)
+    target = palette[(i + 1) % len(palette)].astype(np.float64)
+    frame = np.empty((count, 3), dtype=np.uint8)
+    frame[:] = (current + (target - current) * factor).astype(np.uint8)
+    return frame
+
+
+def kernel_scan(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Tarama - parlak bir çubuk sönük arka plan üzerinde ileri geri hareket eder"""
+    width = max(1, count // 10)
+    travel = count - width + 1
+    i = step % (2 * travel)
+    position = i if i < travel else 2 * travel - 1 - i
+
+    frame = np.empty((count, 3), dtype=np.uint8)
+    frame[:] = color // 8
+    frame[position:position + width] = color
+    return frame
+
+
+def kernel_twinkle(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Yıldız parıltısı - rastgele LEDler farklı parlaklıklarda yanıp yavaşça söner"""
+    rng = state["rng"]
+    levels = state.setdefault("levels", np.zeros(count, dtype=np.int8))
+    timers = state.setdefault("timers", np.zeros(count, dtype=np.float32))
+    speed_ratio = state.get("speed", 50) / 50.0
+
+    # Yanan ve süresi dolan LEDler bir parlaklık seviyesi azalır
+    lit = levels > 0
+    expired = lit & (timers <= 0)
+    levels[expired] -= 1
+    still_lit = expired & (levels > 0)
+    timers[still_lit] = rng.uniform(1.0, 3.0, size=int(still_lit.sum())) * speed_ratio
+    timers[lit & ~expired] -= 1
+
+    # Sönük LEDler %5 olasılıkla yeni bir parlaklık seviyesinde yanar
+    ignite = ~lit & (rng.random(count) < 0.05)
+    ignited = int(ignite.sum())
+    levels[ignite] = rng.integers(1, 4, size=ignited)
+    timers[ignite] = rng.uniform(2.0, 5.0, size=ignited) * speed_ratio
+
+    # Seviye 0: arka plan, 1-3: %50, %75 ve %100 parlaklık
+    table = state.get("table")
+    if table is None:
+        wide = color.astype(np.int32)
+        table = np.stack([wide // 15, wide // 2, wide * 3 // 4, wide]).astype(np.uint8)
+        state["table"] = table
+    return table[levels]
+
+
+def kernel_wave(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Dalga - sinüs dalgası şeklinde parlaklık dalgalanması"""
+    angles = (np.arange(count) * 360 // count + step + 1) % 360
+    factors = (np.sin(np.radians(angles)) + 1) / 2
+    return scale_color(color, factors)
+
+
+def kernel_fire(step: int, count: int, color: np.ndarray, state: Dict) -> np.ndarray:
+    """Ateş - soğuma, yukarı doğru ısı yayılımı ve tabanda rastgele kıvılcımlar"""
+    rng = state["rng"]
+    heat = state.get("heat")
+    if heat is None:
+        heat = state["heat"] = np.zeros(count, dtype=np.int32)
+        state["frame"] = np.empty((count, 3), dtype=np.uint8)
+
+    # Her hücre biraz soğur
+    np.subtract(heat, rng.integers(0, FIRE_COOLING * 10 // count + 3, size=count), out=heat)
+    np.clip(heat, 0, 255, out=heat)
+
+    # Isı yukarı doğru sürüklenir ve yayılır (eski değerlerden hesaplanır)
+    if count > 2:
+        heat[2:] = (heat[1:-1] + 2 * heat[:-2]) // 3
+
+    # Tabana yakın rastgele kıvılcımlar
+    if rng.random() < 0.5:
+        index = int(rng.integers(0, min(count, 7)))
+        heat[index] = min(255, heat[index] + int(rng.integers(FIRE_SPARK_MIN, FIRE_SPARK_MAX + 1)))
+
+    return np.take(HEAT_PALETTE, heat, axis=0, out=state["frame"])
+
+
+# Desen adı -> çekirdek fonksiyonu
+KERNELS: Dict[str, KernelFunc] = {
+    "static": kernel_static,
+    "pulse": kernel_pulse,
+    "breathe": kernel_breathe,
+    "fade": kernel_fade,
+    "chase": kernel_chase,
+    "rainbow": kernel_rainbow,
+    "sparkle": kernel_sparkle,
+    "wipe": kernel_wipe,
+    "theater_chase": kernel_theater_chase,
+    "color_fade": kernel_color_fade,
+    "scan": kernel_scan,
+    "twinkle": kernel_twinkle,
+    "wave": kernel_wave,
+    "fire": kernel_fire,
+}
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: led_controller_layers.py
+# Açıklama: LED kare üreticileri için katman yapısı ve karıştırma modlu bölge birleştiricisi.
+#           Her katman bir bölgeye bağlı, kendi hızında kare üreten bir üreteçtir (generator);
+#           birleştirici katmanları alttan üste karıştırarak tek bir şerit karesi oluşturur.
+# Bağımlılıklar: numpy, threading, logging
+# Bağlı Dosyalar: led_controller_animations.py, led_controller_kernels.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Bir aralığı tam kaplayan bölge katmanlarını kaldıran remove_zone_layers eklendi
+# - [0.1.0] Bölge/katman başına kare üreticileri, karıştırma modları ve yerinde değiştirilebilen
+#           katmanlara sahip birleştirici eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .led_controller_kernels import KernelFunc
+
+# Logger yapılandırması
+logger = logging.getLogger("LEDController")
+
+
+def _blend_normal(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    return src
+
+
+def _blend_add(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    return np.minimum(dst.astype(np.uint16) + src, 255).astype(np.uint8)
+
+
+def _blend_multiply(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    return (dst.astype(np.uint16) * src // 255).astype(np.uint8)
+
+
+def _blend_screen(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    inverse = (255 - dst.astype(np.uint16)) * (255 - src.astype(np.uint16)) // 255
+    return (255 - inverse).astype(np.uint8)
+
+
+def _blend_lighten(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    return np.maximum(dst, src)
+
+
+# Karıştırma modu adı -> (alttaki kare, katman karesi) -> sonuç karesi
+BLEND_MODES: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "normal": _blend_normal,
+    "add": _blend_add,
+    "multiply": _blend_multiply,
+    "screen": _blend_screen,
+    "lighten": _blend_lighten,
+}
+
+
+def pattern_producer(kernel: KernelFunc, count: int, color: Tuple[int, int, int],
+                     state: Dict) -> Iterator[np.ndarray]:
+    """
+    Bir desen çekirdeğini sonsuz kare üreticisine dönüştürür
+
+    Args:
+        kernel (KernelFunc): Desen çekirdeği
+        count (int): LED sayısı
+        color (Tuple[int, int, int]): RGB renk değerleri
+        state (Dict): Çekirdek durumu
+
+    Yields:
+        np.ndarray: (count, 3) uint8 kare
+    """
+    color_array = np.asarray(color, dtype=np.uint8)
+    step = 0
+    while True:
+        yield kernel(step, count, color_array, state)
+        step += 1
+
+
+class LEDLayer:
+    """
+    Bir bölgeye bağlı kare üreticisi
+
+    Üretici her ilerletildiğinde bölge boyutunda bir kare verir; interval None ise
+    tek bir kare üretilir ve katman o kareyi göstermeye devam eder.
+    """
+
+    def __init__(self, name: str, start: int, count: int, producer: Iterator[np.ndarray],
+                 interval: Optional[float], blend_mode: str = "normal", overlay: bool = False,
+                 key: Optional[Tuple] = None):
+        """
+        Katman oluşturur
+
+        Args:
+            name (str): Katman adı
+            start (int): Başlangıç LED indeksi
+            count (int): LED sayısı
+            producer (Iterator[np.ndarray]): Kare üreticisi
+            interval (Optional[float]): Kare aralığı (saniye), None: tek kare
+            blend_mode (str, optional): Karıştırma modu. Varsayılan: "normal"
+            overlay (bool, optional): Bölge katmanlarının üstünde çizilen bindirme katmanı mı. Varsayılan: False
+            key (Optional[Tuple], optional): Aynı animasyonun yeniden başlatılmasını önlemek için parametre anahtarı
+        """
+        self.name = name
+        self.start = start
+        self.count = count
+        self.producer = producer
+        self.interval = interval
+        self.blend = BLEND_MODES.get(blend_mode, _blend_normal)
+        self.blend_mode = blend_mode if blend_mode in BLEND_MODES else "normal"
+        self.overlay = overlay
+        self.key = key
+        self.frame: Optional[np.ndarray] = None
+        self.next_time = 0.0
+
+    def advance(self, now: float) -> bool:
+        """
+        Zamanı geldiyse üreticiden yeni bir kare alır
+
+        Args:
+            now (float): Şimdiki monoton zaman
+
+        Returns:
+            bool: Yeni kare alındıysa True
+
+        Raises:
+            StopIteration: Üretici tükendiyse
+        """
+        if now < self.next_time or (self.interval is None and self.frame is not None):
+            return False
+
+        self.frame = next(self.producer)
+        if self.interval is None:
+            self.next_time = float("inf")
+        else:
+            # Geride kalınırsa kareleri art arda üretme, bir sonraki aralığa hizala
+            self.next_time = max(self.next_time + self.interval, now)
+        return True
+
+    def describe(self) -> Dict:
+        """
+        Katmanın durum bilgisini döndürür
+
+        Returns:
+            Dict: Katman bilgisi
+        """
+        return {
+            "name": self.name,
+            "start": self.start,
+            "count": self.count,
+            "blend_mode": self.blend_mode,
+            "overlay": self.overlay,
+            "interval": self.interval,
+        }
+
+
+class LayerCompositor:
+    """
+    LED katmanlarını birleştiren sınıf
+
+    Bölge katmanları eklenme sırasıyla, bindirme katmanları onların üstünde çizilir.
+    Katmanlar kilit altında yerinde değiştirilir; çizim iş parçacığı bir sonraki
+    karede yeni üreticiyi kullanır.
+    """
+
+    def __init__(self, led_count: int):
+        """
+        Birleştiriciyi oluşturur
+
+        Args:
+            led_count (int): Şeritteki LED sayısı
+        """
+        self.led_count = led_count
+        self.layers: Dict[str, LEDLayer] = {}
+        self.lock = threading.Lock()
+        self._canvas = np.zeros((led_count, 3), dtype=np.uint8)
+
+    def set_layer(self, layer: LEDLayer) -> bool:
+        """
+        Aynı adlı katmanı yenisiyle değiştirir veya yeni katman ekler
+
+        Tam kaplayan normal karıştırmalı bir bölge katmanı, altında kalan bölge
+        katmanlarını kaldırır (ör. "all" bölgesindeki animasyon tüm şeridi devralır).
+
+        Args:
+            layer (LEDLayer): Yeni katman
+
+        Returns:
+            bool: Katman değiştiyse True, aynı animasyon zaten çalışıyorsa False
+        """
+        with self.lock:
+            current = self.layers.get(layer.name)
+            if (current is not None and layer.key is not None and current.key == layer.key
+                    and current.blend_mode == layer.blend_mode):
+                return False
+
+            if not layer.overlay and layer.blend_mode == "normal":
+                self._remove_covered_locked(layer.start, layer.count, keep=layer.name)
+
+            # Sözlük sırası çizim sırasıdır: mevcut katman yerinde değiştirilir
+            self.layers[layer.name] = layer
+            return True
+
+    def _remove_covered_locked(self, start: int, count: int, keep: Optional[str] = None) -> bool:
+        """Kilit altında [start, start + count) aralığında kalan bölge katmanlarını kaldırır"""
+        end = start + count
+        covered = [name for name, layer in self.layers.items()
+                   if not layer.overlay and name != keep
+                   and layer.start >= start and layer.start + layer.count <= end]
+        for name in covered:
+            del self.layers[name]
+        return bool(covered)
+
+    def remove_zone_layers(self, start: int, count: int) -> bool:
+        """
+        Bir aralığın içinde kalan bölge katmanlarını kaldırır (bindirme katmanları korunur)
+
+        Args:
+            start (int): Başlangıç LED indeksi
+            count (int): LED sayısı
+
+        Returns:
+            bool: En az bir katman kaldırıldıysa True
+        """
+        with self.lock:
+            return self._remove_covered_locked(start, count)
+
+    def remove_layer(self, name: str) -> bool:
+        """
+        Bir katmanı kaldırır
+
+        Args:
+            name (str): Katman adı
+
+        Returns:
+            bool: Katman vardıysa True
+        """
+        with self.lock:
+            return self.layers.pop(name, None) is not None
+
+    def clear(self) -> None:
+        """Tüm katmanları kaldırır"""
+        with self.lock:
+            self.layers.clear()
+
+    def advance(self, now: float) -> Tuple[bool, float]:
+        """
+        Zamanı gelen katmanlardan yeni kareler alır; tükenen üreticileri kaldırır
+
+        Args:
+            now (float): Şimdiki monoton zaman
+
+        Returns:
+            Tuple[bool, float]: (herhangi bir katman değişti mi, en yakın sonraki kare zamanı)
+        """
+        changed = False
+        next_time = float("inf")
+        with self.lock:
+            for name, layer in list(self.layers.items()):
+                try:
+                    changed |= layer.advance(now)
+                except StopIteration:
+                    del self.layers[name]
+                    changed = True
+                    continue
+                except Exception as e:
+                    logger.error(f"LED katmanı '{name}' kare üretirken hata, katman kaldırıldı: {e}")
+                    del self.layers[name]
+                    changed = True
+                    continue
+                next_time = min(next_time, layer.next_time)
+        return changed, next_time
+
+    def compose(self, background: np.ndarray, out: np.ndarray) -> None:
+        """
+        Arka plan üzerine katmanları karıştırır
+
+        Args:
+            background (np.ndarray): (N, 3) katmansız LED durumu (doğrudan renk ayarları)
+            out (np.ndarray): (N, 3) sonuç tamponu
+        """
+        canvas = self._canvas
+        canvas[:] = background
+        with self.lock:
+            ordered = ([l for l in self.layers.values() if not l.overlay] +
+                       [l for l in self.layers.values() if l.overlay])
+            for layer in ordered:
+                if layer.frame is None:
+                    continue
+                end = min(self.led_count, layer.start + len(layer.frame))
+                region = canvas[layer.start:end]
+                region[:] = layer.blend(region, layer.frame[:end - layer.start])
+        out[:] = canvas
+
+    def describe(self) -> List[Dict]:
+        """
+        Katmanların durum bilgisini döndürür
+
+        Returns:
+            List[Dict]: Katman bilgileri (çizim sırasıyla)
+        """
+        with self.lock:
+            return [layer.describe() for layer in self.layers.values()]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: led_controller_output.py
+# Açıklama: LED çıkış renk aşaması. Gama ve parlaklık düzeltmesini önceden hesaplanmış
+#           256 girişli arama tablolarıyla (LUT) gönderim anında uygular; kare tamponundaki
+#           renkler hiçbir zaman değiştirilmez.
+# Bağımlılıklar: numpy, threading
+# Bağlı Dosyalar: led_controller_base.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Gama/parlaklık LUT'ları ile yıkıcı olmayan çıkış renk aşaması eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import threading
+
+import numpy as np
+
+
+def build_lut(gamma: float, brightness: float) -> np.ndarray:
+    """
+    Gama ve parlaklık düzeltmesini tek bir kanal arama tablosunda birleştirir
+
+    Args:
+        gamma (float): Gama değeri (1.0: doğrusal)
+        brightness (float): Parlaklık (0.0 - 1.0)
+
+    Returns:
+        np.ndarray: (256,) uint8 arama tablosu
+    """
+    levels = np.arange(256, dtype=np.float64) / 255.0
+    return np.rint(255.0 * np.power(levels, gamma) * brightness).astype(np.uint8)
+
+
+class ColorPipeline:
+    """
+    LED çıkış renk aşaması
+
+    İki tablo tutulur: şeride giden değerler için gama + parlaklık, önizleme
+    (simülasyon ve dashboard) için yalnızca parlaklık. Monitörler zaten gama
+    kodlu renk gösterdiğinden önizlemeye gama uygulanmaz. Parlaklık veya gama
+    değişikliği yalnızca 256 girişli tabloları yeniden oluşturur.
+    """
+
+    def __init__(self, led_count: int, gamma: float = 1.0, brightness: float = 1.0):
+        """
+        Renk aşamasını oluşturur
+
+        Args:
+            led_count (int): LED sayısı
+            gamma (float, optional): Gama değeri. Varsayılan: 1.0
+            brightness (float, optional): Parlaklık (0.0 - 1.0). Varsayılan: 1.0
+        """
+        self.gamma = max(0.1, float(gamma))
+        self.brightness = max(0.0, min(1.0, float(brightness)))
+        self._lock = threading.Lock()
+        self._output = np.zeros((led_count, 3), dtype=np.uint8)
+        self._preview = np.zeros((led_count, 3), dtype=np.uint8)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Arama tablolarını yeniden oluşturur"""
+        with self._lock:
+            self.output_lut = build_lut(self.gamma, self.brightness)
+            self.preview_lut = build_lut(1.0, self.brightness)
+
+    def set_brightness(self, brightness: float) -> None:
+        """
+        Parlaklığı ayarlar (yalnızca tablolar yeniden oluşturulur)
+
+        Args:
+            brightness (float): Parlaklık (0.0 - 1.0)
+        """
+        self.brightness = max(0.0, min(1.0, float(brightness)))
+        self._rebuild()
+
+    def set_gamma(self, gamma: float) -> None:
+        """
+        Gama değerini ayarlar
+
+        Args:
+            gamma (float): Gama değeri (1.0: doğrusal)
+        """
+        self.gamma = max(0.1, float(gamma))
+        self._rebuild()
+
+    def output(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Şeride gönderilecek kareyi (gama + parlaklık) üretir
+
+        Args:
+            frame (np.ndarray): (N, 3) uint8 mantıksal renkler
+
+        Returns:
+            np.ndarray: (N, 3) uint8 düzeltilmiş renkler (yeniden kullanılan tampon)
+        """
+        np.take(self.output_lut, frame, out=self._output)
+        return self._output
+
+    def preview(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Simülasyon/dashboard önizlemesi için kareyi (yalnızca parlaklık) üretir
+
+        Args:
+            frame (np.ndarray): (N, 3) uint8 mantıksal renkler
+
+        Returns:
+            np.ndarray: (N, 3) uint8 önizleme renkleri (yeniden kullanılan tampon)
+        """
+        np.take(self.preview_lut, frame, out=self._preview)
+        return self._preview
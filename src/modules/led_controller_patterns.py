@@ -7,8 +7,12 @@
 # Bağımlılıklar: logging
 # Bağlı Dosyalar: led_controller_base.py, led_controller_animations.py
 
-# Versiyon: 0.4.0
+# Versiyon: 0.4.4
 # Değişiklikler:
+# - [0.4.4] Desen adımları ve enerji tasarrufu kontrolcünün saatini kullanıyor
+# - [0.4.3] Takip deseni her adımda tek kare onayı istiyor
+# - [0.4.2] Başlangıç animasyonu adımları arasında çizim döngüsü durdurulmuyor, katman yerinde değiştiriliyor
+# - [0.4.1] Takip deseni kareyi ortak _show() ile gönderiyor
 # - [0.4.0] led_controller.py dosyasından bölündü (modüler mimari)
 # - [0.2.0] Duygu bazlı animasyon ve renk eşleştirme geliştirildi
 # - [0.1.0] Temel LED kontrol işlevleri oluşturuldu
@@ -112,7 +116,7 @@ class LEDControllerPatterns:
         Enerji tasarrufu moduna girer
         """
         # Son aktivite üzerinden geçen süre
-        elapsed_time = time.time() - self.last_activity_time
+        elapsed_time = self.clock.time() - self.last_activity_time
         
         # Dim modu
         if elapsed_time >= self.power_save_dim_delay:
@@ -159,18 +163,16 @@ class LEDControllerPatterns:
             self.animate(AnimationPattern.RAINBOW, speed=20, zone_name="all")
             time.sleep(2.0)
             
-            # 2. Tarama animasyonu
-            self.stop()
+            # 2. Tarama animasyonu (katmandaki üretici yerinde değiştirilir)
             self.animate(AnimationPattern.SCAN, (0, 0, 255), speed=20, zone_name="all")
             time.sleep(2.0)
             
             # 3. Solma animasyonu ve son renk
-            self.stop()
             self.animate(AnimationPattern.FADE, (255, 255, 255), speed=40, zone_name="all")
             time.sleep(2.0)
             
             # Animasyonu durdur ve varsayılan durum için sabit rengi ayarla
-            self.stop()
+            self.stop_layer("all")
             self.set_emotion_color("neutral")
             
             logger.info("Başlangıç animasyonu tamamlandı")
@@ -256,7 +258,7 @@ class LEDControllerPatterns:
             for color in colors:
                 if isinstance(color, tuple) and len(color) == 3:
                     self._set_zone_color(color, start, count)
-                    time.sleep(speed / 1000.0)
+                    self.clock.sleep(speed / 1000.0)
     
     def _run_alternate_pattern(self, colors, speed=50, repeat=5, **kwargs):
         """
@@ -284,7 +286,7 @@ class LEDControllerPatterns:
             for color in colors:
                 if isinstance(color, tuple) and len(color) == 3:
                     self._set_zone_color(color, start, count)
-                    time.sleep(speed / 1000.0)
+                    self.clock.sleep(speed / 1000.0)
     
     def _run_chase_pattern(self, color=(255, 255, 255), bg_color=(0, 0, 0), width=3, speed=50, repeat=3, **kwargs):
         """
@@ -309,20 +311,17 @@ class LEDControllerPatterns:
         for _ in range(repeat):
             for i in range(count):
                 # Arka planı ayarla
-                self._set_zone_color(bg_color, start, count)
+                self._set_zone_color(bg_color, start, count, commit=False)
                 
                 # Işık noktalarını ayarla
                 for j in range(width):
                     idx = (i + j) % count
                     self._set_pixel_color(color, start + idx)
                 
-                # LEDleri güncelle
-                if not self.simulation_mode and self.strip:
-                    self.strip.show()
-                else:
-                    self._save_simulation_image()
+                # Kareyi tek seferde onayla
+                self._request_frame()
                 
-                time.sleep(speed / 1000.0)
+                self.clock.sleep(speed / 1000.0)
     
     def _run_custom_pattern(self, steps, **kwargs):
         """
@@ -346,4 +345,4 @@ class LEDControllerPatterns:
             
             if isinstance(color, tuple) and len(color) == 3:
                 self._set_zone_color(color, start, count)
-                time.sleep(duration / 1000.0)
\ No newline at end of file
+                self.clock.sleep(duration / 1000.0)
\ No newline at end of file
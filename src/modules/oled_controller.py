@@ -7,8 +7,18 @@
 # Bağımlılıklar: PIL, adafruit_ssd1306, threading, logging, time
 # Bağlı Dosyalar: hardware_defines.py, oled_controller_base.py, oled_controller_display.py, oled_controller_animations.py
 
-# Versiyon: 0.3.2
+# Versiyon: 0.3.10
 # Değişiklikler:
+# - [0.3.10] Kullanılmayan random içe aktarımı kaldırıldı (rastgelelik kontrolcünün üretecinden)
+# - [0.3.9] Genişletilmiş kare güncellemesi büyüyen çember adımını ilerletiyor
+# - [0.3.8] Genişletilmiş kare güncellemesi _update_frame'e ayrıldı (önizleme çizicisi de kullanır);
+#           zaman kaynağı, tohum ve headless parametreleri temel sınıfa iletiliyor
+# - [0.3.7] Genişletilmiş animasyon döngüsü animasyon eğrilerini (sürekli izler) her karede uyguluyor
+# - [0.3.6] Başlangıç animasyonunda göz açılması, parametre almayan _update_blink_state yerine
+#           göz kırpma durumunu doğrudan açarak yapılıyor
+# - [0.3.5] Genişletilmiş animasyon döngüsü konuşma (ağız senkronizasyonu) seviyesini her karede güncelliyor
+# - [0.3.4] Genişletilmiş animasyon döngüsü olay tabanlı çizim modunu (kirli bayrak, son tarihe kadar uyku) destekliyor
+# - [0.3.3] Genişletilmiş animasyon döngüsü son tarih tabanlı kare zamanlayıcıyı kullanıyor
 # - [0.3.2] Çevresel faktörlere tepki veren ifadeler eklendi
 # - [0.3.1] Modül 3'e bölündü: temel, gösterim ve animasyon modülleri
 # - [0.3.0] Duygu alt tiplerinin görsel ifadeleri geliştirildi, duygu geçişleri daha akıcı hale getirildi
@@ -23,7 +33,6 @@
 import os
 import sys
 import time
-import random
 import logging
 import threading
 from typing import Dict, List, Tuple, Optional, Union
@@ -50,15 +59,18 @@ class OLEDController(OLEDControllerBase, OLEDDisplayMixin, OLEDAnimationsMixin):
     Bu sınıf, temel OLED kontrolcü, çizim fonksiyonları ve animasyon fonksiyonlarını birleştirir.
     """
     
-    def __init__(self, config):
+    def __init__(self, config, clock=None, seed: Optional[int] = None, headless: bool = False):
         """
         OLED kontrolcü sınıfını başlatır
         
         Args:
             config (dict): Yapılandırma ayarları
+            clock (optional): Zaman kaynağı. Varsayılan: sistem saati
+            seed (Optional[int], optional): Rastgelelik tohumu. Varsayılan: None
+            headless (bool, optional): Yalnızca bellekte çalış (önizleme çizicisi). Varsayılan: False
         """
         # Temel sınıfı başlat
-        OLEDControllerBase.__init__(self, config)
+        OLEDControllerBase.__init__(self, config, clock, seed, headless)
         
         # Animasyon döngüsüne emotion_transition güncelleme işlevi ekle
         self._original_animation_loop = self._animation_loop
@@ -70,46 +82,52 @@ class OLEDController(OLEDControllerBase, OLEDDisplayMixin, OLEDAnimationsMixin):
         """
         logger.info("Genişletilmiş animasyon döngüsü başlatıldı")
         
+        self.frame_scheduler.reset()
+        
         while self.is_running:
-            loop_start = time.time()
+            self.frame_scheduler.begin_frame()
             
             try:
-                # Güç tasarrufu kontrolü
-                self._check_power_saving_mode()
-                
-                # Duygu geçişi güncelleme
-                self.update_emotion_transition()
-                
-                # Göz pozisyonu güncelleme
-                self._update_eye_position()
-                
-                # Göz kırpma kontrolü
-                self._update_blink_state()
-                
-                # Mikro ifade kontrolü
-                self._update_micro_expression()
-                
-                # Çevresel faktörlere tepki kontrolü
-                self.react_to_environmental_factors()
-                
-                # Ekranlara çizim yap
-                self._draw_all_displays()
-                
-                # Ekranları güncelle
-                if self.power_mode != "off":
-                    self.update_display()
-                
+                self._update_frame()
             except Exception as e:
                 logger.error(f"Animasyon döngüsünde hata: {e}")
             
-            # FPS kontrolü
-            elapsed = time.time() - loop_start
-            sleep_time = max(0, self.frame_delay - elapsed)
-            
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            elif elapsed > 1.5 * self.frame_delay:
-                logger.warning(f"Animasyon döngüsü yavaş çalışıyor: {elapsed:.4f} saniye (hedef: {self.frame_delay:.4f})")
+            # Bir sonraki kareyi veya son tarihi bekle
+            self._wait_next_frame()
+    
+    def _update_frame(self) -> None:
+        """
+        Tek bir karenin yüz durumunu günceller ve gerekirse çizer (duygu geçişleri dahil)
+        """
+        # Güç tasarrufu kontrolü
+        self._check_power_saving_mode()
+        
+        # Duygu geçişi güncelleme
+        self.update_emotion_transition()
+        
+        # Animasyon eğrilerini uygula (göz hedefi, ağız açıklığı, duygu yoğunluğu)
+        self._update_curves()
+        
+        # Göz pozisyonu güncelleme
+        self._update_eye_position()
+        
+        # Göz kırpma kontrolü
+        self._update_blink_state()
+        
+        # Mikro ifade kontrolü
+        self._update_micro_expression()
+        
+        # Konuşma (ağız senkronizasyonu) seviyesini güncelle
+        self._update_speaking()
+        
+        # Büyüyen çember adımını güncelle
+        self._update_growing_circle()
+        
+        # Çevresel faktörlere tepki kontrolü
+        self.react_to_environmental_factors()
+        
+        # Ekranlara çizim yap ve güncelle (olay modunda yalnızca yüz kirliyse)
+        self._render_frame()
     
     def _get_random_blink_interval(self) -> float:
         """
@@ -120,7 +138,7 @@ class OLEDController(OLEDControllerBase, OLEDDisplayMixin, OLEDAnimationsMixin):
         """
         min_interval = self.config.get("animation", {}).get("blink_interval_min", 2.0)
         max_interval = self.config.get("animation", {}).get("blink_interval_max", 10.0)
-        return random.uniform(min_interval, max_interval)
+        return self.random.uniform(min_interval, max_interval)
     
     def show_startup_animation(self) -> None:
         """
@@ -141,8 +159,9 @@ class OLEDController(OLEDControllerBase, OLEDDisplayMixin, OLEDAnimationsMixin):
             self.animate_blink(immediate=True)
             time.sleep(0.3)
             
-            # Göz açılma
-            self._update_blink_state(False)
+            # Göz açılma (sonraki kırpma normal zamanlamayla)
+            self.blink_state = True
+            self.next_blink_time = self.clock.time() + self._get_random_blink_interval()
             self._draw_all_displays()
             self.update_display()
             time.sleep(0.3)
@@ -165,7 +184,7 @@ class OLEDController(OLEDControllerBase, OLEDDisplayMixin, OLEDAnimationsMixin):
             self.animate_blink(immediate=True)
             
             # Aktivite zamanını güncelle
-            self.last_activity_time = time.time()
+            self.last_activity_time = self.clock.time()
             
             # Rastgele göz hareketini etkinleştir
             self.enable_random_eye_movement(True)
@@ -5,10 +5,20 @@
 # Dosya: oled_controller_animations.py
 # Açıklama: OLED ekranları için animasyon ve duygu geçişlerini içeren modül.
 # Bağımlılıklar: PIL, threading, time
-# Bağlı Dosyalar: hardware_defines.py, oled_controller_base.py
+# Bağlı Dosyalar: hardware_defines.py, oled_controller_base.py, oled_controller_morph.py
 
-# Versiyon: 0.3.2
+# Versiyon: 0.3.9
 # Değişiklikler:
+# - [0.3.9] Kullanılmayan random içe aktarımı kaldırıldı (rastgelelik kontrolcünün üretecinden)
+# - [0.3.8] Duygu yoğunluğu izi durdurulduğunda eğrinin kurduğu duygu karışımı kaldırılıyor
+# - [0.3.7] Zaman, bekleme ve rastgelelik kontrolcünün saatinden ve üretecinden okunuyor (önizleme
+#           çizicisinde sanal saat ve sabit tohumla tekrarlanabilir); headless kipte çevresel tepki yok
+# - [0.3.6] Animasyon motoru için sürekli iz (eğri) başlatma/durdurma fonksiyonları eklendi
+# - [0.3.5] Duygu geçişinin ortasında zamana bağlı tek bir göz kırpma planlanıyor; göz kırpma
+#           süresi yapılandırmadan (animation.blink_duration) alınıyor
+# - [0.3.4] blend_emotions duygu adı seçmek yerine morph ara karelerini gösteriyor; geçiş başında
+#           ara kareler önceden çiziliyor ve yüz yalnızca morph adımı değiştiğinde kirli işaretleniyor
+# - [0.3.3] Duygu, mikro ifade, bakış, geçiş ve göz kırpma değişiklikleri olay tabanlı çizim için yüzü kirli işaretliyor
 # - [0.3.2] Çevresel faktörlere tepki veren ifadeler için fonksiyonlar eklendi
 # - [0.3.1] Modül 3'e bölündü, animasyon fonksiyonları bu modüle taşındı
 # - [0.3.0] Duygu geçişleri daha akıcı hale getirildi
@@ -21,7 +31,6 @@
 
 import logging
 import time
-import random
 from typing import Dict, List, Tuple, Optional, Union
 
 # Logger yapılandırması
@@ -57,15 +66,17 @@ class OLEDAnimationsMixin:
         if "emotions" not in self.config:
             self.config["emotions"] = {}
         self.config["emotions"]["default_emotion"] = emotion
+        self.emotion_blend = None
         
         # Aktivite zamanını güncelle (güç tasarrufu kontrolü için)
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Güç modu kapalıysa açık moda geç
         if self.power_mode == "off" or self.power_mode == "dim":
             self.set_power_mode("on")
         
         # Doğrudan çizim yapmak yerine bir sonraki animasyon çerçevesinde güncellenecektir
+        self.mark_dirty()
         logger.info(f"Duygu durumu ayarlandı: {emotion}, yoğunluk: {intensity:.2f}")
     
     def show_micro_expression(self, emotion: str, duration: float = 0.5, intensity: float = 1.0) -> None:
@@ -86,18 +97,54 @@ class OLEDAnimationsMixin:
         
         # Mikro ifadeyi ayarla
         self.micro_expression = emotion
-        self.micro_expression_end_time = time.time() + duration
+        self.micro_expression_end_time = self.clock.time() + duration
         self.micro_expression_intensity = intensity
         
         # Aktivite zamanını güncelle (güç tasarrufu kontrolü için)
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Güç modu kapalıysa açık moda geç
         if self.power_mode == "off" or self.power_mode == "dim":
             self.set_power_mode("on")
         
+        self.mark_dirty()
         logger.info(f"Mikro ifade gösteriliyor: {emotion}, süre: {duration:.2f}s, yoğunluk: {intensity:.2f}")
     
+    def play_curve(self, curve) -> None:
+        """
+        Sürekli bir animasyon izini (göz pozisyonu, ağız açıklığı, duygu yoğunluğu) başlatır
+        
+        Eğri animasyon döngüsünde her karede değerlendirilir; aynı izdeki eski eğrinin yerini alır.
+        
+        Args:
+            curve (KeyframeCurve): Derlenmiş anahtar kare eğrisi
+        """
+        self.curves.play(curve, self.clock.monotonic())
+        
+        self.last_activity_time = self.clock.time()
+        if self.power_mode == "off" or self.power_mode == "dim":
+            self.set_power_mode("on")
+        self.mark_dirty()
+    
+    def stop_curve(self, track: Optional[str] = None, curve=None) -> None:
+        """
+        Sürekli animasyon izini durdurur (izlerin son değerleri korunur)
+        
+        Duygu yoğunluğu izi durursa eğrinin kurduğu karışım kaldırılır ve mevcut
+        duygu tam yoğunlukta gösterilir.
+        
+        Args:
+            track (Optional[str], optional): İz adı. None ise tüm izler durdurulur
+            curve (KeyframeCurve, optional): Verilirse yalnızca bu eğri çalışıyorsa durdurulur
+        """
+        if track is None:
+            self.curves.clear()
+        else:
+            self.curves.stop(track, curve)
+        if not self.curves.is_active("emotion_intensity"):
+            self._release_curve_blend()
+        self.mark_dirty()
+    
     def look_at(self, x: float, y: float, speed: float = 0.2) -> None:
         """
         Göz bebeklerinin belirli bir noktaya bakmasını sağlar
@@ -122,12 +169,13 @@ class OLEDAnimationsMixin:
         self.random_eye_move = False
         
         # Aktivite zamanını güncelle (güç tasarrufu kontrolü için)
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Güç modu kapalıysa açık moda geç
         if self.power_mode == "off" or self.power_mode == "dim":
             self.set_power_mode("on")
         
+        self.mark_dirty()
         logger.debug(f"Göz bakışı ayarlandı: x={x:.2f}, y={y:.2f}, hız={speed:.2f}")
     
     def enable_random_eye_movement(self, enabled: bool = True) -> None:
@@ -141,73 +189,41 @@ class OLEDAnimationsMixin:
         
         if enabled:
             # Sonraki göz hareket zamanını ayarla
-            self.next_eye_move_time = time.time() + random.uniform(0.5, 1.5)
+            self.next_eye_move_time = self.clock.time() + self.random.uniform(0.5, 1.5)
+            self._render_wakeup.set()
             logger.debug("Rastgele göz hareketleri etkinleştirildi")
         else:
             logger.debug("Rastgele göz hareketleri devre dışı bırakıldı")
     
-    def blend_emotions(self, emotion1: str, emotion2: str, ratio: float) -> str:
+    def blend_emotions(self, emotion1: str, emotion2: str, ratio: float, intensity: float = 1.0) -> str:
         """
-        İki duygu arasında yumuşak geçiş sağlar. 
-        Verilen orana göre iki duygudaki göz ve ağız pozisyonlarını karıştırır.
+        İki duygu arasında yumuşak geçiş sağlar
+        
+        Oran morph adımına kuantize edilir ve ekranlarda iki duygunun göz ve ağız
+        şekilleri arasındaki önceden çizilmiş ara kare gösterilir. Karışım,
+        bir sonraki set_emotion çağrısına kadar geçerli kalır.
         
         Args:
             emotion1 (str): Başlangıç duygu durumu
             emotion2 (str): Hedef duygu durumu
             ratio (float): Karıştırma oranı (0.0: tamamen emotion1, 1.0: tamamen emotion2)
+            intensity (float, optional): Duygu yoğunluğu (uyumluluk için). Varsayılan: 1.0
             
         Returns:
-            str: Görsel temsil için kullanılacak etkili duygu
+            str: Baskın duygu (orana göre emotion1 veya emotion2)
         """
-        # Performans optimizasyonu: Önbelleğe alınmış sonuçları kullan
-        cache_key = f"{emotion1}_{emotion2}_{ratio:.2f}"
-        if hasattr(self, "_emotion_blend_cache") and cache_key in self._emotion_blend_cache:
-            return self._emotion_blend_cache[cache_key]
-        
-        # Önbellek yoksa oluştur
-        if not hasattr(self, "_emotion_blend_cache"):
-            self._emotion_blend_cache = {}
-            
-        # Maksimum önbellek boyutunu kontrol et (bellek optimizasyonu)
-        if hasattr(self, "_emotion_blend_cache") and len(self._emotion_blend_cache) > 100:
-            self._emotion_blend_cache.clear()
-        
         # Geçiş oranını sınırla (0.0-1.0 arası)
         ratio = max(0.0, min(1.0, ratio))
         
-        # Eğer geçiş henüz başlamamışsa veya tamamlanmışsa, doğrudan duygulardan birini döndür
-        if ratio <= 0.01:
-            result = emotion1
-            self._emotion_blend_cache[cache_key] = result
-            return result
-        elif ratio >= 0.99:
-            result = emotion2
-            self._emotion_blend_cache[cache_key] = result
-            return result
-            
-        # Performans optimizasyonu: Duygu çiftlerini önceden tanımla ve hızlı erişim için sözlük kullan
-        emotion_pair = f"{emotion1}_{emotion2}"
-        transition_map = {
-            "happy_sad": "neutral" if abs(ratio - 0.5) < 0.2 else (emotion1 if ratio < 0.5 else emotion2),
-            "sad_happy": "neutral" if abs(ratio - 0.5) < 0.2 else (emotion1 if ratio < 0.5 else emotion2),
-            "angry_happy": emotion1 if ratio < 0.33 else ("surprised" if ratio < 0.66 else emotion2),
-            "happy_angry": emotion1 if ratio < 0.33 else ("surprised" if ratio < 0.66 else emotion2),
-            "fearful_angry": emotion1 if ratio < 0.33 else ("surprised" if ratio < 0.66 else emotion2),
-            "angry_fearful": emotion1 if ratio < 0.33 else ("surprised" if ratio < 0.66 else emotion2),
-            "sad_calm": emotion1 if ratio < 0.5 else emotion2,
-            "calm_sad": emotion1 if ratio < 0.5 else emotion2
-        }
-        
-        # Duygu çiftine göre uygun geçiş uygula
-        if emotion_pair in transition_map:
-            result = transition_map[emotion_pair]
-        else:
-            # Diğer durumlarda sadece oran kontrolü yap
-            result = emotion2 if ratio > 0.5 else emotion1
+        blend = (emotion1, emotion2, self._get_morph_step(ratio))
+        if blend != self.emotion_blend:
+            # Yalnızca görünür adım değiştiğinde yeniden çiz
+            if self.emotion_blend is None or self.emotion_blend[:2] != blend[:2]:
+                self.prepare_emotion_morph(emotion1, emotion2)
+            self.emotion_blend = blend
+            self.mark_dirty()
         
-        # Sonucu önbelleğe al
-        self._emotion_blend_cache[cache_key] = result
-        return result
+        return emotion2 if ratio >= 0.5 else emotion1
     
     def start_emotion_transition(self, target_emotion: str, duration: float = 2.0) -> None:
         """
@@ -227,18 +243,25 @@ class OLEDAnimationsMixin:
         # Hedef duyguyu ve geçiş bilgilerini ayarla
         self.config["emotions"]["target"] = {
             "state": target_emotion,
-            "start_time": time.time(),
+            "start_time": self.clock.time(),
             "duration": max(0.5, duration),
-            "progress": 0.0
+            "progress": 0.0,
+            "step": 0,
+            "mid_blink": False
         }
+        self.emotion_blend = None
+        
+        # Ara kareleri geçiş başlamadan önceden çiz
+        self.prepare_emotion_morph(source_emotion, target_emotion)
         
         # Aktivite zamanını güncelle (güç tasarrufu kontrolü için)
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Güç modu kapalıysa açık moda geç
         if self.power_mode == "off" or self.power_mode == "dim":
             self.set_power_mode("on")
         
+        self.mark_dirty()
         logger.info(f"Duygu geçişi başlatıldı: {source_emotion} -> {target_emotion}, süre: {duration:.1f}s")
     
     def update_emotion_transition(self) -> None:
@@ -256,7 +279,7 @@ class OLEDAnimationsMixin:
         target = emotions["target"]
         
         # Zaman hesaplamaları için önceden alınmış değişkenler
-        current_time = time.time()
+        current_time = self.clock.time()
         start_time = target.get("start_time", current_time)
         duration = target.get("duration", 2.0)
         
@@ -264,6 +287,7 @@ class OLEDAnimationsMixin:
         if duration <= 0:
             emotions["default_emotion"] = target["state"]
             emotions["target"] = None
+            self._render_dirty = True
             logger.debug(f"Duygu geçişi anında tamamlandı, yeni durum: {target['state']}")
             return
         
@@ -271,23 +295,26 @@ class OLEDAnimationsMixin:
         elapsed = current_time - start_time
         progress = min(1.0, elapsed / duration)
         
-        # Son değeri önbelleğe almak için önceki değeri kontrol et
-        prev_progress = target.get("progress", 0.0)
+        target["progress"] = progress
         
-        # Önemli bir değişiklik olduğunda veya tamamlandığında güncelle - performans için
-        if abs(progress - prev_progress) >= 0.01 or progress >= 1.0:
-            # İlerleme durumunu güncelle
-            target["progress"] = progress
-            
-            # Geçiş tamamlandıysa, hedef durumu ana duygu olarak ayarla ve hedefi temizle
-            if progress >= 1.0:
-                emotions["default_emotion"] = target["state"]
-                emotions["target"] = None
-                logger.debug(f"Duygu geçişi tamamlandı, yeni durum: {target['state']}")
-                
-                # Bellek temizliği - eski geçiş verilerini temizle
-                if hasattr(self, "_emotion_blend_cache"):
-                    self._emotion_blend_cache.clear()
+        # Yalnızca görünür morph adımı değiştiğinde yeniden çiz
+        step = self._get_morph_step(self._ease_transition_progress(progress))
+        if step != target.get("step"):
+            target["step"] = step
+            self._render_dirty = True
+        
+        # Geçişin ortasında bir kez göz kırp (göz açıksa kırpma durum makinesi hemen kapatır)
+        if progress >= 0.5 and not target.get("mid_blink", True):
+            target["mid_blink"] = True
+            if self.blink_state:
+                self.next_blink_time = min(self.next_blink_time, current_time)
+        
+        # Geçiş tamamlandıysa, hedef durumu ana duygu olarak ayarla ve hedefi temizle
+        if progress >= 1.0:
+            emotions["default_emotion"] = target["state"]
+            emotions["target"] = None
+            self._render_dirty = True
+            logger.debug(f"Duygu geçişi tamamlandı, yeni durum: {target['state']}")
     
     def animate_blink(self, immediate: bool = False) -> None:
         """
@@ -299,18 +326,25 @@ class OLEDAnimationsMixin:
         if immediate:
             # Hemen göz kırp
             self.blink_state = False
-            self.next_blink_time = time.time() + 0.15  # Göz kapalı kalma süresi
-        elif random.random() < 0.2:  # %20 olasılıkla göz kırpma zamanını değiştir
+            self.next_blink_time = self.clock.time() + self.blink_duration  # Göz kapalı kalma süresi
+            self.mark_dirty()
+        elif self.blink_state and self.random.random() < 0.2:  # %20 olasılıkla göz kırpma zamanını değiştir
             # Rastgele bir zamanlamada göz kırp
-            self.next_blink_time = time.time() + random.uniform(0.1, 0.5)
+            self.next_blink_time = self.clock.time() + self.random.uniform(0.1, 0.5)
+            # Boşta bekleyen döngü yeni son tarihi hesaba katsın
+            self._render_wakeup.set()
 
     def react_to_environmental_factors(self) -> None:
         """
         Çevresel faktörlere göre ifadeyi ayarlar.
         Işık, sıcaklık, nem gibi çevresel faktörlere göre otomatik tepkiler oluşturur.
         """
+        # Çevrimdışı önizlemede sensör yok; çıktı yalnızca animasyona bağlı kalmalı
+        if getattr(self, "headless", False):
+            return
+        
         # Performans optimizasyonu: Zaman kontrollerini hızlı yap
-        current_time = time.time()
+        current_time = self.clock.time()
         last_reaction_time = getattr(self, "last_environmental_reaction_time", 0)
         
         # Çok sık çevresel tepki vermesini önlemek için zaman kontrolü
@@ -371,8 +405,8 @@ class OLEDAnimationsMixin:
         # Performans optimizasyonu: Rastgele sayı üretimi ve zaman kontrollerini en aza indir
         
         # Günün saati ve olasılık kontrolünü birleştir
-        hour_of_day = time.localtime().tm_hour
-        rand_value = random.random()
+        hour_of_day = time.localtime(self.clock.time()).tm_hour
+        rand_value = self.random.random()
         
         # Gece (22:00-06:00) - %5 olasılıkla uykulu davranış
         if (22 <= hour_of_day or hour_of_day < 6) and rand_value < 0.05:
@@ -391,7 +425,7 @@ class OLEDAnimationsMixin:
             value (float): Çevresel değer (sıcaklık, nem, ışık seviyesi vb.)
         """
         # Çevresel tepki zamanını kaydet
-        self.last_environmental_reaction_time = time.time()
+        self.last_environmental_reaction_time = self.clock.time()
         
         # Performans optimizasyonu: Tepki türlerine göre önceden tanımlanmış tepki planlarını kullan
         reaction_plan = self._get_optimized_reaction_plan(reaction_type, value)
@@ -407,7 +441,7 @@ class OLEDAnimationsMixin:
             elif action_type == "look_at":
                 self.look_at(params.get("x", 0), params.get("y", 0), params.get("speed", 0.1))
             elif action_type == "wait":
-                time.sleep(params.get("duration", 0.1))
+                self.clock.sleep(params.get("duration", 0.1))
             elif action_type == "log":
                 logger.info(params["message"])
         
@@ -491,8 +525,8 @@ class OLEDAnimationsMixin:
             
         elif reaction_type == "dark":
             # Karanlık tepkisi
-            rand_x = random.uniform(-0.5, 0.5) 
-            rand_y = random.uniform(-0.5, 0.5)
+            rand_x = self.random.uniform(-0.5, 0.5) 
+            rand_y = self.random.uniform(-0.5, 0.5)
             plan = [
                 ("look_at", {"x": rand_x, "y": rand_y, "speed": 0.05}),
                 ("micro_expression", {"emotion": "fearful", "duration": 0.8}),
@@ -512,8 +546,8 @@ class OLEDAnimationsMixin:
             
         elif reaction_type == "energetic":
             # Enerjik tepkisi
-            rand_x = random.uniform(-0.8, 0.8)
-            rand_y = random.uniform(-0.8, 0.8)
+            rand_x = self.random.uniform(-0.8, 0.8)
+            rand_y = self.random.uniform(-0.8, 0.8)
             plan = [
                 ("look_at", {"x": rand_x, "y": rand_y, "speed": 0.2}),
                 ("micro_expression", {"emotion": "excited", "duration": 0.8}),
@@ -4,11 +4,46 @@
 # Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
 # Dosya: oled_controller_base.py
 # Açıklama: OLED ekranları kontrol eden temel modül. Başlatma, yapılandırma ve ana sınıfı içerir.
-# Bağımlılıklar: PIL, adafruit_ssd1306, threading, logging, time
-# Bağlı Dosyalar: hardware_defines.py, oled_controller_display.py, oled_controller_animations.py
+# Bağımlılıklar: PIL, numpy, adafruit_ssd1306, threading, logging, time
+# Bağlı Dosyalar: hardware_defines.py, oled_controller_display.py, oled_controller_animations.py, oled_controller_sprites.py,
+#                 oled_controller_framebuffer.py, oled_controller_pages.py, oled_controller_scheduler.py,
+#                 oled_controller_output.py, frame_sink.py, shared_framebuffer.py, theme/theme_geometry.py,
+#                 oled_controller_morph.py, render_clock.py
 
-# Versiyon: 0.3.2
+# Versiyon: 0.3.22
 # Değişiklikler:
+# - [0.3.22] Duygu yoğunluğu eğrisinin kurduğu karışım eğri bittiğinde veya durdurulduğunda kaldırılıyor
+# - [0.3.21] PIL tamponu yalnızca o karede PIL ile çizilen ekranlarda kare tamponuna yükleniyor
+#           (show_buffer); yeniden çizilmeyen ekranlar eski/boş PIL tamponuyla silinmiyor.
+#           clear_displays kare tamponlarını da temizliyor
+# - [0.3.20] Çıkış aşamasında gönderilemeyen ekranın son gönderilen karesi sıfırlanıyor (sonraki kare
+#           eski içerikle karşılaştırılmadan tam gönderilir)
+# - [0.3.19] Büyüyen çember durumu kare güncellemesinde ilerletiliyor ve sürerken kare hızında çiziliyor
+# - [0.3.18] Kullanılmayan time içe aktarması kaldırıldı (zaman artık clock üzerinden okunuyor)
+# - [0.3.17] Zaman kaynağı (clock) ve rastgele sayı üreteci enjekte edilebilir; kare güncellemesi
+#           _update_frame'e ayrıldı. headless kipte sürücü, kare boru hattı, paylaşılan tampon ve
+#           sensörler kullanılmaz (çevrimdışı önizleme çizicisi için)
+# - [0.3.16] Animasyonların sürekli izleri (göz pozisyonu, ağız açıklığı, duygu yoğunluğu) her karede
+#           eğri oynatıcıdan okunuyor
+# - [0.3.15] Göz bebeği hareketi sabit alt adımlı yay-sönüm modeline, göz kırpma zamanlanmış
+#           geçişli durum makinesine taşındı; ikisi de kare hızından bağımsız
+# - [0.3.14] Konuşma durumu animasyon döngüsüne taşındı (ses seviyesi geri çağırmalarıyla ağız açıklığı)
+# - [0.3.13] Duygu geçişleri için morph adım sayısı, sınırlı morph tablo önbelleği ve durum bilgisi eklendi
+# - [0.3.12] Aktif temanın göz/ağız geometri tablosu başlangıçta theme.json dosyasından yükleniyor
+# - [0.3.11] Olay tabanlı çizim modu eklendi: durum değişiklikleri yüzü kirli işaretler, kare yalnızca
+#           kirliyken veya bir sonraki göz kırpma/göz hareketi son tarihi geldiğinde üretilir
+# - [0.3.10] Gönderilen kareler dashboard süreci için mmap tabanlı paylaşılan kare tamponuna yazılıyor
+# - [0.3.9] Simülasyon kareleri PNG yazımı ve glob tabanlı temizlik yerine arka plan iş parçacıklı
+#           kare boru hattına (halka tampon, isteğe bağlı PNG, ham kayıt) aktarılıyor
+# - [0.3.8] Kanal gruplamalı ve boru hattı destekli I2C çıkış aşaması eklendi (simülasyonda sahte veri yolu);
+#           çoğaltıcı kanallarındaki ekranlar TCA9548A kanal nesneleri üzerinden başlatılıyor
+# - [0.3.7] Animasyon döngüsü monoton saatli, son tarih tabanlı kare zamanlayıcıya taşındı;
+#           get_fps/set_fps ve kare süresi istatistiklerini içeren get_status eklendi
+# - [0.3.6] Sayfa düzeninde NumPy kare tamponu eklendi; tampon sürücü/simülatör belleği üzerinde kopyasız
+#           görünüm olarak çalışıyor, gönderim öncesi PIL dönüşümü yalnızca eski çizim yolunda yapılıyor
+# - [0.3.5] SSD1306 kirli sayfa/sütun pencereleri ile kısmi ekran güncelleme ve periyodik tam yenileme eklendi
+# - [0.3.4] Değişmeyen kareler ekrana gönderilmiyor, ekran başına gönderilen/atlanan kare sayaçları eklendi
+# - [0.3.3] Göz/ağız sprite önbelleği ve tema adı eklendi
 # - [0.3.2] Çevresel faktörlere tepki veren ifadeler için altyapı eklendi
 # - [0.3.1] Modül 3'e bölündü: temel, gösterim ve animasyon modülleri
 # - [0.3.0] Duygu alt tiplerinin görsel ifadeleri geliştirildi, duygu geçişleri daha akıcı hale getirildi
@@ -22,12 +57,13 @@
 """
 import os
 import sys
-import time
+import math
 import random
 import logging
 import threading
 from typing import Dict, List, Tuple, Optional, Union
 from pathlib import Path
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # Proje dizinini ve include dizinini Python yoluna ekle
@@ -35,6 +71,17 @@ PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 sys.path.append(str(PROJECT_DIR))
 
 from include import hardware_defines
+from .oled_controller_sprites import SpriteCache
+from .oled_controller_morph import MorphCache
+from .oled_controller_framebuffer import PageFrameBuffer
+from .oled_controller_pages import window_size, write_ssd1306_window, WINDOW_COMMAND_BYTES
+from .oled_controller_scheduler import FrameScheduler
+from .oled_controller_output import DisplayOutputStage, FakeI2CBus
+from .frame_sink import FRAME_SSD1306, get_simulation_pipeline
+from .shared_framebuffer import get_shared_framebuffer
+from .theme.theme_geometry import load_theme_geometry
+from .animation_curves import CurvePlayer
+from .render_clock import SYSTEM_CLOCK
 
 # Logger yapılandırması
 logger = logging.getLogger("OLEDController")
@@ -68,42 +115,136 @@ except ImportError:
 class SimulatedDisplay:
     """
     SSD1306 ekranı simüle eden sınıf
+    
+    Bellek düzeni adafruit_ssd1306.SSD1306_I2C ile aynıdır: `buffer` ilk baytı
+    I2C kontrol baytı olan, ardından sayfa düzeninde kareyi içeren bir bytearray'dir.
+    Ekran belleği (GDDRAM) ayrı tutulur ve yalnızca show()/write_windows() ile güncellenir.
     """
-    def __init__(self, width, height):
+    def __init__(self, width, height, name="unknown", frame_pipeline=None):
         self.width = width
         self.height = height
-        self.buffer = Image.new("1", (width, height))
-        self.draw = ImageDraw.Draw(self.buffer)
+        self.pages = height // 8
+        self.buffer = bytearray(1 + self.pages * width)
+        self.buffer[0] = 0x40
+        self.framebuf = PageFrameBuffer(width, height, self.buffer, offset=1)
+        self.gddram = PageFrameBuffer(width, height)
         self.contrast_value = 255
+        
+        # I2C üzerinden gelen yazmalar için adresleme durumu (yatay adresleme modu)
+        self.col_offset = (128 - width) // 2 if width != 128 else 0
+        self._address_window = (0, self.pages - 1, 0, width - 1)
+        self._address_cursor = 0
         self.powered_on = True
         
-        # Simülasyon için ekran kaydını izleme amaçlı kayıt dosyası yolu
-        self.frame_counter = 0
-        simulation_dir = os.path.join(PROJECT_DIR, "simulation")
-        os.makedirs(simulation_dir, exist_ok=True)
-        self.sim_dir = simulation_dir
+        # Gönderilen kareler, kaydedilmek/yayınlanmak üzere kare boru hattına aktarılır
+        self.name = name
+        self.frame_pipeline = frame_pipeline
         
-        # Görüntü sayısı sınırlaması için parametreler
-        self.max_simulation_files = 100  # Saklanacak maksimum dosya sayısı
-        self.cleanup_counter = 0  # Temizleme işlemi sayacı
-        self.cleanup_interval = 50  # Kaç kayıt işleminde bir temizlik yapılacağı
+        # Simüle edilen I2C trafiği sayaçları (komut + veri baytları)
+        self.full_frame_bytes = width * self.pages + WINDOW_COMMAND_BYTES
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.last_frame_bytes = 0
     
     def image(self, img):
-        """Görüntüyü tampona yükler"""
-        self.buffer = img.copy()
-        self.draw = ImageDraw.Draw(self.buffer)
+        """Görüntüyü sayfa düzeninde tampona yükler"""
+        self.framebuf.load_image(img)
     
     def fill(self, color):
         """Ekranı belirtilen renkle doldurur"""
-        self.draw.rectangle((0, 0, self.width, self.height), fill=color)
+        self.framebuf.array.fill(0xFF if color else 0)
     
     def show(self):
         """Tamponu ekrana çizer (simüle edilen)"""
-        # Burada gerçek ekrana yazma işlemi yapılacaktı, ancak simüle edildiği için sadece log çıktısı alıyoruz
-        # İsteğe bağlı olarak son tamponu bir dosyaya kaydediyoruz
-        self.save_frame()
+        # Gerçek ekranda tüm tampon I2C ile gönderilir; simülasyonda ekran belleğine kopyalanır
+        np.copyto(self.gddram.array, self.framebuf.array)
+        self._count_frame(self.full_frame_bytes)
+        self.publish_frame()
         logger.debug("Simüle edilen ekran güncellendi")
     
+    def write_windows(self, windows):
+        """
+        Yalnızca değişen sayfa/sütun pencerelerini tampona yazar (simüle edilen kısmi güncelleme)
+        
+        Args:
+            windows (list): (pencere, veri) ikilileri; pencere (sayfa0, sayfa1, sütun0, sütun1),
+                veri (sayfa, sütun) boyutunda dizi
+        """
+        frame_bytes = 0
+        for window, data in windows:
+            np.copyto(self.gddram.window(window), data)
+            frame_bytes += data.size + WINDOW_COMMAND_BYTES
+        
+        self._count_frame(frame_bytes)
+        self.publish_frame()
+        logger.debug(f"Simüle edilen ekran kısmen güncellendi: {len(windows)} pencere, {frame_bytes} bayt")
+    
+    def i2c_write(self, data):
+        """
+        Sahte I2C veri yolundan gelen yazmayı işler (SSD1306 komut/veri akışı)
+        
+        Yalnızca sütun/sayfa adresleme komutları yorumlanır; veri baytları
+        yatay adresleme modunda seçili pencereye yazılır.
+        
+        Args:
+            data (bytes): Kontrol baytı ile başlayan I2C yazması
+        """
+        if not data:
+            return
+        
+        if data[0] == 0x40:
+            payload = np.frombuffer(data, dtype=np.uint8, offset=1)
+            page0, page1, col0, col1 = self._address_window
+            columns = col1 - col0 + 1
+            positions = self._address_cursor + np.arange(payload.size)
+            pages = page0 + (positions // columns) % (page1 - page0 + 1)
+            cols = col0 + positions % columns
+            self.gddram.array[pages, cols] = payload
+            self._address_cursor = int(positions[-1] + 1) if payload.size else self._address_cursor
+            return
+        
+        commands = data[1:]
+        index = 0
+        while index < len(commands):
+            command = commands[index]
+            if command in (0x21, 0x22) and index + 2 < len(commands):
+                start, end = commands[index + 1], commands[index + 2]
+                page0, page1, col0, col1 = self._address_window
+                if command == 0x21:
+                    col0 = max(0, start - self.col_offset)
+                    col1 = min(self.width - 1, end - self.col_offset)
+                else:
+                    page0, page1 = start, min(self.pages - 1, end)
+                self._address_window = (page0, page1, col0, col1)
+                self._address_cursor = 0
+                index += 3
+            elif command == 0x81 and index + 1 < len(commands):
+                self.contrast(commands[index + 1])
+                index += 2
+            else:
+                index += 1
+    
+    def _count_frame(self, frame_bytes):
+        """Gönderilen kare için bayt sayaçlarını günceller"""
+        self.bytes_sent += frame_bytes
+        self.frames_sent += 1
+        self.last_frame_bytes = frame_bytes
+    
+    def get_transfer_stats(self):
+        """
+        Simüle edilen I2C trafiği istatistiklerini döndürür
+        
+        Returns:
+            dict: Toplam bayt, kare sayısı, son kare ve kare başına ortalama bayt
+        """
+        return {
+            "bytes_sent": self.bytes_sent,
+            "frames_sent": self.frames_sent,
+            "last_frame_bytes": self.last_frame_bytes,
+            "bytes_per_frame": self.bytes_sent / self.frames_sent if self.frames_sent else 0.0,
+            "full_frame_bytes": self.full_frame_bytes
+        }
+    
     def contrast(self, value):
         """Kontrast ayarı (0-255)"""
         self.contrast_value = value
@@ -119,65 +260,15 @@ class SimulatedDisplay:
         self.powered_on = True
         logger.debug("Simüle edilen ekran açıldı")
     
-    def save_frame(self, display_name="unknown"):
-        """Güncel ekran görüntüsünü kaydeder"""
-        # Her 10 karede bir görüntüyü dosyaya kaydet (performans için)
-        if self.frame_counter % 10 != 0:
-            self.frame_counter += 1
-            return
-            
-        try:
-            # Dosya adı oluştur
-            timestamp = int(time.time())
-            filename = os.path.join(
-                self.sim_dir, 
-                f"display_{display_name}_{timestamp}_{self.frame_counter:04d}.png"
-            )
-            
-            # PNG olarak kaydet, siyah-beyaz renkleri RGB'ye dönüştür
-            rgb_img = self.buffer.convert("RGB")
-            rgb_img.save(filename)
-            self.frame_counter += 1
-            
-            # Belirli sayıda frame'de bir temizlik işlemi yap
-            self.cleanup_counter += 1
-            if self.cleanup_counter >= self.cleanup_interval:
-                self._cleanup_old_simulation_files(display_name)
-                self.cleanup_counter = 0
-                
-        except Exception as e:
-            logger.debug(f"Simüle edilen ekran kaydedilemedi: {e}")
-    
-    def _cleanup_old_simulation_files(self, display_name):
+    def publish_frame(self):
         """
-        Eski simülasyon görüntülerini temizler
+        Ekran belleğinin kopyasını kare boru hattına aktarır (beklemez)
         
-        Args:
-            display_name (str): Temizlenecek ekran adı
+        PNG kodlaması ve disk yazımı boru hattının iş parçacığında yapılır.
         """
-        try:
-            # Bu ekran için olan tüm görüntü dosyalarını listele
-            pattern = f"display_{display_name}_*.png"
-            file_pattern = os.path.join(self.sim_dir, pattern)
-            
-            import glob
-            files = glob.glob(file_pattern)
-            
-            # Dosyaları zaman damgasına göre sırala (en yeniler önce)
-            files.sort(key=os.path.getmtime, reverse=True)
-            
-            # Maksimum dosya sayısından fazlasını sil
-            if len(files) > self.max_simulation_files:
-                for old_file in files[self.max_simulation_files:]:
-                    try:
-                        os.unlink(old_file)
-                        logger.debug(f"Eski simülasyon dosyası silindi: {os.path.basename(old_file)}")
-                    except Exception as e:
-                        logger.debug(f"Dosya silinirken hata: {e}")
-                
-                logger.info(f"Simülasyon temizleme: {display_name} için {len(files) - self.max_simulation_files} eski dosya silindi")
-        except Exception as e:
-            logger.error(f"Simülasyon dosyaları temizlenirken hata: {e}")
+        if self.frame_pipeline is not None:
+            self.frame_pipeline.publish(self.name, FRAME_SSD1306, self.width, self.height,
+                                        self.gddram.array.tobytes())
 
 
 class OLEDController:
@@ -196,16 +287,32 @@ class OLEDController:
     POWER_SAVE_DIM_DELAY = 120  # saniye
     POWER_SAVE_OFF_DELAY = 300  # saniye
     
-    def __init__(self, config):
+    # Göz bebeği yay-sönüm modeli ayarları
+    EYE_SPEED_REFERENCE_FPS = 30.0  # eye_move_speed bu kare hızındaki kare başına orandır
+    EYE_REST_SPEED = 0.05  # Bu hızın altında (birim/saniye) göz bebeği hedefe sabitlenebilir
+    MAX_PHYSICS_ELAPSED = 0.25  # Uzun duraklamalardan sonra tek güncellemede işlenecek en fazla süre (saniye)
+    FAST_EYE_EMOTIONS = ("concerned", "nervous", "excited", "anxious")
+    SLOW_EYE_EMOTIONS = ("calm", "peaceful", "sleepy")
+    
+    def __init__(self, config, clock=None, seed: Optional[int] = None, headless: bool = False):
         """
         OLED kontrolcü sınıfını başlatır
         
         Args:
             config (dict): Yapılandırma ayarları
+            clock (optional): Zaman kaynağı (time, monotonic, sleep). Varsayılan: sistem saati
+            seed (Optional[int], optional): Göz kırpma ve göz hareketi rastgeleliği için tohum. Varsayılan: None
+            headless (bool, optional): True ise ekranlar yalnızca bellekte simüle edilir; kareler
+                hiçbir yere aktarılmaz ve sensörler okunmaz. Varsayılan: False
         """
         logger.info("OLED Kontrolcü başlatılıyor...")
         self.config = config
         
+        # Zaman kaynağı ve rastgele sayı üreteci (önizleme çizicisi sanal saat ve sabit tohum verir)
+        self.clock = clock or SYSTEM_CLOCK
+        self.random = random.Random(seed)
+        self.headless = headless
+        
         # Ekran nesneleri
         self.displays = {
             "left_eye": None,
@@ -227,21 +334,85 @@ class OLEDController:
             "mouth": None
         }
         
+        # Sayfa düzenindeki kare tamponları (mümkünse sürücü belleği üzerinde kopyasız görünüm)
+        self.framebuffers = {
+            "left_eye": None,
+            "right_eye": None,
+            "mouth": None
+        }
+        
+        # Son gönderimden sonra PIL tamponuna çizilen ekranlar (bkz. show_buffer)
+        self.buffers_drawn = {name: False for name in self.framebuffers}
+        
+        # Ekrana en son gönderilen paketlenmiş kareler (değişiklik tespiti için)
+        self.last_sent_frames = {name: None for name in self.displays}
+        
+        # Ekran başına gönderilen, atlanan, kısmi ve tam kare sayaçları
+        self.frame_counters = {
+            name: {"sent": 0, "skipped": 0, "partial": 0, "full": 0, "since_full": 0, "failed": 0}
+            for name in self.displays
+        }
+        
+        # Kısmi (kirli sayfa) güncelleme ayarları
+        oled_config = config.get("oled", {})
+        self.partial_updates = oled_config.get("partial_updates", True)
+        self.full_refresh_interval = max(1, int(oled_config.get("full_refresh_interval", 60)))  # kare
+        
+        # I2C çıkış aşaması (kanal gruplama ve boru hattı)
+        self.use_output_stage = oled_config.get("output_stage", True) and not headless
+        self.pipelined_output = oled_config.get("pipelined_output", True)
+        self.output_stage = None
+        
         # Font yükleme
         self.font_path = str(PROJECT_DIR / "themes" / "fonts")
         self.fonts = {}
         self._load_fonts()
         
-        # Göz kırpma değişkenleri
+        # Aktif tema ve önceden çizilmiş göz/ağız sprite önbelleği
+        animation_config = config.get("animation", {})
+        self.theme_name = config.get("theme", {}).get("default_theme", "default")
+        self.geometry = load_theme_geometry(self.theme_name)  # Derlenmiş göz/ağız şekil tabloları
+        self.sprite_cache = SpriteCache(animation_config.get("sprite_cache_size", 2048))
+        self.pupil_quantization = max(1, int(animation_config.get("pupil_quantization", 2)))  # piksel
+        
+        # Duygu geçişleri için önceden çizilmiş ara kare (morph) tabloları
+        self.morph_steps = max(1, int(animation_config.get("morph_steps", 8)))  # Geçiş başına ara kare
+        self.morph_cache = MorphCache(animation_config.get("morph_cache_size", 32))
+        self.emotion_blend = None  # Dışarıdan verilen (kaynak, hedef, adım) karışımı
+        self.curve_blend = None  # Duygu yoğunluğu eğrisinin en son kurduğu karışım
+        
+        # Konuşma (ağız senkronizasyonu) durumu - ağız animasyon döngüsü tarafından çizilir
+        self.speaking = False
+        self.speaking_levels = max(2, int(animation_config.get("speaking_levels", 6)))  # Açıklık seviyesi sayısı
+        self.speaking_gain = float(animation_config.get("speaking_gain", 4.0))  # Ses seviyesi -> açıklık çarpanı
+        self.mouth_openness = 0.0  # Ses geri çağırmasından gelen son ağız açıklığı (0.0-1.0)
+        self.speaking_level = None  # Çizilen açıklık seviyesi (None: konuşma yok)
+        self.speaking_pattern = None  # Zamanlanmış konuşma deseni (durumlar, başlangıç, bitiş, ses)
+        self.growing_circle = None  # Büyüyen çember animasyonu (başlangıç, adım süresi, adım sayısı)
+        self.growing_circle_level = None  # Çizilen çember adımı (None: animasyon yok)
+        
+        # Göz kırpma durum makinesi: blink_state (True: açık) next_blink_time'a kadar sürer,
+        # sonraki geçiş karenin işlendiği zamana değil planlanan geçiş zamanına göre hesaplanır
         self.blink_state = False
-        self.next_blink_time = time.time() + self._get_random_blink_interval()
+        self.blink_duration = animation_config.get("blink_duration", 0.15)  # Göz kapalı kalma süresi (saniye)
+        self.next_blink_time = self.clock.time() + self._get_random_blink_interval()
         
         # Göz takip değişkenleri (göz bebeklerinin nereye baktığı)
         self.eye_position = (0, 0)  # x, y (-1.0 - 1.0 arası)
         self.target_eye_position = (0, 0)
-        self.eye_move_speed = 0.1
+        self.eye_move_speed = 0.1  # Referans kare hızında kare başına kalan mesafenin oranı
+        
+        # Göz bebeği yay-sönüm modeli (kare hızından bağımsız, sabit alt adımla)
+        self.eye_velocity = (0.0, 0.0)
+        self.eye_damping_ratio = animation_config.get("eye_damping_ratio", 1.0)  # 1.0: kritik sönüm
+        self.physics_step = 1.0 / max(30.0, animation_config.get("physics_rate", 120.0))  # Alt adım (saniye)
+        self._physics_time = None
+        self._physics_accumulator = 0.0
         self.random_eye_move = True  # Otomatik göz hareketi
-        self.next_eye_move_time = time.time() + random.uniform(1.0, 3.0)
+        self.next_eye_move_time = self.clock.time() + self.random.uniform(1.0, 3.0)
+        
+        # Animasyon motorundan gelen sürekli izler (her karede bir tablo araması)
+        self.curves = CurvePlayer()
         
         # Mikro ifade değişkenleri
         self.micro_expression = None
@@ -250,7 +421,7 @@ class OLEDController:
         
         # Güç tasarrufu modu
         self.power_mode = "on"  # "on", "dim", "off"
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Animasyon döngüsü kontrol değişkenleri
         self.is_running = False
@@ -258,6 +429,21 @@ class OLEDController:
         self.fps = config.get("animation", {}).get("fps", 30)
         self.frame_delay = 1.0 / self.fps
         
+        # Son tarih tabanlı kare zamanlayıcı
+        self.frame_scheduler = FrameScheduler(
+            self.fps,
+            max_catch_up=animation_config.get("max_catch_up_frames", 2),
+            history_size=animation_config.get("frame_history_size", 300)
+        )
+        
+        # Çizim modu: "continuous" her karede çizer, "event" yalnızca yüz kirliyse çizer
+        # ve hareket yokken bir sonraki son tarihe (göz kırpma, göz hareketi) kadar uyur
+        self.render_mode = animation_config.get("render_mode", "continuous")
+        self.idle_fps = max(0.2, float(animation_config.get("idle_fps", 2.0)))  # boşta durum kontrol hızı
+        self._render_dirty = True
+        self._render_wakeup = threading.Event()
+        self.render_counters = {"rendered": 0, "idle": 0}
+        
         # I2C ve ekran başlatma
         self.i2c = None
         self.multiplexer = None
@@ -268,13 +454,17 @@ class OLEDController:
         
         # Simülasyon modu kontrolü
         self.simulation_mode = (
+            headless or
             config.get("hardware", {}).get("simulation_mode", False) or 
             self.platform_type != "raspberry_pi" or 
             not HARDWARE_AVAILABLE or
             "Raspberry Pi 5" in hardware_defines.get_platform_info()
         )
         
-        if self.simulation_mode:
+        if headless:
+            # Kareler önizleme çizicisi tarafından doğrudan ekran belleğinden okunur
+            self.frame_pipeline = None
+        elif self.simulation_mode:
             if self.platform_type == "raspberry_pi":
                 logger.info("Simülasyon modu etkin (Raspberry Pi 5 henüz tam olarak desteklenmiyor veya yapılandırmada seçildi)")
             else:
@@ -284,11 +474,20 @@ class OLEDController:
             self.sim_dir = os.path.join(PROJECT_DIR, "simulation")
             os.makedirs(self.sim_dir, exist_ok=True)
             logger.info(f"Simülasyon görüntüleri şurada saklanacak: {self.sim_dir}")
+            
+            # Kareler halka tampon/PNG/kayıt hedeflerine arka plan iş parçacığında aktarılır
+            self.frame_pipeline = get_simulation_pipeline(self.config, self.sim_dir)
+        else:
+            self.frame_pipeline = None
+        
+        # Gönderilen kareler dashboard sürecinin okuması için paylaşılan belleğe de yazılır
+        self.shared_framebuffer = None if headless else get_shared_framebuffer(self.config)
         
         # Çevresel sensörler
         self.light_sensor = None
         self.temp_sensor = None
-        self._init_sensors()
+        if not headless:
+            self._init_sensors()
     
     def _get_random_blink_interval(self) -> float:
         """
@@ -299,7 +498,7 @@ class OLEDController:
         """
         min_interval = self.config.get("animation", {}).get("blink_interval_min", 2.0)
         max_interval = self.config.get("animation", {}).get("blink_interval_max", 10.0)
-        return random.uniform(min_interval, max_interval)
+        return self.random.uniform(min_interval, max_interval)
     
     def _load_fonts(self):
         """
@@ -358,6 +557,9 @@ class OLEDController:
             if not self._init_displays():
                 return False
             
+            # Göz ve ağız sprite'larını arka planda önceden çiz
+            self.warm_sprite_cache()
+            
             # Animasyon döngüsünü başlat
             self.is_running = True
             self.animation_thread = threading.Thread(target=self._animation_loop)
@@ -386,6 +588,10 @@ class OLEDController:
         # Ekranları temizle
         self.clear_displays()
         
+        # Çıkış aşamasını durdur
+        if self.output_stage is not None:
+            self.output_stage.stop()
+        
         logger.info("OLED Kontrolcü durduruldu")
     
     def _init_displays(self) -> bool:
@@ -404,6 +610,14 @@ class OLEDController:
                 # Simülasyon modu - fiziksel donanım kullanmadan ekranları simüle et
                 logger.info("Simülasyon modunda ekranlar başlatılıyor...")
                 
+                # Çıkış aşaması için I2C zamanlamasını taklit eden sahte veri yolu
+                hardware_config = self.config.get("hardware", {})
+                use_multiplexer = hardware_config.get("use_multiplexer", False)
+                self.i2c = FakeI2CBus(
+                    self.config.get("oled", {}).get("i2c_frequency", hardware_defines.I2C_FREQUENCY),
+                    self._get_multiplexer_address() if use_multiplexer else None
+                )
+                
                 for display_name in self.displays.keys():
                     display_config = displays_config.get(display_name, {})
                     
@@ -412,8 +626,7 @@ class OLEDController:
                     height = display_config.get("height", hardware_defines.DISPLAY_HEIGHT)
                     
                     # Simüle edilmiş ekran nesnesi oluştur
-                    display = SimulatedDisplay(width, height)
-                    display.sim_dir = self.sim_dir  # Simülasyon dizinini ayarla
+                    display = SimulatedDisplay(width, height, display_name, self.frame_pipeline)
                     
                     # Ekranı temizle ve başlat
                     display.fill(0)
@@ -421,13 +634,16 @@ class OLEDController:
                     
                     self.displays[display_name] = display
                     
-                    # Tampon görüntü oluştur
-                    buffer_image = Image.new("1", (width, height))
-                    self.buffers[display_name] = buffer_image
-                    self.draw_objects[display_name] = ImageDraw.Draw(buffer_image)
+                    # Tampon görüntü ve kare tamponu oluştur
+                    self._create_buffers(display_name, display, width, height)
+                    
+                    # Sahte veri yoluna bağla
+                    channel = display_config.get("channel", 0) if use_multiplexer else None
+                    self.i2c.attach(int(display_config.get("i2c_address", "0x3C"), 16), display, channel)
                     
                     logger.info(f"Simüle edilen OLED ekran başlatıldı: {display_name}")
                 
+                self._init_output_stage(displays_config, use_multiplexer)
                 return True
             else:
                 # Gerçek donanım modu
@@ -455,12 +671,10 @@ class OLEDController:
                         height = display_config.get("height", hardware_defines.DISPLAY_HEIGHT)
                         
                         try:
-                            # Multiplexer kanalını seç
-                            self.multiplexer.select_channel(channel)
-                            
-                            # SSD1306 OLED ekranı başlat
+                            # SSD1306 OLED ekranı multiplexer kanalı üzerinden başlat
+                            # (kanal nesnesi her işlemde kanalı kendisi seçer)
                             display = adafruit_ssd1306.SSD1306_I2C(
-                                width, height, self.i2c,
+                                width, height, self.multiplexer[channel],
                                 addr=int(display_config.get("i2c_address", "0x3C"), 16)
                             )
                             
@@ -470,10 +684,8 @@ class OLEDController:
                             
                             self.displays[display_name] = display
                             
-                            # Tampon görüntü oluştur
-                            buffer_image = Image.new("1", (width, height))
-                            self.buffers[display_name] = buffer_image
-                            self.draw_objects[display_name] = ImageDraw.Draw(buffer_image)
+                            # Tampon görüntü ve kare tamponu oluştur
+                            self._create_buffers(display_name, display, width, height)
                             
                             logger.info(f"OLED ekran başlatıldı (multiplexer kanal {channel}): {display_name}")
                         except Exception as e:
@@ -504,10 +716,8 @@ class OLEDController:
                             
                             self.displays[display_name] = display
                             
-                            # Tampon görüntü oluştur
-                            buffer_image = Image.new("1", (width, height))
-                            self.buffers[display_name] = buffer_image
-                            self.draw_objects[display_name] = ImageDraw.Draw(buffer_image)
+                            # Tampon görüntü ve kare tamponu oluştur
+                            self._create_buffers(display_name, display, width, height)
                             
                             logger.info(f"OLED ekran başlatıldı (I2C adres 0x{addr:02X}): {display_name}")
                         except Exception as e:
@@ -518,12 +728,121 @@ class OLEDController:
                     logger.error("Hiçbir OLED ekran başlatılamadı")
                     return False
                 
+                self._init_output_stage(displays_config, use_multiplexer)
                 return True
             
         except Exception as e:
             logger.error(f"Ekranlar başlatılırken beklenmeyen hata: {e}")
             return False
     
+    def _get_multiplexer_address(self) -> int:
+        """
+        Yapılandırmadaki TCA9548A adresini döndürür
+        
+        Returns:
+            int: Çoğaltıcı I2C adresi
+        """
+        address = self.config.get("hardware", {}).get("multiplexer_address", hardware_defines.TCA9548A_ADDRESS)
+        return int(address, 16) if isinstance(address, str) else int(address)
+    
+    def _init_output_stage(self, displays_config: Dict, use_multiplexer: bool) -> None:
+        """
+        Kanal gruplamalı I2C çıkış aşamasını başlatır
+        
+        Çıkış aşaması yazmaları doğrudan ana I2C veri yoluna yapar ve çoğaltıcı
+        kanalını kendisi seçer; bu yüzden yalnızca busio.I2C uyumlu bir veri yolu
+        varsa etkinleştirilir.
+        
+        Args:
+            displays_config (Dict): Ekran yapılandırmaları
+            use_multiplexer (bool): TCA9548A kullanılıyor mu
+        """
+        if not self.use_output_stage or not hasattr(self.i2c, "writeto"):
+            return
+        
+        mux_address = self._get_multiplexer_address() if use_multiplexer else None
+        default_addresses = {
+            "left_eye": hardware_defines.DEFAULT_LEFT_EYE_ADDR,
+            "right_eye": hardware_defines.DEFAULT_RIGHT_EYE_ADDR,
+            "mouth": hardware_defines.DEFAULT_MOUTH_ADDR
+        }
+        
+        stage = DisplayOutputStage(self.i2c, mux_address, self.pipelined_output, self._on_display_sent,
+                                   error_callback=self._on_display_failed)
+        for display_name, display in self.displays.items():
+            if display is None:
+                continue
+            display_config = displays_config.get(display_name, {})
+            default_addr = "0x3C" if use_multiplexer else f"0x{default_addresses[display_name]:02X}"
+            stage.add_display(
+                display_name,
+                int(display_config.get("i2c_address", default_addr), 16),
+                display_config.get("channel", 0) if use_multiplexer else None,
+                self.framebuffers[display_name].width
+            )
+        
+        stage.start()
+        self.output_stage = stage
+        logger.info(f"OLED çıkış aşaması başlatıldı (boru hattı: {stage.is_running}, "
+                    f"çoğaltıcı: {'0x%02X' % mux_address if mux_address is not None else 'yok'})")
+    
+    def _on_display_sent(self, display_name: str, sent_bytes: int) -> None:
+        """
+        Çıkış aşaması bir ekranı gönderdikten sonra çağrılır
+        
+        Args:
+            display_name (str): Ekran adı
+            sent_bytes (int): Gönderilen bayt sayısı (komut + veri)
+        """
+        display = self.displays.get(display_name)
+        if self.simulation_mode and display is not None and hasattr(display, "publish_frame"):
+            display._count_frame(sent_bytes)
+            display.publish_frame()
+    
+    def _on_display_failed(self, display_name: str, error: Exception) -> None:
+        """
+        Çıkış aşaması bir ekranı gönderemediğinde çağrılır
+        
+        Ekrandaki içerik artık bilinmediğinden son gönderilen kare unutulur; bir
+        sonraki kare değişiklik tespiti yapılmadan tam kare olarak gönderilir.
+        
+        Args:
+            display_name (str): Ekran adı
+            error (Exception): Gönderim hatası
+        """
+        if display_name in self.last_sent_frames:
+            self.last_sent_frames[display_name] = None
+        counters = self.frame_counters.get(display_name)
+        if counters is not None:
+            counters["failed"] += 1
+    
+    def _create_buffers(self, display_name: str, display, width: int, height: int) -> None:
+        """
+        Ekran için PIL tampon görüntüsünü ve sayfa düzenindeki kare tamponunu oluşturur
+        
+        Ekran nesnesi SSD1306_I2C bellek düzenine sahipse (kontrol baytı + sayfa
+        düzeninde kare) kare tamponu bu bellek üzerinde kopyasız görünüm olarak
+        oluşturulur; sprite'lar doğrudan sürücünün gönderdiği belleğe yazılır.
+        
+        Args:
+            display_name (str): Ekran adı
+            display: Ekran nesnesi (SSD1306_I2C veya SimulatedDisplay)
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+        """
+        buffer_image = Image.new("1", (width, height))
+        self.buffers[display_name] = buffer_image
+        self.draw_objects[display_name] = ImageDraw.Draw(buffer_image)
+        
+        backing = getattr(display, "buffer", None)
+        if isinstance(backing, bytearray) and len(backing) == 1 + (height // 8) * width:
+            self.framebuffers[display_name] = PageFrameBuffer(width, height, backing, offset=1)
+        else:
+            self.framebuffers[display_name] = PageFrameBuffer(width, height)
+        
+        if self.shared_framebuffer is not None:
+            self.shared_framebuffer.register(display_name, FRAME_SSD1306, width, height)
+    
     def _init_sensors(self) -> None:
         """
         Çevresel sensörleri başlatır
@@ -544,35 +863,146 @@ class OLEDController:
         except Exception as e:
             logger.error(f"Çevresel sensörler başlatılırken hata: {e}")
     
-    def update_display(self) -> None:
+    def show_buffer(self, *display_names: str) -> None:
+        """
+        PIL tamponlarına çizilen ekranları işaretler ve ekranları günceller
+        
+        PIL çizim nesneleri (draw_objects) ile çizen kod, update_display yerine bunu
+        çağırmalıdır; işaretlenmeyen ekranlarda PIL tamponu kare tamponuna yüklenmez.
+        
+        Args:
+            *display_names (str): PIL tamponuna çizilen ekran adları
+        """
+        for display_name in display_names:
+            if display_name in self.buffers_drawn:
+                self.buffers_drawn[display_name] = True
+        self.update_display()
+    
+    def update_display(self, force: bool = False) -> None:
         """
         Tüm ekranları günceller (tamponları ekranlara gönderir)
+        
+        Sprite'lar doğrudan sayfa düzenindeki kare tamponuna yazılır. PIL tampon görüntüsü
+        yalnızca show_buffer ile PIL'e çizildiği bildirilen ve bu karede kare tamponuna
+        yazılmamış ekranlarda paketlenir (eski çizim yolu); diğer ekranlar son çizilen
+        karelerini korur.
+        Kare son gönderilen kare ile karşılaştırılır. Değişmeyen ekranlar gönderilmez;
+        değişenlerde yalnızca kirli sayfa/sütun pencereleri gönderilir. Her
+        full_refresh_interval karede bir tam kare gönderilir.
+        
+        Çıkış aşaması etkinse yazmalar kopyalanıp çıkış aşamasına teslim edilir;
+        kare gönderilirken animasyon döngüsü bir sonraki kareyi çizebilir.
+        
+        Args:
+            force (bool, optional): True ise tüm ekranlara tam kare gönderilir. Varsayılan: False
         """
+        output_jobs = {}
+        
         for display_name, display in self.displays.items():
-            if display is not None and self.buffers[display_name] is not None:
+            if display is not None and self.framebuffers[display_name] is not None:
                 try:
-                    # PIL görüntüsünü ekran tamponuna dönüştür
-                    display.image(self.buffers[display_name])
-                    display.show()
+                    framebuffer = self.framebuffers[display_name]
+                    counters = self.frame_counters[display_name]
+                    
+                    # Bu karede yalnızca PIL tamponuna çizildiyse PIL tamponunu paketle
+                    if self.buffers_drawn[display_name] and not framebuffer.touched:
+                        framebuffer.load_image(self.buffers[display_name])
+                    self.buffers_drawn[display_name] = False
+                    framebuffer.touched = False
+                    
+                    # Değişiklik tespiti - sayfa düzenindeki kareyi son gönderilen kare ile karşılaştır
+                    last_frame = self.last_sent_frames[display_name]
+                    if not force and last_frame is not None and np.array_equal(framebuffer.array, last_frame):
+                        counters["skipped"] += 1
+                        continue
+                    
+                    # Kısmi güncelleme mümkünse kirli pencereleri bul
+                    windows = None
+                    if (not force and last_frame is not None and self.partial_updates
+                            and counters["since_full"] < self.full_refresh_interval
+                            and (self.output_stage is not None
+                                 or hasattr(display, "write_windows") or hasattr(display, "i2c_device"))):
+                        windows = framebuffer.dirty_windows(last_frame)
+                        
+                        # Pencereler tam kareden pahalıysa tam kare gönder
+                        partial_bytes = sum(window_size(w) + WINDOW_COMMAND_BYTES for w in windows)
+                        if partial_bytes >= framebuffer.size + WINDOW_COMMAND_BYTES:
+                            windows = None
                     
-                    # Simülasyon modunda, ekranların son durumunu bir dosyaya kaydediyoruz
-                    if self.simulation_mode and hasattr(display, 'save_frame'):
-                        display.save_frame(display_name)
+                    if self.output_stage is not None:
+                        # Veriler kopyalanır, kare tamponu bir sonraki kare için serbest kalır
+                        if not windows:
+                            windows = [(0, framebuffer.pages - 1, 0, framebuffer.width - 1)]
+                            counters["full"] += 1
+                            counters["since_full"] = 0
+                        else:
+                            counters["partial"] += 1
+                            counters["since_full"] += 1
+                        output_jobs[display_name] = [
+                            (window, framebuffer.window(window).tobytes()) for window in windows
+                        ]
+                    elif windows:
+                        self._write_windows(display, framebuffer, windows)
+                        counters["partial"] += 1
+                        counters["since_full"] += 1
+                    else:
+                        # Kare tamponu sürücü belleğini paylaşmıyorsa görüntü olarak yükle
+                        if framebuffer.backing is not getattr(display, "buffer", None):
+                            display.image(framebuffer.to_image())
+                        display.show()
+                        counters["full"] += 1
+                        counters["since_full"] = 0
+                    
+                    if last_frame is None:
+                        self.last_sent_frames[display_name] = framebuffer.array.copy()
+                    else:
+                        np.copyto(last_frame, framebuffer.array)
+                    counters["sent"] += 1
+                    
+                    if self.shared_framebuffer is not None:
+                        self.shared_framebuffer.write(display_name, framebuffer.array)
                         
                 except Exception as e:
                     logger.error(f"Ekran güncellenirken hata: {display_name}, hata: {e}")
+        
+        if output_jobs:
+            self.output_stage.submit(output_jobs)
+    
+    def _write_windows(self, display, framebuffer: PageFrameBuffer, windows: list) -> None:
+        """
+        Kirli sayfa/sütun pencerelerini ekrana gönderir
+        
+        Args:
+            display: Ekran nesnesi (SSD1306_I2C veya SimulatedDisplay)
+            framebuffer (PageFrameBuffer): Yeni kareyi içeren kare tamponu
+            windows (list): Gönderilecek pencereler
+        """
+        if hasattr(display, "write_windows"):
+            display.write_windows([(window, framebuffer.window(window)) for window in windows])
+        else:
+            for window in windows:
+                write_ssd1306_window(display, window, framebuffer.window(window))
     
     def clear_displays(self) -> None:
         """
         Tüm ekranları temizler
         """
+        # Çıkış aşamasında bekleyen kareler temizlenen ekranın üzerine yazılmasın
+        if self.output_stage is not None:
+            self.output_stage.flush()
+        
         for display_name, display in self.displays.items():
             if display is not None:
                 try:
                     display.fill(0)
                     display.show()
                     
-                    # Tampon görüntüleri de temizle
+                    # Ekran içeriği değişti, sonraki kare her durumda gönderilmeli
+                    self.last_sent_frames[display_name] = None
+                    
+                    # Kare tamponunu ve tampon görüntüsünü de temizle
+                    if self.framebuffers[display_name] is not None:
+                        self.framebuffers[display_name].clear()
                     if self.buffers[display_name] is not None:
                         draw = self.draw_objects[display_name]
                         draw.rectangle((0, 0, self.buffers[display_name].width, 
@@ -586,88 +1016,319 @@ class OLEDController:
         """
         logger.info("Animasyon döngüsü başlatıldı")
         
+        self.frame_scheduler.reset()
+        
         while self.is_running:
-            loop_start = time.time()
+            self.frame_scheduler.begin_frame()
             
             try:
-                # Güç tasarrufu kontrolü
-                self._check_power_saving_mode()
-                
-                # Göz pozisyonu güncelleme
-                self._update_eye_position()
-                
-                # Göz kırpma kontrolü
-                self._update_blink_state()
-                
-                # Mikro ifade kontrolü
-                self._update_micro_expression()
-                
-                # Çevresel faktörleri kontrol et
-                self._check_environmental_factors()
-                
-                # Ekranlara çizim yap
-                self._draw_all_displays()
-                
-                # Ekranları güncelle
-                if self.power_mode != "off":
-                    self.update_display()
-                
+                self._update_frame()
             except Exception as e:
                 logger.error(f"Animasyon döngüsünde hata: {e}")
             
-            # FPS kontrolü
-            elapsed = time.time() - loop_start
-            sleep_time = max(0, self.frame_delay - elapsed)
-            
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            elif elapsed > 1.5 * self.frame_delay:
-                logger.warning(f"Animasyon döngüsü yavaş çalışıyor: {elapsed:.4f} saniye (hedef: {self.frame_delay:.4f})")
+            # Bir sonraki kareyi veya son tarihi bekle
+            self._wait_next_frame()
+    
+    def _update_frame(self) -> None:
+        """
+        Tek bir karenin yüz durumunu günceller ve gerekirse çizer
+        
+        Animasyon döngüsü her karede, önizleme çizicisi sanal saati ilerlettikten sonra çağırır.
+        """
+        # Güç tasarrufu kontrolü
+        self._check_power_saving_mode()
+        
+        # Animasyon eğrilerini uygula (göz hedefi, ağız açıklığı, duygu yoğunluğu)
+        self._update_curves()
+        
+        # Göz pozisyonu güncelleme
+        self._update_eye_position()
+        
+        # Göz kırpma kontrolü
+        self._update_blink_state()
+        
+        # Mikro ifade kontrolü
+        self._update_micro_expression()
+        
+        # Konuşma (ağız senkronizasyonu) seviyesini güncelle
+        self._update_speaking()
+        
+        # Büyüyen çember adımını güncelle
+        self._update_growing_circle()
+        
+        # Çevresel faktörleri kontrol et
+        self._check_environmental_factors()
+        
+        # Ekranlara çizim yap ve güncelle (olay modunda yalnızca yüz kirliyse)
+        self._render_frame()
+    
+    def mark_dirty(self) -> None:
+        """
+        Yüzün yeniden çizilmesi gerektiğini işaretler ve boşta bekleyen döngüyü uyandırır
+        """
+        self._render_dirty = True
+        self._render_wakeup.set()
+    
+    def _render_frame(self) -> bool:
+        """
+        Gerekirse ekranlara çizer ve gönderir
+        
+        Sürekli modda her karede, olay modunda yalnızca yüz kirli işaretlendiyse çizim yapılır.
+        
+        Returns:
+            bool: Kare çizildiyse True
+        """
+        if self.render_mode == "event":
+            # Önce uyandırma olayını temizle; çizim sırasında gelen işaretler sonraki kareye kalır
+            self._render_wakeup.clear()
+            if not self._render_dirty:
+                return False
+            self._render_dirty = False
+        
+        self._draw_all_displays()
+        
+        if self.power_mode != "off":
+            self.update_display()
+        
+        self.render_counters["rendered"] += 1
+        return True
+    
+    def _is_render_animating(self) -> bool:
+        """
+        Kare hızında çizim gerektiren sürekli bir hareket olup olmadığını döndürür
+        
+        Returns:
+            bool: Göz bebekleri hedefe ilerliyor, zamanlanmış konuşma, büyüyen çember veya
+                duygu geçişi sürüyorsa True
+        """
+        if self.eye_position != self.target_eye_position or self.eye_velocity != (0.0, 0.0):
+            return True
+        if self.speaking_pattern is not None or self.growing_circle is not None or self.curves.active:
+            return True
+        target = self.config.get("emotions", {}).get("target")
+        return target is not None
+    
+    def _get_next_render_deadline(self) -> float:
+        """
+        Bir sonraki zamanlanmış yüz değişikliğine kalan süreyi hesaplar
+        
+        Göz kırpma, rastgele göz hareketi, mikro ifade bitişi ve güç tasarrufu
+        geçişleri dikkate alınır; süre boşta kontrol aralığını (1 / idle_fps) aşmaz.
+        
+        Returns:
+            float: Beklenecek süre (saniye)
+        """
+        now = self.clock.time()
+        deadline = now + 1.0 / self.idle_fps
+        
+        deadline = min(deadline, self.next_blink_time)
+        if self.random_eye_move:
+            deadline = min(deadline, self.next_eye_move_time)
+        if self.micro_expression:
+            deadline = min(deadline, self.micro_expression_end_time)
+        
+        if self.config.get("system", {}).get("power_save_enabled", True):
+            if self.power_mode == "on":
+                deadline = min(deadline, self.last_activity_time + self.POWER_SAVE_DIM_DELAY)
+            elif self.power_mode == "dim":
+                deadline = min(deadline, self.last_activity_time + self.POWER_SAVE_OFF_DELAY)
+        
+        return max(0.0, deadline - now)
+    
+    def _wait_next_frame(self) -> None:
+        """
+        Bir sonraki kareyi bekler
+        
+        Sürekli modda veya hareket sürerken sabit adımlı son tarih kullanılır; olay
+        modunda yüz durağansa en yakın son tarihe kadar (ya da mark_dirty ile
+        uyandırılana kadar) uyunur.
+        """
+        if self.render_mode != "event" or self._render_dirty or self._is_render_animating():
+            # Bir sonraki karenin son tarihine kadar bekle (geç kalındıysa yetiş veya kare atla)
+            self.frame_scheduler.end_frame()
+            return
+        
+        self.render_counters["idle"] += 1
+        self.frame_scheduler.end_idle_frame(self._get_next_render_deadline(), self._render_wakeup)
+    
+    def _get_eye_spring_frequency(self) -> float:
+        """
+        Göz hareket hızını yay-sönüm modelinin doğal frekansına çevirir
+        
+        eye_move_speed, eski kare başına oransal yaklaşımla uyumlu olacak şekilde
+        referans kare hızında (EYE_SPEED_REFERENCE_FPS) kare başına kapatılan mesafe
+        oranı olarak yorumlanır; böylece hareketin süresi kare hızına bağlı değildir.
+        
+        Returns:
+            float: Doğal frekans (rad/s)
+        """
+        speed = self.eye_move_speed
+        
+        # Duygu geçişi sırasında hedef duyguya göre hızlan/yavaşla (kare başına birikmez)
+        target = self.config.get("emotions", {}).get("target")
+        if target is not None:
+            if target.get("state") in self.FAST_EYE_EMOTIONS:
+                speed = min(0.3, speed * 1.5)
+            elif target.get("state") in self.SLOW_EYE_EMOTIONS:
+                speed = max(0.05, speed * 0.7)
+        
+        speed = max(0.01, min(0.95, speed))
+        return -self.EYE_SPEED_REFERENCE_FPS * math.log(1.0 - speed)
+    
+    def _integrate_eye_spring(self, dt: float) -> None:
+        """
+        Göz bebeği yay-sönüm modelini tek bir sabit alt adım ilerletir (yarı örtük Euler)
+        
+        Args:
+            dt (float): Alt adım süresi (saniye)
+        """
+        omega = self._get_eye_spring_frequency()
+        damping = 2.0 * self.eye_damping_ratio * omega
+        stiffness = omega * omega
+        
+        position = []
+        velocity = []
+        for axis in (0, 1):
+            x = self.eye_position[axis]
+            v = self.eye_velocity[axis]
+            v += (stiffness * (self.target_eye_position[axis] - x) - damping * v) * dt
+            position.append(x + v * dt)
+            velocity.append(v)
+        
+        self.eye_position = (position[0], position[1])
+        self.eye_velocity = (velocity[0], velocity[1])
     
     def _update_eye_position(self) -> None:
         """
         Göz pozisyonunu günceller (göz bebeklerinin hareketi için)
+        
+        Göz bebeği hedefe yay-sönüm modeliyle, geçen gerçek süre boyunca sabit
+        alt adımlarla ilerler; kare hızı düşse de hareketin süresi ve şekli değişmez.
         """
         # Rastgele göz hareketi kontrolü
         if self.random_eye_move:
-            current_time = time.time()
+            current_time = self.clock.time()
             if current_time >= self.next_eye_move_time:
                 # Yeni hedef pozisyon belirle (-0.7 ve 0.7 arasında)
                 self.target_eye_position = (
-                    random.uniform(-0.7, 0.7),
-                    random.uniform(-0.7, 0.7)
+                    self.random.uniform(-0.7, 0.7),
+                    self.random.uniform(-0.7, 0.7)
                 )
                 # Sonraki hareket zamanını belirle
-                self.next_eye_move_time = current_time + random.uniform(1.0, 3.0)
+                self.next_eye_move_time = current_time + self.random.uniform(1.0, 3.0)
         
-        # Mevcut pozisyondan hedef pozisyona doğru yumuşak geçiş
-        self.eye_position = (
-            self.eye_position[0] + (self.target_eye_position[0] - self.eye_position[0]) * self.eye_move_speed,
-            self.eye_position[1] + (self.target_eye_position[1] - self.eye_position[1]) * self.eye_move_speed
-        )
+        now = self.clock.monotonic()
+        if self.eye_position == self.target_eye_position and self.eye_velocity == (0.0, 0.0):
+            # Hareketsizken saati ilerletme; yeni hedef geldiğinde birikmiş süre olmasın
+            self._physics_time = now
+            self._physics_accumulator = 0.0
+            return
+        
+        if self._physics_time is None:
+            self._physics_time = now
+        self._physics_accumulator += min(self.MAX_PHYSICS_ELAPSED, now - self._physics_time)
+        self._physics_time = now
+        
+        previous_key = self._get_pupil_render_key(self.eye_position)
+        
+        step = self.physics_step
+        while self._physics_accumulator >= step:
+            self._integrate_eye_spring(step)
+            self._physics_accumulator -= step
+        
+        # Kuantize göz bebeği ofseti hedefinkiyle aynıysa ve göz yavaşladıysa kalan hareket görünmez: hedefe sabitle
+        key = self._get_pupil_render_key(self.eye_position)
+        if (key == self._get_pupil_render_key(self.target_eye_position)
+                and math.hypot(*self.eye_velocity) < self.EYE_REST_SPEED):
+            self.eye_position = self.target_eye_position
+            self.eye_velocity = (0.0, 0.0)
+        
+        # Yalnızca ekranda görünen ofset değiştiyse yeniden çiz
+        if key != previous_key:
+            self._render_dirty = True
     
     def _update_blink_state(self) -> None:
         """
-        Göz kırpma durumunu günceller
+        Göz kırpma durum makinesini günceller
+        
+        Geçişler planlandıkları zamana göre zincirlenir (açık -> kapalı -> açık), böylece
+        kırpma sıklığı ve süresi kare hızından bağımsızdır. Kapalı göz her zaman en az
+        bir karede gösterilir.
         """
-        current_time = time.time()
-        if current_time >= self.next_blink_time:
+        current_time = self.clock.time()
+        while current_time >= self.next_blink_time:
+            scheduled = self.next_blink_time
             self.blink_state = not self.blink_state
+            self._render_dirty = True
+            
+            if not self.blink_state:
+                # Göz kapalı - açılma zamanı kapanmanın planlandığı andan itibaren
+                self.next_blink_time = scheduled + self.blink_duration
+                break
             
-            if self.blink_state:
-                # Göz açık
+            # Göz açık - uzun bir bekleme sonrası (ör. güç tasarrufu) geçmiş kırpmaları tekrar oynatma
+            self.next_blink_time = scheduled + self._get_random_blink_interval()
+            if self.next_blink_time <= current_time:
                 self.next_blink_time = current_time + self._get_random_blink_interval()
+    
+    def _update_curves(self) -> None:
+        """
+        Etkin animasyon eğrilerini değerlendirir ve yüz durumuna uygular
+        
+        Göz pozisyonu eğrisi göz bebeğinin hedefini belirler (hareket yay-sönüm modeliyle
+        izlenir), ağız açıklığı konuşma seviyesine, duygu yoğunluğu nötr ile mevcut duygu
+        arasındaki morph adımına çevrilir. Duygu yoğunluğu eğrisi bittiğinde karışım
+        kaldırılır ve mevcut duygu tam yoğunlukta gösterilir.
+        """
+        if not self.curves.active:
+            return
+        
+        values = self.curves.evaluate(self.clock.monotonic())
+        
+        position = values.get("eye_position")
+        if position is not None:
+            self.target_eye_position = position
+            # Eğri sürerken rastgele göz hareketi hedefi ezmesin
+            self.next_eye_move_time = max(self.next_eye_move_time, self.clock.time() + 1.0)
+        
+        openness = values.get("mouth_openness")
+        if openness is not None:
+            self.mouth_openness = openness
+            self._update_speaking()
+        
+        intensity = values.get("emotion_intensity")
+        if intensity is not None:
+            emotion = self.config.get("emotions", {}).get("default_emotion", "neutral")
+            if emotion != "neutral" and self.curves.is_active("emotion_intensity"):
+                self.blend_emotions("neutral", emotion, intensity)
+                self.curve_blend = self.emotion_blend
             else:
-                # Göz kapalı
-                self.next_blink_time = current_time + 0.15  # Göz kapalı kalma süresi
+                # Eğri bu karede bitti
+                self._release_curve_blend()
+        
+        self.last_activity_time = self.clock.time()
+    
+    def _release_curve_blend(self) -> None:
+        """
+        Duygu yoğunluğu eğrisinin kurduğu karışımı kaldırır
+        
+        Karışım bu arada başka bir kaynak (set_emotion, blend_emotions) tarafından değiştirildiyse korunur.
+        """
+        if self.curve_blend is None:
+            return
+        if self.emotion_blend == self.curve_blend:
+            self.emotion_blend = None
+            self.mark_dirty()
+        self.curve_blend = None
     
     def _update_micro_expression(self) -> None:
         """
         Mikro ifadeyi günceller
         """
-        if self.micro_expression and time.time() > self.micro_expression_end_time:
+        if self.micro_expression and self.clock.time() > self.micro_expression_end_time:
             logger.debug(f"Mikro ifade sona erdi: {self.micro_expression}")
             self.micro_expression = None
+            self._render_dirty = True
     
     def _check_power_saving_mode(self) -> None:
         """
@@ -676,7 +1337,7 @@ class OLEDController:
         if not self.config.get("system", {}).get("power_save_enabled", True):
             return
             
-        idle_time = time.time() - self.last_activity_time
+        idle_time = self.clock.time() - self.last_activity_time
         
         # Güç tasarrufu modunu güncelle
         # Sadece mod değiştiğinde log oluştur
@@ -722,20 +1383,113 @@ class OLEDController:
                 logger.debug(f"Sıcaklık: {temperature} °C, Nem: {humidity} %")
                 # Sıcaklık ve neme göre ifadeleri güncelle
                 if temperature > 30:
-                    self.micro_expression = "hot"
-                    self.micro_expression_end_time = time.time() + 5
+                    self._set_environment_micro_expression("hot")
                 elif temperature < 10:
-                    self.micro_expression = "cold"
-                    self.micro_expression_end_time = time.time() + 5
+                    self._set_environment_micro_expression("cold")
                 elif humidity > 70:
-                    self.micro_expression = "humid"
-                    self.micro_expression_end_time = time.time() + 5
+                    self._set_environment_micro_expression("humid")
                 elif humidity < 30:
-                    self.micro_expression = "dry"
-                    self.micro_expression_end_time = time.time() + 5
+                    self._set_environment_micro_expression("dry")
             except Exception as e:
                 logger.error(f"Sıcaklık sensörü okunurken hata: {e}")
     
+    def _set_environment_micro_expression(self, emotion: str, duration: float = 5.0) -> None:
+        """
+        Çevresel faktörden kaynaklanan mikro ifadeyi ayarlar
+        
+        Args:
+            emotion (str): Mikro ifade ("hot", "cold", "humid", "dry")
+            duration (float, optional): Süre (saniye). Varsayılan: 5.0
+        """
+        if self.micro_expression != emotion:
+            self._render_dirty = True
+        self.micro_expression = emotion
+        self.micro_expression_end_time = self.clock.time() + duration
+    
+    def get_frame_stats(self) -> Dict:
+        """
+        Ekran başına gönderilen ve atlanan kare sayılarını döndürür
+        
+        Returns:
+            Dict: Ekran adına göre {"sent", "skipped", "partial", "full", "failed", "skip_ratio"} bilgileri,
+                çıkış aşaması etkinse "transmit" (gönderim süresi) bilgisi
+        """
+        stats = {}
+        for display_name, counters in self.frame_counters.items():
+            total = counters["sent"] + counters["skipped"]
+            stats[display_name] = {
+                "sent": counters["sent"],
+                "skipped": counters["skipped"],
+                "partial": counters["partial"],
+                "full": counters["full"],
+                "failed": counters["failed"],
+                "skip_ratio": counters["skipped"] / total if total else 0.0
+            }
+            
+            # Çıkış aşamasında ekran başına gönderim süresi
+            if self.output_stage is not None:
+                transmit = self.output_stage.get_display_stats(display_name)
+                if transmit is not None:
+                    stats[display_name]["transmit"] = transmit
+            
+            # Simülasyon modunda kare başına bayt sayaçları
+            display = self.displays.get(display_name)
+            if display is not None and hasattr(display, "get_transfer_stats"):
+                stats[display_name]["transfer"] = display.get_transfer_stats()
+        return stats
+    
+    def get_fps(self) -> float:
+        """
+        Hedef kare hızını döndürür
+        
+        Returns:
+            float: Hedef FPS
+        """
+        return self.fps
+    
+    def set_fps(self, fps: float) -> None:
+        """
+        Hedef kare hızını değiştirir
+        
+        Args:
+            fps (float): Yeni hedef FPS
+        """
+        self.fps = max(1.0, float(fps))
+        self.frame_delay = 1.0 / self.fps
+        self.frame_scheduler.set_fps(self.fps)
+        logger.info(f"OLED kare hızı ayarlandı: {self.fps:.1f} FPS")
+    
+    def get_frame_timing(self) -> Dict:
+        """
+        Animasyon döngüsünün kare zamanlama istatistiklerini döndürür
+        
+        Returns:
+            Dict: FPS, p50/p95/p99 kare süreleri, histogram, kaçırılan son tarih ve atlanan kare sayıları
+        """
+        return self.frame_scheduler.get_stats()
+    
+    def get_status(self) -> Dict:
+        """
+        OLED kontrolcünün durum bilgilerini döndürür
+        
+        Returns:
+            Dict: Çalışma durumu, güç modu, kare zamanlama, ekran ve sprite önbelleği istatistikleri
+        """
+        return {
+            "running": self.is_running,
+            "simulation_mode": self.simulation_mode,
+            "power_mode": self.power_mode,
+            "theme": self.theme_name,
+            "displays": [name for name, display in self.displays.items() if display is not None],
+            "timing": self.get_frame_timing(),
+            "render": {"mode": self.render_mode, **self.render_counters},
+            "frames": self.get_frame_stats(),
+            "output": self.output_stage.get_stats() if self.output_stage is not None else None,
+            "frame_pipeline": self.frame_pipeline.get_stats() if self.frame_pipeline is not None else None,
+            "sprite_cache": self.sprite_cache.get_stats(),
+            "morph_cache": self.morph_cache.get_stats()
+        }
+    
     def set_brightness(self, brightness: float) -> None:
         """
         OLED ekranların parlaklığını ayarlar
@@ -778,12 +1532,13 @@ class OLEDController:
                     logger.error(f"Ekran güç modu ayarlanırken hata: {display_name}, mod: {mode}, hata: {e}")
         
         self.power_mode = mode
+        self.mark_dirty()
     
     def reset_activity_timer(self) -> None:
         """
         Aktivite zamanlayıcısını sıfırlar (güç tasarrufu modu için)
         """
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock.time()
         
         # Eğer ekranlar kapalı veya dim modundaysa, açık moda geç
         if self.power_mode != "on":
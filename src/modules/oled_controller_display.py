@@ -4,11 +4,32 @@
 # Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
 # Dosya: oled_controller_display.py
 # Açıklama: OLED ekranları için çizim işlevlerini içeren modül.
-# Bağımlılıklar: PIL, adafruit_ssd1306
-# Bağlı Dosyalar: hardware_defines.py, oled_controller_base.py
+# Bağımlılıklar: PIL, numpy, adafruit_ssd1306
+# Bağlı Dosyalar: hardware_defines.py, oled_controller_base.py, oled_controller_sprites.py, oled_controller_framebuffer.py,
+#                 theme/theme_geometry.py, oled_controller_morph.py
 
-# Versiyon: 0.3.1
+# Versiyon: 0.3.14
 # Değişiklikler:
+# - [0.3.14] Kullanılmayan random içe aktarımı kaldırıldı
+# - [0.3.13] clear_eyes, clear_mouth ve show_mouth_expression doğrudan kare tamponuna yazıyor; PIL ile
+#           çizen başlangıç animasyonu ve hata yedekleri tamponu show_buffer / buffers_drawn ile bildiriyor
+# - [0.3.12] Göz morph tabloları göz bebeksiz çiziliyor ve (tema, göz, kaynak, hedef, kırpma, adım)
+#           ile önbellekleniyor; ara göz bebeği sprite olarak ayrıca üzerine kopyalanıyor
+# - [0.3.11] Göz kırpma ve büyüyen çember bloklamayan, animasyon döngüsünün çizdiği durumlara dönüştü
+#           (animasyon zamanlayıcısının iş parçacığında beklenmiyor)
+# - [0.3.10] Göz kırpma, büyüyen çember ve konuşma zamanlaması kontrolcünün saatini kullanıyor
+# - [0.3.9] Ağız açıklığı eğrisi sürerken konuşma seviyesi eğri değerinden çiziliyor
+# - [0.3.8] Duygu geçişinde her karede rastgele göz kırpma ve birikerek değişen göz hızı kaldırıldı
+# - [0.3.7] Konuşma animasyonu bloklamayan, animasyon döngüsünün çizdiği bir duruma dönüştü; ağız açıklığı
+#           SoundProcessor ses seviyesi geri çağırmalarından gelir ve önceden çizilmiş seviyelerden kopyalanır
+# - [0.3.6] Duygu geçişleri tek bir duygu adı seçmek yerine tema geometrisinden üretilen
+#           önceden çizilmiş morph ara kareleriyle çiziliyor
+# - [0.3.5] Göz ve ağız şekilleri if/elif zincirleri yerine tema geometri tablolarından derlenmiş
+#           çizim işlemleriyle çiziliyor; ters köşeli ağız kutuları artık hata vermiyor
+# - [0.3.4] Tema değişimi ve konuşma animasyonu sonu olay tabanlı çizim için yüzü kirli işaretliyor;
+#           göz hareketinin görünür etkisini ölçmek için kuantize göz bebeği anahtarı eklendi
+# - [0.3.3] Sprite'lar PIL tamponu yerine sayfa düzenindeki kare tamponuna kopyalanıyor
+# - [0.3.2] Göz ve ağız çizimleri sprite önbelleğine taşındı (her varyant bir kez çizilir)
 # - [0.3.1] Modül 3'e bölündü, çizim fonksiyonları bu modüle taşındı
 # - [0.3.0] Duygu alt tiplerinin görsel ifadeleri geliştirildi
 # - [0.2.0] Göz takibi özelliği eklendi ve mikro ifadeler geliştirildi
@@ -20,13 +41,64 @@
 
 import logging
 import time
-import math
-import random
 from typing import Dict, List, Tuple, Optional, Union
 
+from .theme.theme_geometry import ThemeGeometry, draw_shapes, load_theme_geometry
+from .oled_controller_morph import interpolate_pupil, render_morph_frames, to_morph_shape
+
 # Logger yapılandırması
 logger = logging.getLogger("OLEDController")
 
+# Alt duygu tiplerini ana duygulara eşleme tablosu
+EMOTION_SUBTYPES_MAP = {
+    # Happy alt tipleri
+    "joy": "happy", "content": "happy", "excited": "excited",
+    "amused": "happy", "proud": "happy",
+    
+    # Sad alt tipleri
+    "disappointed": "sad", "lonely": "sad", "depressed": "sad",
+    "miserable": "sad", "guilty": "sad",
+    
+    # Angry alt tipleri
+    "frustrated": "angry", "irritated": "angry", "enraged": "angry",
+    "annoyed": "angry", "bitter": "angry",
+    
+    # Surprised alt tipleri
+    "amazed": "surprised", "astonished": "surprised", "shocked": "surprised",
+    "startled": "surprised", "confused": "confused",
+    
+    # Fearful alt tipleri
+    "anxious": "fearful", "terrified": "fearful", "nervous": "fearful", 
+    "worried": "fearful", "scared": "fearful",
+    
+    # Disgusted alt tipleri
+    "disapproval": "disgusted", "revolted": "disgusted", "judgmental": "disgusted",
+    "avoidant": "disgusted", "loathing": "disgusted",
+    
+    # Calm alt tipleri
+    "relaxed": "calm", "peaceful": "calm", "serene": "calm",
+    "tranquil": "calm", "composed": "calm",
+    
+    # Neutral alt tipleri
+    "indifferent": "neutral", "objective": "neutral", "detached": "neutral", 
+    "unconcerned": "neutral", "balanced": "neutral",
+    
+    # Özel duygu ifadeleri
+    "sleepy": "sleepy", "bored": "bored", "love": "love"
+}
+
+# Zamanlanmış konuşma desenleri (0: kapalı, 4: tam açık) ve saniyedeki durum değişikliği
+SPEAKING_PATTERNS = {
+    "default": [0, 1, 2, 3, 4, 3, 2, 1],
+    "fast": [0, 2, 4, 2, 0, 3, 1],
+    "slow": [0, 1, 2, 2, 3, 3, 4, 4, 3, 3, 2, 2, 1, 1]
+}
+SPEAKING_PATTERN_RATE = 4.0
+
+# Sprite önbelleği ısıtılırken kullanılan duygu listeleri
+BASE_EMOTIONS = sorted(set(EMOTION_SUBTYPES_MAP.values()) | {"happy", "sad", "angry", "surprised", "neutral"})
+MOUTH_EMOTIONS = sorted(set(EMOTION_SUBTYPES_MAP) | set(BASE_EMOTIONS))
+
 class OLEDDisplayMixin:
     """
     OLED ekranlar için çizim işlevlerini içeren mixin sınıfı.
@@ -36,9 +108,13 @@ class OLEDDisplayMixin:
     def _draw_all_displays(self) -> None:
         """
         Tüm ekranlara mevcut duygu durumuna göre çizim yapar
+        
+        Duygu geçişi veya dışarıdan verilen karışım sürüyorsa önceden çizilmiş
+        morph ara kareleri kullanılır.
         """
         # Kullanılacak duygu belirleme (mikro ifade varsa onu kullan)
         current_emotion = self.config.get("emotions", {}).get("default_emotion", "calm")
+        morph = None
         
         # Eğer bir mikro ifade varsa, onu kullan
         if self.micro_expression:
@@ -49,120 +125,440 @@ class OLEDDisplayMixin:
             source = self.config["emotions"].get("source", current_emotion)
             progress = target.get("progress", 0.0)
             
-            # İki duygu arasında geçiş yaparken blend_emotions fonksiyonunu kullan
+            # İki duygu arasında geçiş yaparken morph ara karelerini kullan
             if progress > 0.0 and progress < 1.0:
-                # Duygu geçişini daha doğal bir eğri ile yumuşat (kübik easing fonksiyonu)
-                # Bu fonksiyon başta yavaş, ortada hızlı, sonda tekrar yavaşlayan bir geçiş sağlar
-                eased_progress = progress
-                
-                # Kübik easing fonksiyonu (daha doğal geçiş için)
-                if progress < 0.5:
-                    eased_progress = 4 * progress * progress * progress
-                else:
-                    p = progress - 1
-                    eased_progress = 1 + 4 * p * p * p
-                
-                # Duygular arasında yumuşak geçiş için blend_emotions kullan
-                current_emotion = self.blend_emotions(source, target["state"], eased_progress)
-                
-                # Göz pozisyonu ve kırpma durumunu duygu geçişine göre ayarla
-                if 0.45 < progress < 0.55:
-                    # Geçişin ortasında göz kırpma olasılığı artar
-                    if random.random() < 0.2:
-                        self.blink_state = not self.blink_state
-                
-                # "Concerned" ve "excited" gibi duygular için göz hareketi hızını ayarla
-                if target["state"] in ["concerned", "nervous", "excited", "anxious"]:
-                    self.eye_move_speed = min(0.3, self.eye_move_speed * 1.5)
-                elif target["state"] in ["calm", "peaceful", "sleepy"]:
-                    self.eye_move_speed = max(0.05, self.eye_move_speed * 0.7)
-                
-                # Eğer geçiş tamamlanmışsa, hedef duygusunu ayarla
-                if progress >= 1.0:
-                    self.config["emotions"]["default_emotion"] = target["state"]
+                morph = (source, target["state"],
+                         self._get_morph_step(self._ease_transition_progress(progress)))
+                # Geçiş ortasındaki göz kırpma ve göz hızı ayarı zamana bağlı olarak
+                # update_emotion_transition ve _get_eye_spring_frequency tarafından yapılır
+        # Dışarıdan (EmotionEngine geçişi) verilen karışım
+        elif self.emotion_blend is not None:
+            morph = self.emotion_blend
+        
+        # Konuşurken ağız, ifade yerine açıklık seviyesinden çizilir
+        speaking_level = self.speaking_level
+        
+        if morph is not None:
+            self._draw_emotion_morph(*morph, self.blink_state, draw_mouth=speaking_level is None)
+        else:
+            # Sol ve sağ gözleri çiz (büyüyen çember sürerken çember adımı çizilir)
+            if self.growing_circle_level is not None:
+                self.draw_growing_circle(self.growing_circle_level)
+            else:
+                self.draw_eyes(current_emotion, self.blink_state)
+            
+            # Ağzı çiz
+            if speaking_level is None:
+                self.draw_mouth(current_emotion)
+        
+        if speaking_level is not None:
+            self.draw_speaking_mouth(speaking_level)
+    
+    def _ease_transition_progress(self, progress: float) -> float:
+        """
+        Geçiş ilerlemesine kübik yumuşatma uygular
+        
+        Başta yavaş, ortada hızlı, sonda tekrar yavaşlayan bir geçiş sağlar.
+        
+        Args:
+            progress (float): Doğrusal ilerleme (0.0 - 1.0)
+            
+        Returns:
+            float: Yumuşatılmış ilerleme
+        """
+        if progress < 0.5:
+            return 4 * progress * progress * progress
+        p = progress - 1
+        return 1 + 4 * p * p * p
+    
+    def _get_morph_step(self, ratio: float) -> int:
+        """
+        Geçiş oranını morph tablosundaki adıma kuantize eder
+        
+        Args:
+            ratio (float): Geçiş oranı (0.0: kaynak, 1.0: hedef)
+            
+        Returns:
+            int: 0 (kaynak), 1..K (ara kareler) veya K + 1 (hedef)
+        """
+        steps = self.morph_steps
+        return max(0, min(steps + 1, int(round(ratio * (steps + 1)))))
+    
+    def _get_morph_pupil(self, width: int, height: int, eye_name: str,
+                         base_emotion: str, blink_state: bool) -> Optional[Tuple[int, int, int]]:
+        """
+        Bir gözün morph sırasında ayrıca çizilen göz bebeğini döndürür
+        
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı
+            base_emotion (str): Ana duygu
+            blink_state (bool): Göz kırpma durumu
+            
+        Returns:
+            Optional[Tuple[int, int, int]]: (merkez x, merkez y, yarıçap), göz kapalıysa veya göz bebeği yoksa None
+        """
+        eye = self.geometry.eye(width, height, eye_name, base_emotion)
+        if not blink_state or not eye.pupil:
+            return None
+        offset_x, offset_y = self._get_pupil_offset(width, height, eye_name, base_emotion, blink_state)
+        return (eye.center[0] + offset_x, eye.center[1] + offset_y, eye.pupil_size)
+    
+    def _get_eye_morph_frames(self, eye_name: str, size: Tuple[int, int], source_base: str,
+                              target_base: str, blink_state: bool) -> Tuple:
+        """
+        İki ana duygu arasındaki göz ara karelerini (göz bebeksiz) morph önbelleğinden döndürür
+        
+        Args:
+            eye_name (str): Göz adı
+            size (Tuple[int, int]): Ekran boyutu
+            source_base (str): Kaynak ana duygu
+            target_base (str): Hedef ana duygu
+            blink_state (bool): Göz kırpma durumu
+            
+        Returns:
+            Tuple[np.ndarray, ...]: Paketlenmiş ara kareler
+        """
+        width, height = size
+        
+        def build():
+            shapes = []
+            for base_emotion in (source_base, target_base):
+                eye = self.geometry.eye(width, height, eye_name, base_emotion)
+                ops = eye.open_ops if blink_state else eye.closed_ops
+                shapes.append([to_morph_shape(op) for op in ops])
+            return render_morph_frames(size, shapes[0], shapes[1], self.morph_steps)
+        
+        key = (self.theme_name, eye_name, source_base, target_base, blink_state, self.morph_steps)
+        return self.morph_cache.get_or_build(key, build)
+    
+    def _draw_morph_pupil(self, eye_name: str, size: Tuple[int, int], source_base: str,
+                          target_base: str, blink_state: bool, step: int) -> None:
+        """
+        Morph adımındaki göz bebeğini göz karesinin üzerine çizer
+        
+        Args:
+            eye_name (str): Göz adı
+            size (Tuple[int, int]): Ekran boyutu
+            source_base (str): Kaynak ana duygu
+            target_base (str): Hedef ana duygu
+            blink_state (bool): Göz kırpma durumu
+            step (int): Morph adımı (1..K)
+        """
+        width, height = size
+        pupil = interpolate_pupil(
+            self._get_morph_pupil(width, height, eye_name, source_base, blink_state),
+            self._get_morph_pupil(width, height, eye_name, target_base, blink_state),
+            step / (self.morph_steps + 1))
+        if pupil is None:
+            return
+        
+        center_x, center_y, radius = pupil
+        key = (self.theme_name, "pupil", center_x, center_y, radius)
+        sprite = self.sprite_cache.get_or_render(
+            key, size,
+            lambda draw, w, h: draw.ellipse((center_x - radius, center_y - radius,
+                                             center_x + radius, center_y + radius), fill=1)
+        )
+        self.framebuffers[eye_name].blit(sprite, mode="or")
+    
+    def _get_mouth_morph_frames(self, size: Tuple[int, int], source: str, target: str) -> Tuple:
+        """
+        İki duygu arasındaki ağız ara karelerini morph önbelleğinden döndürür
+        
+        Args:
+            size (Tuple[int, int]): Ekran boyutu
+            source (str): Kaynak duygu
+            target (str): Hedef duygu
+            
+        Returns:
+            Tuple[np.ndarray, ...]: Paketlenmiş ara kareler
+        """
+        width, height = size
+        
+        def build():
+            source_shapes = [to_morph_shape(op) for op in self.geometry.mouth_ops(
+                width, height, source, self._get_base_emotion(source))]
+            target_shapes = [to_morph_shape(op) for op in self.geometry.mouth_ops(
+                width, height, target, self._get_base_emotion(target))]
+            return render_morph_frames(size, source_shapes, target_shapes, self.morph_steps)
+        
+        key = (self.theme_name, "mouth", source, target, self.morph_steps)
+        return self.morph_cache.get_or_build(key, build)
+    
+    def _draw_emotion_morph(self, source: str, target: str, step: int, blink_state: bool,
+                            draw_mouth: bool = True) -> None:
+        """
+        İki duygu arasındaki morph adımını ekranlara çizer
+        
+        Uç adımlar ve aynı görünen çiftler sprite önbelleğinden, ara adımlar
+        önceden çizilmiş morph tablosundan kopyalanır.
+        
+        Args:
+            source (str): Kaynak duygu
+            target (str): Hedef duygu
+            step (int): Morph adımı (0: kaynak, K + 1: hedef)
+            blink_state (bool): Göz kırpma durumu
+            draw_mouth (bool): Ağız da çizilsin mi (konuşurken False)
+        """
+        if step <= 0 or step > self.morph_steps:
+            emotion = source if step <= 0 else target
+            self.draw_eyes(emotion, blink_state)
+            if draw_mouth:
+                self.draw_mouth(emotion)
+            return
+        
+        source_base = self._get_base_emotion(source)
+        target_base = self._get_base_emotion(target)
+        
+        for eye_name in ["left_eye", "right_eye"]:
+            if self.displays[eye_name] is None or self.draw_objects[eye_name] is None:
+                continue
+            try:
+                if source_base == target_base:
+                    self.draw_eyes(target, blink_state)
+                    break
+                size = self.buffers[eye_name].size
+                frames = self._get_eye_morph_frames(eye_name, size, source_base, target_base, blink_state)
+                self.framebuffers[eye_name].blit(frames[step - 1])
+                self._draw_morph_pupil(eye_name, size, source_base, target_base, blink_state, step)
+            except Exception as e:
+                logger.error(f"Göz geçiş karesi çizilirken hata: {eye_name}, {source} -> {target}, hata: {e}")
+                self.draw_eyes(target, blink_state)
+                break
+        
+        if not draw_mouth or self.displays["mouth"] is None or self.draw_objects["mouth"] is None:
+            return
+        try:
+            if source == target:
+                self.draw_mouth(target)
+                return
+            frames = self._get_mouth_morph_frames(self.buffers["mouth"].size, source, target)
+            self.framebuffers["mouth"].blit(frames[step - 1])
+        except Exception as e:
+            logger.error(f"Ağız geçiş karesi çizilirken hata: {source} -> {target}, hata: {e}")
+            self.draw_mouth(target)
+    
+    def prepare_emotion_morph(self, source: str, target: str) -> None:
+        """
+        İki duygu arasındaki açık göz ve ağız ara karelerini önceden çizer
+        
+        Geçiş başlarken çağrılır; böylece geçiş sırasında kareler yalnızca kopyalanır.
         
-        # Sol ve sağ gözleri çiz
-        self.draw_eyes(current_emotion, self.blink_state)
+        Args:
+            source (str): Kaynak duygu
+            target (str): Hedef duygu
+        """
+        source_base = self._get_base_emotion(source)
+        target_base = self._get_base_emotion(target)
         
-        # Ağzı çiz
-        self.draw_mouth(current_emotion)
+        try:
+            if source_base != target_base:
+                for eye_name in ("left_eye", "right_eye"):
+                    if self.buffers.get(eye_name) is not None:
+                        self._get_eye_morph_frames(eye_name, self.buffers[eye_name].size,
+                                                   source_base, target_base, True)
+            if source != target and self.buffers.get("mouth") is not None:
+                self._get_mouth_morph_frames(self.buffers["mouth"].size, source, target)
+        except Exception as e:
+            logger.error(f"Duygu geçiş kareleri hazırlanırken hata: {source} -> {target}, hata: {e}")
+    
+    def _get_base_emotion(self, emotion: str) -> str:
+        """
+        Alt duygu tipini ana duyguya eşler
+        
+        Args:
+            emotion (str): Duygu veya alt duygu tipi
+            
+        Returns:
+            str: Ana duygu
+        """
+        return EMOTION_SUBTYPES_MAP.get(emotion, emotion)
+    
+    def _get_eye_dimensions(self, width: int, height: int, eye_name: str, base_emotion: str) -> Tuple[int, int]:
+        """
+        Duyguya göre göz genişliğini ve yüksekliğini tema geometrisinden döndürür
+        
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı ("left_eye" veya "right_eye")
+            base_emotion (str): Ana duygu
+            
+        Returns:
+            Tuple[int, int]: Göz genişliği ve yüksekliği
+        """
+        eye = self.geometry.eye(width, height, eye_name, base_emotion)
+        return eye.width, eye.height
+    
+    def _get_pupil_offset(self, width: int, height: int, eye_name: str,
+                          base_emotion: str, blink_state: bool,
+                          eye_position: Optional[Tuple[float, float]] = None) -> Tuple[int, int]:
+        """
+        Göz pozisyonuna göre kuantize edilmiş göz bebeği ofsetini hesaplar
+        
+        Ofsetler sprite önbelleğinin anahtarında kullanıldığı için
+        self.pupil_quantization piksellik adımlara yuvarlanır.
+        
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı
+            base_emotion (str): Ana duygu
+            blink_state (bool): Göz kırpma durumu (True: açık, False: kapalı)
+            eye_position (Optional[Tuple[float, float]]): Göz pozisyonu (None ise self.eye_position)
+            
+        Returns:
+            Tuple[int, int]: Göz bebeği ofseti (x, y)
+        """
+        if eye_position is None:
+            eye_position = self.eye_position
+        
+        # Kapalı göz ve göz bebeği olmayan şekiller (ör. kalp göz) için ofset yok
+        eye = self.geometry.eye(width, height, eye_name, base_emotion)
+        if not blink_state or not eye.pupil:
+            return (0, 0)
+        
+        max_offset_x = eye.width // 4
+        max_offset_y = eye.height // 4
+        step = self.pupil_quantization
+        
+        pupil_offset_x = int(round(eye_position[0] * max_offset_x / step)) * step
+        pupil_offset_y = int(round(eye_position[1] * max_offset_y / step)) * step
+        
+        # Kısıtlamaları uygula
+        pupil_offset_x = max(-max_offset_x, min(max_offset_x, pupil_offset_x))
+        pupil_offset_y = max(-max_offset_y, min(max_offset_y, pupil_offset_y))
+        
+        return (pupil_offset_x, pupil_offset_y)
+    
+    def _get_pupil_render_key(self, eye_position: Tuple[float, float]) -> Tuple:
+        """
+        Göz pozisyonunun ekranlarda üreteceği kuantize göz bebeği ofsetlerini döndürür
+        
+        Olay tabanlı çizimde göz hareketinin görünür bir değişiklik üretip üretmediğini
+        ve hareketin piksel düzeyinde tamamlanıp tamamlanmadığını belirlemek için kullanılır.
+        
+        Args:
+            eye_position (Tuple[float, float]): Göz pozisyonu (-1.0 - 1.0 arası)
+            
+        Returns:
+            Tuple: Göz ekranlarına göre göz bebeği ofsetleri
+        """
+        emotion = self.micro_expression or self.config.get("emotions", {}).get("default_emotion", "calm")
+        base_emotion = self._get_base_emotion(emotion)
+        
+        key = []
+        for eye_name in ("left_eye", "right_eye"):
+            buffer = self.buffers.get(eye_name)
+            if buffer is not None:
+                key.append(self._get_pupil_offset(buffer.width, buffer.height, eye_name,
+                                                  base_emotion, True, eye_position))
+        return tuple(key)
+    
+    def _iter_pupil_offsets(self, width: int, height: int, eye_name: str, base_emotion: str):
+        """
+        Bir göz için olası tüm kuantize göz bebeği ofsetlerini üretir
+        
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı
+            base_emotion (str): Ana duygu
+            
+        Yields:
+            Tuple[int, int]: Göz bebeği ofseti (x, y)
+        """
+        eye = self.geometry.eye(width, height, eye_name, base_emotion)
+        if not eye.pupil:
+            yield (0, 0)
+            return
+        
+        max_offset_x = eye.width // 4
+        max_offset_y = eye.height // 4
+        step = self.pupil_quantization
+        
+        offsets_x = sorted({max(-max_offset_x, min(max_offset_x, i * step))
+                            for i in range(-(max_offset_x // step) - 1, max_offset_x // step + 2)})
+        offsets_y = sorted({max(-max_offset_y, min(max_offset_y, i * step))
+                            for i in range(-(max_offset_y // step) - 1, max_offset_y // step + 2)})
+        
+        for offset_y in offsets_y:
+            for offset_x in offsets_x:
+                yield (offset_x, offset_y)
+    
+    def _render_eye(self, draw, width: int, height: int, eye_name: str,
+                    base_emotion: str, blink_state: bool, pupil_offset: Tuple[int, int]) -> None:
+        """
+        Tek bir göz karesini verilen çizim nesnesine çizer
+        
+        Göz şekli tema geometrisinden derlenmiş çizim işlemleriyle çizilir;
+        yalnızca göz bebeği ofsete göre konumlandırılır.
+        
+        Args:
+            draw (ImageDraw): Çizim nesnesi (boş bir 1-bit görüntü üzerinde)
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı ("left_eye" veya "right_eye")
+            base_emotion (str): Ana duygu
+            blink_state (bool): Göz kırpma durumu (True: açık, False: kapalı)
+            pupil_offset (Tuple[int, int]): Kuantize göz bebeği ofseti
+        """
+        eye = self.geometry.eye(width, height, eye_name, base_emotion)
+        
+        if not blink_state:
+            # Göz kapalı
+            draw_shapes(draw, eye.closed_ops)
+            return
+        
+        # Göz açık
+        draw_shapes(draw, eye.open_ops)
+        
+        # Göz bebeği çizimi (duyguya ve göz pozisyonuna göre)
+        if eye.pupil:
+            center_x, center_y = eye.center
+            pupil_size = eye.pupil_size
+            pupil_offset_x, pupil_offset_y = pupil_offset
+            draw.ellipse((center_x - pupil_size + pupil_offset_x,
+                          center_y - pupil_size + pupil_offset_y,
+                          center_x + pupil_size + pupil_offset_x,
+                          center_y + pupil_size + pupil_offset_y), fill=1)
+    
+    def _get_eye_sprite(self, eye_name: str, size: Tuple[int, int], base_emotion: str,
+                        blink_state: bool, pupil_offset: Tuple[int, int]):
+        """
+        Göz sprite'ını önbellekten döndürür, yoksa çizer
+        
+        Args:
+            eye_name (str): Göz adı
+            size (Tuple[int, int]): Ekran boyutu (genişlik, yükseklik)
+            base_emotion (str): Ana duygu
+            blink_state (bool): Göz kırpma durumu
+            pupil_offset (Tuple[int, int]): Kuantize göz bebeği ofseti
+            
+        Returns:
+            np.ndarray: Sayfa düzeninde paketlenmiş göz sprite'ı
+        """
+        key = (self.theme_name, eye_name, base_emotion, blink_state, pupil_offset)
+        return self.sprite_cache.get_or_render(
+            key, size,
+            lambda draw, w, h: self._render_eye(draw, w, h, eye_name, base_emotion, blink_state, pupil_offset)
+        )
     
     def draw_eyes(self, emotion: str, blink_state: bool) -> None:
         """
         Göz ekranlarına çizim yapar
         
+        Göz şekilleri her karede yeniden çizilmez; sprite önbelleğindeki
+        paketlenmiş kare doğrudan kare tamponuna kopyalanır.
+        
         Args:
             emotion (str): Duygu durumu
             blink_state (bool): Göz kırpma durumu (True: açık, False: kapalı)
         """
-        # Performans optimizasyonu: Duygu alt tiplerini önbellekleme
-        if not hasattr(self, "_emotion_subtypes_map"):
-            # Alt duygu tiplerini ana duygulara eşle - önbelleğe al
-            self._emotion_subtypes_map = {
-                # Happy alt tipleri
-                "joy": "happy", "content": "happy", "excited": "excited",
-                "amused": "happy", "proud": "happy",
-                
-                # Sad alt tipleri
-                "disappointed": "sad", "lonely": "sad", "depressed": "sad",
-                "miserable": "sad", "guilty": "sad",
-                
-                # Angry alt tipleri
-                "frustrated": "angry", "irritated": "angry", "enraged": "angry",
-                "annoyed": "angry", "bitter": "angry",
-                
-                # Surprised alt tipleri
-                "amazed": "surprised", "astonished": "surprised", "shocked": "surprised",
-                "startled": "surprised", "confused": "confused",
-                
-                # Fearful alt tipleri
-                "anxious": "fearful", "terrified": "fearful", "nervous": "fearful", 
-                "worried": "fearful", "scared": "fearful",
-                
-                # Disgusted alt tipleri
-                "disapproval": "disgusted", "revolted": "disgusted", "judgmental": "disgusted",
-                "avoidant": "disgusted", "loathing": "disgusted",
-                
-                # Calm alt tipleri
-                "relaxed": "calm", "peaceful": "calm", "serene": "calm",
-                "tranquil": "calm", "composed": "calm",
-                
-                # Neutral alt tipleri
-                "indifferent": "neutral", "objective": "neutral", "detached": "neutral", 
-                "unconcerned": "neutral", "balanced": "neutral",
-                
-                # Özel duygu ifadeleri
-                "sleepy": "sleepy", "bored": "bored", "love": "love"
-            }
-        
-        # Alt duygu tipini ana duyguya eşle - önbellek kullan
-        base_emotion = emotion
-        if emotion in self._emotion_subtypes_map:
-            base_emotion = self._emotion_subtypes_map[emotion]
-        
-        # Göz şekilleri ve parametrelerini hesapla - çoklu göz çizimleri için önbellek
-        eye_params = {}
-        eye_width = 0
-        eye_height = 0
-        
-        # Performans optimizasyonu: Göz parametrelerini tek seferde hesapla
-        if blink_state:
-            # Duyguya göre göz biçimini belirle
-            eye_width = self.width * 3 // 4  # Varsayılan göz genişliği
-            eye_height = self.height * 2 // 3  # Varsayılan göz yüksekliği
-            
-            # Duyguya göre göz boyutlarını ayarla
-            if base_emotion == "happy" or base_emotion == "excited":
-                eye_height = self.height * 1 // 2  # Mutlu gözler daha küçük
-            elif base_emotion == "surprised" or base_emotion == "fearful":
-                eye_height = self.height * 3 // 4  # Şaşkın gözler daha büyük
-                eye_width = self.width * 4 // 5
-            elif base_emotion == "angry":
-                eye_height = self.height * 1 // 2  # Kızgın gözler daha dar
-                
-            # Göz parametrelerini kaydet
-            eye_params["width"] = eye_width
-            eye_params["height"] = eye_height
+        # Alt duygu tipini ana duyguya eşle
+        base_emotion = self._get_base_emotion(emotion)
         
         # Sol göz ve sağ göz ekranlarını çiz
         for eye_name in ["left_eye", "right_eye"]:
@@ -170,167 +566,11 @@ class OLEDDisplayMixin:
                 continue
             
             try:
-                # Tampon görüntüyü temizle - optimize edilmiş yaklaşım
                 buffer = self.buffers[eye_name]
-                draw = self.draw_objects[eye_name]
-                
-                # Performans optimizasyonu: Tüm ekranı temizleme hızlı yöntem
-                buffer.paste(0, (0, 0, buffer.width, buffer.height))
-                
-                # Ekran boyutlarını al
-                width, height = buffer.width, buffer.height
-                center_x, center_y = width // 2, height // 2
-                
-                if blink_state:
-                    # Göz açık
-                    
-                    # Parametreleri al
-                    eye_width = eye_params["width"]
-                    eye_height = eye_params["height"]
-                    
-                    # Duyguya göre göz şekli çizimi
-                    if base_emotion == "angry":
-                        # Kızgın göz için açıyı ayarla
-                        if eye_name == "left_eye":
-                            # Performans optimizasyonu: polygon çizimlerini optimize et
-                            points = [(center_x - eye_width//2, center_y - 5), 
-                                     (center_x - eye_width//2 + 5, center_y - 15), 
-                                     (center_x + eye_width//2, center_y - 5),
-                                     (center_x + eye_width//2, center_y + eye_height//3),
-                                     (center_x - eye_width//2, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                        else:
-                            points = [(center_x - eye_width//2, center_y - 5), 
-                                     (center_x + eye_width//2 - 5, center_y - 15), 
-                                     (center_x + eye_width//2, center_y - 5),
-                                     (center_x + eye_width//2, center_y + eye_height//3),
-                                     (center_x - eye_width//2, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                    elif base_emotion == "disgusted":
-                        # Tiksinmiş göz şekli
-                        if eye_name == "left_eye":
-                            points = [(center_x - eye_width//2, center_y), 
-                                     (center_x, center_y - eye_height//3), 
-                                     (center_x + eye_width//2, center_y),
-                                     (center_x + eye_width//2, center_y + eye_height//3),
-                                     (center_x - eye_width//2, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                        else:
-                            points = [(center_x - eye_width//2, center_y), 
-                                     (center_x, center_y - eye_height//3), 
-                                     (center_x + eye_width//2, center_y),
-                                     (center_x + eye_width//2, center_y + eye_height//3),
-                                     (center_x - eye_width//2, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                    elif base_emotion == "sad":
-                        # Üzgün göz için açıyı ayarla
-                        if eye_name == "left_eye":
-                            points = [(center_x - eye_width//2, center_y), 
-                                     (center_x - eye_width//4, center_y - eye_height//4), 
-                                     (center_x + eye_width//2, center_y),
-                                     (center_x + eye_width//3, center_y + eye_height//3),
-                                     (center_x - eye_width//3, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                        else:
-                            points = [(center_x - eye_width//2, center_y), 
-                                     (center_x + eye_width//4, center_y - eye_height//4), 
-                                     (center_x + eye_width//2, center_y),
-                                     (center_x + eye_width//3, center_y + eye_height//3),
-                                     (center_x - eye_width//3, center_y + eye_height//3)]
-                            draw.polygon(points, outline=1, width=1)
-                    elif base_emotion == "sleepy" or base_emotion == "bored":
-                        # Uykulu/sıkılmış göz çizimi
-                        eye_height = height * 1 // 3  # Göz kapakları yarı açık
-                        draw.ellipse((center_x - eye_width//2, center_y - eye_height//2, 
-                                     center_x + eye_width//2, center_y + eye_height//2), outline=1)
-                    elif base_emotion == "confused":
-                        # Kafası karışmış göz - bir göz normal diğeri farklı
-                        if eye_name == "left_eye":
-                            eye_height = height * 2 // 3
-                            draw.ellipse((center_x - eye_width//2, center_y - eye_height//2, 
-                                         center_x + eye_width//2, center_y + eye_height//2), outline=1)
-                        else:
-                            # Sağ göz daha küçük ve açılı
-                            eye_height = height * 1 // 2
-                            draw.arc((center_x - eye_width//2, center_y - eye_height//2, 
-                                     center_x + eye_width//2, center_y + eye_height//2),
-                                     180, 0, fill=1, width=1)
-                    elif base_emotion == "love":
-                        # Aşık göz - kalp şeklinde
-                        heart_size = min(width, height) // 3
-                        
-                        # İki daire yan yana ve bir üçgen altında (kalp şekli)
-                        draw.ellipse(
-                            (center_x - heart_size, center_y - heart_size // 2, 
-                             center_x, center_y + heart_size // 2),
-                            outline=1
-                        )
-                        draw.ellipse(
-                            (center_x, center_y - heart_size // 2, 
-                             center_x + heart_size, center_y + heart_size // 2),
-                            outline=1
-                        )
-                        draw.polygon(
-                            [(center_x - heart_size, center_y),
-                             (center_x + heart_size, center_y),
-                             (center_x, center_y + heart_size)],
-                            outline=1
-                        )
-                    else:
-                        # Normal göz çizimi - optimizasyon için parametreleri önbelleğe al
-                        ellipse_coords = (center_x - eye_width//2, center_y - eye_height//2, 
-                                        center_x + eye_width//2, center_y + eye_height//2)
-                        draw.ellipse(ellipse_coords, outline=1)
-                    
-                    # Göz bebeği çizimi (duyguya ve göz pozisyonuna göre)
-                    # Normal göz bebeği boyutu
-                    pupil_size = min(width, height) // 8
-                    
-                    # Duyguya göre göz bebeği boyutunu ayarla
-                    if base_emotion == "fearful" or base_emotion == "surprised":
-                        pupil_size = min(width, height) // 6  # Daha büyük göz bebeği
-                    elif base_emotion == "disgusted" or base_emotion == "angry":
-                        pupil_size = min(width, height) // 10  # Daha küçük göz bebeği
-                        
-                    # Performans optimizasyonu: Göz bebeği pozisyonunu tek seferde hesapla
-                    max_offset_x = eye_width // 4
-                    max_offset_y = eye_height // 4
-                    
-                    pupil_offset_x = int(self.eye_position[0] * max_offset_x)
-                    pupil_offset_y = int(self.eye_position[1] * max_offset_y)
-                    
-                    # Kısıtlamaları uygula
-                    pupil_offset_x = max(-max_offset_x, min(max_offset_x, pupil_offset_x))
-                    pupil_offset_y = max(-max_offset_y, min(max_offset_y, pupil_offset_y))
-                    
-                    # Love duygusu haricinde göz bebeği çiz
-                    if base_emotion != "love":
-                        # Optimizasyon: Ellips koordinatlarını önbelleğe al
-                        ellipse_coords = (center_x - pupil_size + pupil_offset_x, 
-                                        center_y - pupil_size + pupil_offset_y, 
-                                        center_x + pupil_size + pupil_offset_x, 
-                                        center_y + pupil_size + pupil_offset_y)
-                        draw.ellipse(ellipse_coords, fill=1)
-                
-                else:
-                    # Göz kapalı - daha basit çizimler, optimize edildi
-                    line_width = 2  # Varsayılan çizgi kalınlığı
-                    
-                    if base_emotion == "angry":
-                        # Kızgın kapalı göz - açılı çizgiler
-                        offset = 8
-                        draw.line([(center_x - width//3, center_y - offset), 
-                                  (center_x + width//3, center_y)], fill=1, width=line_width)
-                    elif base_emotion == "sad":
-                        # Üzgün kapalı göz - aşağı eğri çizgiler
-                        draw.arc((center_x - width//3, center_y, 
-                                 center_x + width//3, center_y + height//3), 
-                                 0, 180, fill=1, width=line_width)
-                    else:
-                        # Normal kapalı göz - düz çizgi
-                        line_coords = [(center_x - width//3, center_y), 
-                                     (center_x + width//3, center_y)]
-                        draw.line(line_coords, fill=1, width=line_width)
+                pupil_offset = self._get_pupil_offset(buffer.width, buffer.height, eye_name,
+                                                      base_emotion, blink_state)
+                sprite = self._get_eye_sprite(eye_name, buffer.size, base_emotion, blink_state, pupil_offset)
+                self.framebuffers[eye_name].blit(sprite)
                 
             except Exception as e:
                 logger.error(f"Göz çizilirken hata: {eye_name}, duygu: {emotion}, hata: {e}")
@@ -342,11 +582,30 @@ class OLEDDisplayMixin:
                     center_x, center_y = width // 2, height // 2
                     
                     # Basit oval göz
+                    buffer.paste(0, (0, 0, width, height))
                     draw.ellipse((center_x - width//4, center_y - height//4, 
                                  center_x + width//4, center_y + height//4), outline=1)
+                    self.buffers_drawn[eye_name] = True
     
                 except Exception as e:
                     logger.error(f"Varsayılan göz çizilirken bile hata: {e}")
+    
+    def _render_mouth(self, draw, width: int, height: int, emotion: str) -> None:
+        """
+        Ağız karesini verilen çizim nesnesine çizer
+        
+        Ağız şekli tema geometrisinde önce duygunun kendisi, sonra ana duygu
+        için aranır; bulunamazsa varsayılan hafif gülümseme çizilir.
+        
+        Args:
+            draw (ImageDraw): Çizim nesnesi (boş bir 1-bit görüntü üzerinde)
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            emotion (str): Duygu durumu (alt tipler farklı ağız şekilleri kullanır)
+        """
+        base_emotion = self._get_base_emotion(emotion)
+        draw_shapes(draw, self.geometry.mouth_ops(width, height, emotion, base_emotion))
+    
     def draw_mouth(self, emotion: str) -> None:
         """
         Ağız ekranına çizim yapar
@@ -357,529 +616,106 @@ class OLEDDisplayMixin:
         if self.displays["mouth"] is None or self.draw_objects["mouth"] is None:
             return
         
+        buffer = self.buffers["mouth"]
+        
         try:
-            # Tampon görüntüyü temizle - optimize edilmiş yöntemle
-            buffer = self.buffers["mouth"]
-            draw = self.draw_objects["mouth"]
-            
-            # Performans optimizasyonu: Daha hızlı ekran temizleme
-            buffer.paste(0, (0, 0, buffer.width, buffer.height))
-            
-            # Ekran boyutlarını al
-            width, height = buffer.width, buffer.height
-            center_x, center_y = width // 2, height // 2
-            
-            # Performans optimizasyonu: Duygu tipi haritasını önbelleğe alma
-            if not hasattr(self, "_emotion_subtypes_map"):
-                # Alt duygu tiplerini ana duygulara eşle (draw_eyes metodu ile paylaşılacak)
-                self._emotion_subtypes_map = {
-                    # Happy alt tipleri
-                    "joy": "happy", "content": "happy", "excited": "excited",
-                    "amused": "happy", "proud": "happy",
-                    
-                    # Sad alt tipleri
-                    "disappointed": "sad", "lonely": "sad", "depressed": "sad",
-                    "miserable": "sad", "guilty": "sad",
-                    
-                    # Angry alt tipleri
-                    "frustrated": "angry", "irritated": "angry", "enraged": "angry",
-                    "annoyed": "angry", "bitter": "angry",
-                    
-                    # Surprised alt tipleri
-                    "amazed": "surprised", "astonished": "surprised", "shocked": "surprised",
-                    "startled": "surprised", "confused": "confused",
-                    
-                    # Fearful alt tipleri
-                    "anxious": "fearful", "terrified": "fearful", "nervous": "fearful", 
-                    "worried": "fearful", "scared": "fearful",
-                    
-                    # Disgusted alt tipleri
-                    "disapproval": "disgusted", "revolted": "disgusted", "judgmental": "disgusted",
-                    "avoidant": "disgusted", "loathing": "disgusted",
-                    
-                    # Calm alt tipleri
-                    "relaxed": "calm", "peaceful": "calm", "serene": "calm",
-                    "tranquil": "calm", "composed": "calm",
-                    
-                    # Neutral alt tipleri
-                    "indifferent": "neutral", "objective": "neutral", "detached": "neutral", 
-                    "unconcerned": "neutral", "balanced": "neutral",
-                    
-                    # Özel duygu ifadeleri
-                    "sleepy": "sleepy", "bored": "bored", "love": "love"
-                }
-            
-            # Alt duygu tipi analizi ve görsel ifade seçimi - önbelleği kullan
-            base_emotion = emotion
-            if emotion in self._emotion_subtypes_map:
-                base_emotion = self._emotion_subtypes_map[emotion]
-            
-            # Performans optimizasyonu: Sık kullanılan parametreleri önbelleğe al
-            # Ağız boyutları için standart değerler - birçok duyguda tekrar kullanılır
-            standard_mouth_width = width * 2 // 3
-            standard_mouth_height = height // 3
-            
-            # Happy duygu tipi ve alt tipleri
-            if base_emotion == "happy":
-                mouth_width = standard_mouth_width
-                mouth_height = standard_mouth_height
-                
-                # Alt tiplere göre ağız ifadesi ayarlaması
-                if emotion == "joy":
-                    # Geniş gülümseme, dişler gösterilir
-                    arc_coords = (center_x - mouth_width//2, center_y - mouth_height//2,
-                                center_x + mouth_width//2, center_y + mouth_height)
-                    draw.arc(arc_coords, 0, 180, fill=1, width=2)
-                    
-                    # Diş çizgisi
-                    line_coords = [(center_x - mouth_width//3, center_y), 
-                                  (center_x + mouth_width//3, center_y)]
-                    draw.line(line_coords, fill=1, width=1)
-                        
-                elif emotion == "content":
-                    # Orta seviyeli gülümseme
-                    arc_coords = (center_x - mouth_width//2, center_y - mouth_height//4,
-                                center_x + mouth_width//2, center_y + mouth_height//2)
-                    draw.arc(arc_coords, 0, 180, fill=1, width=2)
-                    
-                elif emotion == "amused":
-                    # Eğlenen gülümseme, biraz daha geniş
-                    arc_coords = (center_x - mouth_width//2, center_y - mouth_height//4,
-                                center_x + mouth_width//2, center_y + mouth_height//2)
-                    draw.arc(arc_coords, 0, 180, fill=1, width=2)
-                    
-                    # Küçük bir çizgi daha ekle, gülüşü vurgulamak için
-                    small_arc_coords = (center_x - mouth_width//4, center_y, 
-                                      center_x + mouth_width//4, center_y + mouth_height//4)
-                    draw.arc(small_arc_coords, 0, 180, fill=1, width=1)
-                    
-                elif emotion == "proud":
-                    # Gurur duyduğunu gösteren gülümseme, daha ölçülü
-                    arc_coords = (center_x - mouth_width//2, center_y - mouth_height//8,
-                                center_x + mouth_width//2, center_y + mouth_height//3)
-                    draw.arc(arc_coords, 0, 180, fill=1, width=2)
-                    
-                else:
-                    # Varsayılan mutlu ağız
-                    arc_coords = (center_x - mouth_width//2, center_y - mouth_height//4,
-                                center_x + mouth_width//2, center_y + mouth_height//2)
-                    draw.arc(arc_coords, 0, 180, fill=1, width=2)
-            
-            # Sad duygu tipi ve alt tipleri
-            elif base_emotion == "sad":
-                mouth_width = standard_mouth_width
-                mouth_height = standard_mouth_height
-                
-                # Alt tiplere göre ağız ifadesi ayarlaması - ortak parametreleri önbelleğe al
-                arc_params = {
-                    "depressed": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//2,
-                                center_x + mouth_width//2, center_y - mouth_height//4),
-                        "line": None
-                    },
-                    "miserable": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//2,
-                                center_x + mouth_width//2, center_y - mouth_height//3),
-                        "line": [(center_x - mouth_width//4, center_y + mouth_height//8),
-                              (center_x + mouth_width//4, center_y + mouth_height//8)]
-                    },
-                    "guilty": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//3,
-                                center_x + mouth_width//2, center_y - mouth_height//8),
-                        "line": None
-                    },
-                    "lonely": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//3,
-                                center_x + mouth_width//2, center_y - mouth_height//8),
-                        "line": None
-                    },
-                    "disappointed": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//4,
-                                center_x + mouth_width//2, center_y - mouth_height//8),
-                        "line": None
-                    },
-                    "default": {
-                        "coords": (center_x - mouth_width//2, center_y + mouth_height//4,
-                                center_x + mouth_width//2, center_y - mouth_height//8),
-                        "line": None
-                    }
-                }
-                
-                # Parametreleri seç
-                params = arc_params.get(emotion, arc_params["default"])
-                
-                # Arc çiz
-                draw.arc(params["coords"], 180, 360, fill=1, width=2)
-                
-                # Ek çizgi varsa çiz
-                if params["line"]:
-                    draw.line(params["line"], fill=1, width=1)
-            
-            # Angry duygu tipi ve alt tipleri
-            elif base_emotion == "angry":
-                mouth_width = standard_mouth_width
-                
-                # Alt tiplere göre ağız ifadesi seçimi
-                if emotion == "enraged":
-                    # Çok kızgın ağız - dişler görünüyor ve açık
-                    rect_coords = (center_x - mouth_width//2, center_y - height//8,
-                                  center_x + mouth_width//2, center_y + height//4)
-                    draw.rectangle(rect_coords, outline=1)
-                    
-                    # Diş çizgileri
-                    for i in range(5):
-                        x = center_x - mouth_width//3 + (mouth_width*2//3) * i // 4
-                        tooth_coords = [(x, center_y - height//8), (x, center_y + height//4)]
-                        draw.line(tooth_coords, fill=1, width=1)
-                    
-                elif emotion == "frustrated" or emotion == "irritated":
-                    # Sinirli/tahriş olmuş ağız - sıkılmış
-                    line_coords = [(center_x - mouth_width//2, center_y),
-                                  (center_x + mouth_width//2, center_y)]
-                    draw.line(line_coords, fill=1, width=3)
-                
-                elif emotion == "bitter":
-                    # Acı ağız - aşağı bükük ve sıkı
-                    arc_coords = (center_x - mouth_width//2, center_y + height//6,
-                                 center_x + mouth_width//2, center_y - height//8)
-                    draw.arc(arc_coords, 190, 350, fill=1, width=2)
-                    
-                else:
-                    # Varsayılan kızgın ağız - düz çizgi
-                    line_coords = [(center_x - mouth_width//2, center_y + height//20),
-                                  (center_x + mouth_width//2, center_y + height//20)]
-                    draw.line(line_coords, fill=1, width=2)
-            
-            # Surprised duygu tipi ve alt tipleri
-            elif base_emotion == "surprised":
-                # Performans optimizasyonu: Ortak elips parametrelerini hesapla
-                ellipse_params = {
-                    "shocked": (center_x - width//4, center_y - height//6,
-                               center_x + width//4, center_y + height//4),
-                    "amazed": (center_x - width//4, center_y - height//8,
-                              center_x + width//4, center_y + height//4),
-                    "startled": (center_x - width//5, center_y - height//10,
-                                center_x + width//5, center_y + height//5),
-                    "astonished": (center_x - width//4, center_y - height//6,
-                                  center_x + width//4, center_y + height//4),
-                    "default": (center_x - width//5, center_y - height//8,
-                               center_x + width//5, center_y + height//5)
-                }
-                
-                # Parametreleri seç
-                ellipse_coords = ellipse_params.get(emotion, ellipse_params["default"])
-                
-                # Elips çiz
-                draw.ellipse(ellipse_coords, outline=1, width=2)
-                
-                # Ek özellikler
-                if emotion == "astonished":
-                    # Ünlem işareti
-                    line_coords = [(center_x, center_y - height//10), 
-                                  (center_x, center_y + height//10)]
-                    draw.line(line_coords, fill=1, width=1)
-                    
-                    dot_coords = (center_x - 1, center_y + height//8 - 1,
-                                 center_x + 1, center_y + height//8 + 1)
-                    draw.ellipse(dot_coords, fill=1)
-            
-            # Fearful duygu tipi ve alt tipleri
-            elif base_emotion == "fearful":
-                mouth_width = width // 2
-                mouth_height = height // 4
-                
-                # Alt tiplere göre ağız ifadesi ayarlaması
-                if emotion == "terrified":
-                    # Dehşete düşmüş ağız - büyük oval
-                    ellipse_coords = (center_x - width//3, center_y - height//6,
-                                     center_x + width//3, center_y + height//3)
-                    draw.ellipse(ellipse_coords, outline=1, width=2)
-                    
-                elif emotion == "anxious" or emotion == "nervous":
-                    # Endişeli/sinirli ağız - ince ve titrek çizgi
-                    # Performans optimizasyonu: Önbelleğe nokta listesi al
-                    points = []
-                    num_points = 10
-                    
-                    # Daha az rastgele sayı üretimi ile nokta hesaplama
-                    seed_vals = [0, -2, -1, 1, 2, -1, -2, 0, 1, 2]
-                    for i in range(num_points):
-                        x = center_x - mouth_width//2 + mouth_width * i // (num_points-1)
-                        # Titrek çizgi için yarı-rastgele dikey offset
-                        y_offset = seed_vals[i % len(seed_vals)]
-                        points.append((x, center_y + y_offset))
-                    
-                    # Titrek çizgi çiz - tek seferde çiz
-                    for i in range(1, len(points)):
-                        draw.line([points[i-1], points[i]], fill=1, width=1)
-                    
-                elif emotion == "worried" or emotion == "scared":
-                    # Endişeli/korkmuş ağız - aşağı eğimli çizgi
-                    arc_coords = (center_x - mouth_width//2, center_y + mouth_height//2,
-                                 center_x + mouth_width//2, center_y - mouth_height//8)
-                    draw.arc(arc_coords, 190, 350, fill=1, width=2)
-                    
-                else:
-                    # Varsayılan korku ağız ifadesi - hafif oval
-                    ellipse_coords = (center_x - mouth_width//2, center_y - mouth_height//4,
-                                     center_x + mouth_width//2, center_y + mouth_height//2)
-                    draw.ellipse(ellipse_coords, outline=1, width=1)
-            
-            # Disgusted duygu tipi ve alt tipleri
-            elif base_emotion == "disgusted":
-                mouth_width = standard_mouth_width
-                
-                # Alt tiplere göre ağız ifadesi ayarlaması
-                if emotion == "revolted":
-                    # Tiksinen ağız - çok çarpık
-                    # Performans optimizasyonu: Poligon noktalarını tek seferde hesapla
-                    points = [(center_x - mouth_width//2, center_y),
-                             (center_x - mouth_width//4, center_y + height//6),
-                             (center_x, center_y),
-                             (center_x + mouth_width//4, center_y - height//8),
-                             (center_x + mouth_width//2, center_y)]
-                    
-                    # Çizgiyi çiz - tek seferde poligon
-                    for i in range(1, len(points)):
-                        draw.line([points[i-1], points[i]], fill=1, width=2)
-                    
-                elif emotion in ["disapproval", "judgmental"]:
-                    # Onaylamayan/yargılayıcı ağız - tek taraflı aşağı eğimli
-                    arc_coords = (center_x - mouth_width//2, center_y + height//8,
-                                 center_x + mouth_width//2, center_y - height//8)
-                    draw.arc(arc_coords, 200, 340, fill=1, width=2)
-                
-                elif emotion == "loathing":
-                    # Nefret ağzı - çok çarpık ve biraz açık
-                    # Dış çizgi
-                    arc_coords = (center_x - mouth_width//2, center_y + height//6,
-                                 center_x + mouth_width//2, center_y - height//8)
-                    draw.arc(arc_coords, 210, 330, fill=1, width=2)
-                    
-                    # İç çizgi
-                    inner_arc_coords = (center_x - mouth_width//3, center_y + height//10,
-                                       center_x + mouth_width//3, center_y)
-                    draw.arc(inner_arc_coords, 210, 330, fill=1, width=1)
-                
-                else:
-                    # Varsayılan tiksinme ifadesi
-                    arc_coords = (center_x - mouth_width//2, center_y + height//10,
-                                 center_x + mouth_width//2, center_y - height//10)
-                    draw.arc(arc_coords, 190, 350, fill=1, width=2)
-            
-            # Confused duygu tipi
-            elif emotion == "confused":
-                # Kafası karışık ağız - zikzak veya dalgalı
-                mouth_width = standard_mouth_width
-                mouth_height = height // 6
-                
-                # Performans optimizasyonu: Önişlenmiş zikzak noktaları
-                # Bir kereliğine sinüs hesapla ve önbelleğe al
-                if not hasattr(self, "_confused_wave_points"):
-                    segments = 8
-                    self._confused_wave_points = []
-                    
-                    for i in range(segments + 1):
-                        x_ratio = i / segments
-                        x = center_x - mouth_width // 2 + int(mouth_width * x_ratio)
-                        # Sinüs dalgası şeklinde dikey ofset (daha az hesaplama)
-                        y_offset = int(math.sin(i * math.pi / 2) * mouth_height / 3)
-                        self._confused_wave_points.append((x, center_y + y_offset))
-                
-                # Önbelleğe alınmış noktaları kullan
-                for i in range(len(self._confused_wave_points) - 1):
-                    draw.line([self._confused_wave_points[i], 
-                              self._confused_wave_points[i+1]], fill=1, width=2)
-            
-            # Excited duygu tipi
-            elif emotion == "excited":
-                # Heyecanlı ağız - büyük açık gülümseme
-                mouth_width = width * 3 // 4
-                mouth_height = height // 2
-                
-                # Eliptik gülümseme
-                outer_arc_coords = (center_x - mouth_width // 2, center_y - mouth_height // 3, 
-                                   center_x + mouth_width // 2, center_y + mouth_height)
-                draw.arc(outer_arc_coords, 0, 180, fill=1, width=2)
-                
-                # İç çizgi (diş veya dil)
-                inner_arc_coords = (center_x - mouth_width // 3, center_y, 
-                                   center_x + mouth_width // 3, center_y + mouth_height // 2)
-                draw.arc(inner_arc_coords, 0, 180, fill=1, width=1)
-            
-            # Bored duygu tipi
-            elif emotion == "bored":
-                # Sıkılmış ağız - çok az eğri, neredeyse düz
-                mouth_width = width // 2
-                
-                # Hafif aşağı eğri
-                arc_coords = (center_x - mouth_width // 2, center_y - 5, 
-                             center_x + mouth_width // 2, center_y + 15)
-                draw.arc(arc_coords, 190, 350, fill=1, width=2)
-            
-            # Sleepy duygu tipi
-            elif emotion == "sleepy":
-                # Uykulu ağız - esniyor gibi
-                mouth_width = width // 3
-                mouth_height = height // 3
-                
-                # Oval ağız
-                ellipse_coords = (center_x - mouth_width // 2, center_y - mouth_height // 2, 
-                                 center_x + mouth_width // 2, center_y + mouth_height // 2)
-                draw.ellipse(ellipse_coords, outline=1, width=2)
-                
-                # İçine "Z" harfi çiz (uyku sembolü)
-                z_width = mouth_width // 3
-                z_height = mouth_height // 3
-                z_x = center_x + z_width // 2
-                z_y = center_y - z_height // 2
-                
-                # Z harfini oluşturan çizgiler
-                z_top = (z_x - z_width, z_y - z_height, z_x + z_width, z_y - z_height)
-                z_diag = (z_x + z_width, z_y - z_height, z_x - z_width, z_y + z_height)
-                z_bottom = (z_x - z_width, z_y + z_height, z_x + z_width, z_y + z_height)
-                
-                draw.line(z_top, fill=1)
-                draw.line(z_diag, fill=1)
-                draw.line(z_bottom, fill=1)
-            
-            # Love duygu tipi
-            elif emotion == "love":
-                # Aşık ağız - büyük gülümseme, kalp şekli
-                mouth_width = standard_mouth_width
-                mouth_height = height // 3
-                
-                # Geniş gülümseme
-                arc_coords = (center_x - mouth_width // 2, center_y - mouth_height, 
-                             center_x + mouth_width // 2, center_y + mouth_height)
-                draw.arc(arc_coords, 0, 180, fill=1, width=2)
-                
-                # Küçük kalp (ağzın üzerinde) - performans için optimize edilmiş
-                heart_size = mouth_height // 2
-                heart_y = center_y - mouth_height - heart_size
-                
-                # İki daire yan yana - tek seferde hesapla
-                left_circle = (center_x - heart_size, heart_y, 
-                             center_x, heart_y + heart_size)
-                right_circle = (center_x, heart_y, 
-                              center_x + heart_size, heart_y + heart_size)
-                
-                draw.ellipse(left_circle, fill=1)
-                draw.ellipse(right_circle, fill=1)
-                
-                # Üçgen (kalp alt kısmı)
-                heart_points = [(center_x - heart_size, heart_y + heart_size // 2),
-                               (center_x + heart_size, heart_y + heart_size // 2),
-                               (center_x, heart_y + heart_size * 2)]
-                draw.polygon(heart_points, fill=1)
-                
-            # Calm duygu tipi ve alt tipleri
-            elif base_emotion == "calm":
-                mouth_width = standard_mouth_width
-                
-                # Alt tiplere göre ağız ifadesi parametrelerini önbelleğe al
-                arc_params = {
-                    "relaxed": {
-                        "coords": (center_x - mouth_width//2, center_y - height//16,
-                                 center_x + mouth_width//2, center_y + height//6),
-                        "angles": (0, 180)
-                    },
-                    "peaceful": {
-                        "coords": (center_x - mouth_width//2, center_y - height//16,
-                                 center_x + mouth_width//2, center_y + height//6),
-                        "angles": (0, 180)
-                    },
-                    "serene": {
-                        "coords": (center_x - mouth_width//2, center_y - height//10,
-                                 center_x + mouth_width//2, center_y + height//20),
-                        "angles": (0, 180)
-                    },
-                    "tranquil": {
-                        "coords": (center_x - mouth_width//2, center_y - height//10,
-                                 center_x + mouth_width//2, center_y + height//20),
-                        "angles": (0, 180)
-                    },
-                    "default": {
-                        "coords": [(center_x - mouth_width//2, center_y),
-                                  (center_x + mouth_width//2, center_y)],
-                        "angles": None  # Çizgi için açı yok
-                    }
-                }
-                
-                params = arc_params.get(emotion, arc_params["default"])
-                
-                # Eğer açılar tanımlandıysa arc çiz, değilse çizgi
-                if params["angles"]:
-                    draw.arc(params["coords"], params["angles"][0], params["angles"][1], 
-                            fill=1, width=1)
-                else:
-                    draw.line(params["coords"], fill=1, width=1)
-            
-            # Neutral duygu tipi ve alt tipleri
-            elif base_emotion == "neutral":
-                mouth_width = standard_mouth_width
-                
-                # Alt tiplere göre ağız ifadesi - parametre sözlüğü
-                neutral_params = {
-                    "detached": {
-                        "type": "line",
-                        "coords": [(center_x - mouth_width//2, center_y),
-                                  (center_x + mouth_width//2, center_y)]
-                    },
-                    "objective": {
-                        "type": "line",
-                        "coords": [(center_x - mouth_width//2, center_y),
-                                  (center_x + mouth_width//2, center_y)]
-                    },
-                    "indifferent": {
-                        "type": "arc",
-                        "coords": (center_x - mouth_width//2, center_y + height//30,
-                                 center_x + mouth_width//2, center_y - height//30),
-                        "angles": (190, 350)
-                    },
-                    "unconcerned": {
-                        "type": "arc",
-                        "coords": (center_x - mouth_width//2, center_y + height//30,
-                                 center_x + mouth_width//2, center_y - height//30),
-                        "angles": (190, 350)
-                    },
-                    "default": {
-                        "type": "line",
-                        "coords": [(center_x - mouth_width//2, center_y),
-                                  (center_x + mouth_width//2, center_y)]
-                    }
-                }
-                
-                params = neutral_params.get(emotion, neutral_params["default"])
-                
-                # Parametre türüne göre çiz
-                if params["type"] == "arc":
-                    draw.arc(params["coords"], params["angles"][0], params["angles"][1],
-                            fill=1, width=1)
-                else:
-                    draw.line(params["coords"], fill=1, width=1)
-            
-            # Diğer durumlar için varsayılan hafif gülümseme
-            else:
-                # Nötr ağız - hafif gülümseme
-                mouth_width = standard_mouth_width
-                arc_coords = (center_x - mouth_width//2, center_y - height//20,
-                             center_x + mouth_width//2, center_y + height//10)
-                draw.arc(arc_coords, 0, 180, fill=1, width=1)
+            key = (self.theme_name, "mouth", emotion, None, None)
+            sprite = self.sprite_cache.get_or_render(
+                key, buffer.size,
+                lambda draw, w, h: self._render_mouth(draw, w, h, emotion)
+            )
+            self.framebuffers["mouth"].blit(sprite)
             
         except Exception as e:
             logger.error(f"Ağız çizilirken hata: {e}")
             # Hata durumunda basit bir ağız çiz
             try:
+                draw = self.draw_objects["mouth"]
                 width, height = buffer.width, buffer.height
                 center_x, center_y = width // 2, height // 2
                 
                 # Basit düz çizgi
+                buffer.paste(0, (0, 0, width, height))
                 draw.line([(center_x - width//4, center_y), 
                           (center_x + width//4, center_y)], 
                          fill=1, width=1)
+                self.buffers_drawn["mouth"] = True
             except:
                 pass
+    
+    def warm_sprite_cache(self) -> None:
+        """
+        Sprite önbelleğini arka planda ısıtır
+        
+        Mevcut duygu için tüm göz bebeği ofsetleri, diğer duygular için
+        ortalanmış ve kapalı gözler, konuşma açıklık seviyeleri ile tüm ağız
+        ifadeleri önceden çizilir.
+        """
+        sizes = {name: buffer.size for name, buffer in self.buffers.items() if buffer is not None}
+        if not sizes:
+            return
+        
+        theme = self.theme_name
+        current = self._get_base_emotion(
+            self.config.get("emotions", {}).get("default_emotion", "neutral"))
+        base_emotions = [current] + [e for e in BASE_EMOTIONS if e != current]
+        
+        def jobs():
+            for base_emotion in base_emotions:
+                for eye_name in ("left_eye", "right_eye"):
+                    if eye_name not in sizes:
+                        continue
+                    width, height = sizes[eye_name]
+                    if base_emotion == current:
+                        offsets = list(self._iter_pupil_offsets(width, height, eye_name, base_emotion))
+                    else:
+                        offsets = [(0, 0)]
+                    
+                    # Kapalı göz
+                    yield ((theme, eye_name, base_emotion, False, (0, 0)), (width, height),
+                           lambda draw, w, h, n=eye_name, e=base_emotion:
+                               self._render_eye(draw, w, h, n, e, False, (0, 0)))
+                    
+                    # Açık göz
+                    for offset in offsets:
+                        yield ((theme, eye_name, base_emotion, True, offset), (width, height),
+                               lambda draw, w, h, n=eye_name, e=base_emotion, o=offset:
+                                   self._render_eye(draw, w, h, n, e, True, o))
+            
+            if "mouth" in sizes:
+                for level in range(self.speaking_levels):
+                    yield (self._get_speaking_sprite_key(level), sizes["mouth"],
+                           lambda draw, w, h, l=level: self._render_speaking_mouth(draw, w, h, l))
+                for emotion in MOUTH_EMOTIONS:
+                    yield ((theme, "mouth", emotion, None, None), sizes["mouth"],
+                           lambda draw, w, h, e=emotion: self._render_mouth(draw, w, h, e))
+        
+        self.sprite_cache.warm(jobs())
+        logger.debug(f"Sprite önbelleği ısıtılıyor: tema={theme}, duygu={current}")
+    
+    def set_theme(self, theme_name: str, geometry: Optional[ThemeGeometry] = None) -> None:
+        """
+        Aktif temayı değiştirir ve sprite önbelleğini yeni tema için ısıtır
+        
+        Args:
+            theme_name (str): Tema adı
+            geometry (Optional[ThemeGeometry]): Tema yöneticisinin derlediği geometri
+                (None ise theme.json dosyasından yüklenir)
+        """
+        if theme_name == self.theme_name and (geometry is None or geometry is self.geometry):
+            return
+        
+        if geometry is None:
+            geometry = load_theme_geometry(theme_name)
+        
+        self.theme_name = theme_name
+        self.geometry = geometry
+        self.sprite_cache.clear()
+        self.morph_cache.clear()
+        self.warm_sprite_cache()
+        self.mark_dirty()
+        logger.info(f"OLED teması değiştirildi: {theme_name}")
+
 
     def _draw_startup_eye_animation(self, eye_name: str) -> None:
         """
@@ -897,7 +733,7 @@ class OLEDDisplayMixin:
         
         # İlk aşama: Ekranı temizle
         draw.rectangle((0, 0, width, height), fill=0)
-        self.update_display()
+        self.show_buffer(eye_name)
         time.sleep(0.3)
         
         # İkinci aşama: Dışarıdan içeriye doğru büyüyen daireler
@@ -908,7 +744,7 @@ class OLEDDisplayMixin:
                 (center_x - radius, center_y - radius, center_x + radius, center_y + radius),
                 outline=1
             )
-            self.update_display()
+            self.show_buffer(eye_name)
             time.sleep(0.05)
         
         # Üçüncü aşama: Göz bebeği oluştur
@@ -918,7 +754,7 @@ class OLEDDisplayMixin:
             center_x + pupil_size, center_y + pupil_size),
             fill=1
         )
-        self.update_display()
+        self.show_buffer(eye_name)
         time.sleep(0.2)
         
         # Dördüncü aşama: Göz kırpma
@@ -927,7 +763,7 @@ class OLEDDisplayMixin:
             (center_x - max_radius, center_y, center_x + max_radius, center_y),
             fill=1, width=3
         )
-        self.update_display()
+        self.show_buffer(eye_name)
         time.sleep(0.2)
         
         # Son aşama: Standart göze geri dön
@@ -942,7 +778,7 @@ class OLEDDisplayMixin:
             center_x + pupil_size, center_y + pupil_size),
             fill=1
         )
-        self.update_display()
+        self.show_buffer(eye_name)
     
     def _draw_startup_mouth_animation(self) -> None:
         """
@@ -957,7 +793,7 @@ class OLEDDisplayMixin:
         
         # İlk aşama: Ekranı temizle
         draw.rectangle((0, 0, width, height), fill=0)
-        self.update_display()
+        self.show_buffer("mouth")
         time.sleep(0.3)
         
         # İkinci aşama: Düz bir çizgi çiz
@@ -966,7 +802,7 @@ class OLEDDisplayMixin:
             (center_x - mouth_width // 2, center_y, center_x + mouth_width // 2, center_y),
             fill=1, width=2
         )
-        self.update_display()
+        self.show_buffer("mouth")
         time.sleep(0.5)
         
         # Üçüncü aşama: Yavaşça gülümsemeye dönüştür
@@ -989,7 +825,7 @@ class OLEDDisplayMixin:
                 0, 180, fill=1, width=2
             )
             
-            self.update_display()
+            self.show_buffer("mouth")
             time.sleep(0.05)
         
         # Son aşama: Biraz bekle
@@ -1035,12 +871,7 @@ class OLEDDisplayMixin:
         """
         for eye_name in ["left_eye", "right_eye"]:
             if eye_name in self.displays and self.displays[eye_name] is not None:
-                draw = self.draw_objects[eye_name]
-                buffer = self.buffers[eye_name]
-                width, height = buffer.width, buffer.height
-                
-                # Ekranı temizle
-                draw.rectangle((0, 0, width, height), fill=0)
+                self.framebuffers[eye_name].clear()
                 
         self.update_display()
 
@@ -1049,12 +880,7 @@ class OLEDDisplayMixin:
         Ağız ekranını temizler
         """
         if "mouth" in self.displays and self.displays["mouth"] is not None:
-            draw = self.draw_objects["mouth"]
-            buffer = self.buffers["mouth"]
-            width, height = buffer.width, buffer.height
-            
-            # Ekranı temizle
-            draw.rectangle((0, 0, width, height), fill=0)
+            self.framebuffers["mouth"].clear()
             
         self.update_display()
         
@@ -1062,85 +888,125 @@ class OLEDDisplayMixin:
         """
         Gözlerde büyüyen çember animasyonu gösterir
         
+        Çağıran iş parçacığını bloklamaz; çember adımları animasyon döngüsü tarafından
+        çizilir. Son adımda göz bebeği eklenir, ardından gözler normal çizime döner.
+        
         Args:
             duration (float): Animasyon süresi (saniye)
         """
+        if not any(self.displays.get(eye_name) is not None for eye_name in ["left_eye", "right_eye"]):
+            return
+        
+        # Büyüyen çemberler için adım sayısı (saniyede 10 adım)
+        step_count = max(1, int(10 * duration))
+        self.growing_circle = (self.clock.time(), max(0.0, duration) / step_count, step_count)
+        
+        self.last_activity_time = self.clock.time()
+        if self.power_mode == "off" or self.power_mode == "dim":
+            self.set_power_mode("on")
+        self._update_growing_circle()
+    
+    def _get_growing_circle_level(self, now: float) -> Optional[int]:
+        """
+        Büyüyen çemberin şimdiki adımını hesaplar; süre dolduysa animasyonu bitirir
+        
+        Args:
+            now (float): Şimdiki zaman
+            
+        Returns:
+            Optional[int]: Adım (0 - adım sayısı, son adım göz bebekli), animasyon yoksa None
+        """
+        if self.growing_circle is None:
+            return None
+        
+        start_time, step_time, step_count = self.growing_circle
+        level = int((now - start_time) / step_time) if step_time > 0 else step_count
+        if level > step_count:
+            self.growing_circle = None
+            return None
+        return max(0, level)
+    
+    def _update_growing_circle(self) -> None:
+        """
+        Büyüyen çember adımını günceller; adım değiştiyse yüzü kirli işaretler
+        """
+        if self.growing_circle is None and self.growing_circle_level is None:
+            return
+        
+        level = self._get_growing_circle_level(self.clock.time())
+        if level != self.growing_circle_level:
+            self.growing_circle_level = level
+            self.mark_dirty()
+    
+    def _render_growing_circle(self, draw, width: int, height: int, level: int, step_count: int) -> None:
+        """
+        Büyüyen çemberin bir adımını çizer
+        
+        Args:
+            draw (ImageDraw): Çizim nesnesi (boş bir 1-bit görüntü üzerinde)
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            level (int): Adım
+            step_count (int): Adım sayısı
+        """
+        center_x, center_y = width // 2, height // 2
+        
+        # Maksimum yarıçap
+        max_radius = min(width, height) // 2
+        radius = max(1, int((min(level, step_count - 1) / step_count) * max_radius))
+        
+        # Çemberi çiz
+        draw.ellipse(
+            (center_x - radius, center_y - radius, center_x + radius, center_y + radius),
+            outline=1
+        )
+        
+        # Son olarak göz bebeği ekle
+        if level >= step_count:
+            pupil_size = max_radius // 3
+            draw.ellipse(
+                (center_x - pupil_size, center_y - pupil_size,
+                 center_x + pupil_size, center_y + pupil_size),
+                fill=1
+            )
+    
+    def draw_growing_circle(self, level: int) -> None:
+        """
+        Göz ekranlarına büyüyen çemberin bir adımını çizer
+        
+        Args:
+            level (int): Adım
+        """
+        step_count = self.growing_circle[2] if self.growing_circle is not None else max(1, level)
+        
         for eye_name in ["left_eye", "right_eye"]:
-            if eye_name in self.displays and self.displays[eye_name] is not None:
-                buffer = self.buffers[eye_name]
-                draw = self.draw_objects[eye_name]
-                
-                # Ekran boyutlarını al
-                width, height = buffer.width, buffer.height
-                center_x, center_y = width // 2, height // 2
-                
-                # Maksimum yarıçap
-                max_radius = min(width, height) // 2
-                
-                # Büyüyen çemberler için adım sayısı
-                step_count = int(10 * duration)
-                
-                # Ekranı temizle
-                draw.rectangle((0, 0, width, height), fill=0)
-                self.update_display()
-                
-                # Büyüyen çember
-                for i in range(step_count):
-                    radius = int((i / step_count) * max_radius)
-                    if radius < 1:
-                        radius = 1
-                    
-                    # Ekranı temizle
-                    draw.rectangle((0, 0, width, height), fill=0)
-                    
-                    # Çemberi çiz
-                    draw.ellipse(
-                        (center_x - radius, center_y - radius, center_x + radius, center_y + radius),
-                        outline=1
-                    )
-                    
-                    self.update_display()
-                    time.sleep(duration / step_count)
-                
-                # Son olarak göz bebeği ekle
-                pupil_size = max_radius // 3
-                draw.ellipse(
-                    (center_x - pupil_size, center_y - pupil_size, 
-                     center_x + pupil_size, center_y + pupil_size),
-                    fill=1
-                )
-                self.update_display()
+            if self.displays[eye_name] is None or self.draw_objects[eye_name] is None:
+                continue
+            
+            buffer = self.buffers[eye_name]
+            key = (self.theme_name, "eyes_growing_circle", level, step_count, None)
+            sprite = self.sprite_cache.get_or_render(
+                key, buffer.size,
+                lambda draw, w, h: self._render_growing_circle(draw, w, h, level, step_count)
+            )
+            self.framebuffers[eye_name].blit(sprite)
     
     def blink(self, duration: float = 0.2) -> None:
         """
         Göz kırpma animasyonu gösterir
         
+        Çağıran iş parçacığını bloklamaz; gözler göz kırpma durum makinesiyle kapatılır
+        ve süre sonunda animasyon döngüsü tarafından açılır.
+        
         Args:
             duration (float): Kırpma süresi (saniye)
         """
-        for eye_name in ["left_eye", "right_eye"]:
-            if eye_name in self.displays and self.displays[eye_name] is not None:
-                buffer = self.buffers[eye_name]
-                draw = self.draw_objects[eye_name]
-                
-                # Ekran boyutlarını al
-                width, height = buffer.width, buffer.height
-                center_x, center_y = width // 2, height // 2
-                
-                # Mevcut ekran içeriğini yedekle
-                original_image = buffer.copy()
-                
-                # Ekranı temizle ve yatay çizgi çiz
-                draw.rectangle((0, 0, width, height), fill=0)
-                draw.line((0, center_y, width, center_y), fill=1, width=3)
-                self.update_display()
-                
-                # Belirlenen süre kadar bekle
-                time.sleep(duration)
-                
-                # Orijinal görüntüyü geri yükle
-                self.buffers[eye_name].paste(original_image)
-                self.update_display()
+        if not any(self.displays.get(eye_name) is not None for eye_name in ["left_eye", "right_eye"]):
+            return
+        
+        self.blink_state = False
+        self.next_blink_time = self.clock.time() + max(0.0, duration)
+        self.mark_dirty()
     
     def show_mouth_expression(self, emotion: str = "happy", intensity: float = 0.7) -> None:
         """
@@ -1151,85 +1017,186 @@ class OLEDDisplayMixin:
             intensity (float): İfade yoğunluğu
         """
         if "mouth" in self.displays and self.displays["mouth"] is not None:
-            # Ekranı temizle
-            self.clear_mouth()
-            
-            # Ağız ifadesini çiz
+            # Ağız sprite'ı ekranın tamamını kaplar; önce temizleyip boş kare göndermeye gerek yok
             self.draw_mouth(emotion)
             self.update_display()
     
-    def animate_mouth_speaking(self, duration: float = 1.0, pattern: str = "default", volume: float = 0.5) -> None:
+    def _get_speaking_sprite_key(self, level: int) -> Tuple:
         """
-        Konuşma animasyonuyla ağzın hareket etmesini sağlar
+        Konuşma ağzı sprite'ının önbellek anahtarını döndürür
         
         Args:
-            duration (float): Animasyon süresi
-            pattern (str): Konuşma deseni
-            volume (float): Ses seviyesi (0.0-1.0 arası), ağız açıklığını etkiler
-        """
-        if "mouth" not in self.displays or self.displays["mouth"] is None:
-            return
+            level (int): Açıklık seviyesi
             
-        buffer = self.buffers["mouth"]
-        draw = self.draw_objects["mouth"]
+        Returns:
+            Tuple: Sprite anahtarı
+        """
+        return (self.theme_name, "mouth_speaking", level, self.speaking_levels, None)
+    
+    def _render_speaking_mouth(self, draw, width: int, height: int, level: int) -> None:
+        """
+        Bir açıklık seviyesindeki konuşma ağzını çizer
         
-        # Ekran boyutlarını al
-        width, height = buffer.width, buffer.height
+        Args:
+            draw (ImageDraw): Çizim nesnesi (boş bir 1-bit görüntü üzerinde)
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            level (int): Açıklık seviyesi (0: kapalı, speaking_levels - 1: tam açık)
+        """
+        mouth_open = level / (self.speaking_levels - 1)
         
-        # Konuşma için ağız durumları
-        states = 5
-        iterations = int(duration * 4)  # Saniyede yaklaşık 4 durum değişikliği
+        center_x, center_y = width // 2, height // 2
+        mouth_width = int(width * 0.6)
+        mouth_height = int(height * 0.2 * mouth_open) + 3
         
-        # Konuşma desenleri
-        patterns = {
-            "default": [0, 1, 2, 3, 4, 3, 2, 1],
-            "fast": [0, 2, 4, 2, 0, 3, 1],
-            "slow": [0, 1, 2, 2, 3, 3, 4, 4, 3, 3, 2, 2, 1, 1]
-        }
+        # Ağız dış çizgisi
+        draw.ellipse(
+            (center_x - mouth_width // 2, center_y - mouth_height // 2,
+             center_x + mouth_width // 2, center_y + mouth_height // 2),
+            outline=1
+        )
         
-        # Deseni seç (yoksa varsayılanı kullan)
-        speak_pattern = patterns.get(pattern, patterns["default"])
+        # Ağız içi (konuşurken açık ağız için)
+        if mouth_open > 0.1:
+            inner_height = max(1, int(mouth_height * 0.7))
+            draw.ellipse(
+                (center_x - mouth_width // 2 + 3, center_y - inner_height // 2,
+                 center_x + mouth_width // 2 - 3, center_y + inner_height // 2),
+                fill=1
+            )
+    
+    def draw_speaking_mouth(self, level: int) -> None:
+        """
+        Konuşma ağzını sprite önbelleğinden ağız ekranına kopyalar
         
-        # Ses seviyesini normalize et (0.0-1.0 arası)
-        volume = max(0.0, min(1.0, volume))
+        Args:
+            level (int): Açıklık seviyesi
+        """
+        if self.displays["mouth"] is None or self.draw_objects["mouth"] is None:
+            return
         
-        for i in range(iterations):
-            # Ağzı temizle
-            draw.rectangle((0, 0, width, height), fill=0)
-            
-            # Konuşma durumuna göre ağzı çiz
-            state = speak_pattern[i % len(speak_pattern)]
-            
-            # Ağız açıklığı hesaplama (ses seviyesi ile etkilenir)
-            # 0: kapalı, 4: tam açık - ses seviyesi ağız açıklığını artırır
-            raw_mouth_open = state / 4
-            
-            # Ses seviyesi düşükse ağız daha az açılır, yüksekse daha fazla açılır
-            mouth_open = raw_mouth_open * (0.3 + 0.7 * volume)
-            
-            # Ağız şeklini çiz
-            center_x, center_y = width // 2, height // 2
-            mouth_width = int(width * 0.6)
-            mouth_height = int(height * 0.2 * mouth_open) + 3
-            
-            # Ağız dış çizgisi
-            draw.ellipse(
-                (center_x - mouth_width // 2, center_y - mouth_height // 2,
-                 center_x + mouth_width // 2, center_y + mouth_height // 2),
-                outline=1
+        try:
+            sprite = self.sprite_cache.get_or_render(
+                self._get_speaking_sprite_key(level), self.buffers["mouth"].size,
+                lambda draw, w, h: self._render_speaking_mouth(draw, w, h, level)
             )
+            self.framebuffers["mouth"].blit(sprite)
+        except Exception as e:
+            logger.error(f"Konuşma ağzı çizilirken hata: {e}")
+    
+    def _quantize_openness(self, openness: float) -> int:
+        """
+        Ağız açıklığını önceden çizilmiş seviyelerden birine yuvarlar
+        
+        Args:
+            openness (float): Ağız açıklığı (0.0-1.0)
             
-            # Ağız içi (konuşurken açık ağız için)
-            if mouth_open > 0.1:
-                inner_height = max(1, int(mouth_height * 0.7))
-                draw.ellipse(
-                    (center_x - mouth_width // 2 + 3, center_y - inner_height // 2,
-                     center_x + mouth_width // 2 - 3, center_y + inner_height // 2),
-                    fill=1
-                )
+        Returns:
+            int: Açıklık seviyesi
+        """
+        openness = max(0.0, min(1.0, openness))
+        return int(round(openness * (self.speaking_levels - 1)))
+    
+    def _get_speaking_level(self, now: float) -> Optional[int]:
+        """
+        Zamanlanmış desen veya ses seviyesine göre çizilecek açıklık seviyesini hesaplar
+        
+        Args:
+            now (float): Şu anki zaman
             
-            self.update_display()
-            time.sleep(duration / iterations)
+        Returns:
+            Optional[int]: Açıklık seviyesi veya konuşma yoksa None
+        """
+        pattern = self.speaking_pattern
+        if pattern is not None:
+            states, start_time, end_time, volume = pattern
+            if now < end_time:
+                state = states[int((now - start_time) * SPEAKING_PATTERN_RATE) % len(states)]
+                # Ses seviyesi düşükse ağız daha az açılır, yüksekse daha fazla açılır
+                return self._quantize_openness(state / 4 * (0.3 + 0.7 * volume))
+            self.speaking_pattern = None
+        
+        if self.speaking or self.curves.is_active("mouth_openness"):
+            return self._quantize_openness(self.mouth_openness)
+        return None
+    
+    def _update_speaking(self) -> None:
+        """
+        Konuşma açıklık seviyesini günceller; seviye değiştiyse yüzü kirli işaretler
+        
+        Animasyon döngüsü her karede, ses geri çağırmaları her ölçümde çağırır.
+        """
+        if (self.speaking_level is None and self.speaking_pattern is None and not self.speaking
+                and not self.curves.is_active("mouth_openness")):
+            return
+        
+        level = self._get_speaking_level(self.clock.time())
+        if level != self.speaking_level:
+            self.speaking_level = level
+            self.mark_dirty()
+    
+    def set_speaking_state(self, speaking: bool) -> None:
+        """
+        Konuşma durumunu ayarlar (SoundProcessor konuşma geri çağırması)
+        
+        Args:
+            speaking (bool): Konuşma algılandıysa True
+        """
+        self.speaking = bool(speaking)
+        if self.speaking:
+            self.last_activity_time = self.clock.time()
+            if self.power_mode == "off" or self.power_mode == "dim":
+                self.set_power_mode("on")
+        else:
+            self.mouth_openness = 0.0
+        self._update_speaking()
+    
+    def set_mouth_openness(self, volume: float) -> None:
+        """
+        Ses seviyesine göre ağız açıklığını ayarlar (SoundProcessor ses seviyesi geri çağırması)
+        
+        Yalnızca hedef açıklık kaydedilir; ağız animasyon döngüsünde, seviye
+        değiştiğinde önceden çizilmiş sprite'tan kopyalanır.
+        
+        Args:
+            volume (float): Ses seviyesi (0.0-1.0 arası)
+        """
+        self.mouth_openness = max(0.0, min(1.0, volume * self.speaking_gain))
+        if self.speaking:
+            self._update_speaking()
+    
+    def animate_mouth_speaking(self, duration: float = 1.0, pattern: str = "default", volume: float = 0.5) -> None:
+        """
+        Belirli bir süre konuşma deseniyle ağzın hareket etmesini sağlar
+        
+        Çağıran iş parçacığını bloklamaz; desen animasyon döngüsü tarafından çizilir.
+        
+        Args:
+            duration (float): Animasyon süresi
+            pattern (str): Konuşma deseni ("default", "fast", "slow")
+            volume (float): Ses seviyesi (0.0-1.0 arası), ağız açıklığını etkiler
+        """
+        if "mouth" not in self.displays or self.displays["mouth"] is None:
+            return
+        
+        now = self.clock.time()
+        self.speaking_pattern = (SPEAKING_PATTERNS.get(pattern, SPEAKING_PATTERNS["default"]),
+                                 now, now + max(0.0, duration), max(0.0, min(1.0, volume)))
+        
+        self.last_activity_time = now
+        if self.power_mode == "off" or self.power_mode == "dim":
+            self.set_power_mode("on")
+        self._update_speaking()
+    
+    def animate_speaking(self, duration: float = 1.0, pattern: str = "default") -> None:
+        """
+        Konuşma animasyonu (animasyon motoru eylemleri için kısa ad)
+        
+        Args:
+            duration (float): Animasyon süresi
+            pattern (str): Konuşma deseni
+        """
+        self.animate_mouth_speaking(duration, pattern)
 
 # OLEDController sınıfını OLEDDisplayMixin ile bağla
 try:
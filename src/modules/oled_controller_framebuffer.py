@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_framebuffer.py
+# Açıklama: SSD1306 sayfa düzeninde paketlenmiş NumPy kare tamponu.
+#           Sprite ve temel şekiller doğrudan bu tampona yazılır; tampon sürücünün
+#           (veya simülatörün) kendi belleği üzerinde kopyasız bir görünüm olabilir.
+# Bağımlılıklar: numpy, PIL
+# Bağlı Dosyalar: oled_controller_base.py, oled_controller_display.py, oled_controller_sprites.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Sayfa düzeninde kare tamponu, sprite/şekil yazma ve kirli pencere tespiti eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+# Pencere tipi: (başlangıç sayfası, bitiş sayfası, başlangıç sütunu, bitiş sütunu) - uçlar dahil
+Window = Tuple[int, int, int, int]
+
+
+def pack_image(image: Image.Image) -> np.ndarray:
+    """
+    1-bit PIL görüntüsünü SSD1306 sayfa düzenine paketler
+
+    Her sayfa için genişlik kadar bayt üretilir; her bayt o sütundaki
+    8 dikey pikseli içerir (LSB en üst satır).
+
+    Args:
+        image (Image.Image): "1" modunda görüntü (yükseklik 8'in katı)
+
+    Returns:
+        np.ndarray: (yükseklik // 8, genişlik) boyutunda uint8 dizi
+    """
+    width, height = image.size
+    if image.mode != "1":
+        image = image.convert("1")
+    bits = np.unpackbits(np.frombuffer(image.tobytes(), dtype=np.uint8)).reshape(height, -1)[:, :width]
+    return np.packbits(bits.reshape(height // 8, 8, width), axis=1, bitorder="little").reshape(height // 8, width)
+
+
+def unpack_image(pages: np.ndarray) -> Image.Image:
+    """
+    Sayfa düzenindeki diziyi 1-bit PIL görüntüsüne çevirir
+
+    Args:
+        pages (np.ndarray): (sayfa, genişlik) boyutunda uint8 dizi
+
+    Returns:
+        Image.Image: "1" modunda görüntü
+    """
+    page_count, width = pages.shape
+    bits = np.unpackbits(pages[:, np.newaxis, :], axis=1, bitorder="little").reshape(page_count * 8, width)
+    return Image.frombytes("1", (width, page_count * 8), np.packbits(bits, axis=1).tobytes())
+
+
+class PageFrameBuffer:
+    """
+    SSD1306 sayfa düzeninde paketlenmiş kare tamponu
+
+    Tampon, verilen bir bytearray (ör. adafruit_ssd1306 sürücüsünün
+    `buffer` alanı) üzerinde kopyasız bir NumPy görünümü olarak
+    oluşturulabilir. Böylece sprite'lar doğrudan sürücü belleğine yazılır
+    ve gönderim öncesinde tam kare dönüşümüne gerek kalmaz.
+    """
+
+    def __init__(self, width: int, height: int, backing: Optional[bytearray] = None, offset: int = 0):
+        """
+        Kare tamponunu oluşturur
+
+        Args:
+            width (int): Ekran genişliği (sütun)
+            height (int): Ekran yüksekliği (8'in katı)
+            backing (Optional[bytearray]): Paylaşılacak bellek. None ise yeni bellek ayrılır
+            offset (int): Paylaşılan bellekte karenin başladığı bayt
+        """
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.size = self.pages * width
+
+        if backing is None:
+            backing = bytearray(self.size)
+            offset = 0
+        self.backing = backing
+        self.offset = offset
+        self.array = np.frombuffer(backing, dtype=np.uint8, count=self.size, offset=offset).reshape(self.pages, width)
+
+        # Son gönderimden sonra doğrudan bu tampona çizim yapıldı mı
+        self.touched = False
+
+    def view(self) -> memoryview:
+        """
+        Karenin paylaşılan bellek üzerindeki kopyasız görünümünü döndürür
+
+        Returns:
+            memoryview: Sayfa düzenindeki kare baytları
+        """
+        return memoryview(self.backing)[self.offset:self.offset + self.size]
+
+    def clear(self, value: int = 0) -> None:
+        """
+        Tamponu temizler
+
+        Args:
+            value (int): 0 ise tüm pikseller sönük, aksi halde yanık
+        """
+        self.array.fill(0xFF if value else 0)
+        self.touched = True
+
+    def blit(self, sprite: np.ndarray, x: int = 0, page: int = 0, mode: str = "copy") -> None:
+        """
+        Sayfa düzenindeki bir sprite'ı tampona yazar (ekran dışına taşan kısım kırpılır)
+
+        Args:
+            sprite (np.ndarray): (sayfa, genişlik) boyutunda uint8 sprite
+            x (int): Hedef sütun
+            page (int): Hedef sayfa (dikey konum / 8)
+            mode (str): "copy" üzerine yazar, "or" mevcut piksellerle birleştirir
+        """
+        src_page0 = max(0, -page)
+        src_col0 = max(0, -x)
+        dst_page0 = max(0, page)
+        dst_col0 = max(0, x)
+        page_count = min(sprite.shape[0] - src_page0, self.pages - dst_page0)
+        col_count = min(sprite.shape[1] - src_col0, self.width - dst_col0)
+        if page_count <= 0 or col_count <= 0:
+            return
+
+        target = self.array[dst_page0:dst_page0 + page_count, dst_col0:dst_col0 + col_count]
+        source = sprite[src_page0:src_page0 + page_count, src_col0:src_col0 + col_count]
+
+        if mode == "or":
+            np.bitwise_or(target, source, out=target)
+        else:
+            np.copyto(target, source)
+        self.touched = True
+
+    def _row_masks(self, y0: int, y1: int) -> np.ndarray:
+        """
+        [y0, y1] satır aralığı için sayfa başına bit maskelerini döndürür
+
+        Args:
+            y0 (int): İlk satır
+            y1 (int): Son satır (dahil)
+
+        Returns:
+            np.ndarray: (sayfa,) boyutunda uint8 maske dizisi
+        """
+        rows = np.arange(self.height)
+        inside = (rows >= y0) & (rows <= y1)
+        return np.packbits(inside.reshape(self.pages, 8), axis=1, bitorder="little").reshape(self.pages)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, value: int = 1) -> None:
+        """
+        Dolu dikdörtgen çizer
+
+        Args:
+            x (int): Sol sütun
+            y (int): Üst satır
+            width (int): Genişlik
+            height (int): Yükseklik
+            value (int): 1 yanık, 0 sönük
+        """
+        x0 = max(0, x)
+        x1 = min(self.width, x + width)
+        if x1 <= x0 or height <= 0:
+            return
+
+        masks = self._row_masks(y, y + height - 1)[:, np.newaxis]
+        region = self.array[:, x0:x1]
+        if value:
+            np.bitwise_or(region, masks, out=region)
+        else:
+            np.bitwise_and(region, ~masks, out=region)
+        self.touched = True
+
+    def hline(self, x0: int, x1: int, y: int, value: int = 1) -> None:
+        """
+        Yatay çizgi çizer
+
+        Args:
+            x0 (int): Başlangıç sütunu
+            x1 (int): Bitiş sütunu (dahil)
+            y (int): Satır
+            value (int): 1 yanık, 0 sönük
+        """
+        if x1 < x0:
+            x0, x1 = x1, x0
+        self.fill_rect(x0, y, x1 - x0 + 1, 1, value)
+
+    def vline(self, x: int, y0: int, y1: int, value: int = 1) -> None:
+        """
+        Dikey çizgi çizer
+
+        Args:
+            x (int): Sütun
+            y0 (int): Başlangıç satırı
+            y1 (int): Bitiş satırı (dahil)
+            value (int): 1 yanık, 0 sönük
+        """
+        if y1 < y0:
+            y0, y1 = y1, y0
+        self.fill_rect(x, y0, 1, y1 - y0 + 1, value)
+
+    def set_pixel(self, x: int, y: int, value: int = 1) -> None:
+        """
+        Tek bir pikseli ayarlar
+
+        Args:
+            x (int): Sütun
+            y (int): Satır
+            value (int): 1 yanık, 0 sönük
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        bit = 1 << (y & 7)
+        if value:
+            self.array[y >> 3, x] |= bit
+        else:
+            self.array[y >> 3, x] &= ~bit & 0xFF
+        self.touched = True
+
+    def load_image(self, image: Image.Image) -> None:
+        """
+        PIL görüntüsünü tampona paketler (eski ImageDraw tabanlı çizim yolu için)
+
+        Args:
+            image (Image.Image): "1" modunda, tampon ile aynı boyutta görüntü
+        """
+        np.copyto(self.array, pack_image(image))
+
+    def to_image(self) -> Image.Image:
+        """
+        Tamponu 1-bit PIL görüntüsüne çevirir (simülasyon kayıtları için)
+
+        Returns:
+            Image.Image: "1" modunda görüntü
+        """
+        return unpack_image(self.array)
+
+    def dirty_windows(self, previous: np.ndarray) -> List[Window]:
+        """
+        Önceki kareye göre değişen sayfa/sütun pencerelerini bulur
+
+        Her kirli sayfada değişen ilk ve son sütun bulunur; ardışık kirli
+        sayfalar sütun aralıklarının birleşimi ile tek pencerede toplanır.
+
+        Args:
+            previous (np.ndarray): Son gönderilen kare
+
+        Returns:
+            List[Window]: Gönderilmesi gereken pencereler
+        """
+        diff = self.array != previous
+        dirty_pages = diff.any(axis=1)
+
+        windows = []
+        current = None
+        for page in range(self.pages):
+            if not dirty_pages[page]:
+                if current is not None:
+                    windows.append(tuple(current))
+                    current = None
+                continue
+
+            columns = np.flatnonzero(diff[page])
+            first, last = int(columns[0]), int(columns[-1])
+            if current is None:
+                current = [page, page, first, last]
+            else:
+                current[1] = page
+                current[2] = min(current[2], first)
+                current[3] = max(current[3], last)
+
+        if current is not None:
+            windows.append(tuple(current))
+
+        return windows
+
+    def window(self, window: Window) -> np.ndarray:
+        """
+        Bir pencerenin kopyasız görünümünü döndürür
+
+        Args:
+            window (Window): Pencere
+
+        Returns:
+            np.ndarray: (sayfa, sütun) boyutunda görünüm
+        """
+        page0, page1, col0, col1 = window
+        return self.array[page0:page1 + 1, col0:col1 + 1]
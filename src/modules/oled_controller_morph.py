@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_morph.py
+# Açıklama: Duygu geçişleri için göz ve ağız şekilleri arasında ara kare (morph) üretimi
+#           ve duygu çifti başına önceden çizilmiş kare tablolarının LRU önbelleği.
+# Bağımlılıklar: PIL, numpy, threading, logging
+# Bağlı Dosyalar: oled_controller_display.py, oled_controller_animations.py,
+#                 oled_controller_sprites.py, theme/theme_geometry.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Göz bebekleri morph karelerinden çıkarıldı; ara göz bebeği interpolate_pupil ile ayrıca
+#           hesaplanıyor, böylece göz tabloları göz bebeği ofsetinden bağımsız önbellekleniyor
+# - [0.1.0] Derlenmiş tema geometrisinden eşit örneklenmiş şekil noktaları, iki şekil listesi
+#           arasında K adımlı ara kareler ve sınırlı LRU morph tablo önbelleği eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .oled_controller_framebuffer import pack_image
+
+# Logger yapılandırması
+logger = logging.getLogger("OLEDController")
+
+# Bir şeklin ara kare üretimine hazır hali: (örnek sayısı, 2) boyutunda nokta dizisi
+MorphShape = namedtuple("MorphShape", ["points", "closed", "fill", "width"])
+
+# Her şekil kenarı boyunca örneklenecek nokta sayısı
+MORPH_SAMPLES = 48
+
+
+def _resample_path(vertices: Sequence[Tuple[float, float]], closed: bool, samples: int) -> np.ndarray:
+    """
+    Bir çokgen yolunu yay uzunluğuna göre eşit aralıklı noktalarla yeniden örnekler
+
+    Args:
+        vertices (Sequence[Tuple[float, float]]): Yol köşeleri
+        closed (bool): Yol kapalı mı (son köşeden ilk köşeye dönülür)
+        samples (int): Örnek sayısı
+
+    Returns:
+        np.ndarray: (samples, 2) boyutunda nokta dizisi
+    """
+    path = np.asarray(vertices, dtype=np.float64)
+    if closed:
+        path = np.vstack([path, path[:1]])
+
+    lengths = np.hypot(*np.diff(path, axis=0).T)
+    total = lengths.sum()
+    if total == 0:
+        return np.repeat(path[:1], samples, axis=0)
+
+    cumulative = np.concatenate([[0.0], np.cumsum(lengths)])
+    targets = np.linspace(0.0, total, samples, endpoint=not closed)
+    return np.column_stack([np.interp(targets, cumulative, path[:, 0]),
+                            np.interp(targets, cumulative, path[:, 1])])
+
+
+def _ellipse_points(box: Sequence[int], start: float, end: float, samples: int,
+                    closed: bool) -> np.ndarray:
+    """
+    Bir elips (veya yay) çevresinden eşit açılı noktalar üretir
+
+    PIL açıları saat yönünde, 3 yönünden başlayarak derece cinsinden ölçer.
+
+    Args:
+        box (Sequence[int]): Sınır kutusu (x0, y0, x1, y1)
+        start (float): Başlangıç açısı
+        end (float): Bitiş açısı
+        samples (int): Örnek sayısı
+        closed (bool): Tam elips mi
+
+    Returns:
+        np.ndarray: (samples, 2) boyutunda nokta dizisi
+    """
+    x0, y0, x1, y1 = box
+    center_x, center_y = (x0 + x1) / 2.0, (y0 + y1) / 2.0
+    radius_x, radius_y = (x1 - x0) / 2.0, (y1 - y0) / 2.0
+    angles = np.radians(np.linspace(start, end, samples, endpoint=not closed))
+    return np.column_stack([center_x + radius_x * np.cos(angles),
+                            center_y + radius_y * np.sin(angles)])
+
+
+def to_morph_shape(op, samples: int = MORPH_SAMPLES) -> MorphShape:
+    """
+    Derlenmiş bir çizim işlemini ara kare üretimi için nokta dizisine dönüştürür
+
+    Args:
+        op (ShapeOp): Tema geometrisinden derlenmiş çizim işlemi
+        samples (int): Örnek sayısı
+
+    Returns:
+        MorphShape: Eşit örneklenmiş şekil
+    """
+    if op.kind == "ellipse":
+        points = _ellipse_points(op.coords, 0, 360, samples, closed=True)
+        closed = True
+    elif op.kind == "arc":
+        start, end = op.start, op.end
+        while end <= start:
+            end += 360
+        closed = end - start >= 360
+        points = _ellipse_points(op.coords, start, end, samples, closed)
+    elif op.kind == "rectangle":
+        x0, y0, x1, y1 = op.coords
+        points = _resample_path([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], True, samples)
+        closed = True
+    else:
+        vertices = list(zip(op.coords[0::2], op.coords[1::2]))
+        closed = op.kind == "polygon"
+        points = _resample_path(vertices, closed, samples)
+
+    return MorphShape(points, closed, op.fill, op.width)
+
+
+def interpolate_pupil(source: Optional[Tuple[int, int, int]], target: Optional[Tuple[int, int, int]],
+                      t: float) -> Optional[Tuple[int, int, int]]:
+    """
+    İki göz bebeği arasındaki t oranındaki göz bebeğini hesaplar
+
+    Göz bebekleri göz şekillerinden ayrı çizilir; böylece morph tabloları göz
+    bebeği konumundan bağımsızdır. Karşılığı olmayan göz bebeği kendi merkezine söner.
+
+    Args:
+        source (Optional[Tuple[int, int, int]]): Kaynak göz bebeği (merkez x, merkez y, yarıçap)
+        target (Optional[Tuple[int, int, int]]): Hedef göz bebeği (merkez x, merkez y, yarıçap)
+        t (float): Geçiş oranı (0.0: kaynak, 1.0: hedef)
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Ara göz bebeği, iki uçta da göz bebeği yoksa None
+    """
+    if source is None and target is None:
+        return None
+    if source is None:
+        source = (target[0], target[1], 0)
+    elif target is None:
+        target = (source[0], source[1], 0)
+    return tuple(int(round(a * (1.0 - t) + b * t)) for a, b in zip(source, target))
+
+
+def _collapsed(shape: MorphShape) -> MorphShape:
+    """
+    Şeklin ağırlık merkezine çökmüş halini döndürür (karşılığı olmayan şekiller için)
+
+    Args:
+        shape (MorphShape): Şekil
+
+    Returns:
+        MorphShape: Tüm noktaları merkezde olan şekil
+    """
+    center = shape.points.mean(axis=0)
+    return shape._replace(points=np.repeat(center[np.newaxis, :], len(shape.points), axis=0))
+
+
+def _align(source: MorphShape, target: MorphShape) -> MorphShape:
+    """
+    Hedef şeklin noktalarını kaynak şekle en yakın eşleşecek şekilde sıralar
+
+    Açık şekillerde yön, kapalı şekillerde yön ve başlangıç noktası seçilir; böylece
+    ara kareler şekli merkezden geçirmek yerine en kısa yoldan dönüştürür.
+
+    Args:
+        source (MorphShape): Kaynak şekil
+        target (MorphShape): Hedef şekil
+
+    Returns:
+        MorphShape: Noktaları yeniden sıralanmış hedef şekil
+    """
+    candidates = [target.points, target.points[::-1]]
+    if source.closed and target.closed:
+        candidates = [np.roll(points, shift, axis=0)
+                      for points in candidates for shift in range(len(points))]
+
+    stacked = np.stack(candidates)
+    costs = ((stacked - source.points[np.newaxis]) ** 2).sum(axis=(1, 2))
+    return target._replace(points=candidates[int(np.argmin(costs))])
+
+
+def pair_shapes(source: List[MorphShape], target: List[MorphShape]) -> List[Tuple[MorphShape, MorphShape]]:
+    """
+    İki şekil listesini sırayla eşler; karşılığı olmayan şekiller merkezden doğar veya merkeze söner
+
+    Args:
+        source (List[MorphShape]): Kaynak şekiller
+        target (List[MorphShape]): Hedef şekiller
+
+    Returns:
+        List[Tuple[MorphShape, MorphShape]]: Şekil çiftleri
+    """
+    pairs = []
+    for index in range(max(len(source), len(target))):
+        a = source[index] if index < len(source) else None
+        b = target[index] if index < len(target) else None
+        if a is None:
+            a = _collapsed(b)
+        elif b is None:
+            b = _collapsed(a)
+        else:
+            b = _align(a, b)
+        pairs.append((a, b))
+    return pairs
+
+
+def draw_morph_frame(draw, pairs: List[Tuple[MorphShape, MorphShape]], t: float) -> None:
+    """
+    Şekil çiftleri arasındaki t oranındaki ara kareyi çizer
+
+    Args:
+        draw (ImageDraw): Çizim nesnesi
+        pairs (List[Tuple[MorphShape, MorphShape]]): Şekil çiftleri
+        t (float): Geçiş oranı (0.0: kaynak, 1.0: hedef)
+    """
+    for a, b in pairs:
+        points = np.rint(a.points * (1.0 - t) + b.points * t).astype(np.int32)
+        dominant = a if t < 0.5 else b
+        width = max(1, int(round(a.width * (1.0 - t) + b.width * t)))
+        coords = [tuple(point) for point in points.tolist()]
+
+        if dominant.fill and dominant.closed:
+            draw.polygon(coords, fill=1)
+            continue
+        if dominant.closed:
+            coords.append(coords[0])
+        draw.line(coords, fill=1, width=width)
+
+
+def render_morph_frames(size: Tuple[int, int], source: List[MorphShape], target: List[MorphShape],
+                        steps: int) -> Tuple[np.ndarray, ...]:
+    """
+    İki şekil listesi arasındaki K ara kareyi çizer ve sayfa düzenine paketler
+
+    Uç noktalar (kaynak ve hedef) dahil değildir; bunlar sprite önbelleğinden çizilir.
+    k. kare k / (K + 1) oranına karşılık gelir. Göz bebekleri bu karelere dahil
+    edilmez (bkz. interpolate_pupil).
+
+    Args:
+        size (Tuple[int, int]): Ekran boyutu (genişlik, yükseklik)
+        source (List[MorphShape]): Kaynak şekiller
+        target (List[MorphShape]): Hedef şekiller
+        steps (int): Ara kare sayısı (K)
+
+    Returns:
+        Tuple[np.ndarray, ...]: Paketlenmiş ara kareler
+    """
+    pairs = pair_shapes(source, target)
+    frames = []
+    for step in range(1, steps + 1):
+        image = Image.new("1", size)
+        draw_morph_frame(ImageDraw.Draw(image), pairs, step / (steps + 1))
+        packed = pack_image(image)
+        packed.flags.writeable = False
+        frames.append(packed)
+    return tuple(frames)
+
+
+class MorphCache:
+    """
+    Duygu çifti başına önceden çizilmiş ara kare tablolarını saklayan sınırlı LRU önbellek
+
+    Her tablo bir ekran ve (kaynak, hedef) çifti için K paketlenmiş kare içerir.
+    """
+
+    def __init__(self, max_tables: int = 32):
+        """
+        Morph önbelleğini başlatır
+
+        Args:
+            max_tables (int): Önbellekte tutulacak maksimum tablo sayısı
+        """
+        self.max_tables = max(1, max_tables)
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+        """
+        Ara kare tablosunu önbellekten döndürür, yoksa oluşturup ekler
+
+        Args:
+            key (Hashable): Tablo anahtarı
+            builder (Callable): Önbellekte yoksa çağrılacak tablo oluşturma fonksiyonu
+
+        Returns:
+            Tuple[np.ndarray, ...]: Paketlenmiş ara kareler
+        """
+        with self._lock:
+            frames = self._tables.get(key)
+            if frames is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return frames
+
+        self.misses += 1
+        frames = builder()
+
+        with self._lock:
+            self._tables[key] = frames
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+                self.evictions += 1
+        return frames
+
+    def clear(self) -> None:
+        """
+        Önbelleği temizler
+        """
+        with self._lock:
+            self._tables.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Önbellek istatistiklerini döndürür
+
+        Returns:
+            Dict: Tablo sayısı, isabet, ıska ve çıkarma sayıları
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._tables),
+            "max_size": self.max_tables,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_output.py
+# Açıklama: OLED ekranları için I2C çıkış aşaması. Yazmaları TCA9548A kanalına göre
+#           gruplar, kanal değişimlerini en aza indirir ve kareleri ayrı bir iş parçacığında
+#           göndererek bir sonraki karenin çizimi ile iletimi üst üste bindirir.
+#           Simülasyon için I2C zamanlamasını taklit eden sahte veri yolu içerir.
+# Bağımlılıklar: threading, time, collections
+# Bağlı Dosyalar: oled_controller_base.py, oled_controller_pages.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Gönderim hataları ekran başına hata geri çağrısıyla bildiriliyor; bir ekranın veya kanalın
+#           hatası aynı karedeki diğer kanal gruplarının gönderimini engellemiyor
+# - [0.1.0] Kanal gruplamalı, boru hattı (pipeline) destekli çıkış aşaması ve sahte I2C veri yolu eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .oled_controller_pages import SET_COL_ADDR, SET_PAGE_ADDR, DATA_CONTROL_BYTE
+
+# Logger yapılandırması
+logger = logging.getLogger("OLEDController")
+
+# I2C kontrol baytı (komut akışı)
+COMMAND_CONTROL_BYTE = 0x00
+
+# Pencere tipi: (başlangıç sayfası, bitiş sayfası, başlangıç sütunu, bitiş sütunu)
+Window = Tuple[int, int, int, int]
+
+# Bir ekran için gönderilecek iş: (pencere, veri baytları) listesi
+DisplayJob = List[Tuple[Window, bytes]]
+
+
+class FakeI2CBus:
+    """
+    busio.I2C arayüzünü taklit eden simüle I2C veri yolu
+
+    Her yazma işlemi, veri yolu hızına göre hesaplanan süre kadar veri yolunu
+    meşgul eder (başlangıç + adres baytı + veri baytları, bayt başına 9 saat
+    darbesi). TCA9548A adresine yapılan yazmalar kanal seçimi olarak yorumlanır,
+    diğer yazmalar seçili kanallardaki ilgili adrese bağlı cihaza iletilir.
+    """
+
+    def __init__(self, frequency: int = 400000, mux_address: Optional[int] = None):
+        """
+        Sahte veri yolunu başlatır
+
+        Args:
+            frequency (int): Simüle edilen I2C saat frekansı (Hz)
+            mux_address (Optional[int]): TCA9548A adresi, çoğaltıcı yoksa None
+        """
+        self.frequency = frequency
+        self.mux_address = mux_address
+        self._lock = threading.Lock()
+        self._devices = {}
+        self._selected_mask = 0
+        self._busy_until = 0.0
+
+        # İstatistikler
+        self.transactions = 0
+        self.bytes_written = 0
+        self.busy_time = 0.0
+
+    def attach(self, address: int, device, channel: Optional[int] = None) -> None:
+        """
+        Veri yoluna bir cihaz bağlar
+
+        Args:
+            address (int): Cihazın I2C adresi
+            device: `i2c_write(data)` metodu olan cihaz nesnesi
+            channel (Optional[int]): Çoğaltıcı kanalı, doğrudan bağlıysa None
+        """
+        self._devices[(channel, address)] = device
+
+    def try_lock(self) -> bool:
+        """Veri yolunu kilitlemeyi dener"""
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self) -> None:
+        """Veri yolu kilidini bırakır"""
+        self._lock.release()
+
+    def scan(self) -> List[int]:
+        """Bağlı cihaz adreslerini döndürür"""
+        addresses = {address for _, address in self._devices}
+        if self.mux_address is not None:
+            addresses.add(self.mux_address)
+        return sorted(addresses)
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Bir cihaza veri yazar ve veri yolu süresini simüle eder
+
+        Args:
+            address (int): Hedef I2C adresi
+            buffer: Yazılacak veri
+            start (int): Başlangıç indeksi
+            end (Optional[int]): Bitiş indeksi
+        """
+        data = bytes(buffer[start:end])
+        self._occupy(len(data))
+
+        if address == self.mux_address:
+            self._selected_mask = data[0] if data else 0
+            return
+
+        if self.mux_address is None:
+            targets = [self._devices.get((None, address))]
+        else:
+            targets = [self._devices.get((channel, address))
+                       for channel in range(8) if self._selected_mask & (1 << channel)]
+
+        for device in targets:
+            if device is not None:
+                device.i2c_write(data)
+
+    def _occupy(self, data_bytes: int) -> None:
+        """
+        Yazma süresi kadar veri yolunu meşgul eder
+
+        Kısa işlemlerin süresi biriktirilir ve 1 ms'yi aştığında uyunur;
+        böylece time.sleep çözünürlüğü küçük komut yazmalarını şişirmez.
+
+        Args:
+            data_bytes (int): Veri bayt sayısı (adres baytı hariç)
+        """
+        duration = (data_bytes + 1) * 9 / self.frequency
+        now = time.perf_counter()
+        self._busy_until = max(now, self._busy_until) + duration
+        self.transactions += 1
+        self.bytes_written += data_bytes + 1
+        self.busy_time += duration
+
+        remaining = self._busy_until - now
+        if remaining > 0.001:
+            time.sleep(remaining)
+
+
+class DisplayOutputStage:
+    """
+    OLED ekranları için I2C çıkış aşaması
+
+    - Yazmalar çoğaltıcı kanalına göre gruplanır: her kanal bir kez seçilir,
+      o kanaldaki tüm ekranların pencereleri tek veri yolu kilidi altında gönderilir.
+    - Her pencere için adresleme komutları tek I2C işleminde, veri tek işlemde yazılır.
+    - Boru hattı modunda kare N gönderilirken animasyon döngüsü kare N+1'i çizer;
+      en fazla bir kare sırada bekler, daha fazlası submit() çağrısını bekletir.
+    """
+
+    def __init__(self, bus, mux_address: Optional[int] = None, pipelined: bool = True,
+                 callback: Optional[Callable[[str, int], None]] = None, history_size: int = 120,
+                 error_callback: Optional[Callable[[str, Exception], None]] = None):
+        """
+        Çıkış aşamasını başlatır
+
+        Args:
+            bus: busio.I2C uyumlu veri yolu (try_lock, unlock, writeto)
+            mux_address (Optional[int]): TCA9548A adresi, çoğaltıcı yoksa None
+            pipelined (bool): True ise kareler ayrı iş parçacığında gönderilir
+            callback (Optional[Callable]): Bir ekran gönderildikten sonra (ekran adı, bayt) ile çağrılır
+            history_size (int): Ekran başına saklanacak gönderim süresi örneği
+            error_callback (Optional[Callable]): Bir ekran gönderilemediğinde (ekran adı, hata) ile çağrılır;
+                ekranın son gönderilen karesi artık bilinmediğinden çağıran bir sonraki kareyi tam göndermelidir
+        """
+        self.bus = bus
+        self.mux_address = mux_address
+        self.pipelined = pipelined
+        self.callback = callback
+        self.error_callback = error_callback
+        self.history_size = history_size
+
+        # Ekran adı -> {"address", "channel", "col_offset"}
+        self.targets = OrderedDict()
+
+        # Boru hattı durumu
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._thread = None
+        self.is_running = False
+
+        # İstatistikler
+        self.frames = 0
+        self.channel_switches = 0
+        self.errors = 0
+        self.pipeline_waits = 0
+        self.pipeline_wait_time = 0.0
+        self._display_stats = {}
+
+    def add_display(self, name: str, address: int, channel: Optional[int] = None, width: int = 128) -> None:
+        """
+        Çıkış aşamasına bir ekran ekler
+
+        Args:
+            name (str): Ekran adı
+            address (int): Ekranın I2C adresi
+            channel (Optional[int]): Çoğaltıcı kanalı, doğrudan bağlıysa None
+            width (int): Ekran genişliği (128'den dar ekranlarda sütunlar ortalanır)
+        """
+        self.targets[name] = {
+            "address": address,
+            "channel": channel if self.mux_address is not None else None,
+            "col_offset": (128 - width) // 2 if width != 128 else 0
+        }
+        self._display_stats[name] = {
+            "times": deque(maxlen=self.history_size),
+            "frames": 0,
+            "bytes": 0,
+            "last_ms": 0.0,
+            "max_ms": 0.0
+        }
+
+    def start(self) -> None:
+        """
+        Boru hattı modunda gönderim iş parçacığını başlatır
+        """
+        if not self.pipelined or self.is_running:
+            return
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._worker, name="OLEDOutput")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Bekleyen kareyi gönderir ve iş parçacığını durdurur
+
+        Args:
+            timeout (float): Bekleme süresi (saniye)
+        """
+        if not self.is_running:
+            return
+
+        self.flush(timeout)
+        with self._cond:
+            self.is_running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def submit(self, jobs: Dict[str, DisplayJob]) -> None:
+        """
+        Bir karenin ekran yazmalarını gönderim için teslim eder
+
+        Veriler çağıran tarafından kopyalanmış olmalıdır (kare tamponu bir
+        sonraki kare için hemen değiştirilebilir).
+
+        Args:
+            jobs (Dict[str, DisplayJob]): Ekran adına göre (pencere, veri) listeleri
+        """
+        if not jobs:
+            return
+
+        if not self.is_running:
+            self._transmit(jobs)
+            return
+
+        with self._cond:
+            if self._pending is not None:
+                # Önceki kare henüz gönderime alınmadı - bekle (geri basınç)
+                self.pipeline_waits += 1
+                wait_start = time.perf_counter()
+                while self._pending is not None and self.is_running:
+                    self._cond.wait()
+                self.pipeline_wait_time += time.perf_counter() - wait_start
+            self._pending = jobs
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Sıradaki ve gönderilmekte olan karelerin bitmesini bekler
+
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye)
+
+        Returns:
+            bool: Tüm kareler gönderildiyse True
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _worker(self) -> None:
+        """
+        Gönderim iş parçacığı - sıradaki kareyi alır ve gönderir
+        """
+        while True:
+            with self._cond:
+                while self._pending is None and self.is_running:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                jobs = self._pending
+                self._pending = None
+                self._busy = True
+                self._cond.notify_all()
+
+            try:
+                self._transmit(jobs)
+            except Exception as e:
+                logger.error(f"OLED çıkış aşamasında gönderim hatası: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _group_by_channel(self, jobs: Dict[str, DisplayJob]) -> "OrderedDict[Optional[int], List[str]]":
+        """
+        Ekranları çoğaltıcı kanalına göre gruplar
+
+        Args:
+            jobs (Dict[str, DisplayJob]): Ekran adına göre işler
+
+        Returns:
+            OrderedDict: Kanal -> ekran adları (kanal sırasına göre)
+        """
+        groups = OrderedDict()
+        names = sorted((name for name in jobs if name in self.targets),
+                       key=lambda n: (self.targets[n]["channel"] is None, self.targets[n]["channel"] or 0))
+        for name in names:
+            groups.setdefault(self.targets[name]["channel"], []).append(name)
+        return groups
+
+    def _transmit(self, jobs: Dict[str, DisplayJob]) -> None:
+        """
+        Bir karenin tüm ekran yazmalarını kanal gruplarıyla gönderir
+
+        Bir ekranın gönderimi başarısız olursa hata bildirilir ve kalan ekranlarla
+        devam edilir; kanal seçilemezse o gruptaki tüm ekranlar başarısız sayılır.
+
+        Args:
+            jobs (Dict[str, DisplayJob]): Ekran adına göre (pencere, veri) listeleri
+        """
+        for channel, names in self._group_by_channel(jobs).items():
+            while not self.bus.try_lock():
+                time.sleep(0)
+            try:
+                if channel is not None:
+                    try:
+                        self.bus.writeto(self.mux_address, bytes([1 << channel]))
+                        self.channel_switches += 1
+                    except Exception as e:
+                        for name in names:
+                            self._report_error(name, e)
+                        continue
+
+                for name in names:
+                    try:
+                        self._transmit_display(name, jobs[name])
+                    except Exception as e:
+                        self._report_error(name, e)
+
+                if channel is not None:
+                    # Diğer sürücülerle uyum için kanalı bırak (adafruit_tca9548a ile aynı)
+                    try:
+                        self.bus.writeto(self.mux_address, b"\x00")
+                    except Exception as e:
+                        logger.debug(f"Çoğaltıcı kanalı bırakılamadı: {channel}, hata: {e}")
+            finally:
+                self.bus.unlock()
+
+        self.frames += 1
+
+    def _report_error(self, name: str, error: Exception) -> None:
+        """
+        Bir ekranın gönderim hatasını kaydeder ve bildirir
+
+        Args:
+            name (str): Ekran adı
+            error (Exception): Hata
+        """
+        self.errors += 1
+        logger.error(f"OLED çıkış aşamasında gönderim hatası: {name}, hata: {error}")
+        if self.error_callback:
+            try:
+                self.error_callback(name, error)
+            except Exception as e:
+                logger.debug(f"Çıkış aşaması hata geri çağrısında hata: {name}, hata: {e}")
+
+    def _transmit_display(self, name: str, job: DisplayJob) -> None:
+        """
+        Tek bir ekranın pencerelerini gönderir ve gönderim süresini kaydeder
+
+        Veri yolu kilidi ve kanal seçimi çağıran tarafından yapılmış olmalıdır.
+
+        Args:
+            name (str): Ekran adı
+            job (DisplayJob): (pencere, veri) listesi
+        """
+        target = self.targets[name]
+        address = target["address"]
+        col_offset = target["col_offset"]
+
+        start = time.perf_counter()
+        sent = 0
+        for (page0, page1, col0, col1), data in job:
+            command = bytes((COMMAND_CONTROL_BYTE,
+                             SET_COL_ADDR, col0 + col_offset, col1 + col_offset,
+                             SET_PAGE_ADDR, page0, page1))
+            self.bus.writeto(address, command)
+            self.bus.writeto(address, bytes((DATA_CONTROL_BYTE,)) + data)
+            sent += len(command) + len(data) + 1
+        elapsed = time.perf_counter() - start
+
+        stats = self._display_stats[name]
+        stats["times"].append(elapsed)
+        stats["frames"] += 1
+        stats["bytes"] += sent
+        stats["last_ms"] = elapsed * 1000.0
+        stats["max_ms"] = max(stats["max_ms"], stats["last_ms"])
+
+        if self.callback:
+            try:
+                self.callback(name, sent)
+            except Exception as e:
+                logger.debug(f"Çıkış aşaması geri çağrısında hata: {name}, hata: {e}")
+
+    def get_display_stats(self, name: str) -> Optional[Dict]:
+        """
+        Bir ekranın gönderim istatistiklerini döndürür
+
+        Args:
+            name (str): Ekran adı
+
+        Returns:
+            Optional[Dict]: Son/ortalama/maksimum gönderim süresi (ms), kare ve bayt sayıları
+        """
+        stats = self._display_stats.get(name)
+        if stats is None:
+            return None
+
+        times = list(stats["times"])
+        return {
+            "last_ms": stats["last_ms"],
+            "avg_ms": (sum(times) / len(times) * 1000.0) if times else 0.0,
+            "max_ms": stats["max_ms"],
+            "frames": stats["frames"],
+            "bytes": stats["bytes"],
+            "bytes_per_frame": stats["bytes"] / stats["frames"] if stats["frames"] else 0.0
+        }
+
+    def get_stats(self) -> Dict:
+        """
+        Çıkış aşaması istatistiklerini döndürür
+
+        Returns:
+            Dict: Kare, kanal değişimi, boru hattı bekleme ve ekran başına gönderim istatistikleri
+        """
+        return {
+            "pipelined": self.is_running,
+            "multiplexer": self.mux_address is not None,
+            "frames": self.frames,
+            "channel_switches": self.channel_switches,
+            "channel_switches_per_frame": self.channel_switches / self.frames if self.frames else 0.0,
+            "errors": self.errors,
+            "pipeline_waits": self.pipeline_waits,
+            "pipeline_wait_ms": self.pipeline_wait_time * 1000.0,
+            "displays": {name: self.get_display_stats(name) for name in self.targets}
+        }
+
+
+# Test kodu - sahte veri yolunda seri ve boru hattı modlarının karşılaştırılması
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    class _NullDevice:
+        def i2c_write(self, data):
+            pass
+
+    def _run(pipelined: bool, frames: int = 60, render_time: float = 0.02) -> float:
+        bus = FakeI2CBus(400000, mux_address=0x70)
+        stage = DisplayOutputStage(bus, 0x70, pipelined=pipelined)
+        for channel, name in enumerate(("left_eye", "right_eye", "mouth")):
+            bus.attach(0x3C, _NullDevice(), channel)
+            stage.add_display(name, 0x3C, channel)
+        stage.start()
+
+        frame = [((0, 7, 0, 127), bytes(1024))]
+        start = time.perf_counter()
+        for _ in range(frames):
+            time.sleep(render_time)  # kare çizimi
+            stage.submit({"left_eye": frame, "right_eye": frame, "mouth": frame})
+        stage.stop()
+        elapsed = time.perf_counter() - start
+        print(f"{'Boru hattı' if pipelined else 'Seri':10s}: {frames / elapsed:5.1f} kare/sn, "
+              f"ekran başına gönderim {stage.get_display_stats('left_eye')['avg_ms']:.1f} ms")
+        return elapsed
+
+    _run(False)
+    _run(True)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_pages.py
+# Açıklama: SSD1306 sayfa/sütun penceresi gönderim yardımcıları. Değişen pencereleri
+#           sütun/sayfa adresleme komutlarıyla yalnızca ilgili bölge olarak gönderir.
+# Bağımlılıklar: numpy
+# Bağlı Dosyalar: oled_controller_base.py, oled_controller_framebuffer.py
+
+# Versiyon: 0.2.0
+# Değişiklikler:
+# - [0.2.0] Paketleme ve kirli pencere tespiti NumPy kare tamponuna (oled_controller_framebuffer.py) taşındı
+# - [0.1.0] Kirli sayfa tespiti ve kısmi ekran güncelleme yardımcıları eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import numpy as np
+
+from .oled_controller_framebuffer import Window
+
+# SSD1306 komutları
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+
+# I2C kontrol baytı (veri akışı)
+DATA_CONTROL_BYTE = 0x40
+
+# Her pencere için adresleme komut baytı sayısı (0x21, c0, c1, 0x22, p0, p1)
+WINDOW_COMMAND_BYTES = 6
+
+
+def window_size(window: Window) -> int:
+    """
+    Pencerenin veri bayt sayısını döndürür
+
+    Args:
+        window (Window): Pencere
+
+    Returns:
+        int: Veri bayt sayısı
+    """
+    page0, page1, col0, col1 = window
+    return (page1 - page0 + 1) * (col1 - col0 + 1)
+
+
+def write_ssd1306_window(display, window: Window, data: np.ndarray) -> None:
+    """
+    Adafruit SSD1306_I2C ekranına yalnızca bir pencereyi gönderir
+
+    Args:
+        display: adafruit_ssd1306.SSD1306_I2C nesnesi
+        window (Window): Pencere
+        data (np.ndarray): Pencere verisi, (sayfa, sütun) boyutunda görünüm
+    """
+    page0, page1, col0, col1 = window
+
+    # 128'den dar ekranlarda sütunlar ortalanır (adafruit_ssd1306.show ile aynı)
+    col_offset = (128 - display.width) // 2 if display.width != 128 else 0
+
+    for cmd in (SET_COL_ADDR, col0 + col_offset, col1 + col_offset, SET_PAGE_ADDR, page0, page1):
+        display.write_cmd(cmd)
+
+    with display.i2c_device:
+        display.i2c_device.write(bytes([DATA_CONTROL_BYTE]) + data.tobytes())
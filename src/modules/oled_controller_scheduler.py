@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_scheduler.py
+# Açıklama: OLED animasyon döngüsü için monoton saatli, son tarih (deadline) tabanlı
+#           sabit adımlı kare zamanlayıcı ve kare süresi istatistikleri.
+# Bağımlılıklar: threading, time, collections
+# Bağlı Dosyalar: oled_controller_base.py, oled_controller.py, performance_optimizer.py
+
+# Versiyon: 0.1.1
+# Değişiklikler:
+# - [0.1.1] Olay tabanlı çizim için boşta bekleme (end_idle_frame) ve boşta kare sayacı eklendi
+# - [0.1.0] Son tarih tabanlı kare zamanlayıcı, kaçırılan/atlanan kare sayaçları ve
+#           kayan pencere kare süresi histogramı (p50/p95/p99) eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# Logger yapılandırması
+logger = logging.getLogger("OLEDController")
+
+# Histogram kova üst sınırları (milisaniye); son kova bu değerlerin üzerini kapsar
+HISTOGRAM_BUCKETS_MS = (2, 4, 8, 16, 33, 66, 133)
+
+
+class FrameScheduler:
+    """
+    Sabit adımlı, son tarih tabanlı kare zamanlayıcı
+
+    Her karenin bir son tarihi vardır (önceki son tarih + kare süresi).
+    Kare son tarihinden önce biterse kalan süre kadar uyunur. Geç kalınırsa
+    son tarih kaçırılmış sayılır; gecikme max_catch_up kareyi aşmıyorsa
+    sonraki kareler beklemeden çalıştırılarak yetişilir, aşıyorsa kaçırılan
+    kareler açıkça atlanır ve zamanlama şimdiki andan yeniden başlar.
+    Tüm ölçümler time.monotonic() ile yapılır.
+    """
+
+    def __init__(self, fps: float = 30, max_catch_up: int = 2, history_size: int = 300):
+        """
+        Kare zamanlayıcıyı başlatır
+
+        Args:
+            fps (float): Hedef kare hızı
+            max_catch_up (int): Yetişmek için beklemeden çalıştırılacak en fazla kare sayısı
+            history_size (int): Kare süresi penceresindeki örnek sayısı
+        """
+        self._lock = threading.Lock()
+        self.fps = 30.0
+        self.period = 1.0 / self.fps
+        self.set_fps(fps)
+        self.max_catch_up = max(0, int(max_catch_up))
+
+        # Kare süreleri (iş süresi) ve kare aralıkları (saniye)
+        self._frame_times = deque(maxlen=max(10, int(history_size)))
+        self._intervals = deque(maxlen=max(10, int(history_size)))
+
+        self.next_deadline = None
+        self._frame_start = None
+        self._last_frame_start = None
+
+        # Sayaçlar
+        self.frames = 0
+        self.missed_deadlines = 0
+        self.dropped_frames = 0
+        self.idle_frames = 0
+
+    def set_fps(self, fps: float) -> None:
+        """
+        Hedef kare hızını değiştirir (bir sonraki son tarihten itibaren geçerli)
+
+        Args:
+            fps (float): Hedef kare hızı
+        """
+        fps = max(1.0, float(fps))
+        with self._lock:
+            self.fps = fps
+            self.period = 1.0 / fps
+
+    def reset(self) -> None:
+        """
+        Zamanlamayı şimdiki andan yeniden başlatır (sayaçlar korunur)
+        """
+        self.next_deadline = None
+        self._last_frame_start = None
+
+    def begin_frame(self) -> float:
+        """
+        Yeni bir karenin başladığını bildirir
+
+        Returns:
+            float: Karenin başlangıç zamanı (monoton saat)
+        """
+        now = time.monotonic()
+        if self.next_deadline is None:
+            self.next_deadline = now + self.period
+        if self._last_frame_start is not None:
+            with self._lock:
+                self._intervals.append(now - self._last_frame_start)
+        self._last_frame_start = now
+        self._frame_start = now
+        return now
+
+    def end_frame(self) -> None:
+        """
+        Karenin bittiğini bildirir, süresini kaydeder ve bir sonraki son tarihe kadar bekler
+        """
+        now = time.monotonic()
+        if self._frame_start is None:
+            return
+
+        with self._lock:
+            self._frame_times.append(now - self._frame_start)
+            self.frames += 1
+        self._frame_start = None
+
+        deadline = self.next_deadline
+        if now <= deadline:
+            # Zamanında: son tarihe kadar uyu
+            self.next_deadline = deadline + self.period
+            time.sleep(deadline - now)
+            return
+
+        # Son tarih kaçırıldı
+        self.missed_deadlines += 1
+        late_frames = int((now - deadline) / self.period)
+
+        if late_frames < self.max_catch_up:
+            # Yetişme: sonraki kareyi beklemeden çalıştır
+            self.next_deadline = deadline + self.period
+        else:
+            # Çok geride kalındı: kaçırılan kareleri açıkça atla
+            self.dropped_frames += late_frames
+            self.next_deadline = now + self.period
+            logger.debug(f"Kare zamanlayıcı {late_frames} kare atladı "
+                         f"(gecikme: {(now - deadline) * 1000:.1f} ms)")
+
+    def end_idle_frame(self, timeout: float, wakeup: Optional[threading.Event] = None) -> bool:
+        """
+        Karenin bittiğini bildirir ve sabit adım yerine verilen süre kadar boşta bekler
+
+        Olay tabanlı çizimde yüz değişmediğinde kullanılır. Bekleme wakeup olayı
+        ile erken sonlandırılabilir; sonraki kare uyanış anından itibaren zamanlanır.
+
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye)
+            wakeup (Optional[threading.Event]): Beklemeyi erken bitiren olay
+
+        Returns:
+            bool: Bekleme wakeup olayı ile bittiyse True
+        """
+        now = time.monotonic()
+        if self._frame_start is not None:
+            with self._lock:
+                self._frame_times.append(now - self._frame_start)
+                self.frames += 1
+            self._frame_start = None
+        self.idle_frames += 1
+
+        timeout = max(0.0, timeout)
+        if wakeup is not None:
+            woke = wakeup.wait(timeout)
+        else:
+            time.sleep(timeout)
+            woke = False
+
+        # Boşta geçen süre son tarih kaçırma sayılmaz
+        self.next_deadline = None
+        return woke
+
+    @staticmethod
+    def _percentile(sorted_values, fraction: float) -> float:
+        """
+        Sıralı listeden en yakın sıra yöntemiyle yüzdelik değeri döndürür
+
+        Args:
+            sorted_values (list): Sıralı değerler
+            fraction (float): Yüzdelik (0.0 - 1.0)
+
+        Returns:
+            float: Yüzdelik değer
+        """
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+        return sorted_values[index]
+
+    def get_stats(self) -> Dict:
+        """
+        Kare zamanlama istatistiklerini döndürür
+
+        Süreler milisaniye cinsindendir ve son history_size kare üzerinden hesaplanır.
+
+        Returns:
+            Dict: Hedef/gerçek FPS, p50/p95/p99/ortalama/maksimum kare süresi,
+                histogram, kaçırılan son tarih ve atlanan kare sayıları
+        """
+        with self._lock:
+            frame_times = sorted(self._frame_times)
+            intervals = list(self._intervals)
+            fps = self.fps
+            period = self.period
+            frames = self.frames
+
+        histogram = {f"<{edge}ms": 0 for edge in HISTOGRAM_BUCKETS_MS}
+        histogram[f">={HISTOGRAM_BUCKETS_MS[-1]}ms"] = 0
+        for value in frame_times:
+            ms = value * 1000.0
+            for edge in HISTOGRAM_BUCKETS_MS:
+                if ms < edge:
+                    histogram[f"<{edge}ms"] += 1
+                    break
+            else:
+                histogram[f">={HISTOGRAM_BUCKETS_MS[-1]}ms"] += 1
+
+        mean_interval = sum(intervals) / len(intervals) if intervals else 0.0
+
+        return {
+            "target_fps": fps,
+            "actual_fps": 1.0 / mean_interval if mean_interval > 0 else 0.0,
+            "budget_ms": period * 1000.0,
+            "frame_time_ms": {
+                "p50": self._percentile(frame_times, 0.50) * 1000.0,
+                "p95": self._percentile(frame_times, 0.95) * 1000.0,
+                "p99": self._percentile(frame_times, 0.99) * 1000.0,
+                "mean": (sum(frame_times) / len(frame_times) * 1000.0) if frame_times else 0.0,
+                "max": (frame_times[-1] * 1000.0) if frame_times else 0.0
+            },
+            "histogram": histogram,
+            "samples": len(frame_times),
+            "frames": frames,
+            "missed_deadlines": self.missed_deadlines,
+            "dropped_frames": self.dropped_frames,
+            "idle_frames": self.idle_frames,
+            "missed_ratio": self.missed_deadlines / frames if frames else 0.0
+        }
+
+    def get_percentile(self, fraction: float) -> Optional[float]:
+        """
+        Kare süresi yüzdeliğini saniye cinsinden döndürür
+
+        Args:
+            fraction (float): Yüzdelik (0.0 - 1.0)
+
+        Returns:
+            Optional[float]: Kare süresi (saniye) veya henüz örnek yoksa None
+        """
+        with self._lock:
+            if not self._frame_times:
+                return None
+            frame_times = sorted(self._frame_times)
+        return self._percentile(frame_times, fraction)
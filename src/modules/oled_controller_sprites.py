@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: oled_controller_sprites.py
+# Açıklama: OLED göz ve ağız kareleri için önceden çizilmiş sprite önbelleği.
+# Bağımlılıklar: PIL, numpy, threading, logging
+# Bağlı Dosyalar: oled_controller_base.py, oled_controller_display.py, oled_controller_framebuffer.py
+
+# Versiyon: 0.2.0
+# Değişiklikler:
+# - [0.2.0] Sprite'lar SSD1306 sayfa düzeninde paketlenmiş NumPy dizileri olarak saklanıyor
+# - [0.1.0] Tema, ekran, duygu, göz kırpma ve göz bebeği ofsetine göre anahtarlanan
+#           1-bit sprite önbelleği ve arka planda ısıtma desteği eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .oled_controller_framebuffer import pack_image
+
+# Logger yapılandırması
+logger = logging.getLogger("OLEDController")
+
+# Sprite çizim fonksiyonu: (draw, width, height) -> None
+SpriteRenderer = Callable[[ImageDraw.ImageDraw, int, int], None]
+
+
+class SpriteCache:
+    """
+    Önceden çizilmiş 1-bit ekran karelerini saklayan LRU önbellek
+
+    Her varyant bir kez ImageDraw ile çizilip SSD1306 sayfa düzenine
+    paketlenir, sonraki karelerde yalnızca kare tamponuna kopyalanır. Önbellek, animasyon döngüsü ve arka plan
+    ısıtma iş parçacığı tarafından aynı anda kullanılabilir.
+    """
+
+    def __init__(self, max_sprites: int = 2048):
+        """
+        Sprite önbelleğini başlatır
+
+        Args:
+            max_sprites (int): Önbellekte tutulacak maksimum sprite sayısı
+        """
+        self.max_sprites = max(1, max_sprites)
+        self._sprites = OrderedDict()
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Arka plan ısıtma durumu
+        self._warm_thread = None
+        self._warm_generation = 0
+        self.warming = False
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Önbellekteki sprite'ı döndürür
+
+        Args:
+            key (Hashable): Sprite anahtarı
+
+        Returns:
+            Optional[np.ndarray]: Sprite veya bulunamazsa None
+        """
+        with self._lock:
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+            return sprite
+
+    def get_or_render(self, key: Hashable, size: Tuple[int, int], renderer: SpriteRenderer) -> np.ndarray:
+        """
+        Sprite'ı önbellekten döndürür, yoksa çizip önbelleğe ekler
+
+        Args:
+            key (Hashable): Sprite anahtarı
+            size (Tuple[int, int]): Sprite boyutu (genişlik, yükseklik)
+            renderer (SpriteRenderer): Önbellekte yoksa çağrılacak çizim fonksiyonu
+
+        Returns:
+            np.ndarray: Sayfa düzeninde paketlenmiş sprite
+        """
+        sprite = self.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(size, renderer)
+        self._store(key, sprite)
+        return sprite
+
+    def _render(self, size: Tuple[int, int], renderer: SpriteRenderer) -> np.ndarray:
+        """
+        Yeni bir 1-bit sprite çizer ve sayfa düzenine paketler
+
+        Args:
+            size (Tuple[int, int]): Sprite boyutu
+            renderer (SpriteRenderer): Çizim fonksiyonu
+
+        Returns:
+            np.ndarray: (yükseklik // 8, genişlik) boyutunda paketlenmiş sprite
+        """
+        sprite = Image.new("1", size)
+        renderer(ImageDraw.Draw(sprite), size[0], size[1])
+        packed = pack_image(sprite)
+        packed.flags.writeable = False
+        return packed
+
+    def _store(self, key: Hashable, sprite: np.ndarray) -> None:
+        """
+        Sprite'ı önbelleğe ekler, gerekirse en eski kaydı çıkarır
+
+        Args:
+            key (Hashable): Sprite anahtarı
+            sprite (np.ndarray): Paketlenmiş sprite
+        """
+        with self._lock:
+            self._sprites[key] = sprite
+            self._sprites.move_to_end(key)
+            while len(self._sprites) > self.max_sprites:
+                self._sprites.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Önbelleği temizler ve devam eden ısıtmayı iptal eder
+        """
+        with self._lock:
+            self._warm_generation += 1
+            self._sprites.clear()
+
+    def warm(self, jobs: Iterable[Tuple[Hashable, Tuple[int, int], SpriteRenderer]]) -> None:
+        """
+        Verilen sprite'ları arka planda önceden çizer
+
+        Yeni bir ısıtma isteği veya clear() çağrısı, devam eden ısıtmayı iptal eder.
+
+        Args:
+            jobs (Iterable): (anahtar, boyut, çizim fonksiyonu) üçlüleri
+        """
+        with self._lock:
+            self._warm_generation += 1
+            generation = self._warm_generation
+
+        def warm_worker():
+            rendered = 0
+            self.warming = True
+            try:
+                for key, size, renderer in jobs:
+                    if generation != self._warm_generation:
+                        logger.debug("Sprite ısıtma iptal edildi (yeni istek)")
+                        return
+                    if self.get(key) is not None:
+                        continue
+                    try:
+                        self._store(key, self._render(size, renderer))
+                        rendered += 1
+                    except Exception as e:
+                        logger.debug(f"Sprite ısıtılırken hata: {key}, hata: {e}")
+                logger.info(f"Sprite önbelleği ısıtıldı: {rendered} yeni sprite")
+            finally:
+                if generation == self._warm_generation:
+                    self.warming = False
+
+        self._warm_thread = threading.Thread(target=warm_worker, name="SpriteWarmup")
+        self._warm_thread.daemon = True
+        self._warm_thread.start()
+
+    def get_stats(self) -> Dict:
+        """
+        Önbellek istatistiklerini döndürür
+
+        Returns:
+            Dict: Boyut, isabet, ıska ve çıkarma sayıları
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._sprites),
+            "max_size": self.max_sprites,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "warming": self.warming
+        }
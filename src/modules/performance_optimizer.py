@@ -7,8 +7,9 @@
 # Bağımlılıklar: psutil, logging, threading
 # Bağlı Dosyalar: face_plugin.py, oled_controller.py, led_controller.py, sound_processor.py
 
-# Versiyon: 0.5.0
+# Versiyon: 0.5.1
 # Değişiklikler:
+# - [0.5.1] FPS ayarı OLED kare zamanlayıcısının ölçtüğü p95 kare süresi ve kaçırılan son tarihlere göre yapılıyor
 # - [0.5.0] Ses işleme modülü (sound_processor) desteği eklendi
 # - [0.4.0] İlk sürüm - Faz 4 Performans Optimizasyonu
 #
@@ -64,6 +65,12 @@ class PerformanceOptimizer:
         self.battery_level = 100
         self.has_battery = self._check_battery_available()
         
+        # OLED animasyon döngüsünden ölçülen kare zamanlaması
+        self.frame_timing = None
+        self._last_missed_deadlines = 0
+        self._last_timed_frames = 0
+        self.recent_missed_ratio = 0.0
+        
         # İzleme ayarları
         self.check_interval = self.performance_config.get("check_interval", 5.0)
         self.cpu_threshold = self.performance_config.get("cpu_threshold", 70)
@@ -71,6 +78,10 @@ class PerformanceOptimizer:
         self.temp_threshold = self.performance_config.get("temperature_threshold", 70)
         self.battery_threshold = self.performance_config.get("battery_threshold", 20)
         
+        # Kare bütçesi: p95 kare süresi, kare periyodunun bu oranını aşmamalı
+        self.frame_budget_ratio = self.performance_config.get("frame_budget_ratio", 0.8)
+        self.missed_deadline_threshold = self.performance_config.get("missed_deadline_threshold", 0.05)
+        
         # Performans kademeleri [cpu_yuk, fps, parlaklık]
         self.performance_tiers = self.performance_config.get("performance_tiers", [
             [80, 15, 0.5],  # Yüksek yük: Düşük FPS, orta parlaklık
@@ -194,6 +205,8 @@ class PerformanceOptimizer:
                 self.memory_threshold = self.performance_config.get("memory_threshold", 80)
                 self.temp_threshold = self.performance_config.get("temperature_threshold", 70)
                 self.battery_threshold = self.performance_config.get("battery_threshold", 20)
+                self.frame_budget_ratio = self.performance_config.get("frame_budget_ratio", 0.8)
+                self.missed_deadline_threshold = self.performance_config.get("missed_deadline_threshold", 0.05)
                 self.auto_adjust_fps = self.performance_config.get("auto_adjust_fps", True)
                 self.auto_adjust_brightness = self.performance_config.get("auto_adjust_brightness", True)
                 self.battery_saver = self.performance_config.get("battery_saver_enabled", False)
@@ -265,6 +278,9 @@ class PerformanceOptimizer:
             if self.has_battery:
                 self.battery_level = self._get_battery_level()
             
+            # OLED kare zamanlaması
+            self._update_frame_timing()
+            
             logger.debug(f"Sistem metrikleri - CPU: {self.cpu_usage}%, "
                          f"Bellek: {self.memory_usage}%, "
                          f"Sıcaklık: {self.temperature}°C, "
@@ -273,6 +289,40 @@ class PerformanceOptimizer:
         except Exception as e:
             logger.error(f"Sistem metrikleri güncellenirken hata: {e}")
 
+    def _update_frame_timing(self) -> None:
+        """
+        OLED kare zamanlayıcısından kare süresi istatistiklerini alır
+        
+        Kaçırılan son tarih oranı, son kontrolden bu yana geçen kareler üzerinden hesaplanır.
+        """
+        if not self.oled_controller or not hasattr(self.oled_controller, "get_frame_timing"):
+            self.frame_timing = None
+            return
+        
+        timing = self.oled_controller.get_frame_timing()
+        frames = timing["frames"] - self._last_timed_frames
+        missed = timing["missed_deadlines"] - self._last_missed_deadlines
+        self.recent_missed_ratio = missed / frames if frames > 0 else 0.0
+        self._last_timed_frames = timing["frames"]
+        self._last_missed_deadlines = timing["missed_deadlines"]
+        self.frame_timing = timing
+    
+    def _get_sustainable_fps(self) -> Optional[float]:
+        """
+        Ölçülen p95 kare süresine göre kare bütçesini aşmayan en yüksek FPS'i döndürür
+        
+        Returns:
+            Optional[float]: Sürdürülebilir FPS veya ölçüm yoksa None
+        """
+        if not self.frame_timing or not self.frame_timing["samples"]:
+            return None
+        
+        p95_ms = self.frame_timing["frame_time_ms"]["p95"]
+        if p95_ms <= 0:
+            return None
+        
+        return 1000.0 * self.frame_budget_ratio / p95_ms
+    
     def _adjust_performance(self) -> None:
         """
         Performansı sistem yüküne göre ayarlar
@@ -288,6 +338,16 @@ class PerformanceOptimizer:
             fps = tier[1]
             brightness = tier[2]
             
+            # Ölçülen kare süreleri bütçeyi aşıyorsa FPS'i sürdürülebilir değere indir
+            sustainable_fps = self._get_sustainable_fps()
+            if sustainable_fps is not None and sustainable_fps < fps:
+                fps = max(10, int(sustainable_fps))
+            
+            # Son tarihler sık kaçırılıyorsa bir kademe daha düşür
+            if self.recent_missed_ratio > self.missed_deadline_threshold:
+                logger.debug(f"Kaçırılan kare oranı yüksek: {self.recent_missed_ratio:.1%}")
+                fps = max(10, int(fps * 0.75))
+            
             # Kritik durumda çok daha agresif önlemler al
             if is_cpu_high and is_memory_high and is_temp_high:
                 logger.warning("Sistem kaynakları kritik seviyede! Performans kısıtlanıyor.")
@@ -423,6 +483,9 @@ class PerformanceOptimizer:
             "battery_level": self.battery_level if self.has_battery else None,
             "battery_saver_active": self.has_battery and self.battery_level < self.battery_threshold and self.battery_saver,
             "current_fps": self.oled_controller.get_fps() if self.oled_controller else None,
+            "frame_time_p95_ms": self.frame_timing["frame_time_ms"]["p95"] if self.frame_timing else None,
+            "missed_deadline_ratio": self.recent_missed_ratio,
+            "sustainable_fps": self._get_sustainable_fps(),
             "current_brightness": self.led_controller.get_brightness() if self.led_controller else None,
             "auto_adjusting": {
                 "fps": self.auto_adjust_fps,
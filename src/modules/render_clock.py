@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: render_clock.py
+# Açıklama: OLED ve LED kontrolcülerinin zaman kaynağı. Canlı yüz sistem saatini kullanır;
+#           çevrimdışı önizleme çizicisi aynı kontrolcüleri, kare kare ilerletilen sanal
+#           saatle gerçek zamandan hızlı çalıştırır.
+# Bağımlılıklar: time
+# Bağlı Dosyalar: oled_controller_base.py, led_controller_base.py, animation_renderer.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Sistem saati ve sanal saat eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class SystemClock:
+    """
+    Sistem saati (canlı yüz için varsayılan zaman kaynağı)
+    """
+
+    def time(self) -> float:
+        """Duvar saati zamanını döndürür (saniye)"""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Monoton zamanı döndürür (saniye)"""
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Belirtilen süre bekler
+
+        Args:
+            seconds (float): Bekleme süresi (saniye)
+        """
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Elle ilerletilen sanal saat
+
+    time() ve monotonic() aynı değeri döndürür; kontrolcüler yalnızca zaman
+    farklarını kullandığından başlangıç değeri çıktıyı değiştirmez. sleep()
+    beklemez: on_sleep ayarlıysa hedef zamanla çağrılır (çizici bu sürede
+    düşen kareleri üretir), değilse saat doğrudan ileri alınır.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Sanal saati oluşturur
+
+        Args:
+            start (float, optional): Başlangıç zamanı (saniye). Varsayılan: 0.0
+        """
+        self.now = float(start)
+        self.on_sleep: Optional[Callable[[float], None]] = None
+
+    def time(self) -> float:
+        """Sanal zamanı döndürür (saniye)"""
+        return self.now
+
+    def monotonic(self) -> float:
+        """Sanal zamanı döndürür (saniye)"""
+        return self.now
+
+    def set(self, now: float) -> None:
+        """
+        Saati belirtilen zamana ayarlar (geri alınmaz)
+
+        Args:
+            now (float): Yeni zaman (saniye)
+        """
+        self.now = max(self.now, float(now))
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Bekleme yerine saati ilerletir
+
+        Args:
+            seconds (float): Bekleme süresi (saniye)
+        """
+        target = self.now + max(0.0, seconds)
+        if self.on_sleep is not None:
+            self.on_sleep(target)
+        self.set(target)
+
+
+# Canlı kontrolcülerin paylaştığı sistem saati
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: shared_framebuffer.py
+# Açıklama: Yüz eklentisi süreci ile dashboard süreci arasında mmap tabanlı paylaşılan
+#           kare tamponu. Yazıcı (OLED/LED kontrolcüleri) kareleri kodlamadan bölgeye kopyalar,
+#           okuyucu (dashboard) kilitsiz sıra numarası (seqlock) kontrolüyle okur.
+# Bağımlılıklar: mmap, struct, os
+# Bağlı Dosyalar: oled_controller_base.py, led_controller_base.py, dashboard_websocket.py, frame_sink.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Başlık, yuva tablosu ve yuva başına seqlock içeren paylaşılan kare tamponu eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+"""
+
+import os
+import mmap
+import atexit
+import time
+import struct
+import tempfile
+import threading
+import logging
+from typing import Dict, List, Optional
+
+from .frame_sink import Frame, FRAME_SSD1306, FRAME_RGB
+
+# Logger yapılandırması
+logger = logging.getLogger("SharedFrameBuffer")
+
+# Bölge düzeni (küçük endian):
+#   [0, 32)   Başlık: sihirli değer, sürüm, yuva sayısı, en fazla yuva, bölge boyutu, yazıcı PID
+#   [32, ...) Yuva tablosu: MAX_SLOTS x 48 bayt
+#   [...]     Kare verileri (64 bayt hizalı)
+# Her yuvanın 48 baytlık tanımı iki parçadan oluşur:
+#   [0, 30)   Sabit kısım: ad, tür, genişlik, yükseklik, veri ofseti, veri boyutu
+#   [32, 48)  Değişen kısım: sıra numarası (tek ise yazım sürüyor) ve zaman damgası
+MAGIC = b"F1FB"
+VERSION = 1
+MAX_SLOTS = 16
+HEADER = struct.Struct("<4sHHHxxIIxxxxxxxxxxxx")
+SLOT_STATIC = struct.Struct("<16sBxHHII")
+SLOT_DYNAMIC = struct.Struct("<Ixxxxd")
+SLOT_SIZE = 48
+SLOT_DYNAMIC_OFFSET = 32
+SLOT_TABLE_OFFSET = HEADER.size
+DATA_OFFSET = SLOT_TABLE_OFFSET + MAX_SLOTS * SLOT_SIZE
+DATA_ALIGN = 64
+
+KIND_CODES = {FRAME_SSD1306: 0, FRAME_RGB: 1}
+KIND_NAMES = {code: kind for kind, code in KIND_CODES.items()}
+
+
+def default_shared_framebuffer_path() -> str:
+    """
+    Varsayılan paylaşılan bellek dosyası yolunu döndürür
+
+    Varsa /dev/shm (bellekte dosya sistemi), yoksa geçici dizin kullanılır.
+
+    Returns:
+        str: Dosya yolu
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, "face1_framebuffer")
+
+
+class SharedFrameBuffer:
+    """
+    Paylaşılan kare tamponunun yazıcı tarafı
+
+    Her kaynak (ekran veya LED şeridi) için sabit boyutlu bir yuva ayrılır.
+    Yazım yuva başına seqlock ile yapılır: sıra numarası tek sayıya çekilir,
+    veri kopyalanır, zaman damgası yazılır ve sıra numarası tekrar çift yapılır.
+    Yuvalar aynı süreçteki farklı iş parçacıklarından yazılabilir.
+    """
+
+    def __init__(self, path: str, size: int = 65536):
+        """
+        Paylaşılan bölgeyi oluşturur
+
+        Dosya önce geçici adla hazırlanıp yerine taşınır; eski dosyayı açık tutan
+        okuyucular yarım başlık görmez ve yeni dosyayı fark edip yeniden açar.
+
+        Args:
+            path (str): Paylaşılan bellek dosyası
+            size (int): Bölge boyutu (bayt)
+        """
+        self.path = path
+        self.size = max(size, DATA_OFFSET + DATA_ALIGN)
+        self._lock = threading.Lock()
+        self._slots = {}  # Ad -> (yuva indeksi, ofset, boyut)
+        self._sequences = {}
+        self._next_offset = DATA_OFFSET
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.truncate(self.size)
+        self._file = open(temp_path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), self.size)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, 0, MAX_SLOTS, self.size, os.getpid())
+        os.replace(temp_path, path)
+
+        logger.info(f"Paylaşılan kare tamponu oluşturuldu: {path} ({self.size} bayt)")
+
+    def register(self, name: str, kind: str, width: int, height: int) -> bool:
+        """
+        Kaynak için yuva ayırır (aynı ad ikinci kez kaydedilirse mevcut yuva kullanılır)
+
+        Args:
+            name (str): Kaynak adı (ör. "left_eye", "leds")
+            kind (str): Kare türü (FRAME_SSD1306 veya FRAME_RGB)
+            width (int): Genişlik
+            height (int): Yükseklik
+
+        Returns:
+            bool: Yuva kullanılabilir ise True, yer kalmadıysa False
+        """
+        frame_size = (height // 8) * width if kind == FRAME_SSD1306 else width * height * 3
+
+        with self._lock:
+            if name in self._slots:
+                return self._slots[name][2] == frame_size
+
+            index = len(self._slots)
+            offset = self._next_offset
+            if index >= MAX_SLOTS or offset + frame_size > self.size:
+                logger.warning(f"Paylaşılan kare tamponunda yer kalmadı: {name}")
+                return False
+
+            slot_offset = SLOT_TABLE_OFFSET + index * SLOT_SIZE
+            SLOT_STATIC.pack_into(self._map, slot_offset, name.encode("utf-8")[:16], KIND_CODES[kind],
+                                  width, height, offset, frame_size)
+            SLOT_DYNAMIC.pack_into(self._map, slot_offset + SLOT_DYNAMIC_OFFSET, 0, 0.0)
+
+            # Yuva sayısı en son artırılır; okuyucu yarım tanım görmez
+            struct.pack_into("<H", self._map, 6, index + 1)
+
+            self._slots[name] = (index, offset, frame_size)
+            self._sequences[name] = 0
+            self._next_offset = (offset + frame_size + DATA_ALIGN - 1) // DATA_ALIGN * DATA_ALIGN
+            return True
+
+    def write(self, name: str, data) -> None:
+        """
+        Kaynağın karesini yuvasına yazar
+
+        Args:
+            name (str): Kaynak adı
+            data: Kare verisi (bytes, bytearray, memoryview veya C-bitişik numpy dizisi)
+        """
+        slot = self._slots.get(name)
+        if slot is None:
+            return
+
+        index, offset, frame_size = slot
+        seq_offset = SLOT_TABLE_OFFSET + index * SLOT_SIZE + SLOT_DYNAMIC_OFFSET
+        seq = self._sequences[name]
+
+        # Tek sıra numarası: yazım sürüyor
+        struct.pack_into("<I", self._map, seq_offset, (seq + 1) & 0xFFFFFFFF)
+        self._map[offset:offset + frame_size] = memoryview(data).cast("B")[:frame_size]
+        struct.pack_into("<d", self._map, seq_offset + 8, time.time())
+        # Çift sıra numarası: yazım tamamlandı
+        seq = (seq + 2) & 0xFFFFFFFF
+        struct.pack_into("<I", self._map, seq_offset, seq)
+        self._sequences[name] = seq
+
+    def close(self) -> None:
+        """
+        Bölgeyi kapatır ve dosyayı siler
+        """
+        try:
+            # Dosya bu arada başka bir yazıcı tarafından değiştirildiyse silme
+            replaced = os.stat(self.path).st_ino != os.fstat(self._file.fileno()).st_ino
+            self._map.close()
+            self._file.close()
+            if not replaced:
+                os.unlink(self.path)
+        except (OSError, ValueError):
+            pass
+
+
+class SharedFrameBufferReader:
+    """
+    Paylaşılan kare tamponunun okuyucu tarafı
+
+    Okuma kilitsizdir: sıra numarası okunur (tek ise yazım sürüyordur),
+    veri kopyalanır ve sıra numarası tekrar okunur; iki değer farklıysa
+    okuma tekrarlanır. Arayüz RingBufferSink ile aynıdır (sources/latest),
+    böylece dashboard her iki kaynağı da aynı şekilde kullanır.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_retries: int = 8):
+        """
+        Okuyucuyu başlatır (bölge henüz yoksa ilk erişimde açılır)
+
+        Args:
+            path (Optional[str]): Paylaşılan bellek dosyası (None ise varsayılan yol)
+            max_retries (int): Yazımla çakışan okumada en fazla deneme sayısı
+        """
+        self.path = path or default_shared_framebuffer_path()
+        self.max_retries = max_retries
+        self._file = None
+        self._map = None
+        self._inode = None
+        self._slots = {}
+        self._slot_count = 0
+        self.writer_pid = None
+        self.torn_reads = 0
+
+    def open(self) -> bool:
+        """
+        Bölgeyi açar; dosya yeniden oluşturulduysa yeni dosyaya geçer
+
+        Returns:
+            bool: Geçerli bir bölge açık ise True
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self.close()
+            return False
+
+        if self._map is not None and stat.st_ino == self._inode:
+            return True
+
+        self.close()
+        try:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, _, _, writer_pid = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                logger.warning(f"Paylaşılan kare tamponu tanınmadı: {self.path}")
+                self.close()
+                return False
+        except (OSError, ValueError, struct.error) as e:
+            logger.debug(f"Paylaşılan kare tamponu açılamadı: {e}")
+            self.close()
+            return False
+
+        self._inode = stat.st_ino
+        self.writer_pid = writer_pid
+        logger.info(f"Paylaşılan kare tamponu açıldı: {self.path} (yazıcı PID: {writer_pid})")
+        return True
+
+    def close(self) -> None:
+        """
+        Bölgeyi kapatır
+        """
+        if self._map is not None:
+            try:
+                self._map.close()
+                self._file.close()
+            except (OSError, ValueError):
+                pass
+        self._map = None
+        self._file = None
+        self._inode = None
+        self._slots = {}
+        self._slot_count = 0
+
+    def is_alive(self) -> bool:
+        """
+        Bölgenin açık ve yazıcı sürecin çalışıyor olup olmadığını döndürür
+
+        Returns:
+            bool: Yazıcı süreç çalışıyorsa True
+        """
+        if not self.open():
+            return False
+        try:
+            os.kill(self.writer_pid, 0)
+            return True
+        except PermissionError:
+            return True
+        except OSError:
+            return False
+
+    def _refresh_slots(self) -> None:
+        """
+        Yazıcı yeni yuva eklediyse yuva tablosunu yeniden okur
+        """
+        slot_count = struct.unpack_from("<H", self._map, 6)[0]
+        if slot_count == self._slot_count:
+            return
+
+        for index in range(self._slot_count, slot_count):
+            slot_offset = SLOT_TABLE_OFFSET + index * SLOT_SIZE
+            name, kind, width, height, offset, frame_size = SLOT_STATIC.unpack_from(self._map, slot_offset)
+            name = name.rstrip(b"\0").decode("utf-8")
+            self._slots[name] = (slot_offset + SLOT_DYNAMIC_OFFSET, KIND_NAMES.get(kind, FRAME_RGB),
+                                 width, height, offset, frame_size)
+        self._slot_count = slot_count
+
+    def sources(self) -> List[str]:
+        """
+        Bölgedeki kaynak adlarını döndürür
+
+        Returns:
+            List[str]: Kaynak adları
+        """
+        if not self.open():
+            return []
+        self._refresh_slots()
+        return list(self._slots)
+
+    def sequence(self, source: str) -> Optional[int]:
+        """
+        Kaynağın güncel sıra numarasını kopyalama yapmadan döndürür
+
+        Args:
+            source (str): Kaynak adı
+
+        Returns:
+            Optional[int]: Sıra numarası veya kaynak yoksa None
+        """
+        slot = self._slots.get(source)
+        if slot is None or self._map is None:
+            return None
+        return struct.unpack_from("<I", self._map, slot[0])[0]
+
+    def latest(self, source: str) -> Optional[Frame]:
+        """
+        Kaynağın son karesini tutarlı bir kopya olarak okur
+
+        Args:
+            source (str): Kaynak adı
+
+        Returns:
+            Optional[Frame]: Kare; kaynak yoksa, henüz yazılmadıysa veya
+                okuma sürekli yazımla çakıştıysa None
+        """
+        if self._map is None and not self.open():
+            return None
+        self._refresh_slots()
+
+        slot = self._slots.get(source)
+        if slot is None:
+            return None
+        seq_offset, kind, width, height, offset, frame_size = slot
+
+        for _ in range(self.max_retries):
+            seq_before = struct.unpack_from("<I", self._map, seq_offset)[0]
+            if seq_before & 1:
+                # Yazım sürüyor, yazıcıya süre tanı
+                time.sleep(0)
+                continue
+            if seq_before == 0:
+                return None
+
+            data = self._map[offset:offset + frame_size]
+            timestamp = struct.unpack_from("<d", self._map, seq_offset + 8)[0]
+
+            if struct.unpack_from("<I", self._map, seq_offset)[0] == seq_before:
+                return Frame(source, seq_before // 2, timestamp, kind, width, height, data)
+            self.torn_reads += 1
+
+        return None
+
+
+# Süreç genelinde paylaşılan yazıcı (OLED ve LED kontrolcüleri birlikte kullanır)
+_shared_framebuffer = None
+_shared_framebuffer_lock = threading.Lock()
+
+
+def get_shared_framebuffer(config: Dict) -> Optional[SharedFrameBuffer]:
+    """
+    Süreç genelindeki paylaşılan kare tamponu yazıcısını döndürür, yoksa oluşturur
+
+    Yapılandırma "shared_framebuffer" bölümünden okunur: enabled, path, size.
+
+    Args:
+        config (Dict): Yapılandırma ayarları
+
+    Returns:
+        Optional[SharedFrameBuffer]: Yazıcı veya devre dışıysa/oluşturulamadıysa None
+    """
+    global _shared_framebuffer
+
+    shared_config = config.get("shared_framebuffer", {})
+    if not shared_config.get("enabled", False):
+        return None
+
+    with _shared_framebuffer_lock:
+        if _shared_framebuffer is None:
+            try:
+                _shared_framebuffer = SharedFrameBuffer(
+                    shared_config.get("path") or default_shared_framebuffer_path(),
+                    shared_config.get("size", 65536)
+                )
+                atexit.register(_shared_framebuffer.close)
+            except OSError as e:
+                logger.error(f"Paylaşılan kare tamponu oluşturulamadı: {e}")
+                return None
+        return _shared_framebuffer
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+===========================================================
+# Proje: FACE1 - Raspberry Pi 5 Robot AI için Yüz Eklentisi
+# Dosya: theme_geometry.py
+# Açıklama: Göz ve ağız şekillerini tanımlayan bildirimsel geometri tabloları
+#           ve bunların ekran boyutuna göre önceden derlenmesi
+# Bağımlılıklar: logging, os, re, json, threading
+# Bağlı Dosyalar: theme_manager_base.py, oled_controller_display.py
+
+# Versiyon: 0.1.0
+# Değişiklikler:
+# - [0.1.0] Duygu başına göz/ağız şekil tabloları, ifade dili ve ekran boyutu
+#           başına düz koordinat dizilerine derleme eklendi
+#
+# Yazar: GitHub Copilot
+# Tarih: 2025-05-06
+===========================================================
+
+Bu modül, OLED ekranlarda çizilen göz ve ağız şekillerini kod yerine tablo
+olarak tanımlar. Temalar theme.json içindeki "geometry" bölümüyle bu
+tablonun istedikleri girdilerini değiştirebilir.
+
+Koordinatlar ekran merkezine göre ofsetlerdir ve "w/2", "-ew/2+5", "hy+hs*2"
+gibi ifadelerle yazılır. Her terim ``işaret * ((değişken * çarpan) // bölen)``
+olarak tamsayı aritmetiğiyle hesaplanır. Hazır değişkenler ``w`` (genişlik),
+``h`` (yükseklik) ve ``m`` (min(w, h)) dir; girdiler "vars" ile kendi
+değişkenlerini tanımlayabilir.
+
+Şekil türleri:
+    {"arc": [x0, y0, x1, y1], "start": 0, "end": 180, "width": 2}
+    {"ellipse": [x0, y0, x1, y1], "fill": false, "width": 1}
+    {"rectangle": [x0, y0, x1, y1], "fill": false, "width": 1}
+    {"line": [x0, y0, x1, y1, ...], "width": 1}
+    {"polygon": [x0, y0, x1, y1, ...], "fill": false, "width": 1}
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+# Logger yapılandırması
+logger = logging.getLogger("ThemeManager")
+
+# Tema dizini (proje kökü/themes)
+THEMES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))), "themes")
+
+# Derlenmiş tek bir çizim işlemi (koordinatlar mutlak piksel değerleridir)
+ShapeOp = namedtuple("ShapeOp", ["kind", "coords", "fill", "width", "start", "end"])
+
+# Derlenmiş göz geometrisi
+EyeGeometry = namedtuple("EyeGeometry", ["width", "height", "pupil_size", "pupil",
+                                         "center", "open_ops", "closed_ops"])
+
+# Koordinat ifadesindeki tek bir terim: [+-]? (sayı | değişken[*çarpan][/bölen])
+_TERM_PATTERN = re.compile(r"([+-]?)(?:(\d+)|([a-z_][a-z0-9_]*)(?:\*(\d+))?(?:/(\d+))?)")
+
+# Kutu (sol-üst / sağ-alt) koordinatı kullanan şekiller
+_BOX_SHAPES = ("arc", "ellipse", "rectangle")
+_POINT_SHAPES = ("line", "polygon")
+
+# Göz adları
+EYE_NAMES = ("left_eye", "right_eye")
+
+# Varsayılan geometri tablosu - temalar bu tablonun girdilerini değiştirebilir
+DEFAULT_GEOMETRY = {
+    "eyes": {
+        "default": {
+            "vars": {"ew": "w*3/4", "eh": "h*2/3", "ps": "m/8"},
+            "pupil": True,
+            "open": [{"ellipse": ["-ew/2", "-eh/2", "ew/2", "eh/2"]}],
+            "closed": [{"line": ["-w/3", 0, "w/3", 0], "width": 2}]
+        },
+        "happy": {"vars": {"eh": "h/2"}},
+        "excited": {"vars": {"eh": "h/2"}},
+        "surprised": {"vars": {"ew": "w*4/5", "eh": "h*3/4", "ps": "m/6"}},
+        "fearful": "surprised",
+        "angry": {
+            "vars": {"eh": "h/2", "ps": "m/10"},
+            "closed": [{"line": ["-w/3", -8, "w/3", 0], "width": 2}],
+            "left_eye": {
+                "open": [{"polygon": ["-ew/2", -5, "-ew/2+5", -15, "ew/2", -5,
+                                      "ew/2", "eh/3", "-ew/2", "eh/3"]}]
+            },
+            "right_eye": {
+                "open": [{"polygon": ["-ew/2", -5, "ew/2-5", -15, "ew/2", -5,
+                                      "ew/2", "eh/3", "-ew/2", "eh/3"]}]
+            }
+        },
+        "disgusted": {
+            "vars": {"ps": "m/10"},
+            "open": [{"polygon": ["-ew/2", 0, 0, "-eh/3", "ew/2", 0,
+                                  "ew/2", "eh/3", "-ew/2", "eh/3"]}]
+        },
+        "sad": {
+            "closed": [{"arc": ["-w/3", 0, "w/3", "h/3"], "start": 0, "end": 180, "width": 2}],
+            "left_eye": {
+                "open": [{"polygon": ["-ew/2", 0, "-ew/4", "-eh/4", "ew/2", 0,
+                                      "ew/3", "eh/3", "-ew/3", "eh/3"]}]
+            },
+            "right_eye": {
+                "open": [{"polygon": ["-ew/2", 0, "ew/4", "-eh/4", "ew/2", 0,
+                                      "ew/3", "eh/3", "-ew/3", "eh/3"]}]
+            }
+        },
+        "sleepy": {"vars": {"eh": "h/3"}},
+        "bored": "sleepy",
+        "confused": {
+            "right_eye": {
+                "vars": {"eh": "h/2"},
+                "open": [{"arc": ["-ew/2", "-eh/2", "ew/2", "eh/2"], "start": 180, "end": 0}]
+            }
+        },
+        "love": {
+            "vars": {"hs": "m/3"},
+            "pupil": False,
+            "open": [
+                {"ellipse": ["-hs", "-hs/2", 0, "hs/2"]},
+                {"ellipse": [0, "-hs/2", "hs", "hs/2"]},
+                {"polygon": ["-hs", 0, "hs", 0, 0, "hs"]}
+            ]
+        }
+    },
+    "mouth": {
+        "default": {
+            "vars": {"mw": "w*2/3", "mh": "h/3"},
+            "shapes": [{"arc": ["-mw/2", "-h/20", "mw/2", "h/10"], "start": 0, "end": 180, "width": 1}]
+        },
+
+        # Mutlu
+        "happy": {"shapes": [{"arc": ["-mw/2", "-mh/4", "mw/2", "mh/2"], "start": 0, "end": 180, "width": 2}]},
+        "content": "happy",
+        "joy": {"shapes": [
+            {"arc": ["-mw/2", "-mh/2", "mw/2", "mh"], "start": 0, "end": 180, "width": 2},
+            {"line": ["-mw/3", 0, "mw/3", 0], "width": 1}
+        ]},
+        "amused": {"shapes": [
+            {"arc": ["-mw/2", "-mh/4", "mw/2", "mh/2"], "start": 0, "end": 180, "width": 2},
+            {"arc": ["-mw/4", 0, "mw/4", "mh/4"], "start": 0, "end": 180, "width": 1}
+        ]},
+        "proud": {"shapes": [{"arc": ["-mw/2", "-mh/8", "mw/2", "mh/3"], "start": 0, "end": 180, "width": 2}]},
+
+        # Üzgün
+        "sad": {"shapes": [{"arc": ["-mw/2", "mh/4", "mw/2", "-mh/8"], "start": 180, "end": 360, "width": 2}]},
+        "disappointed": "sad",
+        "depressed": {"shapes": [{"arc": ["-mw/2", "mh/2", "mw/2", "-mh/4"], "start": 180, "end": 360, "width": 2}]},
+        "miserable": {"shapes": [
+            {"arc": ["-mw/2", "mh/2", "mw/2", "-mh/3"], "start": 180, "end": 360, "width": 2},
+            {"line": ["-mw/4", "mh/8", "mw/4", "mh/8"], "width": 1}
+        ]},
+        "guilty": {"shapes": [{"arc": ["-mw/2", "mh/3", "mw/2", "-mh/8"], "start": 180, "end": 360, "width": 2}]},
+        "lonely": "guilty",
+
+        # Kızgın
+        "angry": {"shapes": [{"line": ["-mw/2", "h/20", "mw/2", "h/20"], "width": 2}]},
+        "enraged": {
+            "vars": {"tw": "mw*2/3"},
+            "shapes": [
+                {"rectangle": ["-mw/2", "-h/8", "mw/2", "h/4"]},
+                {"line": ["-mw/3", "-h/8", "-mw/3", "h/4"], "width": 1},
+                {"line": ["-mw/3+tw/4", "-h/8", "-mw/3+tw/4", "h/4"], "width": 1},
+                {"line": ["-mw/3+tw*2/4", "-h/8", "-mw/3+tw*2/4", "h/4"], "width": 1},
+                {"line": ["-mw/3+tw*3/4", "-h/8", "-mw/3+tw*3/4", "h/4"], "width": 1},
+                {"line": ["-mw/3+tw", "-h/8", "-mw/3+tw", "h/4"], "width": 1}
+            ]
+        },
+        "frustrated": {"shapes": [{"line": ["-mw/2", 0, "mw/2", 0], "width": 3}]},
+        "irritated": "frustrated",
+        "bitter": {"shapes": [{"arc": ["-mw/2", "h/6", "mw/2", "-h/8"], "start": 190, "end": 350, "width": 2}]},
+
+        # Şaşkın
+        "surprised": {"shapes": [{"ellipse": ["-w/5", "-h/8", "w/5", "h/5"], "width": 2}]},
+        "shocked": {"shapes": [{"ellipse": ["-w/4", "-h/6", "w/4", "h/4"], "width": 2}]},
+        "amazed": {"shapes": [{"ellipse": ["-w/4", "-h/8", "w/4", "h/4"], "width": 2}]},
+        "startled": {"shapes": [{"ellipse": ["-w/5", "-h/10", "w/5", "h/5"], "width": 2}]},
+        "astonished": {"shapes": [
+            {"ellipse": ["-w/4", "-h/6", "w/4", "h/4"], "width": 2},
+            {"line": [0, "-h/10", 0, "h/10"], "width": 1},
+            {"ellipse": [-1, "h/8-1", 1, "h/8+1"], "fill": True}
+        ]},
+
+        # Korkmuş
+        "fearful": {
+            "vars": {"mw": "w/2", "mh": "h/4"},
+            "shapes": [{"ellipse": ["-mw/2", "-mh/4", "mw/2", "mh/2"], "width": 1}]
+        },
+        "terrified": {"shapes": [{"ellipse": ["-w/3", "-h/6", "w/3", "h/3"], "width": 2}]},
+        "anxious": {
+            "vars": {"mw": "w/2"},
+            "shapes": [{"line": ["-mw/2", 0, "-mw/2+mw/9", -2, "-mw/2+mw*2/9", -1,
+                                 "-mw/2+mw*3/9", 1, "-mw/2+mw*4/9", 2, "-mw/2+mw*5/9", -1,
+                                 "-mw/2+mw*6/9", -2, "-mw/2+mw*7/9", 0, "-mw/2+mw*8/9", 1,
+                                 "-mw/2+mw", 2], "width": 1}]
+        },
+        "nervous": "anxious",
+        "worried": {
+            "vars": {"mw": "w/2", "mh": "h/4"},
+            "shapes": [{"arc": ["-mw/2", "mh/2", "mw/2", "-mh/8"], "start": 190, "end": 350, "width": 2}]
+        },
+        "scared": "worried",
+
+        # Tiksinmiş
+        "disgusted": {"shapes": [{"arc": ["-mw/2", "h/10", "mw/2", "-h/10"], "start": 190, "end": 350, "width": 2}]},
+        "revolted": {"shapes": [{"line": ["-mw/2", 0, "-mw/4", "h/6", 0, 0, "mw/4", "-h/8", "mw/2", 0], "width": 2}]},
+        "disapproval": {"shapes": [{"arc": ["-mw/2", "h/8", "mw/2", "-h/8"], "start": 200, "end": 340, "width": 2}]},
+        "judgmental": "disapproval",
+        "loathing": {"shapes": [
+            {"arc": ["-mw/2", "h/6", "mw/2", "-h/8"], "start": 210, "end": 330, "width": 2},
+            {"arc": ["-mw/3", "h/10", "mw/3", 0], "start": 210, "end": 330, "width": 1}
+        ]},
+
+        # Özel duygular
+        "confused": {
+            "vars": {"mh": "h/6"},
+            "shapes": [{"line": ["-mw/2", 0, "-mw/2+mw/8", "mh/3", "-mw/2+mw*2/8", 0,
+                                 "-mw/2+mw*3/8", "-mh/3", "-mw/2+mw*4/8", 0, "-mw/2+mw*5/8", "mh/3",
+                                 "-mw/2+mw*6/8", 0, "-mw/2+mw*7/8", "-mh/3", "-mw/2+mw", 0], "width": 2}]
+        },
+        "excited": {
+            "vars": {"mw": "w*3/4", "mh": "h/2"},
+            "shapes": [
+                {"arc": ["-mw/2", "-mh/3", "mw/2", "mh"], "start": 0, "end": 180, "width": 2},
+                {"arc": ["-mw/3", 0, "mw/3", "mh/2"], "start": 0, "end": 180, "width": 1}
+            ]
+        },
+        "bored": {
+            "vars": {"mw": "w/2"},
+            "shapes": [{"arc": ["-mw/2", -5, "mw/2", 15], "start": 190, "end": 350, "width": 2}]
+        },
+        "sleepy": {
+            "vars": {"mw": "w/3", "zw": "mw/3", "zh": "mh/3", "zx": "zw/2", "zy": "-zh/2"},
+            "shapes": [
+                {"ellipse": ["-mw/2", "-mh/2", "mw/2", "mh/2"], "width": 2},
+                {"line": ["zx-zw", "zy-zh", "zx+zw", "zy-zh"], "width": 1},
+                {"line": ["zx+zw", "zy-zh", "zx-zw", "zy+zh"], "width": 1},
+                {"line": ["zx-zw", "zy+zh", "zx+zw", "zy+zh"], "width": 1}
+            ]
+        },
+        "love": {
+            "vars": {"hs": "mh/2", "hy": "-mh-hs"},
+            "shapes": [
+                {"arc": ["-mw/2", "-mh", "mw/2", "mh"], "start": 0, "end": 180, "width": 2},
+                {"ellipse": ["-hs", "hy", 0, "hy+hs"], "fill": True},
+                {"ellipse": [0, "hy", "hs", "hy+hs"], "fill": True},
+                {"polygon": ["-hs", "hy+hs/2", "hs", "hy+hs/2", 0, "hy+hs*2"], "fill": True}
+            ]
+        },
+
+        # Sakin
+        "calm": {"shapes": [{"line": ["-mw/2", 0, "mw/2", 0], "width": 1}]},
+        "relaxed": {"shapes": [{"arc": ["-mw/2", "-h/16", "mw/2", "h/6"], "start": 0, "end": 180, "width": 1}]},
+        "peaceful": "relaxed",
+        "serene": {"shapes": [{"arc": ["-mw/2", "-h/10", "mw/2", "h/20"], "start": 0, "end": 180, "width": 1}]},
+        "tranquil": "serene",
+
+        # Nötr
+        "neutral": "calm",
+        "indifferent": {"shapes": [{"arc": ["-mw/2", "h/30", "mw/2", "-h/30"], "start": 190, "end": 350, "width": 1}]},
+        "unconcerned": "indifferent"
+    }
+}
+
+
+def _evaluate(expression, variables: Dict[str, int]) -> int:
+    """
+    Bir koordinat ifadesini tamsayı olarak hesaplar
+
+    Args:
+        expression (Union[int, str]): Sayı veya "w/2", "-ew/2+5" gibi ifade
+        variables (Dict[str, int]): Tanımlı değişkenler
+
+    Returns:
+        int: Hesaplanan değer
+    """
+    if isinstance(expression, bool):
+        raise ValueError(f"Geçersiz koordinat: {expression!r}")
+    if isinstance(expression, int):
+        return expression
+    if not isinstance(expression, str):
+        raise ValueError(f"Geçersiz koordinat: {expression!r}")
+
+    text = expression.replace(" ", "")
+    total = 0
+    position = 0
+    while position < len(text):
+        match = _TERM_PATTERN.match(text, position)
+        if not match or match.end() == position or (position > 0 and not match.group(1)):
+            raise ValueError(f"Geçersiz koordinat ifadesi: {expression!r}")
+
+        sign, number, name, multiplier, divisor = match.groups()
+        if number is not None:
+            value = int(number)
+        else:
+            if name not in variables:
+                raise ValueError(f"Tanımsız değişken '{name}': {expression!r}")
+            value = variables[name] * int(multiplier or 1)
+            if divisor:
+                value //= int(divisor)
+
+        total += -value if sign == "-" else value
+        position = match.end()
+
+    if not text:
+        raise ValueError("Boş koordinat ifadesi")
+    return total
+
+
+def _compile_shapes(shapes: List[Dict], variables: Dict[str, int],
+                    center: Tuple[int, int]) -> Tuple[ShapeOp, ...]:
+    """
+    Şekil tanımlarını mutlak koordinatlı çizim işlemlerine derler
+
+    Args:
+        shapes (List[Dict]): Şekil tanımları
+        variables (Dict[str, int]): Tanımlı değişkenler
+        center (Tuple[int, int]): Ekran merkezi
+
+    Returns:
+        Tuple[ShapeOp, ...]: Derlenmiş çizim işlemleri
+    """
+    center_x, center_y = center
+    ops = []
+
+    for shape in shapes:
+        kind = next((k for k in _BOX_SHAPES + _POINT_SHAPES if k in shape), None)
+        if kind is None:
+            raise ValueError(f"Bilinmeyen şekil: {shape}")
+
+        values = shape[kind]
+        if len(values) < 4 or len(values) % 2:
+            raise ValueError(f"Geçersiz koordinat sayısı: {shape}")
+
+        coords = [_evaluate(value, variables) + (center_x if i % 2 == 0 else center_y)
+                  for i, value in enumerate(values)]
+
+        if kind in _BOX_SHAPES:
+            # PIL sol-üst köşenin sağ-alt köşeden küçük olmasını bekler
+            x0, y0, x1, y1 = coords
+            coords = [min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)]
+
+        ops.append(ShapeOp(kind, tuple(coords), bool(shape.get("fill", False)),
+                           int(shape.get("width", 1)),
+                           shape.get("start", 0), shape.get("end", 360)))
+
+    return tuple(ops)
+
+
+def draw_shapes(draw, ops: Tuple[ShapeOp, ...]) -> None:
+    """
+    Derlenmiş çizim işlemlerini bir çizim nesnesine uygular
+
+    Args:
+        draw (ImageDraw): Çizim nesnesi
+        ops (Tuple[ShapeOp, ...]): Derlenmiş çizim işlemleri
+    """
+    for op in ops:
+        if op.kind == "arc":
+            draw.arc(op.coords, op.start, op.end, fill=1, width=op.width)
+        elif op.kind == "line":
+            draw.line(op.coords, fill=1, width=op.width)
+        elif op.fill:
+            getattr(draw, op.kind)(op.coords, fill=1)
+        else:
+            getattr(draw, op.kind)(op.coords, outline=1, width=op.width)
+
+
+class ThemeGeometry:
+    """
+    Bir temanın göz ve ağız geometrisi
+
+    Tema tabloları varsayılan tablonun üzerine girdi bazında birleştirilir ve
+    her ekran boyutu için bir kez düz koordinat dizilerine derlenir. Çizim
+    sırasında yalnızca tablo araması yapılır.
+    """
+
+    def __init__(self, spec: Optional[Dict] = None, name: str = "default"):
+        """
+        Tema geometrisini oluşturur
+
+        Args:
+            spec (Optional[Dict]): Temanın "geometry" bölümü (None ise varsayılan tablo)
+            name (str): Tema adı (günlük mesajları için)
+        """
+        self.name = name
+        spec = spec or {}
+        self.eyes = dict(DEFAULT_GEOMETRY["eyes"])
+        self.eyes.update(spec.get("eyes", {}))
+        self.mouth = dict(DEFAULT_GEOMETRY["mouth"])
+        self.mouth.update(spec.get("mouth", {}))
+
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, table: Dict, key: str) -> Dict:
+        """
+        Tablodaki bir girdiyi takma adları izleyerek döndürür
+
+        Args:
+            table (Dict): Göz veya ağız tablosu
+            key (str): Girdi adı
+
+        Returns:
+            Dict: Girdi tanımı
+        """
+        seen = set()
+        entry = table.get(key)
+        while isinstance(entry, str):
+            if entry in seen:
+                raise ValueError(f"Döngüsel geometri takma adı: {key}")
+            seen.add(entry)
+            entry = table.get(entry)
+        if entry is None:
+            raise ValueError(f"Geometri girdisi bulunamadı: {key}")
+        return entry
+
+    def _merge(self, base: Dict, entry: Dict) -> Dict:
+        """
+        Bir girdiyi temel girdinin üzerine birleştirir (değişkenler sözlük olarak birleşir)
+
+        Args:
+            base (Dict): Temel girdi
+            entry (Dict): Üzerine yazılacak girdi
+
+        Returns:
+            Dict: Birleştirilmiş girdi
+        """
+        merged = dict(base)
+        merged.update(entry)
+        merged["vars"] = dict(base.get("vars", {}))
+        merged["vars"].update(entry.get("vars", {}))
+        return merged
+
+    def _variables(self, entry: Dict, width: int, height: int) -> Dict[str, int]:
+        """
+        Girdinin değişkenlerini sırayla hesaplar
+
+        Args:
+            entry (Dict): Birleştirilmiş girdi
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+
+        Returns:
+            Dict[str, int]: Değişken değerleri
+        """
+        variables = {"w": width, "h": height, "m": min(width, height)}
+        for name, expression in entry.get("vars", {}).items():
+            variables[name] = _evaluate(expression, variables)
+        return variables
+
+    def _compile_size(self, width: int, height: int) -> Dict:
+        """
+        Tüm göz ve ağız girdilerini bir ekran boyutu için derler
+
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+
+        Returns:
+            Dict: ("eye", göz, duygu) ve ("mouth", duygu) anahtarlı derlenmiş tablo
+        """
+        center = (width // 2, height // 2)
+        compiled = {}
+
+        eye_default = self._resolve(self.eyes, "default")
+        for emotion in self.eyes:
+            entry = self._merge(eye_default, self._resolve(self.eyes, emotion))
+            for eye_name in EYE_NAMES:
+                eye_entry = self._merge(entry, entry.get(eye_name, {}))
+                variables = self._variables(eye_entry, width, height)
+                compiled[("eye", eye_name, emotion)] = EyeGeometry(
+                    variables.get("ew", 0), variables.get("eh", 0), variables.get("ps", 0),
+                    bool(eye_entry.get("pupil", True)), center,
+                    _compile_shapes(eye_entry.get("open", []), variables, center),
+                    _compile_shapes(eye_entry.get("closed", []), variables, center))
+
+        mouth_default = self._resolve(self.mouth, "default")
+        for emotion in self.mouth:
+            entry = self._merge(mouth_default, self._resolve(self.mouth, emotion))
+            variables = self._variables(entry, width, height)
+            compiled[("mouth", emotion)] = _compile_shapes(entry.get("shapes", []), variables, center)
+
+        return compiled
+
+    def compile(self, width: int, height: int) -> Dict:
+        """
+        Bir ekran boyutu için derlenmiş tabloyu döndürür (gerekirse derler)
+
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+
+        Returns:
+            Dict: Derlenmiş tablo
+
+        Raises:
+            ValueError: Tablo geçersiz bir ifade veya şekil içeriyorsa
+        """
+        size = (width, height)
+        compiled = self._compiled.get(size)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(size)
+                if compiled is None:
+                    compiled = self._compile_size(width, height)
+                    self._compiled[size] = compiled
+                    logger.debug(f"Tema geometrisi derlendi: {self.name} {width}x{height} "
+                                 f"({len(compiled)} girdi)")
+        return compiled
+
+    def eye(self, width: int, height: int, eye_name: str, base_emotion: str) -> EyeGeometry:
+        """
+        Bir gözün derlenmiş geometrisini döndürür
+
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            eye_name (str): Göz adı ("left_eye" veya "right_eye")
+            base_emotion (str): Ana duygu
+
+        Returns:
+            EyeGeometry: Göz boyutları, göz bebeği bilgisi ve açık/kapalı çizim işlemleri
+        """
+        compiled = self.compile(width, height)
+        geometry = compiled.get(("eye", eye_name, base_emotion))
+        if geometry is None:
+            geometry = compiled[("eye", eye_name, "default")]
+        return geometry
+
+    def mouth_ops(self, width: int, height: int, emotion: str,
+                  base_emotion: Optional[str] = None) -> Tuple[ShapeOp, ...]:
+        """
+        Bir ağız ifadesinin derlenmiş çizim işlemlerini döndürür
+
+        Önce duygunun kendisi, sonra ana duygu, en son varsayılan girdi aranır.
+
+        Args:
+            width (int): Ekran genişliği
+            height (int): Ekran yüksekliği
+            emotion (str): Duygu veya alt duygu tipi
+            base_emotion (Optional[str]): Ana duygu
+
+        Returns:
+            Tuple[ShapeOp, ...]: Çizim işlemleri
+        """
+        compiled = self.compile(width, height)
+        for key in (emotion, base_emotion, "default"):
+            ops = compiled.get(("mouth", key))
+            if ops is not None:
+                return ops
+        return ()
+
+
+def load_theme_geometry(theme_name: str, theme_base_dir: Optional[str] = None) -> ThemeGeometry:
+    """
+    Bir temanın geometrisini theme.json dosyasından yükler
+
+    Tema yöneticisi olmadan çalışan OLED denetleyicisi tarafından kullanılır.
+    Dosya okunamazsa veya geometri geçersizse varsayılan tablo döndürülür.
+
+    Args:
+        theme_name (str): Tema adı
+        theme_base_dir (Optional[str]): Tema dizini (None ise proje/themes)
+
+    Returns:
+        ThemeGeometry: Tema geometrisi
+    """
+    theme_file = os.path.join(theme_base_dir or THEMES_DIR, theme_name, "theme.json")
+    spec = None
+    try:
+        with open(theme_file, "r") as f:
+            spec = json.load(f).get("geometry")
+    except (OSError, ValueError) as e:
+        logger.debug(f"Tema geometrisi okunamadı, varsayılan kullanılıyor: {theme_file} ({e})")
+
+    return build_theme_geometry(spec, theme_name)
+
+
+def build_theme_geometry(spec: Optional[Dict], theme_name: str = "default",
+                         sizes: Optional[List[Tuple[int, int]]] = None) -> ThemeGeometry:
+    """
+    Tema geometrisini oluşturur ve verilen ekran boyutları için derler
+
+    Args:
+        spec (Optional[Dict]): Temanın "geometry" bölümü
+        theme_name (str): Tema adı
+        sizes (Optional[List[Tuple[int, int]]]): Önceden derlenecek ekran boyutları
+
+    Returns:
+        ThemeGeometry: Tema geometrisi (geçersizse varsayılan tablo)
+    """
+    try:
+        geometry = ThemeGeometry(spec, theme_name)
+        for width, height in sizes or []:
+            geometry.compile(width, height)
+        return geometry
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.error(f"Tema geometrisi geçersiz, varsayılan kullanılıyor: {theme_name} ({e})")
+        return ThemeGeometry(None, theme_name)
@@ -5,17 +5,18 @@
 # Dosya: theme_manager_base.py
 # Açıklama: Tema yöneticisi temel sınıfı ve çekirdek işlevler
 # Bağımlılıklar: logging, os, pathlib, json
-# Bağlı Dosyalar: oled_controller.py, face_plugin.py
+# Bağlı Dosyalar: oled_controller.py, face_plugin.py, theme_geometry.py
 
-# Versiyon: 0.3.4
+# Versiyon: 0.3.5
 # Değişiklikler:
 # - [0.1.0] Temel tema yöneticisi sınıfı oluşturuldu
 # - [0.2.0] Tema önizleme özelliği, Pixel ve Gerçekçi tema şablonları eklendi
 # - [0.3.0] Tema düzenleme, kopyalama ve önizleme özellikleri geliştirildi  
 # - [0.3.3] Tema önbellek sistemi geliştirildi
 # - [0.3.4] Tema varlıkları için iyileştirme ve önbellek performans optimizasyonu eklendi
+# - [0.3.5] Tema değişiminde göz/ağız geometri tabloları ekran boyutları için önceden derleniyor
 #
-# Son Güncelleme: 2025-05-02
+# Son Güncelleme: 2025-05-06
 # Yazar: GitHub Copilot
 # Tarih: 2025-05-02
 ===========================================================
@@ -36,6 +37,8 @@ import time
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 
+from .theme_geometry import ThemeGeometry, build_theme_geometry
+
 # Proje dizinini ve include dizinini Python yoluna ekle
 PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 sys.path.append(str(PROJECT_DIR))
@@ -98,6 +101,9 @@ class BaseThemeManager:
         # Tema değiştirme için geri çağırma listesi
         self.change_callbacks = []
         
+        # Aktif temanın derlenmiş göz/ağız geometrisi
+        self.theme_geometry = None
+        
         # Tema listesi önbelleği
         self.themes_list_cache = []
         self.themes_list_cache_timestamp = 0
@@ -178,6 +184,9 @@ class BaseThemeManager:
                     logger.error("Varsayılan tema da yüklenemedi!")
                     return False
             
+            # Aktif temanın geometrisini derle
+            self.theme_geometry = self._compile_theme_geometry(self.active_theme, self.load_theme(self.active_theme))
+            
             logger.info(f"Tema yöneticisi başlatıldı. Mevcut tema: {self.active_theme}")
             return True
             
@@ -215,11 +224,15 @@ class BaseThemeManager:
             logger.error(f"Tema verileri yüklenemedi: {theme_name}")
             return False
         
+        # Göz/ağız geometrisini ekran boyutları için önceden derle
+        geometry = self._compile_theme_geometry(theme_name, theme_data)
+        
         # Önceki tema
         prev_theme = self.active_theme
         
         # Mevcut temayı güncelle
         self.active_theme = theme_name
+        self.theme_geometry = geometry
         
         # Geri çağırma fonksiyonlarını tetikle
         for callback in self.change_callbacks:
@@ -235,6 +248,43 @@ class BaseThemeManager:
         logger.info(f"Tema değiştirildi: {prev_theme} -> {theme_name}")
         return True
     
+    def get_theme_geometry(self) -> ThemeGeometry:
+        """
+        Aktif temanın derlenmiş göz/ağız geometrisini döndürür
+        
+        Returns:
+            ThemeGeometry: Tema geometrisi
+        """
+        if self.theme_geometry is None:
+            self.theme_geometry = self._compile_theme_geometry(self.active_theme, self.load_theme(self.active_theme))
+        return self.theme_geometry
+    
+    def _get_display_sizes(self) -> List[tuple]:
+        """
+        Yapılandırmadaki OLED ekran boyutlarını döndürür
+        
+        Returns:
+            List[tuple]: (genişlik, yükseklik) listesi
+        """
+        displays = self.config.get("hardware", {}).get("oled_displays", {})
+        sizes = {(display.get("width", 128), display.get("height", 64))
+                 for display in displays.values() if isinstance(display, dict)}
+        return sorted(sizes) or [(128, 64)]
+    
+    def _compile_theme_geometry(self, theme_name: str, theme_data: Optional[Dict]) -> ThemeGeometry:
+        """
+        Temanın "geometry" bölümünü ekran boyutları için derler
+        
+        Args:
+            theme_name (str): Tema adı
+            theme_data (Optional[Dict]): Tema verileri
+        
+        Returns:
+            ThemeGeometry: Derlenmiş tema geometrisi
+        """
+        spec = (theme_data or {}).get("geometry")
+        return build_theme_geometry(spec, theme_name, self._get_display_sizes())
+    
     def get_current_theme(self) -> str:
         """
         Mevcut tema adını döndürür
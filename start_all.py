@@ -9,6 +9,10 @@ import psutil
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 SRC_DIR = os.path.join(ROOT_DIR, "src")
 STATUS_FILE = os.path.join(ROOT_DIR, "face_plugin_status.json")
+CONFIG_FILE = os.path.join(ROOT_DIR, "config", "config.json")
+sys.path.append(SRC_DIR)
+
+from modules.face.face_plugin_ipc import FacePluginIPCClient, get_ipc_socket_path
 
 def start_process(command, name):
     try:
@@ -20,8 +24,33 @@ def start_process(command, name):
         print(f"{name} başlatılamadı: {e}")
         return None
 
+def load_config():
+    """Yapılandırma dosyasını okur (okunamazsa boş sözlük döner)"""
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
 def wait_for_status_file(timeout=30):
-    """Durum dosyasının oluşturulmasını ve yüz eklentisinin çalışır duruma gelmesini bekler"""
+    """Yüz eklentisinin çalışır duruma gelmesini bekler
+    
+    IPC kanalı etkinse eklentinin soketi ping'e yanıt verdiği anda (milisaniyeler içinde)
+    döner; IPC kapalıysa durum dosyası yoklanır.
+    """
+    config = load_config()
+    if config.get("ipc", {}).get("enabled", True):
+        client = FacePluginIPCClient(get_ipc_socket_path(config))
+        try:
+            if client.wait_until_ready(timeout=timeout, interval=0.01):
+                print(f"Yüz eklentisi çalışır durumda tespit edildi (IPC, {client.last_rtt_ms:.2f} ms)")
+                return True
+        finally:
+            client.close()
+        
+        print("Yüz eklentisinin çalışır duruma gelmesi zaman aşımına uğradı")
+        return False
+    
     start_time = time.time()
     while (time.time() - start_time) < timeout:
         if os.path.exists(STATUS_FILE):
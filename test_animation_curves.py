@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+FACE1 anahtar kare eğrileri test betiği
+Eğri değerlendirmesini (yumuşatma tabloları, döngü, sınırlama) doğrudan
+yumuşatma fonksiyonlarıyla hesaplanan değerlerle, oynatıcı davranışıyla ve
+OLED kontrolcüsüne uygulanan duygu yoğunluğu izini test eder.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.animation_curves import (EASING_FUNCTIONS, EASING_TABLE_SIZE, CurvePlayer,
+                                          KeyframeCurve, compile_curves)
+from src.modules.animation_renderer import AnimationRenderer
+from src.modules.render_clock import VirtualClock
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def close(a, b, tolerance=1e-9):
+    """İki eğri değerini (float veya demet) karşılaştırır"""
+    if isinstance(a, tuple):
+        return len(a) == len(b) and all(abs(x - y) <= tolerance for x, y in zip(a, b))
+    return abs(a - b) <= tolerance
+
+
+def test_linear_evaluate():
+    """Doğrusal eğri anahtar karelerde tam, aralarda doğrusal değer vermeli"""
+    curve = KeyframeCurve("mouth_openness", [
+        {"time": 1.0, "value": 0.8},
+        {"time": 0.0, "value": 0.0},  # Sırasız anahtar kareler zamana göre dizilir
+        {"time": 2.0, "value": 0.4},
+    ])
+
+    assert curve.duration == 2.0
+    assert curve.evaluate(-1.0) == 0.0
+    assert curve.evaluate(0.0) == 0.0
+    assert close(curve.evaluate(0.5), 0.4, 1.0 / EASING_TABLE_SIZE)
+    assert curve.evaluate(1.0) == 0.8
+    assert close(curve.evaluate(1.5), 0.6, 1.0 / EASING_TABLE_SIZE)
+    assert curve.evaluate(2.0) == 0.4
+    assert curve.evaluate(10.0) == 0.4
+
+
+def test_easing_tables():
+    """Tablo okuma her yumuşatmada fonksiyonun bir tablo adımı içindeki değişiminden fazla sapmamalı"""
+    for easing, func in EASING_FUNCTIONS.items():
+        if easing == "step":
+            continue
+        curve = KeyframeCurve("led_brightness", [{"time": 0.0, "value": 0.0},
+                                                 {"time": 1.0, "value": 1.0}], easing)
+        for i in range(1, 100):
+            u = i / 100.0
+            expected = max(0.0, min(1.0, func(u)))
+            step = [func(u - k / (16.0 * EASING_TABLE_SIZE)) for k in range(17)]
+            tolerance = max(abs(value - func(u)) for value in step) + 1e-9
+            assert close(curve.evaluate(u), expected, tolerance), f"{easing}: u={u}"
+
+
+def test_step_and_per_keyframe_easing():
+    """"step" değeri bir sonraki anahtar kareye kadar tutmalı; easing anahtar kare başına geçerli"""
+    curve = KeyframeCurve("emotion_intensity", [
+        {"time": 0.0, "value": 0.2, "easing": "step"},
+        {"time": 1.0, "value": 0.6},
+        {"time": 2.0, "value": 1.0},
+    ])
+
+    assert curve.evaluate(0.99) == 0.2
+    assert curve.evaluate(1.0) == 0.6
+    assert close(curve.evaluate(1.5), 0.8, 1.0 / EASING_TABLE_SIZE)
+
+
+def test_vector_tracks_and_clamping():
+    """Çok boyutlu izler demet döndürmeli, değerler iz aralığında tutulmalı"""
+    curve = KeyframeCurve("eye_position", [{"time": 0.0, "value": [-3, 0]},
+                                           {"time": 1.0, "value": [1, 0.5]}], "bounce")
+    assert curve.evaluate(0.0) == (-1.0, 0.0)
+    assert curve.evaluate(1.0) == (1.0, 0.5)
+    for i in range(101):
+        x, y = curve.evaluate(i / 100.0)
+        assert -1.0 <= x <= 1.0 and -1.0 <= y <= 1.0
+
+    color = KeyframeCurve("led_color", [{"time": 0.0, "value": [0, 0, 0]},
+                                        {"time": 1.0, "value": [255, 128, 0]}])
+    assert close(color.evaluate(0.5), (127.5, 64.0, 0.0), 2.0)
+
+
+def test_loop():
+    """Döngülü eğri ilk ve son anahtar kare arasında başa sarılmalı (sarma anı hariç)"""
+    keyframes = [{"time": 0.5, "value": 0.0}, {"time": 1.5, "value": 1.0}]
+    looped = KeyframeCurve("mouth_openness", keyframes, loop=True)
+    once = KeyframeCurve("mouth_openness", keyframes)
+
+    # İlk anahtar kareden önce değer tutulur
+    assert looped.evaluate(0.2) == 0.0
+    for t in (0.51, 0.75, 1.0, 1.25, 1.49):
+        for period in (1, 2, 5):
+            assert close(looped.evaluate(t + period), once.evaluate(t)), f"t={t} + {period}"
+    assert once.evaluate(3.25) == 1.0
+
+    # Tek anahtar kareli döngü sabit değer verir
+    single = KeyframeCurve("mouth_openness", [{"time": 0.0, "value": 0.3}], loop=True)
+    assert single.evaluate(5.0) == 0.3
+
+
+def test_invalid_curves():
+    """Bilinmeyen iz, yanlış boyut veya boş anahtar kare listesi ValueError vermeli"""
+    for track, keyframes in (("unknown", [{"time": 0, "value": 0}]),
+                             ("eye_position", [{"time": 0, "value": 0.5}]),
+                             ("led_brightness", [])):
+        try:
+            KeyframeCurve(track, keyframes)
+        except ValueError:
+            continue
+        raise AssertionError(f"Geçersiz eğri kabul edildi: {track}")
+
+    curves = compile_curves({
+        "led_brightness": [{"time": 0, "value": 0}, {"time": 1, "value": 1}],
+        "mouth_openness": {"keyframes": [{"time": 0, "value": 1}], "loop": True, "easing": "sine"},
+    })
+    assert not curves["led_brightness"].loop
+    assert curves["mouth_openness"].loop
+
+
+def test_curve_player():
+    """Oynatıcı izleri değerlendirmeli; döngüsüz eğri son değerini verip kaldırılmalı"""
+    player = CurvePlayer()
+    fade = KeyframeCurve("led_brightness", [{"time": 0, "value": 0}, {"time": 1, "value": 1}])
+    mouth = KeyframeCurve("mouth_openness", [{"time": 0, "value": 0}, {"time": 1, "value": 1}], loop=True)
+    player.play(fade, start_time=10.0)
+    player.play(mouth, start_time=10.0)
+
+    values = player.evaluate(10.5)
+    assert close(values["led_brightness"], 0.5, 1.0 / EASING_TABLE_SIZE)
+    assert player.is_active("led_brightness")
+
+    values = player.evaluate(11.0)
+    assert values["led_brightness"] == 1.0
+    assert not player.is_active("led_brightness")
+    assert player.is_active("mouth_openness")
+
+    # Başka bir eğri çalışırken eskisinin durdurulması yeni eğriyi etkilememeli
+    replacement = KeyframeCurve("mouth_openness", [{"time": 0, "value": 0.5}])
+    player.play(replacement, start_time=11.0)
+    player.stop("mouth_openness", mouth)
+    assert player.is_active("mouth_openness")
+    player.clear()
+    assert not player.active
+    assert player.evaluate(12.0) == {}
+
+
+def test_intensity_curve_blend_released():
+    """Duygu yoğunluğu eğrisinin kurduğu karışım eğri bitince ve durdurulunca kaldırılmalı"""
+    with open(os.path.join(PROJECT_DIR, "config", "config.json"), "r") as f:
+        config = json.load(f)
+    clock = VirtualClock(100.0)
+    oled, _ = AnimationRenderer(config)._create_controllers(clock)
+    oled.set_emotion("happy")
+    keyframes = [{"time": 0.0, "value": 0.0}, {"time": 1.0, "value": 1.0}]
+
+    # Eğri sonuna kadar oynatılır
+    oled.play_curve(KeyframeCurve("emotion_intensity", keyframes))
+    clock.set(100.5)
+    oled._update_frame()
+    assert oled.emotion_blend is not None and oled.emotion_blend[:2] == ("neutral", "happy")
+    clock.set(101.5)
+    oled._update_frame()
+    assert oled.emotion_blend is None
+    assert not oled.curves.active
+
+    # Eğri ortasında durdurulur (animasyon motorunun _stop_timeline_curves yolu)
+    curve = KeyframeCurve("emotion_intensity", keyframes)
+    oled.play_curve(curve)
+    clock.set(102.0)
+    oled._update_frame()
+    assert oled.emotion_blend is not None
+    oled.stop_curve("emotion_intensity", curve)
+    assert oled.emotion_blend is None
+
+    # Başka bir izin durdurulması veya dışarıdan kurulan karışım etkilenmemeli
+    oled.play_curve(KeyframeCurve("emotion_intensity", keyframes, loop=True))
+    clock.set(102.5)
+    oled._update_frame()
+    oled.stop_curve("mouth_openness")
+    assert oled.emotion_blend is not None
+    oled.blend_emotions("sad", "happy", 0.5)
+    oled.stop_curve()
+    assert oled.emotion_blend is not None and oled.emotion_blend[:2] == ("sad", "happy")
+
+
+TESTS = {
+    "Doğrusal değerlendirme": test_linear_evaluate,
+    "Yumuşatma tabloları": test_easing_tables,
+    "Adım ve anahtar kare yumuşatması": test_step_and_per_keyframe_easing,
+    "Çok boyutlu izler ve sınırlama": test_vector_tracks_and_clamping,
+    "Döngü": test_loop,
+    "Geçersiz eğriler": test_invalid_curves,
+    "Eğri oynatıcı": test_curve_player,
+    "Duygu yoğunluğu karışımı": test_intensity_curve_blend_released,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 Anahtar Kare Eğrileri Test Betiği")
+    print("=======================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
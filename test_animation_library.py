@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+FACE1 animasyon kütüphanesi test betiği
+Kalıcı dizin dosyası sayesinde değişmeyen animasyon dosyalarının yeniden
+ayrıştırılmadığını (parse_count), değişikliklerin ve silmelerin algılandığını
+ve dizin önceliğini test eder.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import tempfile
+from pathlib import Path
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.animation_library import AnimationLibrary
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.CRITICAL,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+class LibraryFixture:
+    """Geçici standard/custom dizinleri ve dizin dosyası"""
+
+    def __init__(self):
+        self.root = tempfile.mkdtemp(prefix="face1_library_")
+        self.standard = os.path.join(self.root, "standard")
+        self.custom = os.path.join(self.root, "custom")
+        self.index_path = os.path.join(self.root, ".animation_index.json")
+        os.makedirs(self.standard)
+        os.makedirs(self.custom)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def library(self):
+        """Aynı dizinler ve dizin dosyasıyla yeni bir kütüphane oluşturur"""
+        return AnimationLibrary([("standard", self.standard), ("custom", self.custom)], self.index_path)
+
+    def write(self, directory, name, duration=1.0, description="", raw=None):
+        """Animasyon dosyası yazar; her yazımda mtime ileri alınır"""
+        path = os.path.join(directory, f"{name}.json")
+        if raw is None:
+            raw = json.dumps({
+                "metadata": {"name": name, "duration": duration, "description": description, "tags": ["test"]},
+                "sequence": [{"time": 0.0, "eyes": {"action": "blink"}}],
+            })
+        previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+        with open(path, "w") as f:
+            f.write(raw)
+        mtime_ns = max(previous + 1_000_000, os.stat(path).st_mtime_ns)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+
+def test_refresh_parses_once():
+    """Değişmeyen dosyalar ikinci taramada ve yeni süreçte (dizin dosyasından) ayrıştırılmamalı"""
+    with LibraryFixture() as fixture:
+        for name in ("startup", "speaking", "idle"):
+            fixture.write(fixture.standard, name)
+
+        library = fixture.library()
+        assert library.refresh() == {"startup", "speaking", "idle"}
+        assert library.parse_count == 3
+        assert library.refresh() == set()
+        assert library.parse_count == 3
+        assert os.path.exists(fixture.index_path)
+
+        # Yeniden başlatma: dizin dosyası isabetleri ayrıştırma gerektirmez
+        restarted = fixture.library()
+        assert restarted.refresh() == set()
+        assert restarted.parse_count == 0
+        assert sorted(restarted.names()) == ["idle", "speaking", "startup"]
+        assert restarted.get("speaking").duration == 1.0
+        assert restarted.get("speaking").tags == ("test",)
+
+
+def test_refresh_detects_changes():
+    """Yalnızca değişen, eklenen ve silinen dosyalar raporlanmalı ve ayrıştırılmalı"""
+    with LibraryFixture() as fixture:
+        fixture.write(fixture.standard, "startup")
+        speaking = fixture.write(fixture.standard, "speaking")
+        library = fixture.library()
+        library.refresh()
+        parsed = library.parse_count
+
+        fixture.write(fixture.standard, "speaking", duration=4.0, description="uzun konuşma")
+        fixture.write(fixture.standard, "wave")
+        assert library.refresh() == {"speaking", "wave"}
+        assert library.parse_count == parsed + 2
+        assert library.get("speaking").duration == 4.0
+        assert library.get("speaking").to_info()["description"] == "uzun konuşma"
+
+        os.unlink(speaking)
+        assert library.refresh() == {"speaking"}
+        assert "speaking" not in library
+        assert library.parse_count == parsed + 2
+
+
+def test_invalid_files_parsed_once():
+    """Geçersiz dosya değişene kadar tekrar ayrıştırılmamalı"""
+    with LibraryFixture() as fixture:
+        fixture.write(fixture.standard, "broken", raw="{bozuk json")
+        fixture.write(fixture.standard, "no_sequence", raw=json.dumps({"metadata": {}}))
+        library = fixture.library()
+
+        assert library.refresh() == set()
+        assert library.parse_count == 2
+        library.refresh()
+        assert library.parse_count == 2
+        assert len(library) == 0
+
+        fixture.write(fixture.standard, "broken")
+        assert library.refresh() == {"broken"}
+        assert library.parse_count == 3
+        assert library.load("broken")["metadata"]["name"] == "broken"
+
+
+def test_custom_overrides_standard():
+    """Aynı adlı animasyonda öncelikli dizin (custom) geçerli olmalı"""
+    with LibraryFixture() as fixture:
+        fixture.write(fixture.standard, "happy", duration=1.0)
+        custom = fixture.write(fixture.custom, "happy", duration=2.0)
+        library = fixture.library()
+        library.refresh()
+
+        assert len(library) == 1
+        assert library.get("happy").source == "custom"
+        assert library.load("happy")["metadata"]["duration"] == 2.0
+
+        os.unlink(custom)
+        library.remove_file(custom)
+        assert library.get("happy").source == "standard"
+
+
+def test_stale_index_rebuilt():
+    """Sürümü farklı veya bozuk dizin dosyası yok sayılıp yeniden oluşturulmalı"""
+    with LibraryFixture() as fixture:
+        fixture.write(fixture.standard, "startup")
+        fixture.library().refresh()
+
+        for content in ('{"version": -1, "entries": []}', "{bozuk"):
+            with open(fixture.index_path, "w") as f:
+                f.write(content)
+            library = fixture.library()
+            assert library.refresh() == {"startup"}
+            assert library.parse_count == 1
+
+        assert fixture.library().refresh() == set()
+
+
+TESTS = {
+    "Tek seferlik ayrıştırma": test_refresh_parses_once,
+    "Değişiklik algılama": test_refresh_detects_changes,
+    "Geçersiz dosyalar": test_invalid_files_parsed_once,
+    "Dizin önceliği": test_custom_overrides_standard,
+    "Eski dizin dosyası": test_stale_index_rebuilt,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 Animasyon Kütüphanesi Test Betiği")
+    print("=======================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+FACE1 animasyon önizleme çizicisi test betiği
+Standart animasyonların kare paketi özetinin kararlılığını, paketin ikili biçime
+dönüşümünü ve başarısız eylemlerin raporlanmasını test eder.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.animation_renderer import AnimationRenderer, FramePack
+from src.modules.render_clock import VirtualClock
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+STANDARD_DIR = os.path.join(PROJECT_DIR, "animation", "standard")
+
+
+def load_config():
+    """Proje yapılandırmasını yükler"""
+    with open(os.path.join(PROJECT_DIR, "config", "config.json"), "r") as f:
+        return json.load(f)
+
+
+def load_standard_animations():
+    """Standart animasyonları (ad, veri) listesi olarak yükler"""
+    animations = []
+    for filename in sorted(os.listdir(STANDARD_DIR)):
+        if filename.endswith(".json"):
+            with open(os.path.join(STANDARD_DIR, filename), "r") as f:
+                animations.append((Path(filename).stem, json.load(f)))
+    return animations
+
+
+def test_digest_stability():
+    """Aynı animasyon iki ayrı çizicide aynı özeti üretmeli"""
+    config = load_config()
+    for name, data in load_standard_animations():
+        first = AnimationRenderer(config).render(data, name)
+        second = AnimationRenderer(config).render(data, name)
+        assert first.digest() == second.digest(), f"{name}: özet kararsız"
+        assert first.errors == [], f"{name}: başarısız eylemler: {first.errors}"
+
+
+def test_digest_with_shared_caches():
+    """Canlı kontrolcüyle paylaşılan (dolu) önbellekler özeti değiştirmemeli"""
+    config = load_config()
+    live, _ = AnimationRenderer(config)._create_controllers(VirtualClock())
+    for name, data in load_standard_animations():
+        fresh = AnimationRenderer(config).render(data, name).digest()
+        for _ in range(2):
+            shared = AnimationRenderer(config, sprite_cache=live.sprite_cache,
+                                       morph_cache=live.morph_cache).render(data, name)
+            assert shared.digest() == fresh, f"{name}: paylaşılan önbellekle özet farklı"
+
+
+def test_pack_round_trip():
+    """to_bytes / from_bytes dönüşümü paketi aynen korumalı"""
+    config = load_config()
+    for name, data in load_standard_animations():
+        pack = AnimationRenderer(config).render(data, name)
+        restored = FramePack.from_bytes(pack.to_bytes())
+
+        assert restored.digest() == pack.digest(), f"{name}: özet değişti"
+        assert restored.fps == pack.fps
+        assert restored.frame_count == pack.frame_count
+        assert list(restored.streams) == list(pack.streams)
+        for stream_name in pack.streams:
+            for index in (0, pack.frame_count // 2, pack.frame_count - 1):
+                assert restored.frame(stream_name, index) == pack.frame(stream_name, index)
+
+
+def test_invalid_pack_rejected():
+    """Bozuk paket ValueError ile reddedilmeli"""
+    config = load_config()
+    name, data = load_standard_animations()[0]
+    raw = AnimationRenderer(config).render(data, name).to_bytes()
+
+    for broken in (b"", b"XXXX" + raw[4:], raw[:len(raw) // 2]):
+        try:
+            FramePack.from_bytes(broken)
+        except ValueError:
+            continue
+        raise AssertionError("Bozuk paket kabul edildi")
+
+
+def test_action_errors_reported():
+    """Başarısız eylemler çizimi durdurmamalı ve describe() içinde raporlanmalı"""
+    config = load_config()
+    data = {
+        "metadata": {"name": "error_test", "duration": 1.0},
+        "sequence": [
+            {"time": 0.0, "eyes": {"action": "blink", "params": {"duration": "uzun"}}},
+            {"time": 0.5, "mouth": {"action": "speak", "params": {"duration": 0.3}}},
+        ],
+    }
+    pack = AnimationRenderer(config).render(data, "error_test")
+    description = pack.describe()
+
+    assert pack.frame_count > 0
+    assert len(description["errors"]) == 1, description["errors"]
+    assert description["errors"][0]["action"] == "eyes.blink"
+    assert description["errors"][0]["time"] == 0.0
+
+
+TESTS = {
+    "Özet kararlılığı": test_digest_stability,
+    "Paylaşılan önbellekle özet": test_digest_with_shared_caches,
+    "Paket ikili dönüşümü": test_pack_round_trip,
+    "Bozuk paket reddi": test_invalid_pack_rejected,
+    "Eylem hatası raporu": test_action_errors_reported,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 Animasyon Önizleme Çizicisi Test Betiği")
+    print("=============================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
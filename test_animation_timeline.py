@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+FACE1 animasyon zaman çizelgesi test betiği
+Zaman çizelgesi derleyicisinin eylem sıralamasını, geçersiz adımların ve çözülemeyen
+eylem hedeflerinin atlanmasını ve parametrelerin değişmez hale getirilmesini test eder.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+from types import MappingProxyType
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.animation_timeline import MAX_PARAM_LIST_LENGTH, compile_timeline, freeze_params
+from src.modules.animation_renderer import AnimationRenderer, _PreviewActions
+from src.modules.render_clock import VirtualClock
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.ERROR,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def noop(params):
+    """Hiçbir şey yapmayan eylem"""
+
+
+DISPATCH = {
+    "sound": {"play": noop},
+    "emotion": {"set_emotion": noop},
+    "leds": {"pulse": noop, "off": noop},
+    "eyes": {"blink": noop, "clear": noop},
+    "mouth": {"speak": noop},
+    "curves": {"play": noop},
+}
+
+
+def sequence_of(timeline):
+    """Zaman çizelgesini (zaman, bileşen, eylem) listesine çevirir"""
+    return [(t, action.component, action.action) for t, action in zip(timeline.times, timeline.actions)]
+
+
+def test_ordering():
+    """Eylemler zamana, aynı zamanda adım sırasına, adım içinde bileşen önceliğine göre dizilmeli"""
+    data = {
+        "metadata": {"name": "order"},
+        "sequence": [
+            {"time": 1.0, "mouth": {"action": "speak"}, "eyes": {"action": "blink"}},
+            {"time": 0.0, "eyes": {"action": "clear"}, "emotion": {"action": "set_emotion"}},
+            {"time": 1.0, "leds": {"action": "off"}},
+            {"time": 0.5, "mouth": {"action": "speak"}, "leds": {"action": "pulse"},
+             "sound": {"action": "play"}},
+        ],
+    }
+    timeline = compile_timeline("order", data, DISPATCH)
+
+    assert sequence_of(timeline) == [
+        (0.0, "emotion", "set_emotion"),
+        (0.0, "eyes", "clear"),
+        (0.5, "sound", "play"),
+        (0.5, "leds", "pulse"),
+        (0.5, "mouth", "speak"),
+        (1.0, "eyes", "blink"),
+        (1.0, "mouth", "speak"),
+        (1.0, "leds", "off"),
+    ]
+    assert list(timeline.times) == sorted(timeline.times)
+    assert timeline.duration == 1.0
+
+
+def test_curves_and_duration():
+    """Eğriler aynı zamandaki adımlardan önce başlamalı, süre eğri ve metadata ile uzamalı"""
+    data = {
+        "metadata": {"name": "curves"},
+        "sequence": [{"time": 0.0, "eyes": {"action": "blink"}}],
+        "tracks": {"mouth_openness": [{"time": 0.0, "value": 0.0}, {"time": 2.0, "value": 1.0}]},
+    }
+    timeline = compile_timeline("curves", data, DISPATCH)
+
+    assert sequence_of(timeline) == [(0.0, "mouth", "curve"), (0.0, "eyes", "blink"), (2.0, "end", "end")]
+    assert timeline.duration == 2.0
+    assert timeline.curves["mouth_openness"].duration == 2.0
+
+    data["metadata"]["duration"] = 5
+    assert compile_timeline("curves", data, DISPATCH).duration == 5.0
+
+
+def test_invalid_steps_skipped():
+    """Geçersiz adımlar, bilinmeyen eylemler ve çözülemeyen hedefler atlanmalı"""
+    data = {
+        "metadata": {"name": "invalid"},
+        "sequence": [
+            "adım değil",
+            {"time": "sonra", "eyes": {"action": "blink"}},
+            {"time": -1, "eyes": {"action": "blink"}},
+            {"time": 0.2, "eyes": {"action": "wink"}, "mouth": {"params": {}}},
+            {"time": 0.3, "leds": {"action": "pulse"}, "mouth": {"action": "speak"}},
+        ],
+        "tracks": {"unknown_track": [{"time": 0.0, "value": 1.0}]},
+    }
+
+    def resolve_target(component, action):
+        return "LEDController.animate" if component == "leds" else None
+
+    timeline = compile_timeline("invalid", data, DISPATCH, resolve_target)
+
+    # Negatif zaman sıfıra çekilir, diğer geçersiz adımlar atlanır
+    assert sequence_of(timeline) == [(0.0, "eyes", "blink"), (0.3, "mouth", "speak")]
+    assert dict(timeline.curves) == {}
+
+
+def test_freeze_params():
+    """Parametreler özyinelemeli olarak salt okunur olmalı ve kaynak veri değişmemeli"""
+    source = {"color": [0, 0, 255], "nested": {"points": [[1, 2], [3, 4]]}, "speed": 50}
+    frozen = freeze_params(source)
+
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen["color"] == (0, 0, 255)
+    assert frozen["nested"]["points"] == ((1, 2), (3, 4))
+    assert frozen["speed"] == 50
+
+    for mutate in (lambda: frozen.__setitem__("speed", 10),
+                   lambda: frozen["nested"].__setitem__("points", ()),
+                   lambda: frozen["color"].append(1)):
+        try:
+            mutate()
+        except (TypeError, AttributeError):
+            continue
+        raise AssertionError("Dondurulmuş parametre değiştirilebildi")
+
+    assert source == {"color": [0, 0, 255], "nested": {"points": [[1, 2], [3, 4]]}, "speed": 50}
+
+    # Uzun listeler bir kez seyreltilir
+    long_list = list(range(MAX_PARAM_LIST_LENGTH + 2))
+    assert freeze_params(long_list) == tuple(long_list[::2])
+    assert freeze_params(list(range(MAX_PARAM_LIST_LENGTH))) == tuple(range(MAX_PARAM_LIST_LENGTH))
+
+
+def test_timeline_params_frozen():
+    """Derlenmiş eylem parametreleri JSON verisinden bağımsız olmalı"""
+    data = {
+        "metadata": {"name": "params"},
+        "sequence": [{"time": 0.0, "leds": {"action": "pulse", "params": {"color": [255, 0, 0]}}}],
+    }
+    timeline = compile_timeline("params", data, DISPATCH)
+    data["sequence"][0]["leds"]["params"]["color"][0] = 0
+
+    assert timeline.actions[0].params["color"] == (255, 0, 0)
+    assert isinstance(timeline.actions[0].params, MappingProxyType)
+
+
+def test_action_targets_resolve():
+    """Eylem haritasındaki her hedef metot gerçek kontrolcülerde bulunmalı"""
+    with open(os.path.join(PROJECT_DIR, "config", "config.json"), "r") as f:
+        config = json.load(f)
+    oled, led = AnimationRenderer(config)._create_controllers(VirtualClock())
+    actions = _PreviewActions(oled, led)
+
+    for component, targets in actions.ACTION_TARGETS.items():
+        assert set(targets) == set(actions.action_dispatch[component]), component
+        for action in targets:
+            assert actions._unresolved_action_target(component, action) is None, f"{component}.{action}"
+
+    # Kontrolcüde bulunmayan hedef derlemede atlanır
+    class Missing:
+        pass
+    actions.led_controller = Missing()
+    assert actions._unresolved_action_target("leds", "pulse") == "Missing.animate"
+
+
+TESTS = {
+    "Eylem sıralaması": test_ordering,
+    "Eğriler ve süre": test_curves_and_duration,
+    "Geçersiz adımlar": test_invalid_steps_skipped,
+    "Parametre dondurma": test_freeze_params,
+    "Zaman çizelgesi parametreleri": test_timeline_params_frozen,
+    "Eylem hedefleri": test_action_targets_resolve,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 Animasyon Zaman Çizelgesi Test Betiği")
+    print("===========================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
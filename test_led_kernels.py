@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+FACE1 LED desen çekirdekleri test betiği
+NumPy desen çekirdeklerinin ürettiği kareleri, çekirdeklerden önceki piksel piksel
+çalışan _animate_* döngülerinin ürettiği kare dizileriyle karşılaştırır.
+"""
+
+import os
+import sys
+import math
+import time
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.led_controller_kernels import KERNELS, WHEEL, HEAT_PALETTE
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+COLOR = (200, 120, 35)
+COUNTS = (1, 7, 30, 64)
+
+
+# Eski piksel piksel desenler: her biri bir döngü boyunca sırayla gösterilen kareleri üretir
+def reference_wheel(pos):
+    """Eski renk tekerleği"""
+    pos = pos % 256
+    if pos < 85:
+        return (255 - pos * 3, pos * 3, 0)
+    elif pos < 170:
+        pos -= 85
+        return (0, 255 - pos * 3, pos * 3)
+    else:
+        pos -= 170
+        return (pos * 3, 0, 255 - pos * 3)
+
+
+def scaled(color, factor):
+    """Rengi eski desenlerdeki gibi int() ile ölçekler"""
+    return tuple(int(c * factor) for c in color)
+
+
+def reference_static(color, count):
+    yield [color] * count
+
+
+def reference_pulse(color, count):
+    for brightness in list(range(0, 100, 5)) + list(range(100, 0, -5)):
+        yield [scaled(color, brightness / 100.0)] * count
+
+
+def reference_breathe(color, count):
+    for i in range(100):
+        yield [scaled(color, (math.sin(i / 100.0 * math.pi) + 1) / 2)] * count
+
+
+def reference_fade(color, count):
+    # Tam renk iki, siyah üç adım süre bekler
+    for _ in range(2):
+        yield [color] * count
+    for i in range(100, 0, -2):
+        yield [scaled(color, i / 100.0)] * count
+    for _ in range(3):
+        yield [(0, 0, 0)] * count
+
+
+def reference_chase(color, count):
+    for i in range(count):
+        frame = [(0, 0, 0)] * count
+        frame[i] = color
+        yield frame
+
+
+def reference_rainbow(color, count):
+    for position in range(1, 257):
+        yield [reference_wheel(i * 256 // count + position) for i in range(count)]
+
+
+def reference_wipe(color, count):
+    frame = [(0, 0, 0)] * count
+    for i in range(count):
+        frame[i] = color
+        yield list(frame)
+    for _ in range(5):
+        yield list(frame)
+    for _ in range(5):
+        yield [(0, 0, 0)] * count
+
+
+def reference_theater_chase(color, count):
+    for q in range(3):
+        yield [color if i % 3 == q else (0, 0, 0) for i in range(count)]
+
+
+def reference_scan(color, count):
+    width = max(1, count // 10)
+    dim = tuple(c // 8 for c in color)
+    positions = list(range(count - width + 1)) + list(range(count - width, -1, -1))
+    for position in positions:
+        yield [color if position <= i < position + width else dim for i in range(count)]
+
+
+def reference_wave(color, count):
+    for wave_position in range(1, 361):
+        frame = []
+        for i in range(count):
+            angle = (i * 360 // count + wave_position) % 360
+            frame.append(scaled(color, (math.sin(math.radians(angle)) + 1) / 2))
+        yield frame
+
+
+REFERENCES = {
+    "static": reference_static,
+    "pulse": reference_pulse,
+    "breathe": reference_breathe,
+    "fade": reference_fade,
+    "chase": reference_chase,
+    "rainbow": reference_rainbow,
+    "wipe": reference_wipe,
+    "theater_chase": reference_theater_chase,
+    "scan": reference_scan,
+    "wave": reference_wave,
+}
+
+
+def run_kernel(name, count, steps):
+    """Çekirdeği canlı katmanlardaki gibi (aynı durum sözlüğüyle) adım adım çalıştırır"""
+    kernel = KERNELS[name]
+    color = np.asarray(COLOR, dtype=np.uint8)
+    state = {"rng": np.random.default_rng(0), "speed": 50}
+    for step in range(steps):
+        yield kernel(step, count, color, state).copy()
+
+
+def test_wheel_and_heat_palettes():
+    """Paylaşılan tekerlek ve ısı paletleri eski hesaplamalarla aynı olmalı"""
+    for pos in range(256):
+        assert tuple(int(v) for v in WHEEL[pos]) == reference_wheel(pos), f"tekerlek {pos}"
+
+    for heat in range(256):
+        t192 = heat * 191 // 255
+        ramp = (t192 & 0x3F) << 2
+        if t192 & 0x80:
+            expected = (255, 255, ramp)
+        elif t192 & 0x40:
+            expected = (255, ramp, 0)
+        else:
+            expected = (ramp, 0, 0)
+        assert tuple(int(v) for v in HEAT_PALETTE[heat]) == expected, f"ısı {heat}"
+
+
+def test_kernels_match_baseline():
+    """Belirlenimci çekirdekler eski desenlerle kare kare aynı olmalı (iki tam döngü)"""
+    for name, reference in REFERENCES.items():
+        for count in COUNTS:
+            expected = list(reference(COLOR, count))
+            steps = 2 * len(expected)
+            for step, frame in enumerate(run_kernel(name, count, steps)):
+                assert frame.shape == (count, 3) and frame.dtype == np.uint8
+                wanted = np.asarray(expected[step % len(expected)], dtype=np.uint8)
+                assert np.array_equal(frame, wanted), f"{name} ({count} LED): adım {step} farklı"
+
+
+def test_random_kernels_levels():
+    """Rastgele çekirdekler yalnızca eski desenlerin kullandığı renk seviyelerini üretmeli"""
+    color = np.asarray(COLOR, dtype=np.uint8)
+    count = 30
+
+    sparkle_levels = {scaled(COLOR, 0.1), COLOR}
+    twinkle_levels = {tuple(c // 15 for c in COLOR), tuple(c // 2 for c in COLOR),
+                      tuple(c * 3 // 4 for c in COLOR), COLOR}
+    for name, levels in (("sparkle", sparkle_levels), ("twinkle", twinkle_levels)):
+        for frame in run_kernel(name, count, 200):
+            assert {tuple(int(v) for v in pixel) for pixel in frame} <= levels, name
+
+    # Renkler arası geçiş: eski desen her renk çifti arasında 100 adımda int() ile ara renk üretir
+    colors = [COLOR, (10, 200, 90), (0, 0, 255)]
+    state = {"rng": np.random.default_rng(0), "palette": np.asarray(colors, dtype=np.uint8)}
+    for step in range(2 * 100 * len(colors)):
+        current = colors[(step // 100) % len(colors)]
+        target = colors[(step // 100 + 1) % len(colors)]
+        factor = (step % 100) / 100.0
+        expected = tuple(int(c + (t - c) * factor) for c, t in zip(current, target))
+        frame = KERNELS["color_fade"](step, count, color, state)
+        assert np.array_equal(frame, np.tile(np.asarray(expected, dtype=np.uint8), (count, 1))), \
+            f"color_fade: adım {step} farklı"
+
+
+def test_kernels_are_seeded():
+    """Aynı tohumla çalışan rastgele çekirdekler aynı kareleri üretmeli (önizleme kararlılığı)"""
+    for name in ("sparkle", "twinkle", "fire"):
+        first = list(run_kernel(name, 30, 50))
+        second = list(run_kernel(name, 30, 50))
+        assert all(np.array_equal(a, b) for a, b in zip(first, second)), name
+
+
+TESTS = {
+    "Tekerlek ve ısı paletleri": test_wheel_and_heat_palettes,
+    "Eski desenlerle karşılaştırma": test_kernels_match_baseline,
+    "Rastgele desen seviyeleri": test_random_kernels_levels,
+    "Tohumlu rastgele desenler": test_kernels_are_seeded,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 LED Desen Çekirdekleri Test Betiği")
+    print("========================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
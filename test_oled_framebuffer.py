@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+FACE1 OLED kare tamponu test betiği
+Sayfa düzenine paketleme/açma dönüşümlerini, doğrudan tampona çizimi ve
+kirli pencere tespitini piksel piksel çalışan başvuru uygulamasıyla karşılaştırır.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Proje dizinini Python yoluna ekle
+PROJECT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(str(PROJECT_DIR))
+
+from src.modules.oled_controller_framebuffer import PageFrameBuffer, pack_image, unpack_image
+from src.modules.oled_controller import OLEDController
+from src.modules.animation_renderer import _PreviewActions
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def random_image(width, height, seed):
+    """Tekrarlanabilir rastgele 1-bit görüntü oluşturur"""
+    rng = np.random.default_rng(seed)
+    pixels = (rng.random((height, width)) < 0.4).astype(np.uint8) * 255
+    return Image.fromarray(pixels, "L").convert("1")
+
+
+def reference_pack(image):
+    """Sayfa düzenine piksel piksel paketleme (her bayt 8 dikey piksel, LSB en üstte)"""
+    width, height = image.size
+    pages = np.zeros((height // 8, width), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            if image.getpixel((x, y)):
+                pages[y // 8, x] |= 1 << (y % 8)
+    return pages
+
+
+def test_pack_matches_reference():
+    """pack_image piksel piksel paketleme ile aynı baytları üretmeli"""
+    for width, height, seed in ((128, 64, 1), (100, 16, 2), (13, 8, 3)):
+        image = random_image(width, height, seed)
+        pages = pack_image(image)
+        assert pages.shape == (height // 8, width)
+        assert np.array_equal(pages, reference_pack(image)), f"{width}x{height}: paket farklı"
+
+
+def test_pack_unpack_round_trip():
+    """unpack_image(pack_image(x)) görüntüyü aynen geri vermeli"""
+    for width, height, seed in ((128, 64, 4), (100, 16, 5)):
+        image = random_image(width, height, seed)
+        restored = unpack_image(pack_image(image))
+        assert restored.mode == "1"
+        assert restored.size == image.size
+        assert restored.tobytes() == image.tobytes(), f"{width}x{height}: görüntü değişti"
+
+
+def test_drawing_matches_pil():
+    """Tampona doğrudan çizim ImageDraw ile çizilmiş görüntüyle aynı olmalı"""
+    buffer = PageFrameBuffer(128, 64)
+    image = Image.new("1", (128, 64))
+    draw = ImageDraw.Draw(image)
+
+    buffer.fill_rect(10, 5, 30, 20)
+    draw.rectangle((10, 5, 39, 24), fill=1)
+    buffer.fill_rect(20, 10, 5, 3, 0)
+    draw.rectangle((20, 10, 24, 12), fill=0)
+    buffer.hline(50, 100, 33)
+    draw.line((50, 33, 100, 33), fill=1)
+    buffer.vline(120, 2, 61)
+    draw.line((120, 2, 120, 61), fill=1)
+    buffer.set_pixel(0, 63)
+    draw.point((0, 63), fill=1)
+    buffer.set_pixel(200, 200)  # Ekran dışı, yok sayılmalı
+
+    assert buffer.touched
+    assert buffer.to_image().tobytes() == image.tobytes()
+
+
+def test_blit_clipping():
+    """Ekran dışına taşan sprite kırpılmalı, "or" kipi pikselleri birleştirmeli"""
+    buffer = PageFrameBuffer(16, 16)
+    sprite = np.full((2, 8), 0x0F, dtype=np.uint8)
+
+    buffer.blit(sprite, x=-4, page=-1)
+    expected = np.zeros((2, 16), dtype=np.uint8)
+    expected[0, :4] = 0x0F
+    assert np.array_equal(buffer.array, expected)
+
+    buffer.blit(np.full((1, 4), 0xF0, dtype=np.uint8), x=0, page=0, mode="or")
+    expected[0, :4] = 0xFF
+    assert np.array_equal(buffer.array, expected)
+
+    buffer.blit(sprite, x=20, page=0)  # Tamamen ekran dışı
+    assert np.array_equal(buffer.array, expected)
+
+
+def test_dirty_windows():
+    """Kirli pencereler değişen sayfa/sütun aralıklarını kapsamalı"""
+    buffer = PageFrameBuffer(128, 64)
+    previous = buffer.array.copy()
+    assert buffer.dirty_windows(previous) == []
+
+    # Tek piksel: tek sayfa, tek sütun
+    buffer.set_pixel(40, 9)
+    assert buffer.dirty_windows(previous) == [(1, 1, 40, 40)]
+
+    # Ardışık kirli sayfalar sütun aralıklarının birleşimiyle tek pencerede toplanır
+    buffer.set_pixel(70, 17)
+    assert buffer.dirty_windows(previous) == [(1, 2, 40, 70)]
+
+    # Aradaki temiz sayfa pencereleri ayırır
+    buffer.set_pixel(5, 40)
+    windows = buffer.dirty_windows(previous)
+    assert windows == [(1, 2, 40, 70), (5, 5, 5, 5)]
+
+    # Pencere görünümleri kopyasızdır ve dışındaki tüm baytlar değişmemiştir
+    outside = buffer.array.copy()
+    for window in windows:
+        view = buffer.window(window)
+        assert np.shares_memory(view, buffer.array)
+        page0, page1, col0, col1 = window
+        outside[page0:page1 + 1, col0:col1 + 1] = previous[page0:page1 + 1, col0:col1 + 1]
+    assert np.array_equal(outside, previous)
+
+
+def test_shared_backing():
+    """Paylaşılan bellek üzerindeki tampon o belleğe doğrudan yazmalı"""
+    backing = bytearray(1 + 16 * 2)
+    buffer = PageFrameBuffer(16, 16, backing, offset=1)
+    buffer.set_pixel(3, 8)
+
+    assert backing[0] == 0
+    assert backing[1 + 16 + 3] == 0x01
+    assert bytes(buffer.view()) == bytes(backing[1:])
+
+
+def create_controller():
+    """Simülasyon ekranlarıyla OLED kontrolcü oluşturur (animasyon döngüsü çalışmaz)"""
+    with open(os.path.join(PROJECT_DIR, "config", "config.json"), "r") as f:
+        config = json.load(f)
+    config.setdefault("simulation", {})["png_enabled"] = False
+    controller = OLEDController(config)
+    controller.start()
+    controller.stop()
+    return controller
+
+
+def test_partial_updates_keep_other_displays():
+    """Yalnızca ağzı değiştiren çağrılar göz ekranlarını silmemeli"""
+    controller = create_controller()
+    controller.draw_eyes("happy", True)
+    controller.draw_mouth("happy")
+    controller.update_display()
+
+    eyes = {name: controller.framebuffers[name].array.copy() for name in ("left_eye", "right_eye")}
+    assert all(np.count_nonzero(frame) for frame in eyes.values())
+
+    def assert_eyes_unchanged(step):
+        for name, frame in eyes.items():
+            assert np.array_equal(controller.framebuffers[name].array, frame), f"{step}: {name} değişti"
+
+    happy_mouth = controller.framebuffers["mouth"].array.copy()
+    controller.show_mouth_expression("sad")
+    assert_eyes_unchanged("show_mouth_expression")
+    assert not np.array_equal(controller.framebuffers["mouth"].array, happy_mouth)
+
+    controller.clear_mouth()
+    assert_eyes_unchanged("clear_mouth")
+    assert not np.count_nonzero(controller.framebuffers["mouth"].array)
+
+    # Animasyon eylemleri aynı yolu kullanır
+    actions = _PreviewActions(controller, None)
+    actions._action_mouth_smile({"emotion": "happy"})
+    assert_eyes_unchanged("mouth.smile")
+    assert np.array_equal(controller.framebuffers["mouth"].array, happy_mouth)
+    actions._action_mouth_clear({})
+    assert_eyes_unchanged("mouth.clear")
+
+    # PIL ile çizilen ekran show_buffer ile gönderilir, diğerleri korunur
+    draw = controller.draw_objects["mouth"]
+    draw.rectangle((0, 0, 127, 63), fill=0)
+    draw.line((10, 20, 100, 20), fill=1)
+    controller.show_buffer("mouth")
+    assert_eyes_unchanged("show_buffer")
+    assert np.array_equal(controller.framebuffers["mouth"].array, pack_image(controller.buffers["mouth"]))
+
+    controller.clear_eyes()
+    for name in eyes:
+        assert not np.count_nonzero(controller.framebuffers[name].array)
+
+
+TESTS = {
+    "Paketleme başvuru karşılaştırması": test_pack_matches_reference,
+    "Paketleme/açma dönüşümü": test_pack_unpack_round_trip,
+    "Doğrudan çizim": test_drawing_matches_pil,
+    "Sprite kırpma": test_blit_clipping,
+    "Kirli pencereler": test_dirty_windows,
+    "Paylaşılan bellek": test_shared_backing,
+    "Kısmi güncellemeler": test_partial_updates_keep_other_displays,
+}
+
+
+def main():
+    """Ana fonksiyon"""
+    print("FACE1 OLED Kare Tamponu Test Betiği")
+    print("===================================")
+    print(f"Tarih: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    results = {}
+    for test_name, test in TESTS.items():
+        try:
+            test()
+            results[test_name] = True
+        except Exception as e:
+            print(f"HATA: {test_name}: {e}")
+            results[test_name] = False
+
+    print("\n==== Test Sonuçları ====")
+    for test_name, test_result in results.items():
+        status = "BAŞARILI" if test_result else "BAŞARISIZ"
+        print(f"{test_name}: {status}")
+
+    if all(results.values()):
+        print("\nTÜM TESTLER BAŞARILI!")
+        return 0
+    else:
+        print("\nBAZI TESTLER BAŞARISIZ!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
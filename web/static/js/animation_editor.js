@@ -7,6 +7,7 @@
  * - Animasyonları düzenleme ve kaydetme
  * - Adım eklemek, silmek ve düzenlemek
  * - Zaman çizelgesi görselleştirme
+ * - Sunucuda çevrimdışı çizilen önizleme kare paketini ileri geri sarma
  * - JSON olarak dışa/içe aktarma
  */
 
@@ -18,6 +19,10 @@ let isPlaying = false;           // Oynatma durumu
 let animationSteps = [];         // Animasyon adımları
 let timelineItems = [];          // Zaman çizelgesi öğeleri
 let simulationConnection = null; // WebSocket bağlantısı
+const simulationStream = new F1SimulationStream(); // İkili kare çözücü
+let previewPack = null;          // Çözülmüş önizleme kare paketi (varken canlı kareler çizilmez)
+let previewFrame = 0;            // Gösterilen önizleme karesi
+let previewTimer = null;         // Önizleme oynatma zamanlayıcısı
 
 // DOM Elementleri
 const animationSelect = document.getElementById('animation-select');
@@ -57,6 +62,11 @@ const deleteStepBtn = document.getElementById('delete-step');
 const saveAnimationBtn = document.getElementById('save-animation');
 const exportAnimationBtn = document.getElementById('export-animation');
 const importAnimationBtn = document.getElementById('import-animation');
+const renderPreviewBtn = document.getElementById('render-preview');
+const previewPlayBtn = document.getElementById('preview-play');
+const previewLiveBtn = document.getElementById('preview-live');
+const previewScrub = document.getElementById('preview-scrub');
+const previewTime = document.getElementById('preview-time');
 
 // Tab Butonları
 const tabButtons = document.querySelectorAll('.tab-button');
@@ -166,6 +176,15 @@ function setupEventListeners() {
     saveAnimationBtn.addEventListener('click', saveCurrentAnimation);
     exportAnimationBtn.addEventListener('click', exportAnimationToJSON);
     importAnimationBtn.addEventListener('click', importAnimationFromJSON);
+    
+    // Önizleme kare paketi
+    renderPreviewBtn.addEventListener('click', renderPreview);
+    previewPlayBtn.addEventListener('click', togglePreviewPlayback);
+    previewLiveBtn.addEventListener('click', closePreview);
+    previewScrub.addEventListener('input', () => {
+        stopPreviewPlayback();
+        showPreviewFrame(parseInt(previewScrub.value, 10));
+    });
 }
 
 /**
@@ -177,16 +196,25 @@ function setupWebSocketConnection() {
     const wsUrl = `${protocol}//${location.host}/ws/simulation`;
     
     simulationConnection = new WebSocket(wsUrl);
+    simulationConnection.binaryType = 'arraybuffer';
     
     simulationConnection.onopen = () => {
         console.log('WebSocket bağlantısı kuruldu');
     };
     
     simulationConnection.onmessage = (event) => {
+        // Simülasyon kareleri ikili mesaj olarak gelir
+        if (event.data instanceof ArrayBuffer) {
+            const frame = previewPack ? null : simulationStream.decode(event.data);
+            const element = frame ? document.querySelector(`.simulation-images .${frame.source.replace('_', '-')}`) : null;
+            if (element) {
+                simulationStream.draw(element, frame);
+            }
+            return;
+        }
+        
         const data = JSON.parse(event.data);
-        if (data.type === 'simulation') {
-            updateSimulationImages(data.data.images);
-        } else if (data.type === 'animation_status') {
+        if (data.type === 'animation_status') {
             updateAnimationStatus(data.data);
         }
     };
@@ -202,31 +230,6 @@ function setupWebSocketConnection() {
     };
 }
 
-/**
- * Simülasyon görüntülerini günceller
- */
-function updateSimulationImages(images) {
-    if (images.left_eye) {
-        document.querySelector('.simulation-images .left-eye').style.backgroundImage = 
-            `url('/simulation/${images.left_eye}')`;
-    }
-    
-    if (images.right_eye) {
-        document.querySelector('.simulation-images .right-eye').style.backgroundImage = 
-            `url('/simulation/${images.right_eye}')`;
-    }
-    
-    if (images.mouth) {
-        document.querySelector('.simulation-images .mouth').style.backgroundImage = 
-            `url('/simulation/${images.mouth}')`;
-    }
-    
-    if (images.leds) {
-        document.querySelector('.simulation-images .leds').style.backgroundImage = 
-            `url('/simulation/${images.leds}')`;
-    }
-}
-
 /**
  * Animasyon durumunu günceller
  */
@@ -369,6 +372,203 @@ async function stopCurrentAnimation() {
     }
 }
 
+/**
+ * Düzenlenen animasyonu sunucuda çevrimdışı çizdirir ve kare paketini yükler
+ *
+ * Editörde açık bir animasyon varsa kaydedilmemiş hali gönderilir, yoksa
+ * seçili kayıtlı animasyon çizdirilir.
+ */
+async function renderPreview() {
+    let request;
+    if (currentAnimation) {
+        const animationData = {
+            ...currentAnimation,
+            metadata: {
+                ...currentAnimation.metadata,
+                name: animationNameInput.value.trim() || currentAnimation.metadata?.name || 'preview',
+                duration: parseFloat(animationDurationInput.value) || currentAnimation.metadata?.duration
+            },
+            sequence: [...animationSteps].sort((a, b) => a.time - b.time)
+        };
+        request = fetch('/api/animations/preview', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(animationData)
+        });
+    } else if (animationSelect.value) {
+        request = fetch(`/api/animations/${animationSelect.value}/preview`);
+    } else {
+        showNotification('Önizleme için bir animasyon seçin', 'warning');
+        return;
+    }
+    
+    renderPreviewBtn.disabled = true;
+    try {
+        const response = await request;
+        if (!response.ok) {
+            const error = await response.json().catch(() => ({}));
+            throw new Error(error.detail || response.statusText);
+        }
+        
+        stopPreviewPlayback();
+        previewPack = await decodeFramePack(await response.arrayBuffer());
+        
+        previewScrub.max = previewPack.frameCount - 1;
+        previewScrub.disabled = false;
+        previewPlayBtn.disabled = false;
+        previewLiveBtn.disabled = false;
+        showPreviewFrame(0);
+        
+        showNotification(`Önizleme hazır: ${previewPack.frameCount} kare, ${previewPack.duration.toFixed(2)} sn`);
+    } catch (error) {
+        console.error('Önizleme çizilirken hata:', error);
+        showNotification('Önizleme çizilemedi: ' + error.message, 'error');
+    } finally {
+        renderPreviewBtn.disabled = false;
+    }
+}
+
+/**
+ * Kare paketini çözer (biçim animation_renderer.py içindeki FramePack ile aynıdır)
+ *
+ * @param {ArrayBuffer} buffer - Sunucudan gelen kare paketi
+ * @returns {Promise<Object>} fps, kare sayısı, süre ve akışlar
+ */
+async function decodeFramePack(buffer) {
+    // Önek: "F1PK" + sürüm(u8); gövde zlib ile sıkıştırılmış
+    const prefix = new Uint8Array(buffer, 0, 5);
+    if (String.fromCharCode(...prefix.subarray(0, 4)) !== 'F1PK' || prefix[4] !== 1) {
+        throw new Error('Desteklenmeyen kare paketi');
+    }
+    
+    const stream = new Blob([buffer.slice(5)]).stream().pipeThrough(new DecompressionStream('deflate'));
+    const body = await new Response(stream).arrayBuffer();
+    const view = new DataView(body);
+    const textDecoder = new TextDecoder('utf-8');
+    
+    // Başlık: fps(f32), kare sayısı(u32), akış sayısı(u8)
+    const fps = view.getFloat32(0, true);
+    const frameCount = view.getUint32(4, true);
+    const streamCount = view.getUint8(8);
+    let offset = 9;
+    
+    const streams = [];
+    for (let s = 0; s < streamCount; s++) {
+        // Akış başlığı: ad uzunluğu(u8), tür(u8), genişlik(u16), yükseklik(u16), benzersiz kare(u16), kare boyutu(u32)
+        const nameLength = view.getUint8(offset);
+        const kind = simulationStream.KINDS[view.getUint8(offset + 1)];
+        const width = view.getUint16(offset + 2, true);
+        const height = view.getUint16(offset + 4, true);
+        const uniqueCount = view.getUint16(offset + 6, true);
+        const frameSize = view.getUint32(offset + 8, true);
+        offset += 12;
+        
+        const source = textDecoder.decode(new Uint8Array(body, offset, nameLength));
+        offset += nameLength;
+        
+        const index = new Uint16Array(frameCount);
+        for (let i = 0; i < frameCount; i++) {
+            index[i] = view.getUint16(offset + i * 2, true);
+        }
+        offset += frameCount * 2;
+        
+        const frames = [];
+        for (let i = 0; i < uniqueCount; i++) {
+            frames.push(new Uint8Array(body, offset + i * frameSize, frameSize));
+        }
+        offset += uniqueCount * frameSize;
+        
+        streams.push({ source, kind, width, height, index, frames });
+    }
+    
+    return { fps, frameCount, duration: frameCount / fps, streams };
+}
+
+/**
+ * Önizleme paketinin bir karesini simülasyon alanlarına çizer
+ *
+ * @param {number} frameIndex - Kare numarası
+ */
+function showPreviewFrame(frameIndex) {
+    if (!previewPack) return;
+    
+    previewFrame = Math.max(0, Math.min(previewPack.frameCount - 1, frameIndex));
+    previewPack.streams.forEach(stream => {
+        const element = document.querySelector(`.simulation-images .${stream.source.replace('_', '-')}`);
+        if (element) {
+            simulationStream.draw(element, {
+                source: stream.source,
+                kind: stream.kind,
+                width: stream.width,
+                height: stream.height,
+                data: stream.frames[stream.index[previewFrame]]
+            });
+        }
+    });
+    
+    const time = previewFrame / previewPack.fps;
+    previewScrub.value = previewFrame;
+    previewTime.textContent = `${time.toFixed(2)} / ${previewPack.duration.toFixed(2)} sn`;
+    
+    // Zaman çizelgesi işaretçisi önizleme zamanını gösterir
+    const duration = parseFloat(animationDurationInput.value) || previewPack.duration;
+    timelineMarker.style.left = `${Math.min(100, (time / duration) * 100)}%`;
+}
+
+/**
+ * Önizlemeyi gerçek hızında oynatır veya duraklatır
+ */
+function togglePreviewPlayback() {
+    if (!previewPack) return;
+    
+    if (previewTimer) {
+        stopPreviewPlayback();
+        return;
+    }
+    
+    if (previewFrame >= previewPack.frameCount - 1) {
+        previewFrame = 0;
+    }
+    
+    // Kareler gerçek zamana göre seçilir; tarayıcı geride kalırsa kare atlanır
+    const startTime = performance.now() - (previewFrame / previewPack.fps) * 1000;
+    previewPlayBtn.textContent = 'Duraklat';
+    previewTimer = setInterval(() => {
+        const frameIndex = Math.floor((performance.now() - startTime) / 1000 * previewPack.fps);
+        showPreviewFrame(frameIndex);
+        if (frameIndex >= previewPack.frameCount - 1) {
+            stopPreviewPlayback();
+        }
+    }, 1000 / previewPack.fps);
+}
+
+/**
+ * Önizleme oynatmasını durdurur
+ */
+function stopPreviewPlayback() {
+    if (previewTimer) {
+        clearInterval(previewTimer);
+        previewTimer = null;
+    }
+    previewPlayBtn.textContent = 'Oynat';
+}
+
+/**
+ * Önizlemeyi kapatır, simülasyon alanları yeniden canlı kareleri gösterir
+ */
+function closePreview() {
+    stopPreviewPlayback();
+    previewPack = null;
+    previewScrub.value = 0;
+    previewScrub.disabled = true;
+    previewPlayBtn.disabled = true;
+    previewLiveBtn.disabled = true;
+    previewTime.textContent = '0.00 / 0.00 sn';
+    timelineMarker.style.left = '0';
+}
+
 /**
  * Bir animasyon seçildiğinde
  */
@@ -8,6 +8,9 @@ document.addEventListener('DOMContentLoaded', function() {
     window.socket = null; // *** Global olarak erişim için window.socket olarak değiştirdik ***
     let simulationSocket = null;
     let simulationActive = false;
+    const SIMULATION_FPS = 30; // Simülasyon akışı için istenen kare hızı
+    const simulationStream = new F1SimulationStream();
+    let simulationFpsTimer = null;
     let reconnectAttempts = 0;
     const MAX_RECONNECT_ATTEMPTS = 5;
     const RECONNECT_DELAY_MS = 2000;
@@ -195,7 +198,8 @@ document.addEventListener('DOMContentLoaded', function() {
         }
         
         addLog("Simülasyon akışı başlatılıyor...", 'info');
-        simulationSocket = new WebSocket(`ws://${window.location.host}/ws/simulation`);
+        simulationSocket = new WebSocket(`ws://${window.location.host}/ws/simulation?fps=${SIMULATION_FPS}`);
+        simulationSocket.binaryType = 'arraybuffer';
         
         simulationSocket.onopen = function() {
             simulationActive = true;
@@ -209,13 +213,19 @@ document.addEventListener('DOMContentLoaded', function() {
         
         simulationSocket.onmessage = function(event) {
             try {
+                // Kareler ikili mesaj olarak gelir, kontrol mesajları JSON
+                if (event.data instanceof ArrayBuffer) {
+                    const frame = simulationStream.decode(event.data);
+                    if (frame) {
+                        updateSimulationFrame(frame);
+                    }
+                    return;
+                }
+                
                 const data = JSON.parse(event.data);
                 
-                if (data.type === 'simulation_update' && data.images) {
-                    updateSimulationDisplay(data.images);
-                    if (DEBUG_MODE && VERBOSE_LOGGING) {
-                        console.log("Simülasyon veri alındı:", data);
-                    }
+                if (data.type === 'welcome' && DEBUG_MODE && VERBOSE_LOGGING) {
+                    console.log("Simülasyon akışı:", data);
                 }
             } catch (error) {
                 console.error("Simülasyon veri işleme hatası:", error);
@@ -346,21 +356,9 @@ document.addEventListener('DOMContentLoaded', function() {
     function handleTabChange(tabId) {
         switch (tabId) {
             case 'simulation':
-                // Simülasyon sekmesi açıldığında son görüntüleri yükle
+                // Simülasyon sekmesi açıldığında son kareleri yükle
                 if (!simulationActive) {
-                    fetch('/api/simulation')
-                        .then(response => response.json())
-                        .then(data => {
-                            if (data.images) {
-                                updateSimulationDisplay(data.images);
-                            }
-                        })
-                        .catch(error => {
-                            if (DEBUG_MODE) {
-                                console.error('Simülasyon yükleme hatası:', error);
-                            }
-                            addLog(`Simülasyon görüntüleri yüklenemedi: ${error.message}`, 'error');
-                        });
+                    loadSimulationFrames();
                 }
                 break;
                 
@@ -622,6 +620,21 @@ document.addEventListener('DOMContentLoaded', function() {
             document.getElementById('temperature').textContent = `Sıcaklık: ${stats.cpu.temperature.toFixed(1)}°C`;
         }
         
+        if (stats.frame_timing) {
+            const timing = stats.frame_timing;
+            const ft = timing.frame_time_ms;
+            document.getElementById('frame-timing').textContent =
+                `Kare: ${ft.p50.toFixed(1)} / ${ft.p95.toFixed(1)} / ${ft.p99.toFixed(1)} ms ` +
+                `(${timing.actual_fps.toFixed(1)}/${timing.target_fps.toFixed(0)} FPS, kaçırılan: ${timing.missed_deadlines})`;
+            
+            // p95 kare süresi kare bütçesini aşıyorsa uyarı göster
+            if (ft.p95 > timing.budget_ms) {
+                showBadge('YAVAŞ-KARE', 'warn');
+            } else {
+                hideBadge('YAVAŞ-KARE');
+            }
+        }
+        
         // Yüksek CPU veya RAM kullanımında debug işareti göster
         if (stats.cpu && stats.cpu.percent > 80) {
             showBadge('YÜKSEK-CPU', 'warn');
@@ -680,64 +693,61 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
-    // Simülasyon görüntülerini güncelle
-    function updateSimulationDisplay(images) {
-        if (DEBUG_MODE && VERBOSE_LOGGING) {
-            console.log("Simülasyon görüntüleri güncelleniyor:", images);
+    // Simülasyon kaynak adlarını önizleme elementlerine eşle
+    const SIMULATION_ELEMENTS = {
+        left_eye: '.simulation-images .sim-left-eye',
+        right_eye: '.simulation-images .sim-right-eye',
+        mouth: '.simulation-images .sim-mouth',
+        leds: '.simulation-images .sim-leds'
+    };
+    
+    // Akıştan gelen simülasyon karesini çiz
+    function updateSimulationFrame(frame) {
+        const selector = SIMULATION_ELEMENTS[frame.source];
+        const element = selector ? document.querySelector(selector) : null;
+        if (element) {
+            simulationStream.draw(element, frame);
         }
         
-        // Sol göz
-        if (images.left_eye) {
-            const leftEye = document.querySelector('.simulation-images .sim-left-eye');
-            if (leftEye) {
-                leftEye.style.backgroundImage = `url('/simulation/${images.left_eye}')`;
-                leftEye.textContent = ''; // İçerideki yazıyı temizle
-                addLog(`Sol göz görüntüsü güncellendi: ${images.left_eye}`, 'info', true); // Ayrıntı log
-            } else if (DEBUG_MODE) {
-                console.error("Sol göz elementi bulunamadı");
-            }
-        }
-        
-        // Sağ göz
-        if (images.right_eye) {
-            const rightEye = document.querySelector('.simulation-images .sim-right-eye');
-            if (rightEye) {
-                rightEye.style.backgroundImage = `url('/simulation/${images.right_eye}')`;
-                rightEye.textContent = ''; // İçerideki yazıyı temizle
-                addLog(`Sağ göz görüntüsü güncellendi: ${images.right_eye}`, 'info', true); // Ayrıntı log
-            } else if (DEBUG_MODE) {
-                console.error("Sağ göz elementi bulunamadı");
-            }
-        }
-        
-        // Ağız
-        if (images.mouth) {
-            const mouth = document.querySelector('.simulation-images .sim-mouth');
-            if (mouth) {
-                mouth.style.backgroundImage = `url('/simulation/${images.mouth}')`;
-                mouth.textContent = ''; // İçerideki yazıyı temizle
-                addLog(`Ağız görüntüsü güncellendi: ${images.mouth}`, 'info', true); // Ayrıntı log
-            } else if (DEBUG_MODE) {
-                console.error("Ağız elementi bulunamadı");
-            }
+        // Gerçek kare hızını saniyede bir göster
+        if (!simulationFpsTimer) {
+            simulationFpsTimer = setInterval(updateSimulationFps, 1000);
         }
+    }
+    
+    // Kaynak başına alınan gerçek kare hızını göster
+    function updateSimulationFps() {
+        const fpsElement = document.getElementById('sim-fps');
+        if (!fpsElement) return;
         
-        // LED'ler
-        if (images.leds) {
-            const leds = document.querySelector('.simulation-images .sim-leds');
-            if (leds) {
-                leds.style.backgroundImage = `url('/simulation/${images.leds}')`;
-                leds.textContent = ''; // İçerideki yazıyı temizle
-                addLog(`LED görüntüsü güncellendi: ${images.leds}`, 'info', true); // Ayrıntı log
-            } else if (DEBUG_MODE) {
-                console.error("LED elementi bulunamadı");
-            }
+        if (!simulationActive) {
+            clearInterval(simulationFpsTimer);
+            simulationFpsTimer = null;
+            fpsElement.textContent = '';
+            return;
         }
         
-        // Tüm görüntüler boşsa
-        if (!images.left_eye && !images.right_eye && !images.mouth && !images.leds) {
-            addLog("Hiç simülasyon görüntüsü bulunamadı", 'warn');
-        }
+        fpsElement.textContent = Object.keys(SIMULATION_ELEMENTS)
+            .map(source => `${source}: ${simulationStream.getFps(source)} fps`)
+            .join(' | ');
+    }
+    
+    // Akış başlamadan önce her kaynağın en son karesini yükle
+    function loadSimulationFrames() {
+        Object.entries(SIMULATION_ELEMENTS).forEach(([source, selector]) => {
+            fetch(`/api/simulation/${source}/frame`)
+                .then(response => response.ok ? response.arrayBuffer() : null)
+                .then(buffer => {
+                    const frame = buffer ? simulationStream.decode(buffer) : null;
+                    const element = frame ? document.querySelector(selector) : null;
+                    if (element) {
+                        simulationStream.draw(element, frame);
+                    }
+                })
+                .catch(error => {
+                    addLog(`Simülasyon karesi yüklenemedi (${source}): ${error.message}`, 'error');
+                });
+        });
     }
     
     // Ses seviyesini görsel olarak gösterme
@@ -888,23 +898,8 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
-    // Sayfa yüklendiğinde son simülasyon görüntülerini al
-    fetch('/api/simulation')
-        .then(response => {
-            if (!response.ok) {
-                throw new Error('Simülasyon görüntüleri alınamadı');
-            }
-            return response.json();
-        })
-        .then(data => {
-            if (data.images) {
-                updateSimulationDisplay(data.images);
-                addLog('Simülasyon görüntüleri yüklendi', 'info');
-            }
-        })
-        .catch(error => {
-            addLog(`API hatası: ${error.message}`, 'error');
-        });
+    // Sayfa yüklendiğinde son simülasyon karelerini al
+    loadSimulationFrames();
     
     // İlk başlangıç için günlük mesajı
     addLog('Dashboard yüklendi', 'info');
@@ -0,0 +1,159 @@
+/**
+ * FACE1 Simülasyon Kare Akışı
+ *
+ * Versiyon: 0.1.0
+ * Tarih: 06.05.2025
+ *
+ * /ws/simulation üzerinden gelen ikili kare mesajlarını çözer ve
+ * OLED (1-bit sayfa düzeni) ile LED (RGB) karelerini canvas üzerine çizer.
+ * Mesaj biçimi frame_sink.py içindeki encode_frame ile aynıdır.
+ */
+
+class F1SimulationStream {
+    constructor() {
+        // Başlık: sürüm(u8), tür(u8), genişlik(u16), yükseklik(u16), sıra(u32), zaman(f64), kaynak uzunluğu(u8)
+        this.HEADER_SIZE = 19;
+        this.KINDS = { 0: 'ssd1306', 1: 'rgb' };
+        this.textDecoder = new TextDecoder('utf-8');
+
+        // Kaynak başına alınan kare zamanları (gerçek FPS ölçümü için)
+        this.frameTimes = {};
+    }
+
+    /**
+     * İkili mesajı kare nesnesine çevirir
+     * @param {ArrayBuffer} buffer - WebSocket mesajı
+     * @returns {Object|null} Kare veya geçersiz mesajda null
+     */
+    decode(buffer) {
+        if (!(buffer instanceof ArrayBuffer) || buffer.byteLength < this.HEADER_SIZE) {
+            return null;
+        }
+
+        const view = new DataView(buffer);
+        const sourceLength = view.getUint8(18);
+        const dataOffset = this.HEADER_SIZE + sourceLength;
+
+        return {
+            version: view.getUint8(0),
+            kind: this.KINDS[view.getUint8(1)],
+            width: view.getUint16(2, true),
+            height: view.getUint16(4, true),
+            seq: view.getUint32(6, true),
+            timestamp: view.getFloat64(10, true),
+            source: this.textDecoder.decode(new Uint8Array(buffer, this.HEADER_SIZE, sourceLength)),
+            data: new Uint8Array(buffer, dataOffset)
+        };
+    }
+
+    /**
+     * Kareyi hedef elementin içindeki canvas'a çizer (canvas yoksa oluşturur)
+     * @param {HTMLElement} element - Önizleme elementi
+     * @param {Object} frame - decode() ile çözülmüş kare
+     */
+    draw(element, frame) {
+        let canvas = element.querySelector('canvas.sim-canvas');
+        if (!canvas) {
+            element.textContent = '';
+            canvas = document.createElement('canvas');
+            canvas.className = 'sim-canvas';
+            canvas.style.maxWidth = '100%';
+            canvas.style.maxHeight = '100%';
+            canvas.style.imageRendering = 'pixelated';
+            element.appendChild(canvas);
+        }
+
+        if (frame.kind === 'ssd1306') {
+            this._drawPages(canvas, frame);
+        } else if (frame.kind === 'rgb') {
+            this._drawLeds(canvas, frame);
+        }
+
+        this._countFrame(frame.source);
+    }
+
+    /**
+     * SSD1306 sayfa düzenindeki kareyi çizer (her bayt 8 dikey piksel, LSB en üstte)
+     */
+    _drawPages(canvas, frame) {
+        if (canvas.width !== frame.width || canvas.height !== frame.height) {
+            canvas.width = frame.width;
+            canvas.height = frame.height;
+        }
+
+        const context = canvas.getContext('2d');
+        const image = context.createImageData(frame.width, frame.height);
+        const pixels = image.data;
+
+        for (let page = 0; page < frame.height / 8; page++) {
+            for (let x = 0; x < frame.width; x++) {
+                const byte = frame.data[page * frame.width + x];
+                for (let bit = 0; bit < 8; bit++) {
+                    const offset = ((page * 8 + bit) * frame.width + x) * 4;
+                    const value = (byte >> bit) & 1 ? 255 : 0;
+                    pixels[offset] = value;
+                    pixels[offset + 1] = value;
+                    pixels[offset + 2] = value;
+                    pixels[offset + 3] = 255;
+                }
+            }
+        }
+
+        context.putImageData(image, 0, 0);
+    }
+
+    /**
+     * LED şeridini yan yana daireler olarak çizer
+     */
+    _drawLeds(canvas, frame) {
+        const ledCount = frame.data.length / 3;
+        const radius = 10;
+        const spacing = 5;
+        const width = Math.max(100, ledCount * (radius * 2 + spacing));
+        const height = radius * 2 + 20;
+
+        if (canvas.width !== width || canvas.height !== height) {
+            canvas.width = width;
+            canvas.height = height;
+        }
+
+        const context = canvas.getContext('2d');
+        context.fillStyle = '#000';
+        context.fillRect(0, 0, width, height);
+
+        const step = radius * 2 + spacing;
+        const startX = (width - (step * ledCount - spacing)) / 2;
+        for (let i = 0; i < ledCount; i++) {
+            const r = frame.data[i * 3], g = frame.data[i * 3 + 1], b = frame.data[i * 3 + 2];
+            context.fillStyle = `rgb(${r}, ${g}, ${b})`;
+            context.beginPath();
+            context.arc(startX + i * step, height / 2, radius, 0, Math.PI * 2);
+            context.fill();
+        }
+    }
+
+    /**
+     * Kaynak için alınan kareyi son bir saniyelik pencereye ekler
+     */
+    _countFrame(source) {
+        const now = performance.now();
+        const times = this.frameTimes[source] || (this.frameTimes[source] = []);
+        times.push(now);
+        while (times.length && now - times[0] > 1000) {
+            times.shift();
+        }
+    }
+
+    /**
+     * Kaynağın son bir saniyede aldığı kare sayısını döndürür
+     * @param {string} source - Kaynak adı
+     * @returns {number} Gerçek FPS
+     */
+    getFps(source) {
+        const times = this.frameTimes[source] || [];
+        const now = performance.now();
+        return times.filter(time => now - time <= 1000).length;
+    }
+}
+
+window.F1SimulationStream = F1SimulationStream;